@@ -11,7 +11,7 @@ Original file is located at
 ![image.png](data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAABDgAAAIVCAIAAAC7kNgKAAAgAElEQVR4Aey9CXwV5b3/H5KcNQHcsFpbrbYutba3t7f33v5ue21rcmbmJIAIuC/IkhAWF9R6a6211iKyZDn7SQIEZFNAUUCBJOyybyIIJDnnJCEECHuSs83yPN///zsnUIWogAEDfsfpyWTOzDPP836Gvp5PvlsS0EYEiAARIAJEgAgQASJABIgAEehkBJI6WX+oO0SACBABIkAEiAARIAJEgAgQASChQi8BESACRIAIEAEiQASIABEgAp2OAAmVTjcl1CEiQASIABEgAkSACBABIkAESKjQO0AEiAARIAJEgAgQASJABIhApyNAQqXTTQl1iAgQASJABIgAESACRIAIEAESKvQOEAEiQASIABEgAkSACBABItDpCJBQ6XRTQh0iAkSACBABIkAEiAARIAJEgIQKvQNEgAgQASJABIgAESACRIAIdDoCJFQ63ZRQh4gAESACRIAIEAEiQASIABEgoULvABEgAkSACBABIkAEiAARIAKdjgAJlU43JdQhIkAEiAARIAJEgAgQASJABEio0DtABIgAESACRIAIEAEiQASIQKcjQEKl000JdYgIEAEiQASIABEgAkSACBABEir0DhABIkAEiAARIAJEgAgQASLQ6QiQUOl0U0IdIgJEgAgQASJABIgAESACRICECr0DRIAIEAEiQASIABEgAkSACHQ6AiRUOt2UUIeIABEgAkSACBABIkAEiAARIKFC7wARIAJEgAgQASJABIgAESACnY4ACZVONyXUISJABIgAESACRIAIEAEiQARIqNA7QASIABEgAkSACBABIkAEiECnI0BCpdNNCXWICBABIkAEiAARIAJEgAgQARIq9A4QASJABIgAESACRIAIEAEi0OkIkFDpdFNCHSICRIAIEAEiQASIABEgAkSAhAq9A0SACBABIkAEiAARIAJEgAh0OgIkVDrdlFCHiAARIAJEgAgQASJABIgAESChQu8AESACRIAIEAEiQASIABEgAp2OAAmVTjcl1CEiQASIABEgAkSACBABIkAESKjQO0AEiAARIAJEgAgQASJABIhApyNAQqXTTQl1iAgQASJABIgAESACRIAIEAESKvQOEAEiQASIABEgAkSACBABItDpCJBQ6XRTQh0iAkSACBABIkAEiAARIAJEgIQKvQNEgAgQASJABIgAESACRIAIdDoCJFQ63ZRQh4gAESACRIAIEAEiQASIABEgoULvABEgAkSACBABIkAEiAARIAKdjgAJlU43JdQhIkAEiAARIAJEgAgQASJABEio0DtABIgAESACRIAIEAEiQASIQKcjQEKl000JdYgIEAEiQASIABEgAkSACBABEir0DhABIkAEiAARIAJEgAgQASLQ6QiQUOl0U0IdIgJEgAgQASJABIgAESACRICECr0DRIAIEAEiQASIABEgAkSACHQ6AiRUOt2UUIeIABEgAkSACBABIkAEiAARIKFC7wARIAJEgAgQASJABIgAESACnY4ACZVONyXUISJABIgAESACRIAIEAEiQARIqNA7QASIABEgAkSACBABIkAEiECnI0BCpdNNCXWICBABIkAEiAARIAJEgAgQARIq9A4QASJABIgAESACRIAIEAEi0OkIkFDpdFNCHSICRIAIEAEiQASIABEgAkSAhAq9A0SACBABIkAEiAARIAJEgAh0OgIkVDrdlFCHiAARIAJEgAgQASJABIgAESChQu8AESACRIAIEAEiQASIABEgAp2OAAmVTjcl1CEiQASIABEgAkSACBABIkAESKjQO0AELhECGgAD4PihAJdBYwBw8qQ+Bqb/fokMh7rZWQmEQqHO2jXqFxEgAkSACHy3CJBQ+W7NN4320iWgAFOBaShV9P/pRyqA2qZf9JHhd7QRgW9EgITKN8JHNxMBIkAEiEDHESCh0nEsqSUicEEJMADGgTH9U9cqeCYhXBSAOIcog8gF7QI1/l0gQELluzDLNEYiQASIwCVBgITKJTFN1EkiAHEAGZ2+NAXiUYhGId4C0AIQBVB1/aJpoGkEigh8UwIkVL4pQbqfCBABIkAEOogACZUOAknNEIELTIBx3X6icdA4VyEqw4mI0hJpYVoMmAxMUzkqGdqIwDckQELlGwKk24kAESACRKCjCJBQ6SiS1A4RuMAENBU4CwPsjrMFh+WJB9iL25UBS469tu7wkobYYQYal4GT69cFnoXvQPMkVL4Dk0xDJAJEgAhcGgRIqFwa80S9/K4R4MBjoJtQFK4CcA4QO3YEYGYLvFSvjQwoOaHYr1a0Gt2Naa7gNdMbRn0sH2wF4HvjoCqYDUwDrRkPeOLmb50fx1wAnAHXgMeBqxj2fzKJGdd7iYNsNxkAZjfTR5LIaoYjAg5xvBtd3SIqqAm/OE0/obZdHk/8vLw/dV8/PQmcnmhBRf9ALQaqiq6CMQD5JDNV/zWWCGkCpiPED02Pemo7nWBFQuXyfmdodESACBCBS4gACZVLaLKoq98lAicX7RpwFTgoEAb48Lj6bFV4SBCG1kBegP3P0nAXX32yu85UsM9UuDNv5b6wDKC14BJeS4SrKBxD77/9jevZyfQYG8yorOnxNidFVCInwL8yA5zWXV3ZKHGIa5iRmaug6otvVGG61GkGHmEJ1cIiwOVExuYvLL1Pa/Ey+vWkiMPXRdd9+nuj6bgTKeH0T1R0OpfEN+g+mADU9qNNKSbAkFC5jF4QGgoRIAJE4NImQELl0p4/6v1lS4ADaPjnbhUYaBDVYG4E/lQdGRyCgSEYVgPDquH35dFUb12Srza56GCSp8nk2j1qDRyPqKCh6UJfyEc03RjTGSh9US/pxWBABq7oZhZcNeua6otXJfrNcFWNpoNElA7HjMz4wRUcKWdhmR9vBQ1X5FFgUY5iBlft34ktYV9K6A3UehpoMrAY4JuTACUDtCJWjsx1k5au8PRbTikahte22aJIqHwn3hwaJBEgAkTgUiBAQuVSmCXq43eMQGJBri8tGcSBxWFJOP58gA+tgcFBGBJkeUElN8B/szRqdjV0cdclFe9Pch4yFR5ImtjwyoaWE7KioR1FxuV6eyv/bwMnx9WzGtXVl646gEX1LuL6WV8063mXz+wuBxZmnCu6VuGcM12ooBjR4jLAqurI8PELB/zjXe+87a0aMK51EiPSRYLMMYGCruI4ShRNkxnsPhD2Ldj84qTlzxUve23KqrLFnzWdiCHnhB8Y5rIGfKtYlJ1KFIdT0AafhMpFmjt6DBEgAkSACHwdARIqX0eIvicC3wYBTS8/j0+OwfZj8ELDibwAR0NKDeQF5dxQdHCt+h8rosne/ZaifUnu+iRvfbKrIcW1r1tpo+OTwzE13Bai0VYh8tsYw+eeyfS1cZzDOxU7csZ9OHDCkrxx7+WOW/CKf9GexogeaNG+6xcDWLbrUN74958cuyhnwvyc8e/ljF/YcOQ4eoFpsVAz+49BJWl2t1F0XJ315sxV9fGEbaYTKbTPUbgghzHdHQ4wponFm1WYuqLh54+XXt3La5YmmcW3uktTrxHLdoUOqIwxFmcgc4xdaWFYdSeOx1xpEzAnjVAkVC7IRFGjRIAIEAEicO4ESKicOzO6gwhcBAL4522MvPg0Dq/XxoYEYHCtPDTA82ogN8gG1yq5Qf4/S8NJvn1J7n3Govou7tokz15TUWOS+8CNvtrZtVoz/qFdD5W+CL39ukcwvd5LFOD/PBVWMT/Z7jdLhQab/4ZeY53zNumpytRTf9H/fGPhOHuyYG1ahtsoTjVJPovotEqlW+uP6BEX8rrA/muz8lNtk1KyJlrFgj+5PsIMBAm3rzNtM59v97I55iwRfgIszlVe8Vnrjf3Gm8WiVNFpsPuMksdkK/rB/WVxJc54LMpiuw4d2dLUsvVgy/b9WugoKGhIURK5DU7qFCChctm8HTQQIkAEiMClToCEyqU+g9T/S54ALhB1nxx9pYjOWnjA46BBQIYx+1oG1cp5NTC4Vh0S4rkByEHvLxgagLsrWlO99UnefUmufUZHQ7JrX5J3f5KnMcVx5I7SfR/Wt+gVIFU9mZaC8fi4Kk14/1xsaBw45zLj/E/uSqvoSJVKTKLblFlqtHnvf/XdhuaIBnEMN0mgYOrJmG+5uiF288NOq1iAa27JYRYLrHb39vpjevR8/EBEve/Ft7tmuEw2708ecC/ZfFDDWxUt4dykh2Sg4NORJnKCtXlAIQg9zYCuZ3TXMwwG0jDIIxGur+LXiXW8nlBLV44aLuvbXNV0YZVAytviaxJebLq7HQM96D8hl/AqvQ9Mfy7j+jzoE4PXJXy38La2BvQn6G9B4gjvZQwLeyaeje5vHAN08Fe0menR8YyzJ0cvsor5RslnEKdebff8Lqfs7qenD3euRFwKyBr8Idd98/2lP+pX9uN+Ra/6l8R1wx3DrioYDaVvJFQu9j8Peh4RIAJEgAh8CQESKl8Chk4TgYtFoG15qIeT4CpZVyqMqcE4jKuP5ITkoQHIC/DcIM8Nwuf3/7e0NdW7t4t7b5JrXxd3Y5J7X5Jnr8HZkOTen+Rt+tnkmiX1UX0Zq6JpRdcAuoUloYQu1vD05yRW6hzUUd7VFtFtEdwmyXWlbUKybdIP7nMv37FPAZlzjP/Wg7oVGcNXmAyxN8q2GkWXSSo0S0Vm0WOxedLsrl2h4xpKHxQW1Y0n3PM/+fv0LR9tORSOAZfjmIVAz1OsSxFdmHGF41pcZRDBVhVUBHoSrMTK/wtiBdf/Gl6CKY85uphhNU2uR5tjwH48IQxATwOt5yrAx+l6g+OyPyElErOYkCmnTjHGmcx4HONssEZnHHuq5wPQK3Vir9vSBuAtev4uvYP6RSpwlUErjlkPesdZxMqfel4BTdG72nznQz6j3WWS8lPE4gf+OvfTuoNbm1r3Nh3SMGsxap3bHplglIrNoiNVLH6uYAmma0hYZNrSxOFskVC5qP826GFEgAgQASLw5QRIqHw5G/qGCFwkAlo0UakRF8OyDDIo/FAcJhxoHbg3klcDI6tgWA3LRa3y9UIlrbAuyV+b5G1M8hy7a/aBbU0ywCHM6IRaIabhAvnkX84v0ujwMe0KFaPda7D5zTbHc96VKKRYDAVCW5JdDbToYRlu7u0wSX6j5DCIDrPoNQkea5bzk70HcGXflsVKVVizBi2gxYHJuqEh8ZWiCxKG8Rj8GAeZoeRoRR80Da1MunTD1b9uycBSJJwxxKNGo6iXNNCaAMIy2jsU4M2oWhiGd+C3aPxoBVkBFVf/LJFLC0VDGCCs6RnIsHsoYRKUZcwdwGLAGAbXoMhRMN8ZWo44qGH9Khw5KqHEBLV5dEU5tGoQ11RgCsShFX8kphCZatHExUorCipV/V6volTxra4Zk9IyXY73tmmgRLECTwtAqwrxGPDbH3alZU5JFyYk2z3PFS3BHqoxUMOgRXSLG/aWhMpF/JdBjyICRIAIEIGvIkBC5avo0HdE4KIQUHQfLX35i0tYdkKF6Y0wqD46oJaPrILcAOjmlLMSKkn+fUnefZaiYJLrWJLniH1hfXVzXOO4uMXFub4KxqX2xd3aFSpJWcVm0WkQS2/s7z94AlAq6GUcUYRg6mHFN39naqbHKPiNksskOY2izyh6zNnOnQ1VDMMrsKTle8uCs5c1zFpaNbvi01DjcTWR8yvheKUyWYVAU3zxtoOu93f8vWzDq5M/cb23Y9HW4O4jx1oTUieRbICrzbI8Z1Vg+qpdby/f/c7HdYeOho8fPbpgbe3fp+54vWz1vOXVYTRgyLopBsPPjzSzdbsOvFX+6WvTVrxStmzCO6vnrq76JBA7FtdNHIncZFjgUt9Bi3EeOBxf/Mkx/4eB19/a8Ncpq/8xa0tZ5d41u5sPt+hOb0wDprBEJjTdC4xz2H9CW7HrUOmS3a9N2/jypA2j5+yZu6bu07pDLRo6c4GGwkYB2N90Ytaa/VMrQlf28hilkjSb15DhGjhu1fTK4JRl9YGaA83R6IcbG6cuD17/gCfNVmoVHKmSN/vF2dOWh6Ytq9pdexg4voSJl4KEysX9x0FPIwJEgAgQgS8lQELlS9HQF0TgYhFgCRcgXAkzOMrhnUPR4UFtUIiPqEJzysBaGBxiZ+n6leQ92MV1KNld08UbSHY2pbj39lu4f28MQI1hHjD8M38s4aF0sUaHz2lXqKSKTotQkCIVmwX3hBlbZLxI1WuroxHjSLPyx5GzUrJKzKLHKBSYxSKT6DWKHkuWa0/oIC7POasOx27oNcZq8xtET9o9Y6ctqcbwDy2uoqSA/ZHIpI+2ZT03u0e235TpNgoOo600LdN5Q89x4rPTfAt2taAkQmEBHPYc5T/o6bWIhV3vKb25r2vyqoaRBZVXSf4ke3GS6P+PQVP3oqQJQxwUrpXvDD75esUtD0+ySM5kydtF9KYKrnS741dPTn/Jt2ZPvW7e0VqxzgsWwuFHZChbXpP90tvX9SlKE4osGR6TzWEUirpKhbc/4hkwfvG2muNYxlKNgRZhTFM11qrBBxuCj/5t7k/6+9MEh0GcYMh60yB4r8ka/5sc/0slq3buj6k8AiyiAHywvvZ7D/ivyMzHMB5pvClrbJfsYrNQ3DXDmSoUjpm9LtAY/mPu3O73jEvOLjKjbcpnFCd2s+UbxaJkW+HYd3ZjBA6lJ76Y/yToWUSACBABInAWBEionAUkuoQIXFACbUHUGLhwAmDuYRgeiD8Z4nk1fGgAhoTQ3SsneJZCpcHg2G9w7E3y7E1yB7oWBUxFjSnuxsfeDx6SMXhcT4qlniqecUGH9fnG2xUqN/dxX93Hm2p3mgTnHQ84G1tRR6l6vAdobM7Hwe/3m2qU8q22/BseKk23F1gEt9nmTbN7ttcdRQuRxgOtsWt7u5Kkt5KyJ6ZmusrKa1FNsLiqO2j9bea2H/YZa5FcKVlTksVJBtGXLHlTRY/RVmzNLPthtvcv/kXNCfHGld3HI9f2cSX1ft0oFfy4j+Phccuvzx7bNdNhsTlMNucz3pXHUOOpXIN3V9X+5IECs1iYJjjTBIy3sYoeq+C2ZLqMds+Vgufe5+bsOhSLQwRDTjQe5zC5svb6PhOMkjtV8JlFr0XwWsQik+CwiD6z6DPbnb9+bMK2fUxWGWhRjbMWBSaV77nzUaclY5xRnJgsTjZIPqO9yCB5DJLbaC9NF4r7vfTup41H0Z2Pwwfrg1c/MNVyT5nB7rZIBWZpXJesIoPdYxCLk7L8o+dsqtnX+pu8942SJynbn25zWQWPQXJYpDFJ2YVJ9vyxc7foIThtljayqHz+1aVjIkAEiAAR+BYJkFD5FuHTo7/LBE7FWePqPI5/2NeYpq06HH4m0PpwPQyrZsNr2EMN2uP17KkqlhdgiQCVHAyp5xivEoCTwfQNSS5MUtzF3ZDsqDMWhCxjt6W+sif5L9VJf11tfG19yph9Blft8+UhFkaxEklENVxc9u0KlbufmPSgY2eqfYJVLEgTiqYu3oMJt3SpIkfVYUWLDMLkbtI/r8wqeNix5bp+XqvgsuhCZf2hXQyj22ONx+M3ST5r5iSzNKH7Pa9NK9+DNek1dGNaumx713uKjTZfcpY3xZ5/be+if3us9M4BZT36TjBnjUu1Fxsy/D/MGvv2qhq0MrF44Ejs+9lvmURP9z9MTcsqtN43q0tPX7d7i67r6f9Bf/+izTtQGqmwMdTw6ycnpWTOTOrtTbG7u2c7fvrklP9+9t2bHp2Ylu1OsY9JFaeaMor7jZ59RLfWgAz7Y/Dje/9plvxdxMmmTM9NfT2Pvrn4xWlb+/19wXVZhdZMr0GcmG7Pf+T191rQnUuJA6yrOvKrxz0msTjF7k+RXFf1dv1q4PR7hs/7cb+S9Kw3k7IdSb2mdMsserZwzYko54yt2rL7v4ZNv+P+2anZPrQa3TPZLDm+389x+6MTb3mkbNL7W/cePHbvq3NvfNKTnD3pintKu9oKDWLptff6bnls6m0Pl0z9YCemFTv5SpBQOUmCfhIBIkAEiMC3TICEyrc8AfT47xwB3dFIj6HWs/HqKbg0iMoQW9kMLwZgYBDyAuHT4uZzg5BXg9aVgbV8SIgNq2F5NfCbpeEu3v1dnE1Jnsbkwt2Wl9elD158ZZ9JFrvHJLqMQtueLrpS+0y/YfiCNxdUhaMKKFikPGHF0X9gAZO26IQLNhntCpWfDp60YF3d1fd5u2e6kuy+3q8sPHFCjkEcVHV79Ym7hs00Z06ySmP+K/dt34c7ftDfZRbdBsmRLnk/q23CEXBoOhrv2tefLhQaRK/xHs+sRbWYF0uGqoj8s35T0zPdXez+VGnyvz9WMG9ZzYmIFlOiK3Y23v301FTJkyyWpImOR/+x4HAYDSUNB49f09dnlrz6U4qvsfv6vbSwrGLP4s2h+csD+47GQIZILPJi8dYrxQJjhiepZ/H3HyyZNGddJMZjjAcPRp4e/5FFLEqWSiyCw5Q1dubaE3qOae2j7U3GjAKz4E21O7pm5s/f3ISagKPL1tSK2p8+7L/h4Ym/ftgv/eWjuqYWDCZiseGulWapwCC5UqXSWx70TF6wMRyJqgx2N57I+edMS7YrSZrcVSi6tu/k5TvioB2Ja9CqKMdboj16uY1YRMWXIjqcczbFY1osFtcUWWM8Lsdj0fiNj05OE51G0Z0iFT9T8GEsrkTisqJqekqxtuknoXLB/h1Qw0SACBABInBuBEionBsvupoIfFMCJ9PiYiauRPy8hn43W8Lwl/rWISGWWwODQ9qZQgVr0gewfAoe1ODB/ywNd3HXp3rqza9sMD0+y9DLr4enu42C0yg4TaIrsVvEcal2d7JUclN/v3/B7hiKBizBoSfu1dfMmKL2wkqVdoXK7UPK6g6EM158z5LpSbb77nistHJLrYa5vKLF87enZ3ssgtNk9w0rLC//9MAP+3ktgt8gOdLsrp3tCpUM98xFAUwXoMLEZVu6/cGBSXjthV2F8bPW1oY1UDQFlGZNhumVDT/MnmCxuVMz3L/Nm7IrtE/ThcrVff26UHGl29+87+W3dhzQ0x1jNjENo00UCO4/8rvhb5tthWkY3+/ILVh1rDXMtFasvaJA/VHl9kfcRtGbZvMYJUfP52fHdK7vbQiYbK8aRI9R9F1lm/DuxkAcJ6CVgXwsDB9v2r96Q93y7fvXB0+0RKPAtEgYbuzvM4sug57HeVj+0iMxUFQF83ox2FDTcutjE5PtpWlCkUlwjfKsBRZR0R6ixWXtmt4+o+g0SP4uQqF33ra2YjFc0zDHAFqhTgmVZNH/nGMx07Of6TmQMUYmsZFQOUmCfhIBIkAEiMC3TICEyrc8AfT47xwBzhO5cfXVoV6Hj8GOOPylJpYTYE/Uq0/WsuFYfv70PSeIVpTh1bppJQiDQvDbpS3dnLVJo1Ym9S7pnll4ZWahyeYwiS6z5DaL/9qNosMiFOG63Obv0bNg5opaXJPq0dOJaoO6fQULgFy4rV2hclvuVJBjr03fkJ5VnJzl7SoUvVy2Li4rkbAsjJphEL1pgrtrn5KFm2rW7K7/YV+/xTbJKDks2UU76w62Y1HJcM1cXIVV1jUY5pxntZUYJLdZGv8fT/iPo/1I0bS4zCIxUA+E2fIdjYu27l+4df/Kzw4ebY0xUPcebL6qX7FJ8llE19XZE53vbWMobDAXsKZpjEdBhrW7D1zT25uS5THf472hv2dqeQ2wKOdhVWGgKFyL/1/JCovoSs8oNoklP+rjrT0a4RD+tKmpe8brKWJJapYvPWPKD3v6H/jH0qmLq4J1R+JxpnCIYwEZGdQWjsmRYf0n+5MFjwXNKd7uYv5H6xo5ZlvQFEy9HImr0O9v81Mlj1V0miTvLwZPwwI0yDcWjatX98ZRGyR/slCEQkWvNqN7w+llWfjnhIrkf14XKtgqpiAgoXLhXn9qmQgQASJABM6TAAmV8wRHtxGB8yUQ1drixRNeWPwzFd6oax0UhJwaGFaj5QZ5TntCZUAdy9EdwAYFYUAdHxJUMxY1pj2zOFmYlJbpN0sOo91hFf6lT05pFYNQlm5zpYvju2S5krPct/bJX7imMabGgbeCFsa/o/NEmZXzHdBZ3NeuULl1yFTQYh/vaLz9sbIkyW2xef7fiNlVB4+u/PREd7HQYHekZZb914iSE7KyYU/g+/1KLJmTTWKROduxs+50169UyWfIcM9csgMLNar8vr/OTBVKU6Viq1j4wEsfogjDGiZowtLQhqRi+uPE3pbrSms41HpVvxKz5LUKzqvvmzV9ea1eUwUNT3plF6zK8uGGeovkTspyW23Ftz3mr/ikEeuoYHMqYClJmLOq1phZ0DWz2Cj4e/SauKnmEKgQVSH3jVXd7D6TvcAglCZnlaTZ3NY/Fna15d/4gKPfq7MnV1TVHIgzBYu3cAYzFm5KwuRd+Sl2f3dpQrAhDFxGgxfKrej/P4qXJ643S06z6DJK3iv6FDcrieqV0agCV/cuNUoug+RPlZy+edt0/zgcPPLX/0OLiuBA1y978aiijz5nUUFTVmIji8pJEvSTCBABIkAEvmUCJFS+5Qmgx3/3CMTavKy0uMaVahXy9ysjquNDA/BkCEZWs6f38AG1p5tTcoMYnTJUd/16spYPrI3/qTqSuzhw7SPObhlOa6Y/xe5NycIojjN3ozDZInitYr7BXpRsd1ttzv+XM6V8+0FVVYFFdMMOrt8v6NauULlzyBRgPBqJP/zKvKRsn8Xm6i45S5YF+7+62GzzGqUia2bp5EVbgMH63aFr+080CaVmscCc5T5TqKRI/tRMz8zyrSpATIn3evGdFNFvkLxWm/OJf6zEvMwchQoOUy8Gj8e6/sAlPG5Kw6HWKxNCRXRc3d8zY3kV3gJYBpFheXp0/pq3KmC1OZKzCq22ibcPmLRq15GEUNFLJcYZh0Ub96XYiqyZLqNYdEWvSet2HtDTKDfXHok961r9b/e7r/y9K8nuSvyfsw4AACAASURBVLEXmUWv0VacIpakCCXmzIn35E2dvaaJKVhKpnjuqlRxvFks7GIvTc9y7D8cB44R9pglAHUWHzNzq1lyGiW3UfKkZbuPR2W9sqTaqkKP3qjNSKhc0JeZGicCRIAIEIGLRoCEykVDTQ8iAjoBdLPRV8lM2Q/gbVSfqkJbymBM58UGYckUGFF9em1H9AQLYE2V4dUwKKTlBSPF+2HW7pYniuYbpNfREUjwpgkOk73wTKFikgpMksss+K1YBt6TavcYszx3D5tW1RDjGtYt0b2+LqxSaVeo/HzQFKydooRnr9yXlOW1ZhZabPl3PjE5LduL63jBc/MT0060aqDCut0N19w/2SQUW8R8c5ZvZ92h01y/UiR/SqZnZsUmrLSuxe7/64IU0WWRCtOEop4vzI8geLR4JMwSiZrvuORPmFjwi4RQKTVLiPHa/kWzltYDBvIoccBH4aEGSzY2XIGmnnEW2+RbHp28eFMjaGHgcd2NDs00sxZ/liR6zEKhWRp7ZZ/Jn9QcZyoHfpzF2MFW2Lwn5H9vx/35q3+ZM+Nau8+a4TWg3ihIt+UbbN5fDZ+5pyYYBpi+ZIc1Y7xV8CSJpeZs757ao7olBUCT43p40Uu+5Ua80WOSXNf08cqqCipmQj6hwvd6+bsKE0io0P/XEAEiQASIwOVBgITK5TGPNIrOSEDXI18IWse/6DPOGfpdneDgORB5opYPOSMcJTfYVj4FTSg1bfvwAM8JwpAgDK+JOg7E1yqwJBgoXrb+oTc/SLONxRxfotskFqJTEDoOOS1YTtFtETCN1Wm71eY220r+Lfft/a0AWqvKGef6n/7biorEASIM1DZjQ0egTQTDKABP+1egahLdRsn5y4ETQQMZlAic+OW906yZUww9X08Ry5Ky3Sb7OEOm+2+zNoKKzNZ9duh7/YvNossiuNIk747aYygdOBw4plzTuyRdKEzLLLbc43prSS1oisrgRde8pF7FXbL9XezFP+nvaNEA1LjK1VY0pET31Te97t880LllsHvz61N3Vx9QY6DWNZ24qm+ZSfKb7eN79C2ZseKzRFF5VddxWIuexzcG99/UNz8py28WS34oTnMsDEbhKLBmUICpKmixfo4NaTZPquhPyvbf1NeDSbxYCygY3xJmoGpRjOZHWdTS0tz6wbr63wx7yyT6k4VpZrG4x73uSe9/AtBcXg0mm9+QVdTF5u0mFJUtPxJG37woqOFWAEWF+54rM4ges+gxZPkyczwtKDV1768IdLuv1CJNSLH7DaLT/f52OVHnHmcQI1HioNz+4Nwk++TU7MKkbPfThQtRqek703NkJ6aaXL864pWnNogAESACRKADCJBQ6QCI1AQR+FICenCAHjKPC17UKRjzoJzQ2FtH1Gd3ycOr1HZzfOVgkccvOIANr8IA+qG1Sv4+bVUc1skwP9Tgq/y4aNmGrFdmX2n3mgS/wZ5/SpNYRLe+e06dOXVgFF0Wm6P7PePve2l21cETWN08EaCQMPXoff7SEZ3XF7qDGdZyfN671CoWpQmoo+4aVKYvsDmDcNHcvWkZ7tTsApNYbMIAjMIf9y/eUNeKXlecb9q5//r+XqvgsAqONLt7Z91BTGIFrPF45Kp7vRZpgkn0GGwTplRUY9A8g/dX7zUKjqszCg1iiUEaP3r2+tbEml1ujipQuCBwVXahRZzQNfMf9pGlwYajnMcaDxzpcV+pVfRZpPE9+k6csWI3Gr7Q5qIbnFDLqcGDqjRqVqrkSpYcXcXxD//9g+CRZlAYVyCqwe7gke/3KkwTxxlEv9XmfuS1WVEAmcOirdXuJRsnvLvpH2+tf2vJ5ijEwyhXFU1TN4ait/cfZxUdaYI3vZc/f/ZWUCMnZLjj8YlGqTA1y5cqep/464yWo4e5Fj8OAPKJhZubvv/ApGR7mUnwWG35Y6asjAEoPApcYTFI71tskcYbJK9ZKPLP26x7t3HgGtrLUIrwu+6fYhDcVrymZMjo+VEGUa4wFgVNYSeNaiRUzusdp5uIABEgAkSg4wmQUOl4ptQiEWgjoK/7NfyrNsfcUehrxKIAERUWHo4+E9IGV8OwgJYXlE/P8aXHoqD9JHRq57nVMDSgjW5UK8LwaStsjGnzavd7lq5wLVs4Zv6qjBfmdLW7UrMcFsGX2M1iwpbSTuCKSXJZhAKrUGTN9ueOW9R4qBWjLBgWVOGYxzYRt93R08gUYOx57zKr4LQKbpPovmPIlLYMaFqkpgV++oi/i73ELLrTbW6z4B30xpKjrREsRcLZxs/2Xd/faxGdZsFlsXt31u3Xs1Rp+05ErujjNdnzUyVvijChrLIKzzM43Aq/HVzaLbMoFUuv+G7M9o6evG3VrsbNNfsK3626Y8BUgz3fJPktds+gwvJwNM611saDR3vcV2IR/VbR+b0+ZTOXVyeCWPRAec4Bo9hbozBmxvqrsx0pPUuS7QXXZU8c5SjfUN34WdOx9zbu6ztqQbd7ilIlZ6pU8gPxzZU7G2QOUQ7Pe5dZMvJN9/gMmaU/7OOZtbTuWCsWRTkYhvHv7ezRpyDF7jXZiq+7f+K05TVYVlKL/2366u62N9OlgmSp9Nq+vuf8y9dXHQk1Rhau3PW/z71nzfLpAL23PDpla/AEYNauMOeyEufWfqUme0Gq5DWJhf55m3WbmAZMj8VnEAP4nycmY5kXwZFqK/vFg47JFbvnbqxuCkdAjWOgi76RUOnoV5/aIwJEgAgQgfMkQELlPMHRbUTg6wnoK/6ESkEZoGC4RRhg6TF4PqgNq4Yna2FgLdZF+TKhMjgEg0NsSIjlBNmgEH81qCxpgc1R2BJTNse0hcF679Ll/vJKX+Wy0R+s+ve8YpPgtgoei+CzCn6z6DOLGMaACYu/6P2Fy1zJndTTYZC814gTXyreEGYtoCmcxxWs6q4LFSwCeSoR1NeP9auvQBIMJdAz3lVm0WsSig2S/46cSYzpPmdK7ATEnvUtSxGLDaIjLcPfo8+USeU1HB2qVHT92tXU4/4So+TBwo7ZJTvrDmEyLg4Nx+JX9C422AoM4qRUm3tKeRA0xrimqdqq3Uev6jnFIHpSs9xmu+OqbOdN9/t+8GjxVVklXTMdJrvDKJXd0MtVsadZNyRoe5siV/QtNYjFJsF7fZ+Js5ZVoU8UJgpTde2G6b04h91NxzNGTEnLnJIs+brYnVdIZT/pM/nOB9039Cuw9JxgyCpNss8wCoUvl1QqMnBVViDy2f7mm7LfTBKnJGWVmMQJ193n/8+Bk//41OxfDJh2zb2TTTYfBt/bSzNGTGo4FsF6j1z+tPHI3U/NNQieNLHYLHjTe3puut/z8wcd1/bzp9hL0myFXYXCrtnO16Zvx7KRjAEafHg8xtL6TjaJriSpOMXm8L6/XR9BIhU1ZjuLAwwvWG6WCpLEyUnSlO62/Bt6e27u7y3/tFn3c8OIfQAgoZLgQJ9EgAgQASLwrRMgofKtTwF14HImwHRzCgZiywxkiDPY1grPhGI5AYw2GVwXSYSdfJVQCWpDA8rwGvXFuuYFEdgehi0x9WNN3hxjiwK13qUrfIs3+CuWupYtGv3hxlsfcFnRVOK0CD6z6DOJHmN7QsUiuFMlf5dsR5pYaMqcmmYrdM5b3SxjrUQN9MhzVCi4BO6oucEgCwYKh+eKV6NVxOY2Ca6fDfFyDYtNgqJFIPbRtvof9HGZxbFdbf7f5U3ftu+YXgmTy4yv23Xw+gdLTKLDJDqs6Pp1RE9/BY1Hoj3u9acJE0w2vzmjcNriKq5xlTPgLTHgU1bs/Elff6o4Kynbl9wzP93mTRGK00R/WqbLIPmu71s866OdoLRl/t3bFLuir9csOq2Zruvv8769bOfnhUrCDQwgroCyIRD5zaOTrhEcBnt+km1qqjTFLJQapZKknvkpUuFV2f7B4z/cG1Y58tO4qvB45INVn950v7urzZsuFCb19Ol1OQu6CuPNQr7B7jD3dN32iHNLzTGuxWWOlFTGl2479JshpUabP0WabBTdZsnXRSxLlvwGCUs6dr/XnVtYefxoK3ZMQ2HJGGiK1v1ef3fRgddgHZWtmPE4ITsxPRlKzy0H+C33jzFJniQ7WqiMwlTTPaWFc/ao6OQmJ6abhEpHvfbUDhEgAkSACHxDAiRUviFAup0IfDmBtiAH3QNMQVvKxkj0+VqWW80HB2BwiA8PKLlBNjj0FRYVnhvUhlfJL9bC/Ba2XoHNEW1TXFunaBvjsDDY6Kv82FP+sbdyuXdppadi1eg5y28dOMUqTLAILrPoQxOE3ZUIXv+8UcVgdxsld/cMzBWWYneYpKKuYknxu9uPYlA2+jglqo3o6cm+fHTn8o1uUVFAk/85Y90dj0+587EpP318svDn6XoICFZcVwBqjzSPGL/ol3mT/yPvgzFTlrdCK4bzaypn8id79v16+Mw7Hi+787FJdw2YvLvhsF7kUG063vzLobPueKL41sen3faY//2Ve0BjmElMizEGrWq8YmP14Nfe/8WAt6/qVZpuL7RI7it65981oPSxvy/6aPNeBXWSXu5Sg8OHwr/Ie+uOx0t//sjkf8+b8f7aXWgBa7OoJGqQKCjesD6jWnWk9WVfxd3DZn3vfp+p1+vpYtGV4uQfPlYsPTfXM2fd4aMRhjfqOQo0DBBpVaBic/2g0Qt+MXjGtff6u0nuNMGdJpVc13/qb0e+8yfPqt1NUdDiCgM0qWhxUCHO+faaw88VfPTfedOvud9vyXZZRPeVPT13POwT//y+a/5nx1riKtMwHZnusMdB02LH7ho64+ePTbztiem3PTZp5qJP9AoqKGJQcWIiAS6D8v6GQL+XZt/06NSrezq79fJ+/37vPycu0VDgtc0oCZVzebXpWiJABIgAEbiABEioXEC41PR3nYAuVPTlfizO5e2t8HJd/MlaLC2fE+Q5QZ44yMXExF/QKkNC7In62FNVMHwPDAjBqLrI28dhYww2xvnGON+k7xvjsACFympPxQpvxUpvxUpfxQpv5Yrnpy259eEys1CSmlVkkJwWWztZv4xYut6VbvNgFmB7kVlyGMRJ1z9QUrpkTywOGFcNEUyr27HzxzXgWu3BlrW7Dq3DvWlr8LBeTrGtqKLCWP2hyLba49tqo4eOR3UDTMKvSWsNxzZUHcYbP2tav+tQWE5Ye5iiqeurjqzdffDjXYfW7jpw6HgEOMdFuV6HXdcg6vGWli27Dn60Zu/blZ/Nqvxs/rqqDXsOHm5m6CyFofptF6uytr7q0NpdTes/a1pffbTpBDaVqJJ4koNuucBfVA2UsAK765vLN9fOXrH97fJPP1gRWLljb+1BGT3nGMoHhhoIMIBEr93CODsckTcGjpRvrJ27/LOZFTtmrwxUfrK/quG4LKN3md6sXjuSoZsZem1xkGW2u/bQks2176zYPbP80w9WV6/5dF/dESxSD1xp8+zCjuIDOYuvrTq8blfTml3IqukoBu3jrleu141CmA1aZrDvSHzVjqaFa2sWrKup3FYXajysi522+Sah0rEvPrVGBIgAESAC502AhMp5o6MbicDXEEgUGOSAlcP3heGfdeFh1dppmuRLfuVDg2puDeQEYERIndgM62OwKdYmURJCZVOcLww2+CpXesrbhEpCrrjL14+cVN6jj9Mg+DAJWHu16j9vXTl1bMgquq1/6eItR1XMASUnYv+/ZoSXyNcoSVDy4IYrcv3Xb953znmiQU3TEkaLs2wz0ZNzuoVzrmla4oln+ZTzvoyEynmjoxuJABEgAkSgYwmQUOlYntQaEfgXAY4BKipw7UgcCuthSAByQmclVPJq4OldMKCW59RFSw+hStka1U7pk1MH7QoVT/l6x/Lyga53emQ7zTaf7tl1ejD9KXHy+YM0W6Exs+TnA6es3n0EPbF0+8G/BnNZHCUkSkdplfMWPIkOnL1QSVz/+c9vPhtf0XkSKt8cL7VABIgAESACHUKAhEqHYKRGiMAXCLQthbkKLLJfhqJ9mLkrV086/CUmlC+4fuUGYHANjAzEvUe1VTJsibJNMeWUPjl10K5QQR+wypXuyuUDJiy4tufEVExv5Twz8dfnJUri2GIrMdqLjELRf+W8tarqMNcwr1bbQL4wuEv1l1ML/Y4awKkGz4PSV+iEL+ve5x/3Zdec0/kv6wMJlXPCSBcTASJABIjAhSNAQuXCsaWWv7sE2laumnZM1rwH1IG1Wk5IzgkpT+35oiD5YmjKKQ0zJMgH18neg7A2Cpvi6jpFXqecrUXFV7HaX7HcX77OseSTB8bOuzLLYRE9JoytP70+/WlnUuw+i1hksY9LESf84dnZW0PHGWcJp6az/9v/d3fKL6ORk1C5jCaThkIEiAARuLQJkFC5tOePet8JCSRUCmMszGDqYRhSHxlWw3MDMLKaD6xjp9TIVxzkBbQJjZFlUdgaYRtleZ2ibsYYFThlS0kctGtR8VWs8Vcs81Ws8lSuyi9f3fsvs9LEIrOE6YC/zq7ixPru9iKj5O6a4b7v1fm1h8Oavn3Zn947IXzq0jcnQELlmzOkFogAESACRKBDCJBQ6RCM1AgR0IskApaq0EsbYkGMD4+wp4IwNCQ/Uac+vRtGVMGjDcqZ+gQLqoTY0ICWV4PFVXKDymsN6rJWDE3ZGGcbZHVTnH0SOVuhoofUr/YuW+Re+pGncv2E+at/99xMa2aRWfAZJadRwrTFFtFzmjnFLLrTbJ5UuzNFKrVmTkzPLLDaXU8XLjwWVUDFivU4PPxPT2RFs31ZEyChcllPLw2OCBABInApESChcinNFvW1UxPAknn6Qp5jfYv3T7BRgdPzDp+pUnJRpfAhIXVYQM0NYMD93/fGPkKPr9NzfJ15pl2LSiL31+c/35i/8ncjp6TZ3KmSNyXLYRLdFqGdnMXtSJeerqcKy1siCujl6vVa8J16BqhzHUKAhEqHYKRGiAARIAJE4JsTIKHyzRlSC0QACch6NUC9HgYsOQI5tWxoTTv2kzO1Sl6AP70HMxE/sld9pT68vAU2dqhQ8VWu/ueCil8Pm2jJnGSwuwzZY42S80xZ0s4Zm8MiTh7lXxRRlThADIuC0Fxf/gRIqFz+c0wjJAJEgAhcIgRIqFwiE0Xd7PQEOGjo9KXB1mZ4Zq82rBoG1J5V6HxegA2tgUFBeL4h9m5E3hbl6OjVcRaV4vIV3sqKv7yz/M4BpVbRhVoFCz5+/W4Uirv0dPe41+uau7VVwcEBRDr9PFAHvykBEirflCDdTwSIABEgAh1EgIRKB4GkZr7zBLgGKsSrWpS/NiiDa5UhIXVE1VkJlcEh9ngdjApq7x2BdYq6RpUxdL4jhcrHxYs3eipXj5o67+b73ebMSUbRfzZCJTXLmSZOSLP5b3vgrdlL9gCLKxD/zs/z5Q+AhMrlP8c0QiJABIjAJUKAhMolMlHUzU5PIALQEIa/7Y0ODkFOSB1ZrQyrPkuhwp8KRWceg80R2BjnaxTYGO9IoeKtXOlbssFfvspdufTZssrrehdZzq5cvdHu6JrpTxMcRqH4jgc989fuiGGFd9oucwIkVC7zCabhEQEiQAQuHQIkVC6duaKedm4Cx+XYX+tbHw+iE9czeyCvBgbVnlUy4qFBKDsKn0Rhk6xsiMH2VtgS/fpI+k1xfpbB9K7l5Z6lS0oWry1ZvM5RWf70tBVXZX99WRXMA5Yx1SD5TJIzJXt8Uk/PD7JcOz5r6tyTQL3rAAIkVDoAIjVBBIgAESACHUGAhEpHUKQ2voME9JAUUDC+XIYWVQbfEcjR03wlPs8Mmv+yM6+E2NxWWBmHTYqySY5vjvGtEdgaZZtjTE9PrG2U1U2yfKYzWLtCpXjJ2uLy1d7K5d7KpZ7K5Z7KlUUrljmXLvcvWVGyZKVnybo/T1v5y9yJZ+P69flrDJkOs+iW/lp++HgY4pruASYjA8pXfNm9/CRULrsppQERASJABC5VAiRULtWZo35/ywRwga7xRGERHquPwN/qsapjToCfq1DJCfEXQlpJI1S0wHoZNsaVTXF5vczXy3xDHN3ANsdgC+YBO90frB2hUrnSvXSZe+kKd+VKT+VqT8UaT8Uaf/lyf8VKd8Xq1+YtvW/MrBsf8pptZ2VROSVUTKLbJLqMguumBycuWl8NqhzXMweQI9i3/BJemMeTULkwXKlVIkAEiAAROGcCJFTOGRndQASQAC7SFRlAAQaKujEMT9exhFD5MsvJl50fHIDcAIyoUl+uUyY3w2oZtofZBj2YfmuUbY2iStl81kLFubzCvXSZt3KVr2K1r2Klr2K5v+IjV/m6YSUrbx9UasnON2V5jO0VfDwlS9o/0BOFdcv2uhfsYBCXQZcqqNNUeh8uMwIkVC6zCaXhEAEiQAQuXQIkVC7duaOef6sEdKGiAKi6UFkbhqfqzyoi5Uy5MjSgDQ3wIUEYEoKR1fGCvcriCGyMwdYYfBJWP4mqm+PaOoVvPCMPWDsWFVQmK4rLV5YsWVmChpRlnvKKfyxck/GXt9Kl8UbJZ5B8ZtFtFc7NooLSRcJi9ulZ3qL5nyk8HoMY2lTOXahwLHJ/Dtu5Xn8OTV/cS88cCP/cdnH78jVPI6HyNYDoayJABIgAEbhYBEioXCzS9JzLjACutzXgwBhwiO9sZX+u084UIWdzZnCtilnCqmBEFQytgaEB9bladeohWBJFT7DNMbYprq5TtLMUKsXlHxeXrywuX+Ep//iN+esGFM278RG/SSgwSQ6DPd8sFVhtPqutpH2zyVcUV9GFSo8+vmnlnwLjUeC6TQlQrJzLduZ6/avvPtfrv7q1b/HbS2ggJFS+xfeEHk0EiAARIAKfJ0BC5fM06JgInAMBVCgymlSi0HJUYWMbzyoZ8ZnSZWgAhtXAsGoYHMIakYNCfGiNOiKo/LNBmX0c1sqwKYZhKmcVo1Kx0lvxsbdyhWvpqmfLPvzV8Inde/lNUqFZcFttJVab3yy6jJLbqKuOc9Mq+i2/HDpre/AAKFj3kaPTl3auteo559rZbYyxS2hx/7XvDWPs1LgZwwgnznnipKqqp746dfAtjp2EytfOJl1ABIgAESACF4cACZWLw5mecpkS0M0JXDcrLIrDX3ZGRuzRxUYtzw2qebpD14BaeKIWhgQhN8hzQvKZQiU3AEP1MJWcIOTgZTA0wIcGGZaMrI2/eVBdFIctEVim8S1R/lkz/yTC1ipsvcwW1+ybuHitb8lq79Il7mXz3RUVxeWbiiuXjVuwWfi/967u6bcIPpPoNYsJRy+PWQ9N0SPj2ylLn25zWkSHwe5OkSamSKWpdrdZGmuxucy2iSl2Z0rWP7uJ41+bGtQY2lLOzYySiOgBVB5vvL35Z0Nm3TX4nTuHvPOrQZPvGjLtjtxpP8uZ+ovB0+8aMu0Xg2f858CSXw6e8tNBC8fM3tmiRDSAGOohvQn9uQoe67YsFIm4c9w1VI1Mv1TD3zkonGvAopiZjSugahpneKxH1WCDmr5zPIcTiFfjMcbcsMQZLfEgNBox3NnnnohP1RJXJt5t/YozXnNdkcSPtCoDJ1T+bMg7Px/89p2577w2YzNTYjGAE83RUb61Px0y66e50+7KnXhnztTbcmffOvTtO3Pe+vnwGcLL8/7sX7bqk8PNcdCwS0yDVl0eqgyQzDlPwxnda/cECZV2sdBJIkAEiAARuPgESKhcfOb0xMuTAFdgwbHYyPrIwBAMCkBeAIYGYXiNkhtUc4N8eA0fVtOmQ9rRKro+OXUebSzVeHFOkI+oif4t0Dr1OGxoQevKKsbWKtqWKKYwXhg46F26zFO52Fu+2rtos698bdGi94f5l/708aJ0cYJJ9KZKXoPdaWoTKu2Ik88bVUyi3yS5TJLDLHqsgtcqFppFr1HKT83KN4hTr+8586mx7x5Twuc3ebjUZyrn/FnvMrPgMAsuk+jsdo8vLdOL1p5Mb1qG35rpSxWLTdJYo31css33XPHSsHIMIAo8DhzNV/quAYsBV3UJoennGX6elAy6YknYKyAWja/fs3/JxmOLtuxdtLUpdLBFlyKqhgahMICsgYa5EDgDpgBTdbnCgCsnhYkuBP71C9cflBBDCkBcg7AGcQ4qyrZE986go8ueWFOzbPvTbJPgsticJsk10rWcqbEowLHj4Yf+8ZFRcqZnlHTN8HbN8KTZfBbBnS4UdhWc1gxnN5vzCmHc70eWzv1457HIUdRUqI4wMTQqlzMe1yEnSKh0CEZqhAgQASJABL45ARIq35whtUAEkIACrTJnnx4Dx14YHtIGBzDgJC+g5AblvIA8slobXg1DAmfnHqY7gw2tgZxA4hZtWEgeeyD6bjOsxcAVtkZFofJRoMG1fLmnfLW//GPXkjUvvrXU9vzUK3p6jYIjRXInZ3lS7G7jWQuVVGmiUXJbxcI0wZVu86QJToPdbbB5ukme346c6f1oRzimgRo7v8nGZTzXGOfPeCototMiYL7jVOEto+QwSwVm0W2UXAa7K9leapScVrHIbHP92bciFotjDBBDk4YMENfVCDA81k0jp2wfukkLtQxTUT/IuIJnEGxsvfuFWRabw2wfY8oqKpizSffU0xf7TAXGUG3geFjCOtKmN3TVw08aT/TvWcLYogsDfSht9piEC9dJkdQeGrR7sNjBE3Hbn2braQycJrt7pPsLQsUgOAxZBQa7G1Ui+un5TbZSg+gyZjlSRVeyVGoQ/D3sBcMKPq46wBSI6lItYePB5jt8I6HS4UipQSJABIgAETg/AiRUzo8b3UUETiegofcRrqGPxaDysPpcbWRIDQwMwRN18GQdzw3yoYGztajkBvmQkJobZHk1qHaGBDF8ZWAtPB+UixuVla2wNQqbotr8wD5v5SpP5ZIJHy7v9/o7P3zQh/Enot8geQx2p8HuMIkuq+D9vNnkK451i4rTLDmMNq9RKE0Vi42Cv4dt7N9Klu/YeySKjlsJoXD6wM/md311j4Lj7amC8QAAIABJREFUWe9yi+iyCB6T6DEJb/3v83PE52faRn3wxz/N/uMLczKen5f97Ixez0yXnp01cd52OQYKQ4OFxjUGcQZxVSeMZ9BEg8YQjjtwTQVN5qrC9ZPAZeDRg/VNvx81yyr4LFkTzFluz9trQG4FjaHs0ONrQNWAaQn5FUcpJQPTVHTwigKXUVklrBZ6OI6ehrkteQLTDTfYiNqmmXRh045s0B205KZmxfanubqpym22e57yrEhYVI4fj6BFRXR0sRckS5O69fHd+qjzrofKbntwxvV9i7sL+d3++Gaa4EiV/KlZfrPdmffGh/UtxxlXT+ZxaOeJZzMdX30NCZWv5kPfEgEiQASIwEUjQELloqGmB13uBGRUKVFgcQiDrB2W4Y0j2jN74kOC7HEMkU+oFOWUf9dXHOQE+aC6eE5IHhpUh9ew4dUYbf9kDVpXRgSUv4Ra5kRhXRwW1exzV65/dfbGnz7isWQWpmb5krJcZqnILBVZRNytgjvNhvmIz2ZPs7nMkjPV7jFIxUb0Phr3u7xJG/dhYEkidENGkYDOR+ex6UIF48NH+VboQsVrEj0/kl45DBrjEY1BFGJxiEd0E4cMcBxJAvB4GFpBi4IaAUXfmcow1KQFtYTCdKEBXOVMlVUlmghUARVUzmOg7toPv31+fmrmJIPdbcwqGTdnj6JFFabGUVwowJuBRRl6pEEUtU4E1MOghqMahHW7jIoqoM2pDFgE1GYsnKOi3xnTQGVMhhMcWhg/ARBj6EXWztaeUPH+S6icSAgVZ3fb6O5/cOYWLjnAwhqwMChHAbbv5S+4ll6dNdYguU2SJy1z/LVZ490fbI616SdUjhdiI6FyIahSm0SACBABInAeBEionAc0uoUItEdAj6PQF7dMw6U0i6mw8jgrqA2PqNZy9HD5PIxXOTvvryDPQbsKfuYGIK8GBtWqeTWQW42aJzcQLdqnTlhXn/XKnK5ioUHwpUpuk+iw6iXnLYLHInjNgtckuYwS2lXOSqgIHoPkSbF7zGLRr5/0j5u+bn+LgkYitFGcTEJ88md74/+qcwl/qdOFiug6hEYJrB7JIQY8hs9hKmgMRR9TQFEVkA8dDZfM2/p88dYXSre/MWX1Z/VHW6OwfOuBV8rW9Xttfq+X333KWTlzRV39Md2kxaKM89qj8Kq/YljRitsfcWPghzCuu2289OK7oyavf2ni6oot9TIoUVA9H2x5sWTri6Xr/zxx9UcbQwdPqG8v3f3o2HLbix88Vbhka+C4LgXwo0WBzTWHSxZVj3B83PeVBX3+7+2BYxb+ffrWeRv3ho60qokIlfZ0gy5UlKYTmm5R8VoFt9nejlBJl4qsv5+WM37liVgY3dEwm1or55EogwVbDv37wFIrGqAmJts9wsjZoSalTce198Svmoaz+46EytlxoquIABEgAkTgghMgoXLBEdMDviME2rJJtaWcQm8k4FoMoCEG8w5pf66NDAqxwUEYWId6Y0QVVqMfFIKhQXVoQEvk+8oJopfXkBDuebrH16CQfk0ARlTDyIAyJKANrMUbn9qu9irbcPvwaWmSwyQVpEouo+izCJ50wWHGNF8+s4j5vvTAD4dJOl2oGEWfUfKZpcI0wWmxFRtFtyF7LDoXiQU39sl/qnDp6s+OhXEgDLjG0f0KnaBwNY4/zmc7KVT4KO8qi+jWXb/cPbI9jRiaHgcMadcDRhKPSGTT0r2qOIM9deE/jJyeklmSIjh/2Ldg5qrgS29tu/WBCRZhTIrkThH9XTOcN2YXPDy6vPo4AGtmEN9WF0374xsG0ZMuepPFyUYx3yj6UiRXUlZpmuAYPW2Nhs5j7Hd5M1IEn1Eo6nbP6y9OXvfytG039HF0sRclZRX/oM/YD9bU6h5myuHm6Ji3t/xyYKlVKkgV3AbRbbIVmgVnWobv2l5u+yuLFm9pBFnPOXYGm4RwbWqO2f70nll0WW0+c5brTItKij3fJLoHFS49EYujO5meYQzv1dSICsXvr7q2jyMpe2KK3ddDdMzd1IK50NC97YzndcQJEiodQZHaIAJEgAgQgQ4gQEKlAyBSE0TgywgwTJrLWzjsioG3QcsJKU/vwmzFjzSwoUF11G5tWA0/mZJYT1KsZygeghmKcR+G4fht5wcHWU6QDatSH61ouOO5t25+qKBHrwKT6DRLTtO/Ks2fZUSKx4yxKy6zlG/E3ZMqTLIKhXePKJu/cd/RmKrq8Rnnaz5pB0abUAF1lHe1LlTcJsl1fdab+zGpbxw09KhimFAYw9O1RHotTQOmMqZU7T129zOzjJmTjNn5PfoXPzF60RV9phvEEoPkTbJ7u2T5U1D5OMxZvkf/Pk9RGePyp7XHDRnj0myF3e5xJ0vFXaVxFrHYLBYYpKKrxILRM1bpppLob4fNSbUXG23OKzPGPfjmyhvv95oFT7JUlGr3Zz47vbohAnK8JQr/nLH5ut4uk+hLFvxGyWsSCg1CYSomHnCYJXeS5P9NTsna7fW6q9jpY9eFCjS1tNpeeN8sObDUZpbjTKGSKnqtYn5O4bJwJJHmGNMly3qcvwoQOHj4FwMmJ9tLzKLHkpk/smSbriEjF0anAAmV02eRficCRIAIEIFviQAJlW8JPD32u0AAHZl0ewHHXE0tKnx0QvtTLR8akAcHlaEBbXgNH6Irk4QsyUtUfqyB4VifHjMaj6zmw2r44BB/vJ4/EVKHbGuVvB/f/FD+Lb3H/OjeMT165p+fULGKjnShwCC5u2S5U+2OdNFxQ8/Sl90Vdc2YbRe0CFo5UC502CS1K1Ru7PlKZc2+zaG6DcGjH9cd2BDauyF46OPQiY9DJ3Y0HA0rcQ0iMoR3HNj/22ffMWROTc6a0CWruHum56qskh8/POXfBpXd/GBhWq/xSXZnclZJqq206/++sm7XMcah4UDzQ3+de++LM37Ux5uc5U8Tx1oF338OmfToK9MHv/zOnJXbNUwRFv/fYbPNoi9ddFswKXNJmui87r78W/p7ftLP9VpxpSproEQ3BeUbHixLEUtNku8KYULGiLKiuZ9OXVo3aMz73+89Pk10WgWvQfQML14fDrecyesbCBUMeQKGdWtinGW/+L5RchoET5rk/uNzc/SZiWPjF2AjoXIBoFKTRIAIEAEicD4ESKicDzW6hwicLQFMMKUBk2VQFCxCCDUxmNoUG1WvYnh9AAaG2OAQy0lEpOifQ7HiCs8NskG1bECtNqhWGxZgQ7dHHnpvz50vvPWD/m/e0nvMT7JH/6T3mGuzz1OomDHpljM1y5Ei+a/vPeWxV+dV7NgjY1z7yaS8mFErzs/b0+sMOu0KFUPGO+mSI91WaBUmm+3erqLjCqGom1TUXZwgjZxY06gwvfD9rsYDdz89x5xRZsge0yXLef19k53vLKlrjrcwqG5ofnrMvCsyCw3CRIPot9oKRk9bo3upaa0AO5tYxqh3k9H0MTZd8k14d3ecg6JXUUEJCcr/Dnvbip5yzi5ZRZasScILc2avrak5CJ/WqaEDrQwUTYstWh8Qnp35q6fn3zlk2kOvvVvVxLFqC1OOh+PDC8uN9pKumCTN9/u/fLj/8KEzxo2+Y8DOy6Ki5zcDpnHdS23Qm8vTxHy054iuuwZO0lOQKSRUzgROZ4gAESACROByIkBC5XKaTRpL5yKQKGSeyISrYUgBhqUrHE0rm1phXGNLTm0ktxprOw4N6AmIQ3xQLXqCDQ3w3ID2ZB17op4NDbCB5fvu/tv7P7+/4Jbeo2+6740b73vj5j5v/KT3G9dlTzg3i4rUlv7LJBYbbaXptgn/neubtGTXvuMyMFmPQWlL3PuvuiIdRLRdoZIuTLNIE8xiodlWYhEdVtFhFD1JWf6kbO/dT0+q3t+MubZ4pKb+2B+fmmXNKLZkjTFJbw4Yv7Q5HmcoAWKgyfuOw4/7OVMln0l0mOyu3PwP9dzFMQAWOnjsnmfnpkjubuI4q724aO5mbBDdzPSqLqD+bvjbZsmdKrlSsh03P+heXd3CMbtXGLjCdCJxUE5E46H9rXvqjn1S1RhqOAzokBbTACfxb5PXp2RPSbe5u9kK/ufpt+sOHD+T1vkLFT3XGmgYqM9AHeFYly7mmySvWXLf+qhPzzCGiZQvxEYWlQtBldokAkSACBCB8yBAQuU8oNEtROBsCSQW/miZUFEIRPVwdCyBzmUlxlaEWkdtaHxqj/pMFeRVMT2YnudUs2E1/Kkq9twe/syGVlvhspsfLfpRnzd/kvX6rb3fuPne0T/qM/rmPm/8+N43vtfzPIWKRXBcZRv9om9F/XFVVsNcjWEhR33Zy7FaIvp/daDfV6IxzAD8xRiVJHtZ0r35Sb3GJ9uLUrJHJ2Xnm23OtHtKDJlTM4bOqa3HXMWqCoG6lrufLcPMZqKzm1DkfP9TWcXQe9QAXG0B+MMLM5KznBapwGT3PvnmIj1HGUbl1x049IdR7xtE95XiGHPWpKK5G7AgPRZFwVQHDJT/Gf62UXKlCj6T4Oz756moP9QY8BbgEYZZiPV0AkwGTQa5GbR4JAZ76porN9QVz9s+8LV3b+nvSLZ5uopFJqHoNyNnNTS2nvlafAOhondAUzh2mA2ZsNosFmA4/v/H3n2ARXkk/gPfJBpNciW/3CXn3eUSTbErImUpGo1Ks0ZjTzMxibEgsIWqscZeEVAB6SAdBOy9l9gLWFBUuii9bXnf9/+f94V1gZVFYZdl+fLMecvuu+8785k1z36dd2ZstvT63o8NKuTWME38IKhoQhXnhAAEIACBVxBAUHkFNLwFAk0TYBfbpRi6ms0pJAlIGbKGFvnmS7bvqJYzFx8+mx9xfEzA6cmJad8czvnu+JNvj+RMSUm3Czlv4hH1ycQ1n43+45Mxf3w0fsV/J678ePyKT8eu6D5mxedjV3wybsX7Y1QElU5kneItZKJ8zfYp3p1tfLiBl7dsvN+29npvtNdwcUzClZwSbt46uxguu0EK+fZLJtDXbNNRwWWBpjVVzVEqR1T+PWLthsRbW5NS/RPSdiRe374r1W/XFe+Ui2v3pEWfSi0pL2boUhkju/uoxEIY8Jqt9xu2gX+z9vVNuU7LCSIJPnJJNc3YinZ2tN3yju2mTtY+P6w4xLCjLQzNZOQWDnFKftPa8z3rlR1HBW2I+1NOyNkltWgZxcjN50a/abuls9X2d0Z4/7QsikxckTEVLAAXMBipTCaT3MurWJt8f4hz4ntfb+1ovbHj8A2drL07Wvt2ICutbfqL9XreSD/j+XE52SUNFZoYVDqSBLL+1w3HyDYu3PJqNSMqcjbf0uPckjpab3nLelMn643DRTHsrV/s6mANL9nsZxBUmk2IE0AAAhCAQMsIIKi0jCPOAoFXFsgvkYTtvThJtK3v5NXdJ2/sOWVjt3HLPvnqj0/Hrfh03KpPx638pKaQcKJcPlA1ovImub9ry9s2nmRfRRvvzjZb37b26WSz6U27ze9Ye5r8GLY28uL9ArKbojZ/VAaV98dsrayiGLKDI7uhPDtCwpCd6MnaXzWjOhRz9/EzC8fYd6w2d7bZ+padp9+eG+ym9GzekDPVTJWtKKoTWY55y1+sN3675lDNF32GSc8t+9JxVyebje/arHx9dMiG2Ms0LasgV5EytFzOMGbzdnYiK4Zt6Wy78bvlxxRvZGiqih13YaTM2cycUS5Jf7X25ZZ7ftN6Syerze+O3Nzzh6DeP4S+bbvlLRuv1212mNnHPMotbEjaxKDS2WZtJ9vNs9eeKa2SshPlZdzdd+z6yPK0/EqTmds6WO3oZL25g81GZ+99NXcVcuN0Da/avGcQVJrnh3dDAAIQgECLCSCotBglTgSBVxSgKamMvpNVtjb0hMn0Fd2+Wv7R+JWfkJSy8tOxqz4bu/Lzscs/H7dEOaJwj1UGlXestr5j5fO2tTe7+rBnJ9vNf7He8vYI73+O3vrz5hNnM0okMukLdlF/xeo35W0qg8o/x/qUV8vI8sR0OXsjVzUZ0SBjOuwWKmTsSSpnZK8cVB7kFg91THzN1uevtus6j/TfEnOeYmTs7Vk0d0ue5dywd6w3qwgqFNl0kSyDIGdmLI/5m83aN238O1tv/3C01y+rTgQcyNx/o+BcZsmS4LPvjtrS2W7NW9abh/wW/zDn1W/9ep1stbll9roT5VXl7PrM1QxFM3Qlw1RUM4z/nrSPxq3vbOvdwdbvbdv1CWdzuNvb2NUO2FzTlD5o8jEIKk2mwoEQgAAEIKBZAQQVzfri7BBQL0A2Eqli5FIJxZy9Uzhq3oYe4xd+Mm5Ft3Gru41b+8m41Z+OW/HZuGVNDipeb5EFc7d3tN3a0da7k61nZxuf3tO2x53MlFAUQxWTa7XgDinqm0eOUBlUOn8dkCcn83ZIOqHIPVc1N1zJ2EdyslmInH71EZWHuc+GOcbz7PzettvwN1vvLdEXGKqSndghJVu0MIzl3HCy5WXDERV2806GKSuWMP+x2dLBduubtqv/PmRRyJ6H7JJfeYz8GSOV+USfe3d0EG/kyr9Yrx42K+Huk1dfnvh1220d7DbPXXeoopKkHbL9JbkFTF7JyM88lg3+LeKtEZs72G1+3cbX7LfQu/lkcg57E2HLpxSGwT4qTftM4ygIQAACENC8AIKK5o1xBQg0KsB+2aTJV09KKpUzBeXMtuij1nN9eo5f2m3cyo/Hrf143JqPx61qWlDx7mS7saOd1+u2ZHOPv9ls7P1NgKvP2XtFjISpIP9Cz87pb8kdUhptmuJFlUHl36NX5TwtLyqTV5SWSotkJeUVzyor8iVlBVWVzyoqK6qraLqaoStfeUQlI6fA2jGKN3JHZ5sNf7f2XBh8sbpaVkEGUyoZRsLe+hXZ2cZHRVChaXZHyNL0goq/D/N+3c7/DTvfd6wWnH3yrJopJZvMSJnCImbOqsMdrXfyRm/qbLt28JyY1GdPFe1VPGjirV/vWHt1sl33/fK9aY+L0p8wd55Wp2bJT9wu3rz32sBffTtZbXnDxvcNO88Pxm7aGH2lpJqdS0ST+TaaSCoYUVF0Hx5AAAIQgEDrCiCotK4/rg4Bbuo0O+pASxmZhJHTEilz4V7BQp+kgZMWfT7uj27jVnf9ak2Tg4pnR1vPt+w2fjBq5Q/LEvZfKqyupCm6UsZUksnX3L7n3J1NWrRXGVQ62Pl/syR64rIDU5el/PD7/inLd01btmv6sl3Tlu75blFiYFJqBRltkb9yUHlcUDjeOYo30u8d2w1/sdrSf1bI0qCzqyOvZOeV0AxZ29dsXmQnMiG+wRwVRkbGnOjK/Grmn6PWvWm77e0R/u996emx/dztgooCWfnNvMJlAYe7fu3bwSawo82mN222WM6LuvvkWUPRJgaVvw/f9IbNxm5T/UYLAuxEKbbOYcPtg/v/sPWv1is72WzuaOPVydb7LWvPH5ZGZ+aXS9ntZRhaUjOTp+FVm/cMgkrz/PBuCEAAAhBoMQEElRajxIkg8IoC5DsxeWvNnHIZzcgpRlZeWEkdvvFszHzfz8cs/Yxd5qteVlE5R+Vtq+1vjfDs/o1f4KmneWQFqzIJVSWVs2tIyeTsSAJFvj1r90dlUHnNNuIfIxa/Zr39DZttfx3u96btpk42Xh1sfF+zDXjTasNcr2NPqmmGLnrloFIsoZw8j/Pstv3FZt3b1t6vj/J6a9TW98b7JpzMYFfNoi3mhnWy8W4YVAgWmcwuK2cYqwXRb1t5drTzfN1m1T/GbOgxNaTv9wkfT4346yjvd8ZsfWfkxr+NWN/ZavuguZFZ2a9+69e7wzbzRm7n2fp1stn0uk3UG3ZbO9tu6mjt3WFESCcb37dsVr89fIWt2+m0JxQjLafkUm4KDYKKdj/FuBoEIAABCGhbAEFF2+K4HgTUCnDTydmJGtKn5dK1IUfNv9/QfeyKT8cu7Tp+adfxyz4dt6LHqHUfjPR6w9bnL9Zb/j58419HbOpk4/n6SO//TFw/Z0Pyoyfs9pIUu9+G2utp/gCKYapoUsReRzpae/Hsgt6w8e5svbFeedN68+s2W3m2OzpabZ7jdapAwjCysrRHz4wcEjpZbSEZZtQ2n93XSY4j4U7OUBVVNGMljulg4/2GzbY3bH2+X7GXzEIhM9EZhpIfuVLA/zHwbRu/1+z8eSO9eHbB74zyWRh0UkIzUpoZOjf4NWvfN2x9O9ls+WF5EllpiyJjTmxmJBeQUrIDN/N7feP7jo3Pm9Zeb9h6vT5ySweb9X+1WWvw/dZ5m/f/b1I4b6R/B9utQ2dHpj5h409dTAm7wXx2MWMrjObZ+vNsAzrZetlvOSORkO4tKCn5aumxziO83qqleMt6E1fetPHsYLf1jZHb3x3rY/Dt5vURJ0pVnL7uxVroN4yotBAkTgMBCEAAAs0VQFBpriDeDwGNCHD/Wk7LpHJZiZw5evXxnFW7DCet+nTMmo/HbfzoqzUfT1j87zFL/mK9rqPtdp5t4Bu22/5v9Aa7BbtiT9x7Vs2QQRNKxtDk/zUxjeFlm8zusCil5Ixf9Ck7QdgwUcxIQeBQUcJQUaJysRLE2DpF2zjFjXYI94m+UlLBMDJZTk7p3E3HxziE2jlGDBfG7jl5j6HIsl0kUVDVMppx9tlvLQizEoSNEIatCjvOjhdJyP4j8vIKOX3wWtas1buGzgkz/Da033f+Q+bu2LDzuExOFkQWbEgaLogc4RRuLQxZE3qYhaqWsmcmj8kwUEWFjNp38cmMVfuMfw74dEpgt0khhjMjpizdHXu58PC17G8XJlgJd9oJwoVrkzKfqRpRoWS0XFJcInPzTBkhiBoujBwl2LEx7pxMJmEopri8cFHwuZGCgC8bUNiK4id77Jqz7oh30u3rWZJKsmazilXFXrYjmnI8gkpTlHAMBCAAAQhoQQBBRQvIuAQEXl6g5ps4TVFSmpIwlDSrrDLm+PUJjtt6jF3Rddz6/41f+97YDW/Y+vBG7njddmv/Gb5bEy7lFJQz3OrDbELh9uLQhaDCjn9UMzJJQWHlnXzq9hP5g7yyzOySeuVBXsm9/NL0/JKM3KKC4lKZvJKhy2RVZfeeVd3Py0/Pe3Ijr6y0tJih5DVNI8sZU4+fSW/nSu7mVafmy7KK2A0smWopQ9MShpYzckpWXFWZ+vjZ2bTCM7efXX5YnltCnmdk8kdPq2/lyW/nSlPzZdlFFex+nGSogx1SYQOevIyhyig5VVBedu3B45M3so5fy714L6+golTCVJRUVGbkVd/OldzJkWQWVFfL2Ruy6nY1TWpQRUul2c8kaU/ou08kD/JKM8skDFXFSBmZvOJRofxeXlFmdjFHkZVTkpVTmpVT+uhJSU5JebmUHeLhVlOWaKknEVTq9iF+gwAEIACBVhNAUGk1elwYAo0KyLlN/ci4AflWTjPyChkteVRYuiY4xehr9+62S963XdvJevU/bBb/tiYpNZvMwmekxex3cDLawI6lcDeRaekLbiPN4fa750Z3aiIYU80OWXADF3X/5GpPtoIkbWIX62XIWsU0WVOYbRhpUU0DaTlpMll5mb3di7xCHnFLHNdAkPdVMEwJw1SxlOzlKPaNdO1mJGT8hKz1Re6Wo8iui7Ubv7PnlXPXY/uElpFJRKRmUnZpZdIOigxiqXBmbyTjqsRVWM4w1RTXcu5WLjJ0Vk0WjOamKtX+SZ6oeVzFVr5SznAZqhHmlnkJQaVlHHEWCEAAAhBotgCCSrMJcQIIaECAYsjW6dx3evL9l2bnOsgYGSWtYqQFEtnJG492nU4/cCkr65mUfEunGAnN7UlCvmHXhgFyyxX7Zg1U8SVPWZudaoIXQ77sk3oqF/abPrfbo5wm0UQhQHHDHWzM4PIA9y2erQQJKlxWqYkA3BFypqxmWjy31hl5VsLQZHZITSwgS0KzW0ySFEROxb2R3WSFvXuOXQdYWpNIyJurGYmE3S+TPQVNkk/NG6trM0kdFy6h1faBosXsfWty0lNsqlJBwd76V5NQubdpa4oK9lGp04P4BQIQgAAEWlEAQaUV8XFpCLxYoOZf0ylubEBGvolL5LSUomi5nHy5lVEyOcXOtKBkjFzCUBKakpPEwp2SHX+o/d794qto85XaMQOSndhhDHYYgR044IYPakYQlIeDau55Yjc35JomoxiyeBk7lEEGP7gMULPqMjsKwl6HIpmCtWDHOth3UIqNLms2fCQ+ZEp+bVwgv9Hs+AYZISGX4FIUewD35tp4RN7EPq7ixkLIoEdNyqlryh5U2ymk4dxR7LiNvJrsdSmvWfFAgVDzgGJokoZq7wHkJuXUPblmfsOIimZccVYIQAACEHhpAQSVlybDGyCgRQHuizH31VWm+HrPftuteYn9ds0+5sIJqZziJS3W9CUuRb6rq/xWz52Dq33N+VQdxz5Xc5SiqcpPsqevGSRhB0W4pQkUF62NROw1at/IvUqGQGor8DxascjKropqKcZRFA+aBMFdlBsAeuE7FTUjVavNYk06fbMOQlBpFh/eDAEIQAACLSeAoNJyljgTBCAAgbYvgKDS9vsQLYAABCCgJwIIKnrSkWgGBCAAgRYRQFBpEUacBAIQgAAEmi+AoNJ8Q5yhPQocxw8E9FTg+vXr7fGvNNoMAQhAAAK6J4Cgont9ghpBAAIQgAAEIAABCECg3QsgqLT7jwAAIAABCEAAAhCAAAQgoHsCCCq61yeoEQQgAAEIQAACEIAABNq9AIJKu/8IAAACEIAABCAAAQhAAAK6J4Cgont9ghpBAAIQgAAEIAABCECg3QsgqLT7jwAAIAABCEAAAhCAAAQgoHsCCCq61yeoEQQgAAEIQAACEIAABNq9AIJKu/8IAAACEIAABCAAAQhAAAK6J4Cgont9ghpBAAIQgAAEIAABCECg3QsgqLT7jwAAIAABCEAAAhCAAAQgoHsCCCq61yeoEQQgAAEIQAACEIAABNq9AIJKu/8IAAACEIAABCAAAQhAAAJxLLUXAAAgAElEQVS6J4Cgont9ghpBAAIQgAAEIAABCECg3QsgqLT7jwAAIAABCEAAAhCAAAQgoHsCCCq61yeoEQQgAAEIQAACEIAABNq9AIJKu/8IAAACbVcg03/Ch12GeT7QXAtyAyZ0+XCY1z3NXQFnhgAEIAABCEBAtQCCimoXPAsBvRaoCh/P4/F43Ramvkozq4pyc3OLqpTfuns6j8f7brfyUy3/uOF1760z5PG6iM+01LWqCnJzC+o07MEGcgXh2Za6As4DAQhAAAIQgEBTBRBUmiqF4yCgPwJl4RNITuHxOs99le/4SSSVTE9S9tBKUFFxXeU6NP/xg3V9eby+6zQ4QNP8OuIMEIAABCAAgXYjgKDSbroaDYVArUCupzmPZ74uYG5nXue5R2qfbfr/qwgMCCpN58OREIAABCAAAQg0SQBBpUlMOAgCeiSQ62XG440Pr2JSPbo2vF9LReR4sKYXj9drHZmnwY45cKMx3J81t3vVvKvqXtxM43e5V7qMX3emqA4b+2qXzuzLnbsYzox+oHSXVeNneMF1760jNVujNARSdMbrO8N3O7DX6PCu4XdeZwrq1KHorNf02hryOncbtnB3kYw9gE1fXM3ZP7n2Mkptrz1PwZl147txreC922vCmjM1Z2Bfrzk+rejMmgk1B3U2nBmfW/tm/D8EIAABCEAAAk0VQFBpqhSOg4CeCNzw6MbjTYggGSF1IXkYXqbcssaDSlXqgbg4sTmPxzMXx8VFx8X9yX0FZ9/V19CwQxdzJ6+46DivX3qRO8tmH35+6jQyn+RdK4+4Px/kZlyOWzjsXR7PcI1ikkzjZ3jBdesFlbLdM9/l8Tr0munD1s1nZq8OPN67c89wUYRhmJNz31XUITd1N1uHbm6XSSUzL8dFe03vwuN1me4VHRcXfTiVZakfVO55mXfg8bqM9AjZffjI7vCFI7vweDwzL0VUYo/vYmj8Lq/n9HUhcXEhHuwR5l6ZzyXwCAIQgAAEIACBpgggqDRFCcdAQH8ELrt14XWee5j77p7pZc7jjWRDS20LGw8q7FEvuvWLZ7gurfY0DDtuw5tZO7+enb7f1eOyIjMwzBlxF6WYxF634RmUZ9E0vG7doMLmrnfnnlTUgWHYt8zcU/PMGfvOPN5IpWBWFT6Gx+viwSaV2vGiunNU6gYVbhGCkeFKI0VFESN5tcGPnIKMPvHe/W7380OOzO3M4w3zxaCKUr/gIQQgAAEIQKAJAggqTUDCIRDQGwHZ4bmdeV24MQTSqFz/L8mAgNKX6GYElbqrfu3+jky5rw0qu2fyeN3Eh3OVf0ImkOn8NblCxXXrnqEmddSZxF8nqDxYZ6ycOlT0We6fcXEHUpXuN2PqXkLFZPq6QYW0gjcmXPkMjCyOrC0wLY67Xt3j2efqVFJFrfAUBCAAAQhAAAIqBRBUVLLgSQjoqQA7wjByKXtnFLnBKc6f3KOlfGOSisBQ/8t3w5ENRsW76mQA9su60gyQ5w9rg4e6MzBqgwp7htrA8KL+q0rbvc5p+rCeXbp82KVmKsvzNKUuqLCtUIp53EXqvKu+FcMwCCov6gw8DwEIQAACEGhUAEGlUR68CAG9EqjZPuV5Sqh9pLShiorAUP/L9ysElQwyQaXOrPf6sCquWyfqtERQuUzm5PC6DBJ67bn8gB3bCZ+kPOxTJ3JwFazTdi5yrFDMq6k5RHlR4zrHc68jqNTva/wOAQhAAAIQaJIAgkqTmHAQBPRBINd/mIpNHtn08nyehorAUP/L9ysEFYa9aarecAeZvx53uWaWuYrrvmRQUXXrV9ryXor5IWXhI+vN72da5NYvtua1TatvhREVffibgzZAAAIQgEDrCCCotI47rgoB7Quw26d087hR/8pVZDq4YkOVM2Tqt/KslaLd08mCwzXL9ZI3s9/+1U7BrxczDs9mJ7I/n2POsPVRnLYJQaXhdesOVjScTM/Ghtomc6M6yuMhNU1TTKRh4qbVn+VSN3g0cTK9olEsdd1K1tfH7xCAAAQgAAEIvEAAQeUFMHgaAvomwO6a0tWj3n1LpJV1hxrO2JNc0m3SuvDo8HVOI3t1eNfQuEudoMJtbG88N7ze8sSNTaZnmEz/YdzCvtGXH+SmHvaZ2a3O6lhNCCoNr1svA3DLE/O6TVgTHhcdF86uPqy0ABcrwDOcuyc1N+Pybp+ZvTp369ZV+dYvbr3mdyesaebyxAgq+vaXB+2BAAQgAIFWEUBQaRV2XBQCWhdgt09pMBGcqwa79pdiQ5WqVK/aDQ07D5judbao7qgCeUvREaEht+Vh3Q0flVtVb0SFvFSw2+PL2q0SO3cb5hSX+3y14iYElYbXrRdUSM2UNnzs3K3eboxMpmI/ys7dvhTG3atim/Z8RIWRpfqPJzujKIJZw7YzTdnwkWyOWfvTsJK1r+D/IQABCEAAAhBoRABBpREcvAQBCEAAAhCAAAQgAAEItI4AgkrruOOqEIAABCAAAQhAAAIQgEAjAggqjeDgJQhAAAIQgAAEIAABCECgdQQQVFrHHVeFAAQgAAEIQAACEIAABBoRQFBpBAcvQQACEIAABCAAAQhAAAKtI4Cg0jruuCoEIAABCEAAAhCAAAQg0IgAgkojOHgJAhCAAAQgAAEIQAACEGgdAQSV1nHHVSEAAQhAAAIQgAAEIACBRgQQVBrBwUsQgAAEIAABCEAAAhCAQOsIIKi0jjuuCgEIQAACEIAABCAAAQg0IoCg0ggOXoIABHROICMjQ+fqhApBAAIQgAAEIKABAQQVDaDilBCAgMYEunbtGhgYqLHT48QQgAAEIAABCOiKAIKKrvQE6gEBCKgVOHr0KI/HGzp0qNojcQAEIAABCEAAAm1dAEGlrfcg6g+BdiTQtWtXHvtz9OjRdtRsNBUCEIAABCDQLgUQVNplt6PREGiDAtxwChdUMKjSBjsQVYYABCAAAQi8nACCyst54WgIQKC1BBTDKVxWwaz61uoIXBcCEIAABCCgHQEEFe044yoQgECzBJSHUzCo0ixKvBkCEIAABCDQRgQQVNpIR6GaEGjfAkfZn8WLF/N4vK5du3K/tm8StB4CEIAABCCg5wIIKnrewWgeBPRJIDAwkAsq+tQotAUCEIAABCAAAZUCCCoqWfAkBCCgiwIIKrrYK6gTBCAAAQhAQDMCCCqaccVZIQABDQggqGgAFaeEAAQgAAEI6KgAgoqOdgyqBQEINBRAUGlogmcgAAEIQAAC+iqAoKKvPYt2QUAPBRBU9LBT0SQIQAACEIDACwQQVF4Ag6chAAHdE0BQ0b0+QY0gAAEIQAACmhJAUNGULM4LAQi0uACCSouT4oQQgAAEIAABnRVAUNHZrkHFIACB+gKKfVTqv4DfIQABCEAAAhDQOwEEFb3rUjQIAvorgKCiv32LlkEAAhCAAATqCyCo1BfB7xCAgM4KIKjobNegYhCAAAQgAIEWF0BQaXFSnBACENCUAIKKpmRxXghAAAIQgIDuCSCo6F6foEYQgMALBLigMnTo0Be8jqchAAEIQAACENAfAQQV/elLtAQCei+AoKL3XYwGQgACEIAABBQCCCoKCjyAAAR0XQBBRdd7CPWDAAQgAAEItJwAgkrLWeJMEICAhgUQVDQMjNNDAAIQgAAEdEgAQUWHOgNVgQAEGhdAUGncB69CAAIQgAAE9EkAQUWfehNtgYCeCyCo6HkHo3kQgAAEIAABJQEEFSUMPIQABHRbAEFFt/sHtYMABCAAAQi0pACCSktq4lwQgIBGBRBUNMqLk0MAAhCAAAR0SgBBRae6A5WBAAQaE0BQaUwHr0EAAhCAAAT0SwBBRb/6E62BgF4LIKjodfeicRCAAAQgAIE6AggqdTjwCwQgoMsCCCq63DuoGwQgAAEIQKBlBRBUWtYTZ4MABDQogKCiQVycGgIQgAAEIKBjAggqOtYhqA4EIPBiAQSVF9vgFQhAAAIQgIC+CSCo6FuPoj0Q0GMBBBU97lw0DQIQgAAEIFBPAEGlHgh+hQAEdFcAQUV3+wY1gwAEIAABCLS0AIJKS4vifBCAgMYEEFQ0RosTQwACEIAABHROAEFF57oEFYIABF4kgKDyIhk8DwEIQAACENA/AQQV/etTtAgCeiuAoKK3XYuGQQACEIAABBoIIKg0IMETEICArgogqOhqz6BeEIAABCAAgZYXQFBpeVOcEQIQ0JAAgoqGYHFaCEAAAhCAgA4KIKjoYKegShCAgGoBBBXVLngWAhCAAAQgoI8CCCr62KtoEwT0VABBRU87Fs2CAAQgAAEIqBBAUFGBgqcgAAHdFEBQ0c1+Qa0gAAEIQAACmhBAUNGEKs4JAQhoRABBRSOsOCkEIAABCEBAJwUQVHSyW1ApCEBAlQCCiioVPAcBCEAAAhDQTwEEFf3sV7QKAnopgKCil92KRkEAAhCAAARUCiCoqGTBkxCAgC4KzJgxg8fjDR06VBcrhzpBAAIQgAAEINCiAggqLcqJk0EAApoUQFDRpC7ODQEIQAACENAtAQQV3eoP1AYCEGhEAEGlERy8BAEIQAACENAzAQQVPetQNAcC+izABZUZM2bocyPRNghAAAIQgAAEWAEEFXwQIACBNiOAoNJmugoVhQAEIAABCDRbAEGl2YQ4AQQgoC0BBBVtSeM6EIAABCAAgdYXQFBp/T5ADSAAgSYKIKg0EQqHQQACEIAABPRAAEFFDzoRTYBAexFAUGkvPY12QgACEIAABBgGQQWfAghAoM0IIKi0ma5CRSEAAQhAAALNFkBQaTYhTgABCGhLAEFFW9K4DgQgAAEIQKD1BRBUWr8PUAMIQKCJAggqTYTCYRCAAAQgAAE9EEBQ0YNORBMg0F4EEFTaS0+jnRCAAAQgAAHMUcFnAAIQaEMCCCptqLNQVQhAAAIQgEAzBTCi0kxAvB0CENCeAIKK9qxxJQhAAAIQgEBrCyCotHYP4PoQgECTBRBUmkyFAyEAAQhAAAJtXgBBpc13IRoAgfYjgKDSfvoaLYUABCAAAQggqOAzAAEItBkBBJU201WoKAQgAAEIQKDZAggqzSbECSAAAW0JIKhoSxrXgQAEIAABCLS+AIJK6/cBagABCDRRAEGliVA4DAIQgAAEIKAHAggqetCJaAIE2osAgkp76Wm0EwIQgAAEIIB9VPAZgAAE2pAAgkob6ixUFQIQgAAEINBMAYyoNBMQb4cABLQngKCiPWtcCQIQgAAEINDaAggqrd0DuD4EINBkAQSVJlPhQAhAAAIQgECbF0BQafNdiAZAoP0IIKi0n75GSyEAAQhAAAIIKvgMQAACbUYAQaXNdBUqCgEIQAACEGi2AIJKswlxAghAQFsCCCraksZ1IAABCEAAAq0vgKDS+n2AGkAAAk0UQFBpIhQOgwAEIAABCOiBAIKKHnQimgCB9iKAoNJeehrthAAEIAABCGAfFXwGIACBNiSAoNKGOgtVhQAEIAABCDRTACMqzQTE2yEAAe0JDB06lMfjzZgxQ3uXxJUgAAEIQAACEGglAQSVVoLHZSEAgZcXQFB5eTO8AwIQgAAEINBWBRBU2mrPod4QaIcCCCrtsNPRZAhAAAIQaLcCCCrttuvRcAi0PQEuqCxevLjtVR01hgAEIAABCEDgJQUQVF4SDIdDAAKtJ4Cg0nr2uDIEIAABCEBA2wIIKtoWx/UgAAEIQAACEIAABCAAAbUCCCpqiXAABCAAAQhAAAIQgAAEIKBtAQQVbYvjehCAAAQgAAEIQAACEICAWgEEFbVEOAACEIAABCAAAQhAAAIQ0LYAgoq2xXE9CEAAAhCAAAQgAAEIQECtAIKKWiIcAAEIQAACEIAABCAAAQhoWwBBRdviuB4EIAABCEAAAhCAAAQgoFYAQUUtEQ6AAAQgAAEIQAACEIAABLQtgKCibXFcDwIQgAAEIAABCEAAAhBQK4CgopYIB0AAAhCAAAQgAAEIQAAC2hZAUNG2OK4HAQhAAAIQgAAEIAABCKgVQFBRS4QDIAABCEAAAhCAAAQgAAFtCyCoaFsc14MABCAAAQhAAAIQgAAE1AogqKglwgEQgAAEIAABCEAAAhCAgLYFEFS0LY7rQQACEIAABCAAAQhAAAJqBRBU1BLhAAhAAAIQgAAEIAABCEBA2wIIKtoWx/UgAAEIQAACEIAABCAAAbUCCCpqiXAABCAAAQhAAAIQgAAEIKBtAQQVbYvjehCAAAQgAAEIQAACEICAWgEEFbVEOAACEIAABCAAAQhAAAIQ0LYAgoq2xXE9CEAAAhCAAAQgAAEIQECtAIKKWiIcAAEIQAACEIAABCAAAQhoWwBBRdviuB4EIAABCEAAAhCAAAQgoFYAQUUtEQ6AAAQgAAEIQAACEIAABLQtgKCibXFcDwIQgAAEIAABCEAAAhBQK4CgopYIB0AAAhCAAAQgAAEIQAAC2hZAUNG2OK4HAQhAAAIQgAAEIAABCKgVQFBRS4QDIAABCEAAAhCAAAQgAAFtCyCoaFsc14MABCAAAQhAAAIQgAAE1AogqKglwgEQgAAEIAABCEAAAhCAgLYFEFS0LY7rQQACEIAABCAAAQhAAAJqBRBU1BLhAAhAAAIQgAAEIAABCEBA2wIIKtoWx/UgAAEIQAACEIAABCAAAbUCCCpqiXAABCAAAQhAAAIQgAAEIKBtAQQVbYvjehCAAAQgAAEIQAACEICAWgEEFbVEOAACEIAABCAAAQhAAAIQ0LYAgoq2xXE9CEAAAhCAAAQgAAEIQECtAIKKWiIcAAEIQAACEIAABCAAAQhoWwBBRdviuB4EIAABCEAAAhCAAAQgoFYAQUUtEQ6AAAQgAAEIQAACEIAABLQtgKCibXFcDwIQgAAEIAABCEAAAhBQK4CgopYIB0AAAhCAAAQgAAEIQAAC2hZAUNG2OK4HAQhAAAIQgAAEIAABCKgVQFBRS4QDIAABCEAAAhCAAAQgAAFtCyCoaFsc14MABCAAAQhAAAIQgAAE1AogqKglwgEQgAAEIAABCEAAAhCAgLYFEFS0LY7rQQACEIAABCAAAQhAAAJqBRBU1BLhAAhAAAIQgAAEIAABCEBA2wIIKtoWx/UgAAEIQAACEIAABCAAAbUCCCpqiXAABCAAAQhAAAIQgAAEIKBtAQQVbYvjehCAAAQgAAEIQAACEICAWgEEFbVEOAACEIAABCAAAQhAAAIQ0LYAgoq2xXE9CEAAAhCAAAQgAAEIQECtAIKKWiIcAAEIQAACEIAABCAAAQhoWwBBRdviuB4EIAABCEAAAhCAAAQgoFYAQaU+EUVRpcVFOY8fpafdunHpz7NHD8cF7fBd/cd6D/FqF8H6Bc5+a1fEhwaeP3409erlx/fTCwsK5DJZ/bPgdwhAAAIQgAAEIAABCECgGQIIKjV4FWVlV8+fjQ3yX+cmnD9x1LcWBlP6dZvW+8Mf+v1v5oCPfzbs+svAT341+mSW8WezTT6fbdp9lmn3H427/zTI0P4rm7WugoTQwPu305rREXgrBCAAAQhAAAIQgAAEIPBcAEGFSU9L3bjQ5WebLyYafDqxR5dpPT74rve/v+/znxl9P5zR78Mf+9cElZ8HduOCym9sUJlj1mOuec955r3sLXvbW/b52bzPryPMF8+ZeebIQQywPP984REEIAABCEAAAhCAAAReSaBdB5WMe3cdp4z7qnuXCZ/8Y+rn/5ze/f1venzwba8uLxlU+swf1NdhcD/HL/rbD+7/6yADl28nPrp//5W6A2+CAAQgoF7g+PHj6g/CERCAAAQgwApIZfKr9zJ2Hj6zIXa/OCBh9raYH7xjftoaE3X0rJyi2i1SaUXlrG2xk73ipnjFzfCO8Qje5Zty9MS11GqpVHdM2mlQoSjKd+2KcV3fm/zJ/0359L2pn/1jWvdmBpX+jl/0dxpiIBg6wOlLwzmDDfzWrpRKJLrT06gJBCCgNwIIKnrTlW2lIRRFKxeaol9UqHb8ta+t9Gb7qaecop6VlG5OODjBd+/EyAuTYi5Pjr82JeHGlMSbUxJvTo69sjwiRSqTtx+Qei0tLC2b4LNr6q7UKbtuEZD465Njr06MvDDeb/+i0OTH+QW6gNMeg8qjB/d/HTXs64//Pqnb3zURVIRfGoqGDXQcaug0cdTV82dxJ1i9vxj4FQIQaKYAgkozAfH2JgpUVVbfuJJ+4sClvXGnI333RfsfiPE/EOO7L9Z3X7z//njffWFrYre5BW1zDfR1CfR1CVg3Z33YhvALR/6UVOPf6ZpojMM0JVBWWeW/+9iErSmT4q5MTUqdlnKnXpkcf31xWLJOjR5oyuIF5y0sLZvonVCPZVrKnalJaZPjr0/YcdDeN+56+qPWHXRqj0Flzle2X330t4ldNRtURMONxCOMfxvGj96xXVJd/YIPCZ6GAAQg8NICCCovTYY3vIyARCI9tO/SUlHsGsF5L9eb21xv+bneDHS7Fex6M9ztRqT7zRi36wnuN3a5XdvjcX2/+9VD7tf2Cc8tNV8l+Fws+Ewk/Ew012huVkbWy1wTx0KgJQWqJFLP+AMToy81/BaueAZBpbisYqpXrAKk/oPk21MSbk7Ytvvi7fvVkla7Gax9BZWM9LubF7mP/eivX3+spaAiHmE8Z6hRsOf6lvz7h3NBAALtWwBBpX33v6ZaT9P0nTuZm9eniOekrHROXedyZ5Pb3S3ud3zc72x3v+3vfjvQPS3EPS3cPS3KIzXW41aCx60kj1t7PG7udr2yfpi3y+curp+7un3u6sEWp8/tj8Qexp1gmuotnPfFAhRFHb+aOiHkZP1v3nUHVRBUSisqv/eOaVxpWvLtr7empGflttbf5fYSVDLu3f3FbujIj/4+5sO/TPjoL1oLKs5WJs5Wpo7DjEK8Nr347xRegQAEIPASAggqL4GFQ5smQFF0TMxph7l7FrncWeaW/odb+iq3e2vc7m1wu7vZ7a6X+52t7nd83W/vcL8d5J4W5p620yM12iM1zuNWosetaPvTv/deuKC728Lu7ou6uy/u7r60u8fS7u6ifvZlxWVNuz6OgkCLCZRVVk3yip+alNb4V3AEldLyipk+6oJKyp0pu26titrTWvNV9D+o3L11w2HSmDH/6Tzuv2+N//CdCf/TdlBxsTJ1teYLhptE79iO+Sot9t8hnAgC7VgAQaUdd75Gml5SUrFkaZKLS7qrS/pC1/uLXNOXuKUvd0tf4XZvtdu9dW73Nrrd9XS7602GVu6wQyu3ydCKR2qkR2qMx62QWUcXd3df0t1jWXeP5d0XrOi+YGX3hau6L1zTfaGvs3dr/UOsRqRwUp0XoGj6xLW0CaGnGkkpUxJvfh1+drz/wc3xB1p3AkbrclZWS9yDEsfvODQh7PSUxJuNiI3325dTUNgqtdXnoFJWUhLitWnUZ/8a82+SUr5q1aDiamM2dzj/xP49rdLNuCgEIKBPAggq+tSbrd6WwsKy+cI4e+EtkcsDZ9f7bq73PVzv/+56f7FrOju0co8dWrmrcmgl1D1tp3tq4KyjfzwPJ7+v7f77uu6L1ndftLHH4t97CKrKK1u9jahA+xGgaHpZRMrkuGsqv3ZPTU6bEHh0c8LBk9fSHmTnlVZUUjStBRyKomVyeVMKRWmjPlyTKZourah8mPvkzM27KyN3Twg5MTX5tkq3SbFXdh45qwWohpfQ26BS+LTA45fvbbp0HvvvTuPY4ZRWDyquNmbz7IbkZ2N+YcPPIZ6BAAReQgBB5SWwcGijAhUV1b85JswW353vkuHo8kDo+kDs+sDF9b676/0F3NAKG1fqDa34uN/Z5n7bj8xaIUMrO349RsJJj0Xreyza0GPxph5LNvdY4tljqVePpVu6LzmVgG1/Gu0DvNiiAjK5fKp33JRdtxp+4Z6alDp+x6HDl25UaWtVuiqJ9OLtR67+e8YtibBZGNawWC+oedLu93DrBWF2v4d/tXSnR8C+K3cfS6SyFoVRc7KKqurwQ6cnRl1s6DYt5c6UxJvigAQ1p9DMy3obVH6fPdP2X53GdHlTd4KKm62Zi42Z87Tx2F9FMx9mnBUC7UUAQaW99LSG2ymXU4tWJv8kvP2bS8Yclwx7lwwHlwwnlwciV+WhlfTFrulL2VkrK93urXW7t97t7qa6s1b8fj2+scdiNpws2dJjqXePpT49lm3ruWx7z+Xbey7f+tsGDbcDp4fAcwGpTDY++LjKkYHJ8dfWxuzTznrEFEVJpLLQAxfenBXPczjGE5xpanE8zZt/rNOvcXHHr1ZUaXWZ78LSsmnecSqDyrTk2z96x2hn9Ol5X7KP9DOoHNmdZPdBxzFd3tS1oOJuZy6yMg3xxH+1630O8SsEIPASAggqL4GFQ18gQFH0+Uv3ps698JPzw19cHs5yeTjbJWMuG1fI0IoLGVpxZe8EY4dW7i9xVZ61clcxa2Wb+53tvxz36rHUp+eyrT2Xbeu53Lfncr+ef/j3XBHAllVfuFZXYo3+F3QDnm5RAYqicp8Wvui+r4lRf15Lf6idb9sSqWxz3InX5+7jOZ1uakRRDjOOp9/4LSnl7E3t1JbrBKlMlnT6hQs6T/WK1dpIlPKHQg+Dyq2rl63/1Xn0v3Q0qLjbWcy1HZxx945yN+AxBCAAgaYLIKg03QpHvkigqkry9W8Hv3N+9IPzox+dH/3MxhVuaGVe7dCKkAytkLji4Xp/4fNZK+kr2QXBng+tzDy2vSac/BHQc0VgzxVBvVYG91oZ0mtlWK9V6/o5Z95++KJq4HkItKAARdMXb6dPjlc1QSX59oTgE/9/FLEFL9fIqYrKKrrMCuY5nnyVlMIlFsfT//0tKL+wpJGrtPhLBUUlX0demKZqpsok74SyyqoWv6LaE+pbUCkvK/vRatDIDzroclBxtjbz/N1Nbd/gAAhAAAIqBRBUVLLgyZcSWO11YIr44XTnx986P/re+dEM54c/OT/82fnhr3WHVgR1Z+xUwJ4AACAASURBVK387pq+RGnWylp2QTDvmcdJOOm5ggsnob1WhfdaFdFrdWSv1VG91gT0XHJpb+tMw30pEBysBwJyOdlBZXL89Yb3L01NSpuwbbfW2pj3rOQ1+8OvOJxSO7Ty2tz9+y+kaq3ODMM8LS6dEHRM5Y1zE70TSytaYWEMfQsqx/fttv7vX0a9OKh89d93vun5L4cv+s3ld5/U7e+TP/m/KZ++N/Wzf0zr/s/p3d//pscH3/bq8l3vf3/f5z8z+n44o9+HP/b/38wBH/9s2PXngd1+NfpklvFnv5l8Ptu0+xyzHnPNe84z72Vv2Wf+oL4Og/s7ftHfaYiBYOgA4ZeGomEDuZ3pna1MuOWJXW3M3GzN3O3M3e0sPOws5o8we5Kbo80PH64FAQjojQCCit50ZWs15Glh2YTZKRNFjyeLH091fvyN86N6QyuzXB7OccmY55Ixn5210nBoRTFrZY3bPa+ZJ+qFk+jea2J6r43tvTa+97q4XmvChduwSHFr9XW7uq5cTh2+dOMFQSV1oreWpoNTFH36xn2eU5PnpdQmk3rDL6/ZH/JNPqPNHnxaXDo+6CiCigbNlznOsXu/g+qg8uHbrlbGJ7csebRrR3ZKUHZK4AnPRfMserVKUHEfabHM/lcNQuDUEICA/gogqOhv32qpZUdP3x4579p4cebX4szJ4sdTxI+VhlYekaEVlwZDK+wke5faWSu/u5JZK8vYvVY8Z56I6rUmuteamN5rYnuvjeu9NqH3usTe63b1Xp/Ue31y7/XeZh4IKlrq2vZ9GTao3FQdVHalTvJO1A4PRdMHLqTVSx3kV6dTZGL9/KOqS4PZLK/ZH96adFo7deaugqCiWW2KoiYa9Rr1gYqg8tWHb6//dtSzQ5FVpxOVS2ZSgGCIwbTP/6nlERWPkZZO1mZZDzM0K4KzQ6C1BWiGUVoTnvuNe0LxuO4hL6xwE49XHPbCE+nBCwgqetCJrdgEiqIdlqSMFj4eJ878Spw5QZw5UVwztDLd+XHt0MrDmTWT7DNm1w6tcOsXK81aSV/kmr7UNd1z5imlcLKOCycpvTfs6bNhb5+N+/psjO21ovhJUSs2GZduJwI6HlTemJ3y0/o44fYUrojYB6LtKaLtKY5bk16zP1Iv2yCoMAyjV7d+yWUyq/+8ozKoLBxt+exwlHJEqX2ckH8g/PfRltN7vK/NW788Rlq62Jh7LV3QTv7bgWa2WwE5w8hrsgrF0DK2cE+wjxkZ+zrFHsJlDIphVBW6iqGrGVrCsG/hjuBOVBt0uP/nLijXb3AEFf3uX023TiajRsw6NUqUNVqUNVacOU6cyQ2tTGKHVqbV3gk2w5kdWmFnrSivXyxQGlpht4ZM3/zTaRJO+mxI6bNhd2042d9n04E+mw722Xy4LymHvBNoSkvzmDUNiPPrrICOB5VOv8TcylB923+VRPranPpLhCGo6FtQKXr2zJa976verV+zTT7PTNpRdSrhReX2zi3OIwZqOai4j7J0mmBX+LRAZ//Co2IQaBEBxYgKzUYQLklIGUbKZg4Zlzxq0wlNBmBUFEUyUQQR7gFbw5orcG/jjmyRmuvsSRBUdLZr2kTFYvdcsRZk2YqyRoqyRomyxohJXGkwtPLo29oFwWqHVsj6xeyslQdOtVtDurJbQ26aeWZPn417+2ysDSebDvXZfKTv5iN9PY/29Tzed8vxvlsCR/8hl+n5vyC0id7X70oiqDSzf3HrVzMB1bz9zJFDI99/o96IyoSP/pqwcG7lyfiqUy8s5Sdij21c8H2ff2ttMr3HSMsFoyztR5hdOnNKTavwMgTatgDF0OSfUSl26ERWG0iUx1BqkwwJGioyChtcuGAjrR1/qT2NYliGxBMElbb9SUHttSIgk1OTHHeNEGZZi7JtRFl2bFZhh1ayVA6tsAuCqR5a4baGdHG9v2nmmYN9Nh3qu/kwySeex9hyou+WE323nOq75XQ/r9N9vXYaLi7Oe6aVJuIi7VcAQaWZfY+g0kxANW8P2LSuYVBxsOz9KMG38lR846X8ZJzPL19rOai42VnE7PBV0yq8DIG2LVATIbhkQkIHuQFMwlDVpNBShpJVVkuKyqryiytzCssfFlSk55fdzSm5nV2UllWYmlmYllV4O7soNbfsTn5FxtPKrMKKJyUVxWWVUqmUoeU195LR7PgKSURsWiF5R59/MKKiz72r4balpecMnnX6S2H2CFG2Fckq2baKuCImWaV2aIVMsp/q/HyS/Y/Oj8jQivPzrSHnu2Rws1Y8Z5xSjJyc6Ot1sq/XqX5ep/t5nennfY4t5/v5pPRZeX3feQ03Dqdv7wIIKs38BCCoNBNQzdtXOzvZNRhRCXH8vvJkfOXJOLWl5Fi08/CB2lmemBtRWTBq0MKfv1HTKrwMgbYswN3uVXtvFsVQUkYuYShJpVSeXyK9/6TiUkZRwrn73nuu/BF11iXw6Hc+p0evPTpi2d7BCxLNXGP4ztHmrrGDFySO/T1s+h87Z3smufofXB11ctvui7uv5vyZJXlYUFZQJqmiGBnNkJ28KBkjlzLyVtiUSpu9hKCiTW09u1ZAzHnLeWlDhTlfCnOGiUhcYYdWshVDK2PYWStfsQuC1Zu18oPqWSsPPH84RcJJXy6ceJ2tCSfeF/r5/NnP52K/rZf6bz3Td/OB1VF6honm6JoAgkozewRBpZmAat6+aPbMekFlUrf/exjvqzaiKA64sG35PLMeWthHRRFU7G0Hq2kVXoZAWxbgZpKQoEJGP+RymimWMA+eVqeklqzbc2eW90HbBeGDncMtXGP57ruM3ZL4rjFmLlEWrtFmzpGkuJA/TcURA13iBrokGDnHmoijTEUR5qJwU8cgq0Vxom0pfvuunbpf8qCIKpMxMnKHmQxBpS1/ZFB3zQr8tDB5kFP2F8KcIcKcocKcYbVDK9ZKQyvsrJWsr9hJ9hPZ9Yun1l2/uN6sFc8fTrPhxOd8Px82nGy92J+Ek8v9t17pv+1K/21X+2+71n975OS1WKRYs73b7s+OoNLMjwCCSjMB1bzd4+fvlIPK6H913PLjV5UnYitPxDSxFB+OSPx9zo/9PtT0ho+KoOJsY15WWqKmYXgZAm1WoHZqO8XQcqmcflhMxV154hh0evjiXRYeiebuiXy3RFP3XSbuSUZuyQNJUInnO8fwXbgSy3eOMRVHmzpHGznHGzrHDRTHDRTHGIljjZ1jjMXRRqIoU0GYuVPAaI/QpREnj6UV5Jax83XlsjYL1qSKY0SlSUw4qIGATE6Z/3rMUphjKcwZLMzh4goZWqmNK9yslZHsgmBjlO4EUxpaeb5+MbeN/W8uGZt/OM2NnFxkw8nl/luv1oSTbdf7b7/ef/tNUnwTBy6jMJ++QafgiRYUQFBpJiaCSjMB1bx9wc/fKweVsf9+KzNpR8XxmJcqhQfDkhbbz+j7X43uTK8IKgtGDT66O1lNw/AyBNqsADuWQjO0XCanU7NL1sadH7Ms3tQjyXTBXhP3FBP3ZFP3ZDO3BDPXGHOXSAuXSDOXaJJSnNk/2QemziSoWDiHmwvDzASh5kJSLIRh3J8DxAmG4lgTYfgXAv+vPfx27LmYUVApkZO5+2QSP10zw56dfM9O6m+zksoVR1BR1sDjpgscPnvH1CnTTJhrIcy1FOYMqo0r3NDKcHbWSoOhFTJrRbF+sfKsFW794l+cH3rOOMMOnpB8cq0/CSc32HKz//Zb/X1T+/um9fdNM/C73M+rICO36bXFkRB4WQEElZcVq3c8gko9kBb+dfHcX5SDinBI/7KjURXHo1+2lB+LvrBtueCL/j/2/9+P/f83c8DHPxt2/Xlgt1+NPpll/NlvJp/PNu0+x6zHXPOe88x72Vv2mT+or8Pg/o5f9HcaYiAYOkD4paFo2EDRcCPxCGNnKxMXK1NXa76rjZmbrZm7nbm7nYWHnYUiqHiMGuS5yK2FIXA6COiOACWhKZmEZtJyqxaEnR6xMN7SPZHvkcx3SzJ1STRx22XklmToljSQjKjEm7rF8l2j+SSrRJk6KxVxpIk4iit8UZSpMLKmCHaaC0PMBMHGwrAB4khDUcQgJ98VO49nFMrLaYaRVzPySm4RZHYPFmm17rA0ryYIKs3za7/vHu2YbCLI4QtzzYS55mxcGcTGFeWhleFKs1YUQytj2azCbg1JJtkr9lr5wfnRj84PN39/9ho7cnKDHTm51d/3loFvqoFfGin+d9hy18D/roH/gUXh7VcfLde8gI4Hldfn7LUQh1gvCLNaEFbvzxEeYTxs+KjqE6JXGz6ucxcrBxXfWRPLj0ZVHIt+tZKZ6BflMnPRaEvBUINZxp/ONOyqoaDi/sMUVV2D5yCgFwI0JaOY/GpmS/KlMUtizdwS+B7J5u6JQxYkTlyV/NumpJ83JI5enmS+MMXYJc7SOcLcJfIFQSXSRBxpKo7kiyNNRTtNhTv5wp2mgggzQaSZU7ipINxIGGksiuQ7BFrZb/FKuPREws6KkVXIaLJDJBdUJHohyjAMgoq+9KRW25H/tHTA3FRjYa6JMNdUmMtns4p5o0MrivWLlWetfF131soPzo82fX+ehBMyeELCyW1SSD65a+B/z8A/3WBHusGO+2zZZbFCq23GxdqZgI4HFZ7jaZ7TKZ7jSdXF6TR2pm/4gdWroOK/YbVieeKx/+68f4Wg4lhkxbGo5pS8lIBz3osTF84OmDt103ejVnw9bOEoCxcrY8FQA4fBfedb9rG37OMwuJ/jFwZOQweQMsTAaciApo+oLBw9eP7o4Q07Bs9AQD8EKJqR0MyZ9Ge/eB+wcI9n7/hKHrEg1iHgZOyfmWlZhTcfPQ09+eA7z6OD3GIHi8NfFFRMa1MKF1T4tUGFL4gxc9pp4RRqJggzdgw3dQy3mB9kIwg8da+QomlGXiGnaTaoyBhaKtUPUwQVfelHbbaDougNwacMHDIGCvOMhHmKrFI7tFJn1oryJHvFrBVua0il9Ysfc+sXf8MGFTac+CmFE5JPuHDywGDHA4OADIOAhwYBV/pteXI/W5sNx7XalYCuBBWKPnblLs/pTL3g8bK/vmZ/aFvSaW32IG790qz27phIRVD5pscHf25dWn40skVKxbGowgOhWQnb0yM9b4WsvxG4+or/ykt+f1z0/ePi9uUXty+/5PvHZb8Vl3z/uOCz5Og6t8SFc/znTF3y1VDRcKPGb/1aOHqwvbWFZl1wdgi0ngBFk4WDdx67MWblblOPFGOP3Xy3xF899519UFxGMzRNpq+UU0zipdypq1PMyTR6ct8Xv+a+r0hTZ7aQlLKTL6otwgi+MIIviOALwk2E0eZOYYMcd1g6+fOdgo2cwo2dIvgOoYuDDlSSFccqaIpi8wk7T6b1HFr2yhhRaVnP9nC2aol0vDjFQJAzQJhnKMwbKMxTHlrhZq1YCHO5WSvcgmBfCnOGq1q/eCy7fvHzWSvix5u/P19v5IRLJlw4eWgQ8Mgg8JFB4GODwDv9tp/2SZHL5RRFUzU/3AOafeb5k+2hU9DGFhfQkaDCMEzes5LX7I/wGgySvFRWeW3ugf0X0lpcqZETIqg0gtMCL924dFERVH4z/iQtdEP50Z3aL6VHIooPhj3bF1ywN+h64Gr/OVPdbM1fNEdl4ejBjlbmLdB4nAICOilAtl6kpIF7zlktTTF1T+a7JZi7xPoeultcXsnuMk/yAyOXPCunRb6Hjd3IDWC1s1PIvV6KYioKrymCML4wnC8IMxOEmTmFGQsjzAXBgxy3Wjpt5Qt2GAlDBjqFGTmFjnbZXkCuUM7IpTV3fNFyMsNeL34QVPSiG7XaiJwnJQN+PdZfkGsgzFNkFSM2rnC3gXF3gikm2deuX5yttCAY2RpyJLuTPXsnWM3WkJPEj72/OVM7eEJGThrmk0yDwMwBQekm4WeGxK3/xt/b9/Am7wPrPPet89y3fst+7oHyY2/fwwnJf0qler58n1Y/Ae3jYroTVIrKKj6YFUJu8RK8+rhKl1khBUVl2uw6BBXNapeVlCjmqIiG9MtO9C0/slMXyt2dm7f/Ovn30YMbTqZfOHqwwNpcJsN/jjX72cDZW0tAzjAMJQncc3bY0j2mbokWbnFmLnHRF3LlEglDy9g1wRhGLqmUMR5BR4w9UowaDSp8YbipIMxMGM6lFDOnMBNhuLkgyMJpu4XTdhNBgJEwxNgp2NQxcJDj9oeFUkZWxlASCbvmF8OQFcD04wdBRT/6UZut2Hsyrff8jL7CvP5sUcQVNqvUvxOs3oJgZGiFXb+Y3RoyS7E15Fh2/eLx4kzvb86y4YQMm3AjJ48NAjMNgjINgrIMgjIHBKVaRvtNO7Nm5pW5ogc/izJ+FmfMVFMe/OB4MyjiJKU/f2u12dvt91q6E1QkUtnmuBOvzTtIJqW8QlZxPN3ht6SYY1ck2o3rCCqa/csjlUis3+846oMOoz7o8LudWfHB0PIjETpSig+EHl7jsnqKTb1Vv7igUllRoVkanB0CrSRARjNoKnDvn0OWHzB138V3iTV2TdqQdL2gsJKhGbbQcpp5UETN89nDd40xcYlWOaLCF4WTgRQuqAieBxVTMpk+zNwxkO8UZCwIY+/7Crac72/mFHi/iGJkJYy8WsKO3SCotNJHAJdtfQGKoseIUvoI8voI8/oK8/opZZUB7G1g3NCKCTvD3oxdE0wxtDK4wdaQNuzWkIqhlXFsUHnM3tmVaRCYxYaTbIOgmjIgKGHC0dmC+z86P5rxUkX08GenBLmc/FsHfiDQRAHdCSoMw0iksgUBe9/5NfI1+8M8h+M8xxM8xxOvOZ16XXDmDaHq8prTSZ7DsdfsD//9l4jfg/aXVVQ1seEtdRiCSktJqj6PXCaz6vIWF1TWTbUuOxJRdjhcd0rxwdArfivWTLNTXp4YQUV1X+JZfRGQMEw1w/juvzZ02UEjt10mbomGrnunr9mz/88HhWUyWs5Qcjq7WBZw6ObE5VHmzmEmzlEmZOOUKFP2vi9jcZSRc/RAcYypKIIvDOMLw0wFZN48XxDKd+IKWfXLzDHE1DHU2CncxDHCfH7QYHt/M0HIwyIZufWLIt905GwmqhlZafu2GFFp+32o1RbkPCnpMftmL0F+b0F+HyGJK/3YYiDMUwytNJy1wq5fXGevlS+F2cPYWStWomwbUTY3tDJGlOX9zTnlfJJjEMSW4FsWMRt/uvyd86NXKeKHPzjsqpbozRIYWu3xdnsxnQoq5H4Cis55Why095yxILi3fWBv+8DPBFGG6/802nRJZfl8foilc0jS6et5z0rIejBa/0FQ0Sy5TCaz6foeF1QCZk8uOxSma6X0UNjN4LUrJ1sr9lHhgoqE3JyCHwjoowDNVDDM1oPXbRcnm7jFmbjFmznvNneO+3lTiv+h1APXc/ddy9mUfPXrP+IsXKKMXOJJShHvNBNHmIvCzERhpqIIY1GUoSjaRBRuIgwxrS18QQjfKZjvFGzmGGrmGMp3CFIqgXyHADPHwJxn5Yy8ir2rkiL3nxFdPfnSg6Cij39VNNim1UEnuzvl9RDk9xTkK+JK40Mrpkp7rdS7E2yYMFt5a8iRoizv6ee5ZJJrEJxrEJxnEJw3ICSdH7lo1s1vxI+mOz9+hTJN/Og7BBUNfij089S6FlQaKi8KTZ4cf31ayh2VJen0pYZv0eYzCCqa1aYoalyfrlxQiXefVXowtOyQzpXSgyHH1rn8PmbwglGWC0YNWjh6sJM1JtNr9oOBs7emgIzcZL5j39XRv+8yc4vmu0eaO8cOcgk2dYk2d08Y8Xv88AUxZs7RA10SDVxS+rsk80WRFqIwC1GYpTDUUhA8SBA0SBBk6RTIr40opsIQviDE7HlQCTFzDKmXUhBUWrPHcW0dE5DJqaHzd3/ulNddkN8wq9SLK9yCYA3XL7YU1lm/+EthjmKSva0oy2v6eRJODILzDYLzB4TkDwjJNgpf8cu1Kc6PX7lMFj36BkFFxz5Lul8dBJVm9hGCSjMB1bydoqhvBhtzQeXgCqfSgyGlB0N1sOQn+W39ZaIiqMzH8sRqOhYvt2UBGVmeePv+NOvFBwZ4pBgs2GXolmzsFmniGst3iTMX77QQhZuJo/iiSEth2BBBAF8UZSyONxInGIkTjEWxpsJIc0GYpVOwmTCUG07hUopSUAk2cwyuDSpkLIUUR4yotOXPDOreogLX7+b0+OXkZ4L8z9nSg40rvdihlSbOWuF2slc5a4Xbxt5r+oX8ASFPFMUwLGTSqYnizK+bU0SPp81Pwq1fLfpZ0P+TIag0s48RVJoJqP7t8yePHfVBh9H/6nhm80I2qITo5p8Xty5h7/4iIyr2dkPUNwxHQKCNCshlcpr23391JLn1K97IPd7UJcnMJdLUJZrvHGcmjuaLY4ydE4zFcebCiC+cAiyF4WbCSL4wii+M5gsjLQThlk7Bgx0DzLgRFQEZTuE7hZg5hfAdSUThChtU2JTiSFIK38Gf3Pr1FLd+tdEPDardYgIURQUnX/7E/sGngvzP2PK5IL/e0Ao3ceVFQyvGtdvY124NmcvdCcatX/ylMHu4MNtr+oWCAaFP2VIwIPTmoPhZ9ulfibOaVUSZU0lQwZKYLfZhaA8nQlBpZi8jqDQTUP3b/xDMG/lBh5EfvHFjx4rSA0E6Wwr37tj43Rju1i/RpNHqG4YjINA2BSiaLmMY38PXxy5LtnSPtXCPs3TdM8g18QvXqCEuO4e6RAx2jeK7xpu4JJg7R38hDv3Ceecg58hB4p2DxJGW4khzcbSxINJYGG1KJtDXzEthp6YoRlG42Sm1KcXBn+/gb0r+DMh+WoY5Km3zU4Nat5gARVFjnFM+ccz7VJBfL6vUiyvKC4L1Z/da4bZbUSwIxm23Yi7MNRfWZJXBwpwvhDlfCnO2TjnHpZRnbFaJmHhyrDhrTDOLKHPS/GQElRb7KLSPEyGoNLOfEVSaCaj+7dtWL7d9v6PNPzrc37mxZH+QLpeDKwQLRg3yGDVouf2v6huGIyDQNgXk7GT6I2lZm5Juroz7k5SYtBWxN5fHXVkRd3FV7IUVcX8uib/6e/yNxfHXl8Vd/iP28srYi6tjzq+OObc85qJT8PkvPWKMhNHsDo+KCfSqbvciN32RiELKfD8Elbb5eUGtW1igSiLt9uvlbk5PujnlfyIgRTmufM7eBtaDvQ2slyBf5Z1gyrNWFOsXswuCkbjCZZXtk889GxBayJanhmGz7NNHibOaW0RZExFUWvjjoP+nQ1BpZh+ToBJ4dGry7YZz/Sd6J5ZWVDbz/K/wdt4rvEeX3xIb5G/9r07W/9chJ3Fryb5AXS63gle72Jh7jBoUuHGNLpOibhBoloCcZqhqqUxeJWEkMplUVlUtZSrkTAnFlMsZiUwik1ZJZNJKGV0pp6tlsgoZUyljpFKZVCIplzJ/Pi7/9o8IS0d/M0Fww3kpZmSxr+fzUhQpxWS+L4JKs3oNb9YLAYqifWIufOyY35UEFVIUWYWLK9xtYA2HVuqtX2wozOPiirEw16T2TjAuq1gIcwcLc7ZPPldoGMaVm8OTR4qzbMXZzS2irAkIKnrxOdRmI+Ry6uCfN1QuqzV1V+pk73htVkbltXR81a9nJWXj/Q9OTU5TEVR8dhWXlatslEaf1Legcnzfbqv/vGP93huFu/1L9gXocrkXscFxuOnC0YOvnDuj0T7GySHQkgI0Q9OMjOxMQjN0NUNXMoy8mmFKZExBmSSvuCKvuDK/5Hl5UiR5UlSZV1iV/0zytKj0WVHh06Ly/OKy7JLKnJKKJ8XFz4qesU8WFxQVPysqyiupyCsuLygqKSgqziqqOn772fQlYYMdd5iTeSmh9ealmDkEmjkEcIUMp8z3qy2+Zg4BuU8qGIqiZGVM2WGm9CRTdpopP8aUnmNKzjKl55nyS0xVGiN9wlByRk5aRHHbT5IN7CVk+XpuP8qWtGuxc2F54haj1OsTSaRy49l7PnbM/9jpSVe2NMwq3CT7elmltyC/b4OtIRVDK/VmrVgKc7ZNPldkGFbEZhW/KeesRdlWzS/CrPH2uPVLrz+gGmicVCaLP/GnyqAyJfHWNK9YDVzz5U6p60GluHTC9r1Tk1QEla+3JheWIqi8XHerOPrurRu2H7838v2OJfsCi/fu0OWSEbVx/nC+2Noc29Kr6Eg8pbMCFE3J6SqaqWZoiqmqqCy68zhvz9Uc/6MZG1JS1yRcX5NwfW3ijbW72JJ4Y23i1TWJV9YmXl6bQMq6hMvr4i+vjbu0Jv7CmoTzXFkbf/55STi3Nv7MujhSVseedws5beMSPMgxwNwxhN0vRXlqChlLMXPYYebgT8p8f769n6KYOfg/ya+UUwxTlsZkTGfu/cbc+1HycCZz/2c6fSZ1/2cqY448c6E8P5gp/pORPJXRDBn7oRk5U00zFSSoUDX/08GuQFDRwU7RwSr9eSvzo1+vfOT05COnJx+zpZGhlYaT7PsIyDb2KifZGwvzlIdWtk4+rwgqS3+6MVyUPVyU08wyTJg9zj4Fc1R08HOly1Wqlso2xx+YnHCj4YDA5IQbDn5xrV75JWHJk2Kv1qvelMRbX0de+DrywsGL11u3hsXlFZO8E6Ympdar4bSUO+P99uc+LdR+9fRtRKWspGR0z/+O+887JfsDi/f463J5HO3pMII/32aQ9nsdV4TAqwtQcloulcupEglzNbsi8Pg9UeDxSX/EfOEaaeKSYOKSaMz+aeqaaOKSyD4TZ+wSa+wcY+IcYyyOMSZbN0abCKONRTuNxBFG4ghjcYSRMJwrxoJwE6cIPtlpPtjcIcDcKdBEEGwoCu8n2mnqFMrul6IIKjV3fJGgMp9NKfOfpxQSVxy25j8pkTMUU35FdmeU/NYU5ua4yrvj6TvW9G1rOm24PG1YVZp1+Z0plQ+EzFNvpvomI2XkFCMlG1SyW9kzFMU9fnUsTb0TQUVTsvp1dOnRQQAAIABJREFU3hVBpz6cl/E/Nqgo4kq9oZV6s1a4oZXns1bYbexVZhXFJHszYa4iqDwzDLOfdWeoKKcFijB7DIKKfn0gtdCassqqOdtjyeBJgx0VJ8VeCdh7Qgt1aOQS1VKpd+KhyXHX6lXv653n956/+jD3SZWklXclLq+s+tEnZsouFYATIy+cT73XSOs09JK+BRWGYaZZDJjU9T3dDyqZMZ5OI/jOU7/SUNfitBDQhABNySi5tLhCfuRavmvwBasle03ddvHd48zcos3cYszcYviu0Ypi6hJl6hJNinMUKWJS+CKya4qpeKepOMJUHMEXR5iKwk2FYabCML4wzEgQZySIN3aKMnEKNxWEDhQEGwpDDURhpk4hKvdL4atMKfZ+xg5e+QVFcqaaKbtA3R7B3BrL3LSS3rFmUu2YWyOZG3bMLSvm5lDq1jDpzVHS1GnM4/VMeaacjBRJyVgKWRO1Ssa0wjB3U3oNQaUpSu38GIqibUQpHzo9+R9bFEFF7dBK9wbrFysWBOsnzDNgC7cg2EBhHjdrxWfyeW6CyjPDsGlz0oeIcr5ofhFmj0ZQaecf4pdsvkwuzy8snrBtt8o7lyaEnnqcX/CSp2yxwymaLi2v3Hfh6oTQkw1ngExJvDXRO/FBTn6VRELRZES/tX6qpbKVUXumqBqSmpJw49etMdVSbUcpPQwqwm++nv75v0r27Sje7afLJTvWU2xj7rV0YWt9HHFdCLyUAM39ULLiSsneKzmztxz90nWXmWuKsVuyoXuSqdsuS5cEC+cEC+d4c66I48xIiTJzjjBjA4m5OMJcFGEuCmdLmJko1FwUai5kiyDEnC1mghBzp2ALx0BLxx2DHPwsHfwsHPzMyb4oQbVBpXYlYna/FP58P1KUbvri2/uZ2vsaO2zNKyglc09Kz1O3hzO3xjA3RpAHaXbMzVHM9THMjZHMjRHMjaHM9S+Z69bMtSnyTG+GypRR7HCKnNz3JWPI/+ngD4KKDnaKrlVJJqc++uX8f50KPnR6oogritEV5Vkr3MSVV1u/mMsq3rVB5alh2NQ56YNFOYOaX4TZoxBUdO1TpcP1kcvlhaVls7bFTFO1YtW05NuTvOJLy7W6aBVF03I5JZXJqqXSnILCH71jJsdeqTeW8vzX5NsTgo65B+96VlJaLZHKKUpOUdoPLRRN38vKnRRzWSXjpNgr4YdOV1VrNU3pYVDZtmrZd73+W7LXv2i3ry6XrJjNTiP4B3e1/hoUOvxfHlRNJwRqIgpNUxRVIZUfu5X9m89RS/cUc9fkL5xjBrlEGbslGrnvMnFLMHaLN3atKUaucUYuSsU51sg51khMijEp0UaiKGNRlJGQ/GksjCL7pQgi+cIAc4G/uZO/haP/IIcdgxwCLecHWdgH1y7wVZtSavdLMa0bUbiUYjrP13i+X35BpZxmmJKL1G0r5uZXzE1rKs2avj2YSR3G3LRhblozN4cyN79gbnzB3PiSuTq86s5YqjCGkbKzU2iaLBagE/wqKoGgogIFT9UViD504z+O+f91KlBkFUVcUR5deblZK+yUlXp3gg0U5nlPPvfMMOypYegTw9BJs9MthLktUAQ5dggqdfsUv6kUIIMVFZXhh8786B0zJfHm86/+Snd/TY6/viwihaK09x/1aqns/K17m+MProzcM9UrdnLCdTLxQ2WIqq3n1OTbU3elTtx5ft72uFVRe0IOnsopKJTLtf3vZXI59du2GJXzfKYmp02MvrggZNeJa2lV1RKV3dHiT+phUDl37MiMPv8r2eNXlLJdl0tW9KZ5VuY3L19s8U7FCSHQsgI0G1G4P1OzSxeEnx3iEW/kvtvUbdcXLpGDXSL4rvGmrglmrnFmLnF8l9ia4hxr6hxj6szd+hXN3fdVe+tXFF9E7vjiC8NNheRPM0E4n2zpGGYqDDERhhgLQk2cwkydwkwdw00dIkwdIti95wP4ZLOUAL7DDsVKxMpBxdTel5R5vibztpOg8qSKDSqXqdvWzK3xzE0b2W0bJm3o/2PvPQDauNL1b+//++537/73JrubTfbuJnbaljTHDZBoBgzYxi2Ja+yUe7PZTXMBSRR3p7qAG3FwAdvY2IAbGBdc4+7YpquL3oskOgjVmTnvd88IZBlEM03go31WGUaamTPPjEA/v+d9X5D7gswPSz4VL0ungWQGSDyYbI4xLxBaCgBoCmgcfh/sPxA9vW4EVHrqVM/e98knn9y8ebNn7x0275r41cXnedXPs6DC4gqOq7RjlQ5J9g97rXRdv9jMKuaZYBMCVXvn/lI94Uj1hCOqCUfmf1XgHKjsBwmq/Aio2PftZg8fHIPJ9EN88rwjdxYmCG1mVmBuYcMp1Q1NA2cnRdManb6oSi0rKlsZnTQ3+vr8uPsLjqUuShQvSpJ2OrA2RLGGq8Xns98/K190WrIwQTg/7sG8o7+8H5F4OU2cX66sbmjSDTweMAxSFJfjIsW2an8tOZ+zKEk6/3ja3KjLNQ3NA2epZc8jEFR0Wu3/jH2p6UJUw/l99qyS+G3+705rqKuzXAyyYJ8O2MPv4qF1xowoOJyi1cbdzJ75wyXX1QmcNacd1yY5rUnirE5yXpXkujLJdaV50leiSwgWO+8rwTnkJDfkuHPIcefgY85BWC6snANjnR9O+jrqwj/iysqZH+/MP8bhxeMcFf5RDv8Ih3eIy4vGMlMKL9pCKU7+UY+ACkYUTClOyyKd/PdW12hw4eHmdCrXFxTvgnyaMW8qyHxxOEU6A2R+SO6D5L5I6ocks5HcC0QeIFkMVbEAzTocVqHYTJWh9d720Qmo2Pblcdd6eXmNGjXq5ZdfPnTo0OPuw762kxeq/ry85M/8mufb1JPQijm60q7XSrv6xa8L1G+yshQEGx+o2j33F9WEGOWEmMoJR+Z+WcBhe6309VlQNZ2Ain3dVu1HYw8fHL3RuDbmrM2cCvbbP45RzI28KC4ooRlcybHfH1q9QVZYtiIqcWHE6fnH0xYmCBclSW1/xbfGkvM575+RzTtyt3uGOZ+DuSVRtPBU1rwDVz+KOPXZ3lMnbjxQ1zcaBizznmaYEzdT5kbfsFn+y4xV84/eK1VW97ufHXc4AkEFAD5xHt94IbL+/F57lnT/9xv9v+x4Scgae3PAHn4XD74nyFyeF7cToXDRXgYBY5KVVPMO/uK86ozLqkQXM6vgGV9nnVcm4VjKqgTuylOchzrpFHLCIjaicpwTdIwTdIwbeIzDRlQ4gXEcAc6hx898LBdeHFbAUeeAI2xeSrQzb78zL4otQ4xbprTrl+K0Ipqz4gCXjaU4rtjviCllj/OynxwDdqtrm4ChKE2mMd8dpH6g8KEVM9lwylSQTQWZD8inIPkUJPVF0qm03AOEM0A0i877AoxFOmBz6mn94DvfkyMOa1Ap7u5xs7vHoS4f3/Tg8cmjj1FWjxGAKwyDgiNu/ClA+Wd+jS1WeSRrpd00sDZWwa0hO2atvCZQv87KmlXGBaoi5t6tGh9TMT6mfMLhd78scAxU9oMEVdMIqFj9Oujuc1Pc3efmZpefm0M9+Nx88+jn5hOrz82QcX5XoHI+Z2GC8IOIhJqGJhPV//FxE0XLispCT1yaF3uvsyln1qESy/Lic4qFJzOXRiakKvIX7T69MEFksxO85f3tFvDmCcJ5B68dvHS7qEo9QNntBhN1NV0yb1+yzRJqS5JzCahYfTp7v7jmvxc3JEfWn9trz7q9NfjqmaEv6d17dwd2C/K7eGD97fHeEVv4Cs/nRQZcBAsBbdSfuJfv98NFFzzL6/RDrTzNxTO+TmOFJHLwjC/zpK9TnOCTTsHHzeIEH2+FE3ONr6CjTkFHOYFHzOIKjnD5MVx+jDPv6KP9Ug6Ze8931i/FYUUMZ8VB5+X7uMv3Oa6ImrQ8ymnZbpdlOzkBEdWNGqAYQ4vYkO8MIh+Qe4P0HSSfiiXzNYuR+oDEByTeSOZGiWYhsTdS+ELtDRMwmFGYQc287PHFgQEFFa/uHi93+bD+7jJ8lz/55JOeXw57e2dTi955xcU/8ar/xIJKJ7hiYyZYu4Jgr/DxTDALrvxNoLbRa4XNWvlx7p3y8YfKxh8qnnBozpcFkwKVkwJVfZVAOXXFhWHUR6W7z41Xl5+bl4fvh8V65IP/wekCVBafy56/91xtk8ZE4bz0fvycMgyjNxjvirPnRl9ffNZGy5F2aNH6ozk2cloy9+C1s79kmCM8dU0atrOK8P0zsl7hypLk3PfPyufuv3ItQ4prhfXrCeK/fghp9QZFcfm82Hs2U2sIqPTpjjq9/yccSzm7256V+G1Ac1Njn85zKDYmv4tHjRo1+L+Lh+JS4yK9LKiYGMCt2qvqmkMTU91WJ3QCKokYV1pB5RSbnfIQVDjBx7ltoMLFSSmx3MCjHCwMKlzBEeeHoHLEql9KK6W0Nna0VYl4on+M44oDLst3uyyL4CzfN2n5foflUZxleybzdzUYcNUuujnDkOcJ4umgmMJO95oKFlCR+iJMKRhUQDqZFs0GsSvIvKnS/QjYmDo92HUYe3ihBxRUrL922O1y19/5Xn755W5/U1n/2/DLLz/8mvjyyy8P93yV3JLq0Z+lmEHFmlUs0ZXeTgPrpteKQL1z7p2i8dFF46PzJ0TP+rJgQqCqHyRQ+g4rULHbD4v1wEbeB6cLUFmSnLv4XPbcqCtHr/7SvxEVE0WHn/55wYkM20BiPcXLsnw+Z358yqe7T+1IvKLVt4/V1zVpePsTMfbYTAux7MTWwoITGUHRSf0+sU2j0/tHJdhMqTefNQGVHv69tv22Qpmw/tyeurO77Va1ZyKuHAy3PXr7Xmv9K89ul0fe7+KhuinYCim4TooeILWwdlnkDZfVp3sMKmz7lODjZkrhBh/nBsWzlNIKKiyrtFKKFajEWJUhbu3qiBNUbFEKd8X+8f6HHFdEuizb5bL0R+dlexyWHZi0/KDjsv0fbzrSZG6HUnfdkDMNJDORwhspvNkE+taICi5P3AoqPiD2YoTvgMQRRJ663BCg63FdSNxNxR4fAwoqn3zySU8mgXQ9jaTbWShdx04H2XTL9M7hjihm345cEP0xQPknfo21zHGVdqxiKQjWsdeKpS+kdfHidhn2lmlg2967kz/uYN64A9njD/h9UTheoBrXd/GVPsuHU0SFfHAG+WNrPlzXoGJmlXlH715JE/fXV3maZrYnXlmUKLIZZ3iILuzEs7kHr82NurQm5mxFdW19c4tGp8fhnQ6dUszhi4bmlvvS3E92n5q7/8rc6BvdH4LllsXnsxedlny171Sztt+mAGh0+n/tObnotKSLcySg0qcbnqHpsuM76s5E2K/ORmRev9Snkxyijcnv4iEyfvAPiwDwb1MshtEhSMqsnLPxHHd1EgaVlactMgdSuCGJ3JAErnnSV7ClwyPb2JHNS+EEHuMGsqDCVvcyUwoHB1KwnPlHuLwYLg9TihWosDn0XfZLmeAf7bh8n8uycNel4c7L9jgujXJYGuW0NHLf+dRmQLjWcGWMKXsGSGcjuS+j8ACZL5uU4gPspC8k9gazhFOQcA5IJkGWm17xIWjzAeEuLPb5GFBQsc9THtBRjaSCGQxC3BUX/4tfa5ZNVukaV7rotdIutPI3gdqctRL63u3scfsV46Kk4/dP+6LwbYF6bN/FV/n6X6Do/pyxM6B30RO4c3v44NAMcyVNvDwyYe7hWx07vpuxgY2rXO6vbo/55VVzD93s2LRxCVtceOHJzHmHb/H2J0ZfunP2l/QydU1dU7NWb+gIJzZvGBNFaXT62sbmwgrl6Ttp0Zdur4k5O3f/lQXH0xcmCBfbahiPz5GFoi0nLmp07WM1No/S9UoGobhr9xYcT7NNKedzcFr/3uSVh5L6EY26GNLITKYHgPu7v65L+slupToVrmms7+LCkJfsxwF7+F08FG4gDCjmCr0MpTHB3huFrmsSuOYElda8FOvpXtZ5KScepqa0UQpH8JBSnPmxXMFRS14Km5oSwxYgPsxmpLTN+DIjSsABXOark34pDiv2s9nzu1yW/sRZttfhqz3cL370E0TKSho0YAKjDgrX04ppjHwmSKYh+WScmiLxaZvx5YNE3mCW0IsRzQCRM2Q5m2TvQP19QAye/WaXDwIqdnlZ7GJQtQ0tz66o/GMbqHSBK70qCPYKv9ocWumYtfKaQL3pvVvScZGScZHCcZG+XxS8JVD3g3iqWYLzPfx6ZxfWk0EMkQM0zWh0emVdw7ZTl3FCha35UYuSJKsOn+ljUIVhkEanX7AnqX3qPFuxd96+C/5RifLicnV9Y78Ag9lOvdFY29Rcoqw+dz/zi70nl0QkzO8kd3/ByYwLD7L6+JExn+PcyIs2c2/ePyufv/d88gNhbZMGJ8Z0CA0NxC0wYkHlyk/f1SbtsldQ2ZW695uBuJxkn8SB/nMAAcKNpnBQgTHWNrVsPKfgrEpszaG3ASqWvBQLpRxzCm6t8cUNPMYVxHMFcc6CWGc+K8FRW9O9zKDSVom4B/1SOMv3cZft5i7b7bRs36RlkU5f7fL4fFPY8dt6LWhACzolKD5ACi9aMR3EfiDzfHS6l08rpYi8QehJS3xQli9kOTGSmaj6PJuj0/+FYvrlAhFQ6RcbR+ROAiNu/JFX80d+bResYp24YsYV66wV8zQw67jKo23s2/da+btAvXHO9ay392a+vTdt3F7vLwreEKj7QTzVl5svD2aHvhF5PzxRJ6U3Gq+mS3CpYlt9FefvOduo0fbFEHPR3oUJokdYiI1m/GvPKXX9YGQda/WGoir1hxG4yX27hJbF57M/3X2yj4xkoqjjNx7gSV8deA93ezyWmpVXTA9unHPEgsq1I3tqEsNrT/9on7r003d9+bSQbYkDA+9AK6jgdHJGX6WqXnNCyMEJKqcwq3QKKnjSV1s45ZhTSDybl4LrEXMF8c7dgUpb+3kWVHrWL8Vl2R7npSylLD8wcfl+7lfhgl0JMmULGJgWaKJVQpwor3ChFT4gmok70D+Sl2INKpNNUg8m813IcgDRbEYdDzQwYBh4nx/nCARUHse1J2Abo4l688urz/EwpVhkmQb2X/xamzPBehVa6Vi/+G8C1Q8zr6S+vSfl7d333t7j9UXBa+yUsL4+85WnrkiegItGTrE/HWjUaBdHJNqMBsyLu59fruzLwfRG49LIhPeTZNZf4hclSdfEnNXqB/WPhYmid5+9tuBkRjskmx93X5Rf0pdz1OoNK6IS2oeMWGhZdFqy9sjZvuz88bYdsaCSce1Cfsym2sRwO1RNws67SXGPd8HIVsSBwXIAd1JhcDsRAGQqLK8OPJrOXZXoEnKqlVJwUoo5L+UUJxgX+OKEnMDC2fNsm5Rg3HveVRDvyj/GCTzmEBTnFHSYG3SQG7ifG3iAE3jIKfCwE/8Ql3+Ii1s6HuLwDjvxDnMDDnIDDnD993P993P8o9oUyV2+z1yDmLt8L3fZXufl+5yW7nFausdlaSR3+Z6Jy8PHL49w4UUFRt1ILW7UIhrRwNAKY/5mkDqD3N0k90MSP5C5I6k3I5mCxFggngKiKUjkBSIvEHogkTud5QeZXMicRauOMMheJ37BwJYnHqwbjByn/x24Kyr+02fpz/Frn7MClXbRFZus0peslb8KVN/OvHxvbMTdsRG33o7w+Lzw7/zqvoqn/uuXcqPJXrPE+v/SkT32jwN6o3HdkbM2v2cvTBRGnLnWl8NodPp5e8+364E4b19yZU1dv1cH7nacNMNsT7y68GTmI9R0WrImpk8s0ahpWRyR0BnplQxKh8d25z5iQaUsV34/Yp0dUkptYrj8wPf54ox2V4L8SBywMwdaQQV/U0CMoqTGP/oBd2Ui7jRvu19KayClXb8UruA4R3DMCVcijnHlx7jhNilxDoI4B0GsE/8oTqPH2fMYVJxYUOEEHOAG7Oc8QikYV7grIrnLIznL93GWtcpp6V7MKni6125P/71fbE86cCEzu7yRogAoCphqkzKGkc0DKQdknkbpbFo6DSSujHQKI/ZCbQKRFxJ6IqEnCD0h040SToFMN8jwo1VHKDCSHBU7uyfJcLpygGHQ5iP3/7C8zAwqHXHFOrTyX1Y1wSwFwdrhymh+V71W2kIr6r8IVBtmXLo5dteNsbt+Hvuj++cFf+NX/7WP4qmXbrna1dmS14gDthwwUfTRq7/YLKr7fpJ06b5Ttjbq6bpmrW5ezO123U4izlzTG4w93UW/vq+2sXnBnrPWoLL4rOLDiIS+HKS+uYWFsWzr3ZqX50VdUtcNxvS2duMfsaBiMhguh6+vSdhph7oevrZWWdnuSpAfiQN25sAjoCItVH0VdZezMsEFg4rNfikYVDr2S5kUHD8x5Khj0CFXfoznihOey067Lz/l7B/rFRT77jenl2xJ/jjs3EehSR+GJn4Qlrgk7PSSsLNLQs8tCT27ZEtHnVm82ayk9zdhfbQ1mR9xITTuTsLNbHFOdUsTgztTmrRgbEB1MTr5chBPA7EzyDwwpYingtAT4XBKK6iAGMdSCKjY2Y1HhvOYDjAMcg64+Cyv5lk2omITV6xZxTq00lnWSrv6xR0TV3CGPV+9ZsbFK2/tvPTWzgtjd7p+XvAXfnUf9dpn95pb+qF+0WNaSTYbtg7QDHMxRWgzxeL9M/IPd/fpS3yzVtdxttW1DOkg52xYLo7BZPqfiJOPEMX5nPl7zlne8BgLdU3Nc/dfaZf9Yj7E/D3nGppbHmOffdxkxIIKANw8dkB9aru9gYryxLZLe7cwjJ0m6fbxfiKbjyAHHgEVcX7VF/tuc1fiqV8dQIWd9NVGKe36pXCCojnBB50CjzgJjnED4matOc7fc2lfcsq5ezm3RGUP5BVpitJ0RXG6ojhNUZKqKEtVVKYqqlLl7ZWiqHygqMCSP1RarjI/X6mqqdPTOhNi/1ggLRjETep4U+4SJJ4FQm8Qe4DMk5Z54TLEWVOgDVTMlMJO+mLDKSSiMoLu3SfzVKrrNc9+IXuWX2uRTVbpIsneElrpVdbKK3x1iF/y+be2n31r2+m3tnM/z38V08vj65UVZUvDrpA0+ifzNu7jWdM0cz1TZhNUFp9VLNyd1Jf9N2paFiYIHwGD5Ny74mwK150ZggeD0Ke7HwWV5Nx5+y70ZSh1TZp50ddtFF9Ozl2wO6lRQ0ClL+522FZVXlx8dFPNqe12pYKYjZnXL3YYLFlBHLA3B9qDypeRt7mrTuOICu6Xwtb4Cj7JCT7BCcGBFDYvBdf4atcvxUVw0JV3yCXg+OSgE59GXY3OUGRWVDY1a40ImXBJMYYGGgH7Pwb/wPZtYZ8ZhPu4MG3C07CwkGUB0Qi3OkE4651maKqZapExtcep0hBj9nyQTsYpKMJpIJ5Oy7xNsskgmQwij9aIisirLTXFC0/6yvKELA/IdDNleUGGa9vULxMMzV+f7u8EkkzfvUdP2DsYhlkXdecPvJo/8Gv/YMUq7aIrlgz7fsSVl/lqgV9y4ptbT70ZdvytMKfP81/hV5v7RT7OM0/ttvxChXoIZpg8YbfMyDzd7kDlTF9O+0kAldrG5rmHb7ab3mZmswW7zwxO45R212gkR1QYhrm865vqk9vsClQe/LTWqO+37qHtLif5kTjQfw5YgwqSFCi/jLxjzlHhtFGKU7ClwNdxjChmSnm0X4pjYKxzQNxM/vHNsem/FNcokd4IOPsDjC2gK4FmETTcZOqTmPp4uiGGajgMddGsDkLtQ6HaA/CoUM1+s3SNe3X1uw3KnXTJd5AfAIol7HSvySDxBLEPEvvRkhmUdKpJ6klL3ZHEHQdSxFbTvTCieKIsj46gQgMBlf67m8ieBtgBo4l69bMbf+BhShloVulQv1gd4Hcu/s0tcW9uiXlzi8PnBS/xax5TPNUbn93UG0kO/QDfLiN39wRU+hhRIaAy2B+O8vzssrjN1Se32YlUJ7beiI8abBfI8YgDj+OANagwsiL10v2/OIUkOOPSXuaWKRZKOeYU0mm/FIfA4x5BsaFHfykoaTIZKWC0QNdAcz7UxkDVBijnQek/oWQxlCyAkvlQPB8KPoD8jx5R3oeQ9yHkLmmvnMWQs5jO+QfKWQAKHxB7QpYfCN9jxDONcm8Qz0ASX0bqhaRTQDwViaYyEi9K6o7nerF5KeZACsrywJSSSUDlcW4Rso39OHAtreDZr7ItlNI1q7SrCWZJXHm8rJWXeGr/aUmH3tgU/cbG/W9snPh5/ov8msfQGJ7abcVFSV6V/bhKRjLsHOhHUGEQ09RSd0+YtDP+43VRbuv3u6+Jcl9+fqP/pTBWoeZnwd5p66Lc10W57Yj/6BdhUpNmYCuAMYipb1KLc2+lSJJTJBc+2R36PxcuWmvxwb3sS8kZ8ivlqlya6R32E1AZgnv+yvbV1Se2Vp+0A53YmrV3vVbTPAQukEMSB3rtwCOgkl1a438oBYNK8HEWVNr3S+EExeNmKR37pfBilu4+n1JQajTpgaLBUEvXJyNlCF32IVWygCl5BxX5QdF0KJgJ+e9B3gLIexfy5kDeHJQ32/yMcmdj5cxEOTMsYrL9zALZVJBNAbknUnjTsum0zI+STaVl3iB+l5FOQXJHkHJxpkrGTBBOoyWe1qDykFIyJpOISq9vELKBPTkg+OnGM/6V7UCla1yxngZmPRPsT1btVixZK+0Kglkn2b/IUwdOPbXv9e/3vv7d7je+H/95/mh+TS/Eqx7Nqx7zhXTdvltV1U32ZCoZy/BzoL9AhWao3JIMXuSfViX9am3yqHUXWF381for/77h6iNad+n/rLswau2FUWuTR61M+lVA5B+zFNd6iwc9NLq+SbXx8KyAA08Fnfh/QhJ/FZL4q9Xnf73uyu+stebCb8wvhST+H17MfwTu+4s0727Pq+0TUOnhtejPt91JPFpw6LvqE2FDLuWxLVcOhvfnuZF9EQcG0AGcIkIDnqUFjLG6Cu86AAAgAElEQVS4ojowNsMhJJGLQcU6LyWeE4T7pTix876czf3mBUedAuOdBHFcwRG/lUeP3ZE0GYw438OUD/URUPoZKnqfKZqPiuehovdQ4RwonA0FcyD/XZT3HuTPgvyZkD8T5c2AvBmQOwPl+qFcP8idjnKnoRwswJqKsrEg24ttPO9DK6ZScl9a5o2k3iDxRpJpjMQLSd1AwkZRhL4g9GFwaooHEnmA0AOyJiNWkOEOGZMhfYpJPI7K8IJUd0ifS1fvA0TZbScVkqMygDf+MNy10UQ5rbhok1IsKy0Z9p1lrVjiKuYF6+iKBVes29hbWOVFnjrA98Su178Nf+3bHa9/8/bneT2lFJ569NK8Fz/P9AxILlc3MggNQ+/JkO3Lgf4ClZJKeUDks+svj/r6au+0/tKogMg/litz+9cXhJhyZS5/70trzvduPOsujhLE/9vle9EU1aMaygRU+vfC9Whv1RWlN3asVB8PG3I92LW6WC7u0aDJm4gDQ+8ABhWqFVQMSnXd2hMih+AETvBxc+N5634p3MBYp8BjToHxzoIYF8FhruCIY2CcoyCWwzu07KeLmSVKGneObKEaj1Hln0DRHChYCIXzoOhdVPQuKnwHFbwDBe+g/Dkofw7kzTIL5c2EXFZsIAVy/SBnOsqZDjnTIXsalmIayKcixVQkn4pkviDzRTJfRuoDEqzO+qUg0WQkmgzCySjLHczKcMOskjbFIH6bzvCEFDcmYx5dfRAYmoDK0N+GZAQ9cKCpRf/c5yILk3S20Bmr9HUmGE+9cG5k6PvfbXn/u02Lvl3AOzU7JHlWsC2FJM/CujB75YV3V1/44JtLe06lKWubCaL04CKTt/TIgX4BFQYxW2MXrU3uHRJYkGZN8qjNMe/0aLg9fhNFGbfFLektpZiHtP7yqID9v29uqevJ0Qio9MSl/n/P9aN7quI2q4+HDqGq4jdf+Ol7Zohq2PW/p2SPI98BBIAjKnh+K2NsaNaGnpNygo5xg4/Z7JeCQyiBcc6CwxhUAmMd+LEcwVEX/qHdyalKrQbX8tKkmpQCU8linIhSNAsK56DCh5QCBe8AppSHoNJKKbkzIWcGZM8wgwpLKdMxorCUgkGFpRTEUgp+ZikFJD6d90vBlIJlppRMd2gFlcnGLBcmwwVSubRwNqpNxtXFSNWvkX+fj4QzDD+e+geeujM+abe+M1yxnglmHV3pIrTyPL/mBX7NCzw1b+c1pu1B04zJRHUmo4miaIaiGVJ9eCTcefZ3Dv0CKnqDNnDfXy3g8RgLAfv+C8927r+HwajlH/3/NvQ+wmNhldsZJ2m6+3wVAir9d9F6s6eWpsYHu1arj20ZQmXtXlMgyezNqMl7iQND6wAGFXNJYGBMehM6cC17cvARbvAxc1fHdv1SnALjORhUYlwEMdzAOAd+rBMvxmd1fHJqtgFpEd2E1AehdA5TPI8qXgiFflA4yxJLYSnlHXNqiiWi0hZOmYkpxQIq2dMhmwUV+VRg9RBRpD4g9TWHU9jn1saOHfqlWIFKpju0goobpLvQ6b4o0wHSODrRHGgUtZZBHtqL0MnRydSvTox5Qlf/5fPrlsLE7bDE5o+9Z5VaC65YpoE9zFphQeUJtZ6ctp050C+g0qSp40X+8TH4xLJJwP7fNTbX9Jc3DGIKy8TrLjxmhMc8qu1xiw1GbbdDIqDSrUUD9QbRrSt5B78ZKlCpit145eDOgTo3sl/iwIA4gOeLt/6fYUwILqQXzfvuBBdnpLRVIg6M5wbGcQWxXEEsRxDHEcQ682Oc+TFO/KNOglhn3uG535++KylHSIcMeVD5HRRNhaJ3qeJ5OCOlYA6yTPdqjaXMAZxAP6t9LMUMKjl+GFHaZnxhSpH5ghRP90JSH6y2WApu7Cj2RmIWVCz9UkRsvxTcMmUylhlRzJSS7gbprpDOZVJnQsYESHPRSP4bjGpMaSSiMiC3FtlpfzpwT1z6jH+VTSDpemXvcaXGgiuWTvY4a4WASn9eT7KvPjnQP6DSUhcQ+ZyFOh5jIeDA7+qb1H06E6uNEWL+N0F/3cU+gcrGw7N0eo3VXm0vElCx7cvgrL0Q/nVV7CZV/ObB18/bQjSN9YNzmuQoxIF+cqAtsRXRgMDIQGZe1fLdF1tBha3uZaYUZ8wnsVycOh/rwo9x5sU44XlfsS4B0R9tTU7NqQGGQpr7qEyAS3sVzEGFcyF/HuS/25qXwtb4ag2n5M62TSmYVR6lFPlUHD+R+iIpnu5lRSk+IPLGMvdLEXkioScIvVixXR0f5qW44UlfGFFYpXHo1GmQMQmlTzEWbAGkMwEBlX66lchuBswBhkH/DL3aq3CKNb10xiq9y1ohoDJg15fsuLcOjEhQoWkqK7uvoLKJgEpvb6bBf3+BJPNeeIgqftMgS7x3rez+rcE/X3JE4kDfHDCDCgLGxCAwIqiqadx47C4nMM5ShpgriDNTCgsqsc78oy68NlDhx7r4H/zHjgspBSocl6i/bCr7FxS+g4t65S2gC99lcKUvS14Km52SOwfMoJIzozUvxRxLyZ4BihnWeSlsOKUVVB6Z7iX2AXEbqFj3S8Gswrafz/RojaXgvJRHQAWlu1DpHky6I50xB5SXKNDj+cUkotK3e4hsPdAO1DVp3/zy8jNtDemtIaTny53hSk+zVnjqgJ3XBvpMyf6JAz1xgIBKZ/EfAio9uX+G/j3Xj+4rOfytKm7ToKks5vuLuzdRxh5VhRt6g8gIiAMPHWBBBSFg9DQLKgaj6fCNHM+1py2g4mwFKs78h6DC4cc5BRx19T/wzx0X7pWU4nz8mmRDxUdUyRxccVjxgbFkBlXsB/mWvJQOoGJBlFZKYUGlLS+F7Z3SS1DJ8sRdHTsDlTQ3Os2NzuJSqU4g+QCai3Wg1ZqLCTw0xI6WSI6KHV2MIR1Kmrz8uc+znuHXPtPWkL7nfNLunY+PKzz12kjyj3FDeh+Qg7c5QECFgErbvTA8/0uZjBd3rC2L+U4Vt3Fw9PPW4OrKsuHpFhn1E+4ATqZnxZiTNUwIMrJLl+06zw08zg06zg2McxEcceHHcASxEwJPTQo8yeaoHOHyjzjy4xx5R10CDny682JqkRIQoLoEVPwxU+wHBbMgey5T4McUzGCjK2wx4tYyxDMhZyad50vn+UK2H8hngWwWyGeAYipke4N8CpbMC0vaJoknSD1A6oEkk5FkMoit5Q5idyRyA5EbCN2Q0BUyWWW4ogxnJtOZyuKasDjGTI4pwxlSvCCVQ6V7Q9k+MIEO12U24Xx6u3wQULHLyzLYg2IYFBaf8gyvxgwqfceVx2QVnvqbA3cG++TJ8YgDthwgoEJAxdZ9MazWNdaor2wNVsb+oBpwbby7IyhflD6s7CGDJQ5YHMCd6S3p9LhbI4K6Zt2ec+meIfEcQSwnMN5FcNSVf8iFf8hRcNSJH8flH3XmHeYGHObwjnACjrj57//XjgsZBSpcPaz+JBT+N1M0Dc/4ynkH5c9A+TNt9kthzF1TzIEU+UyQz0bydyj5OyCdCdIZIPHDErdJNB3E00E0HYTTWpU1DVrlC1k+WJnekMEqfQpgeUPaZMAJ9C6Q5gYpnnDPB36ZBikuTNZbBsm/oKkAGDABRRNQsdwLZMEuHaBo5o0vL1tTSt9Z5Q/82l7iSs2fCKjY5e3xZA6KgAoBlZFw518/dqA0er0y9ocBVdZPK9OvnhsJfpFzeEIdeARUGAQUm1J/L6/mi12XXQIOOvDjHAXxLvyYybwDHgGRbrxoZ95hl4Bol4BobsBh54DD7v5Rn+043y2otM+el80D+XuQ7Ydyp9B5k6k8D1OON5U9jcqeSmX7mhQ+JoUPJcei5T6UzNssk3SKSTqFkjyUSeKBJZ5MidqU5U5luUOKDzyYgvkk1R1SXSDVGVI4kOrEZIxrEntDbSKw8zQRaBDQbfUE7O4OIBEVu7skQzEgRbH698vLOoJK33Gld6zCq/6aRFSG4gYgx+zoAAEVAiod74rht+ZW4lHFj/zKmG+Vsd8PkKqOfHvxu2WqsuLh5w4ZMXGg1YGHoIJbPrJf22kE9QY4djt73oajTvzYSYEnnQTHXHmHJwfsdwmI5vBinAMOOfsf4gQc5gbEuOOISo9BJaetX4rsHZC/A9l+TK4PnevJ5HiAwgtk3rgYMZYP4H4pbWIrEeN6xKIpIGwnc1LKZMhklTEZ0t0h3Z0Rvc1kTkQ4nOKJle6G0h2ZjAn6rMlU6SGgakxgYPBkNXzSjL1m0xNQIR9TAPhk85V2877aQUu7LJRe/WjNKs/ya5+zkiXJvrUvJK+aTP0iN6SdOEBAhYCKndyKfRrG7cSj8p0B2Tv9Kw59rTz6fb+rMubb/N3B59Z9Vl1R2qeBko2JA0PpgBlUWmd/mXuq4FUMU1mvjTibNn1NnAM/fhL/mAMvzol31JEX68Q7yg2I4QTEOPKOOvGOuqzY/48dF9IL1IAQXXcCCj9mCqfSBbPYqV9+KH9G+1hKa7+UKZDrjbL9GMU7SDoXRHNBOBey3gWZL5JPQTJWUi8k9UISLyTxBLHHQ4kmg2gyCN0hyx0JXc2CLFfIdMHKwM86sbte6G7KcGXSXSHVDR54wj0vSJ0BpT9CS70RoAUaaKBwAQAEDBiG8gp0fmwCKp1786S80qDRv/rZjXZkYvPHXvFJuzdb44o1qzxSv5hXvS3uwZPiOzlP+3aAgAoBFfu+Q3s2OjOoKHasyA33Lzu4Tnn0u/5jle8qojfk/STIDucRUOnZ1SDvslsHLKDykFXwWBkjQxkLao27zoveWYtLe3F5Rxx48Y68eC7viDPvsDMvhsM74hRw2GV55Kfbz6cXqFpBpeBj2gIqeX4orw1UctjG821lvphcTzrXA2X7gnw6yPzY6sMeIHEGqTeSTW2V2AeJfRiRNysvxHZ1xM9svxSU5dlOkOHxUHemwj1XSB0H6a9RGRO06TOM0gBQH4SWeqBMBgA9LkqsxxEVnEmPm6nY4YOAih1elEEe0vm7Oc9+LnmGX2cTTtqtbIcfvf2xM1xpDa3wqk/8LB3k0yeHIw7YdICACgEVmzfGMFvZGlEJ52VvX5YbHlC6f7XyyHf9ovKD6/J28bJ3+hNQGWb3BBlupw5YcKWtCBhjBNqoo6GskbmYVhgcfsovIMJ1+X4X/4Pu/lEe/vs8/CPdV0S5Ld/nuWzXl9sSsgoqOwWVRxEF2AR6OsePyZkK2Z6gcAeFK53tocvxacqZyuAGKW3K8oasKViZU9qKDluhSLoHYE3GSmOF01HadN8H7rkzqe4G0SxjId9YHc/ochmKJRMwAgUMjUEFZ9LjM7bTLBUCKp3esE/GCwyD+D/d/J1/JQsqPWKVPtYv7oJVnvOvLFU2PBnGk7O0dwf6C1R4kX/s7Bt/T9YH7P9dY3NNf5lFGj72l5PDZj+3E9ipX+GYKHJ3Ls8LX1G0N6Qq5hvlkW8fW1VHvi2JXJX7o3/OzuXZ4QEEVIbN3UAG2o0DFlBh2BADgxBNMzTN/kevM1Som69mlm9LEgcfui/Yfzto/83A/Tf5B24HHbyzav/PPyWl5FfV9RRUcFfHGYxiNqOYDnKcl2KSzKUL1kD9aWhMZZrTGE2qWag51SymKYVufkBrsBjNA9TcKqbpPtP0i1mo8RdouofViJ8N+hsGzR2mOR1a8kGnBEML0AyDoAWUiGHjKRTFAG3EWTl2m6ICBFS6uW1H+ssMQmO/uvwMr7YNVOraFnBDla7V23CK9ftt4sqfP0unaHut5D3S7wRyfu0c6BdQ0Ru1gsiXewIktt9zZRQv6jm9UdtubI/9I4OYnKK0dRdH2T7c1R6t33JknqEHQ6ptbJ57+Obi8zlLknPbacHuM81a3WOfxWNvOOqxtxymG9I0czgiQrKTnx3Oyw4PyAv3N6sgQlBxaH3VkW8fQxWHvy7cHWTeTy5LKRhU1n9WUVQwTF0iwyYOdOFAW5QBAUIIgd7E1LcY1Y16VYNO3aBVYenUjXi5vllvoihAiKk7AQUfo/ypKG8mKGaj3OlM7nTIaVP2dDBLMY2RvwOyGSCbDLLJBvkCXdk2hpbpcFJ7E0ADMC1AUbgwlwkQQ9GgAZMRTAYw6YHWAqMHHPChcG1hI60BBjdE0eK5XCZoYhPjdQwYEBgB4VG19olhzwdXJDZDGRtFYdeZU+q7cGLIXiKgMmTW28eBm1r0zywrboMTC6WYF7oBlX4PrTj7X8SsTx7EATtwoF9AhaapjYdnr7vQIwDoCA9rL4z6JtqHwR3I+u3RomsKjP+3DZcfc0gbLo+6fO+gieq++TgBlX67Zo+3I4PRdObSrdJyteT8SVk4ziTJ/ZGXv+uhSiJXlkevrzz8dU9wpTLmm4pDG0qiVhX8xLfsJPdHXnY4TxHOu7lnc9yJc4rcQvIb/PEuFtlqpDjA8kwrqPiiXLY1Ss50JncaypmOzKySPQ0UrORTafkMJJ+KQUXqxUgXoqLN0PIAjNVGRm9gdEZGQ9HNJkpjoJv1qEEH1QYaLxuYBj2qNSCVAaqMqMKAykEn14GWAj3ocLKJAVpYUOnPvxxDeIEIqAyh+UN+aIZBX+24biucYiGWgWWVR3qt+Fdu2E+6PQ75TUEG0OpAv4AKACgKH/Bi/n1978Fg/eVRvMO/Lqro56wtijZ+fXDKmuTHAZX1l0cFRP+mh1PRCKgM5WeJYdDPtx4UlCoRQvV1jVmnY6U7+TnhvIKf+AURAosKdwcWR64s27+m/OC6ykMbqmK+aafKw1+XR68vO7CmJHJV4Z4gy4Z44SdBDg7U8IQR64plUhPN/Hw77da9DBNFD+WZk2MTB4bSga5ABQdVcCyllVKABRVaMRXk7iDngtwVyaczOUuM2Z8xsk+R7GOkWIiy30XZc3CvFel8kCyi5Isp2Qe07ENG+hGIPwLhhyBcAsL3m2R8g6mAxv3lkQkMmFfYQl5D6UT/HZuASv95Ofz2pDdSf/7X/S5BZfBCK3/6PPN2ZtHwM5GMeIQ60F+gYqKMD0Tn+Ef+fe2FUesvjlp/qUdad2FUYPy/3Uo/TtNU/xrMIKakUs479Ot1F0dtuNJTXFl/BQ979dlfHb+y0WjS92RIBFR64tJAvSdDlH39bgaeqsI+GhubRUlxsp383B95RXuCHlVg8Z6g4r3BJftCiiNXlkatKt2/GitqVUnkypJ9ISV7Q4r3BBXtDnx0q6C8XThKI97Blz+4bzTi25Si6TSh/OqtlIE6K7Jf4oC9O9ApqLRRCgsq8qnACil8QOENsikgnYIbpAi9QTgVd52XuCGpGy1zo2TujNQNRB6Q6QNpMxkRhxE5IaEzW4bYHTJdcRniDK4pyxMMefiPBa3XQ7MWDBhU7LUvSm+vIQGV3jo2kt6feFP++07nfVmCKpaFgYyu8Gq4Ky4YTeRf4kbS/TW8z6W/QIVtpMVUVRftOPZRcOQbgn0vdyE++2pw5Bs74j9S1ZT076Qv6+tRrsxdu99ZEP//dpxvZnPN6jO/4u17PvnOPganYPboQUClRzYNxJukeeU/HLzRLrLRUN+YFb9PEc4riAgs2RfcRxXtDcoO50l38DKvXaXph7+4GQYVlasv3UobiPMi+yQO2L0DGFSY2hOQ9xGT58PkzgD5bHbS17R2sRTcz1HqC1IvjCjS6YxkFiOZA+IZuNgXbpbiBiJvJJzNCN9jMmdB5jTImAYpfpA2DdKmQpo3pHpCmjtkYFBBGc6QMQE05YjG9ZT10IIxBYNKj/5Jye4tJcn09n+JBmqE//sH5b83Xfl9gPr3/Lrf49rEPdFAscozSwsu3c8bqFMl+yUO9N6BrkDlnGL+nrO92iVCjN6g1ek1/5siomlpsKhF12ReY1nfomvS6TVGk77nSNCrkZjfTNOUTq+pb1LnlwrlhQ8UhSnywgcWKQpTzDKvURSmqGpKWnRNVA9SUyyDYUHlFkmmtxgyGAvNLbrw2JtT1t3V6G1E4lSqusyD2xTh/KK9waWRK/ui3F0CebhAeOaYTmvjy1Beac23EWcKy6oH45zJMYgDduSAGVSOQ96HGFRyWkGFyXmYl2KOpbCU4guSqaymM5LptNSXlrvTCgdG8RaSOSCxJxL5IdE0RuxKSd42ScdS0kmU0JPJnAxZLpDJgQwuZHgwGdNMabMgzQmaq3E2IzKaAAML0IBgCCqWDMSlIBGVgXB1WOxTozO+8eUVM6X0L6v0OsmeV/OvsJ+ZtkkKw8I9MsgR7wBNM3cl2YtOS9pVrFqSnLv4XPa8fckjwwGGYRjUvR7jZGubNPNj7y+xXfUrSaOz8f32MY7Sq01GeNWvglL1R9+dfiM4TVreaZ24KmWdMHa3Yldgyb6VZVGrHk+Fu4PkO/nCk9G1NfU2LwDDoOhrpY5fndyXcK9JMwRX2uaoyEriwMA70CWotM34AtnUVlCR+rBNHqezsZTZSPgOLXyPEr4HYk8QTsHTvbLcIWsCSBz0Im+dZLGh4DNj3oc6sTctdISs8ZDhCGkekDINR1daKtl+jZrWikQMYuuFDfwZD/wRCKgMvMd2eoS8sto/fCGzBpX+xRXrYsRdLfOqx351pbax0z+sdmofGdZId4BBKCu3aNFpcUdQWXI+Z97RX5q1uoGbmjXc3WUQKqxQLky05V5y7vsRCXpj93XD+t2EEQsqRhN1MOmew/Kkv6wrCDipprssnqiqqBLGRuTsEpRGrao4sKa3Kt4XIg/nZ506XFNd18UVyq3See2s+t1nv0wLPC7MLuvineQl4sAIcsA2qKDsaa2BFFzjixWe9+VLy6Yzsml49pfEDTekF3NB7AwSV1rijURTIcsXg4rQXS98Dwq3Q8MD0OpBWwnVZ7Uyvj5rBspyhkxHSHekMyYjQ6EBmgFqcGYKbgPDsBWIR4K1BFRGwlXs/TkwDArec+v3vOqOoDKouMKr+eNnGdfSSP393l9CssUAO8AwTHVD08JEkQ1QSc5dcDLzRpacJm1/OrkKeqNp68lLNq1bcj7n44hTQ2LdyAQVimY+3HDqVV7qq9/XzIuuz67SldW0dBGgZhikqqhK2bMxd5egbP/qyuh1PVdp1CpFOF94fH99bVeUwiCkqtfdy9OM+Vr9lKDo2U8urvrxvNFkYzZaJ/cPWU0cGJYO4PlWJoCaeFOJH5XnQ+X5MTnTQT4TFNORYiquRIxBxReZE1QkPkjqw0i9QTIFJFOQ2BMHUswS+oDIBTJmQoYfI53IFAZCcxmgFtxTxailQdNSLzdmzoYUZ1O6J6Q6mjKcoaUe/+MPqm8DFdDjd4+EBwGVkXAVe38OFE0//9m93/NqOwOVwcha4VU/+4X8gaSUVN7v/QUkWwyGAzTNzD10Y/H57I5fuBedlgRHJ+mNbKx9MMYynI7BICQvLp974GpH3/DEubMK/6iEITmfkQYqFM0cu5j26mcX/vJ99V83N/xtY11GSQtCqKBKozc+THDv6DVCUKVuSvnp69xdgorodVWH1vdE5QfW5PzIy4zaolbVdtyn9Rq9kS6v0SKErsqanltX89u19U8Flb/yUdw9YSFllXlvvQlZJg6MAAdaQUUVRxXMZxRz6exZTM4UkE9DWFMRiyjmZ3bGlw+SeqNWSvFCYi8Qe4EIC4m8kNgFsqZBlrtBNAmqj4IW9EDRBgCaaYFGgBpa9gGkuJvSp0GqL5MxCVqq8Z8jpGlt7MiAEQdWRsKDgMpIuIq9P4dL9/N+13k4xUIv/ZVhbyNrhVfz0me3Tl2X937sZAviwCA5wCD0YUTC+2fkHb9wLz6fPe/I3YTbqYRVOl6MwkrVv/YmLD6r6OjbkuTchYnCPeeud9xqENaMHFBR1zWduSmeGnjq1ZXyv21u+NvmhvHb6k6mN5jrESOESqtbTF3G+xCCsvwiYeTGHBxXWVN5aH3V4Q1dqOzAmpxdgqyozWVlyq4vlcHE5Fc1m6efGUzoh4sNf9xQ+9u1dU+vrvnPz9N9+cfO3pI0NJHJvl27SF4dlg5QwOBW8eozTN6nIH0fZLMh2wMpfDCotKMUqS9IfEDijcQYUawpBUReJokHJXFnhF5INMkgcgX1DWiBZmC0uBe9RosZxEgpvoI0rjFzApM5HmW8DS2lFG42jz/2uBs9PVIwBUjVr2H5WejjoBkGLfjmctfhFAur9Di0UvcMv6c1wZ4JUDqtuJihqCCxlD5eSrL5gDrAIPTTmWsLE4U2v3AvPp+z4ETG4p9Onb6TVlVbr9UbnuT72WAyVTc03ZVk++9PnHfo5qIkG0UIzDbOj72XX97Nd90BuqwjAVRatPrIhLuzViX8VZD69x+q/74FU8rYsPpNVxqsC5JodJS6QW/po2LTUIpiikRZwoi1OT/yi/atrIhep4z5uqOqcEP61Tm7BKIDW8oKCm3uyrKSopmCKk2LVc2xygbTh4cxqJj1dEjV7z+9Pi3o5KEz9zVag2VDskAcGAEOmMx8UHePKfgK5NNBOg1kPoxiCpL7tIKKOXueTVCxBhVLLMUcUaEkHiaxG8rygCwOI/SC4qOgZfRg1EONARDFAOiatJIlkMZBaRNQxngm3Qm0BTTCxb5MwFCgweWJu4qqDiezSURlOF2tfhorwyDngEs9B5V+y1rh1TyzvOzZzyWCn25o9WTOTD9dTrKbgXRAlF8y99ANm6WrzF+73z8jX5Qomnvo5uk7aUOSdzGQZ9+LfTdqtHMjLy1KEL2fJF18zsZkObNdi89lL49KGJKSXwAwvEGltkETGv2z84qEvwem/P27yte21L+2uf7vWHX/iK2ranzkVyqDULG6pbGlm0nqRhOVk56WtTMkO5yX+5MA48rBdaqYr9VHvlEd+abq0IbSqNX5EUHZP/LFu9cVSsTWLVNs3h2V9XphUUO7l/JVBudtyt+urW3VmpqnAkue+fzOhM/jd8XffpL5vp1R5Mfh7gBuX0ID6CqoihAqjwsyH5DMZiMq3q0zviTmMl8+INsLGC0AACAASURBVMZC4intYikg9AShJyP0wF0dcf6JN6R5UuJ/Qv1FQMVgpHFzFEM9XbhXJ5oA96fA3TnwYLohYyEYS3B5YlzqizYQUBnud9ITP36GQd8fuvc7f6V12KQny48/E4ynfvZz0bill77afi2/rOaJvwLEgGHjgImiP919clGS1GZQxbJy4amsw1fumKgnN1u4trF5XvR1iyG2F87nzIu5fV+WZ/1P/4N5KwxXUGls1gXvSBq7NPm1dXmvb1S/vqXOrNe21L22uW5cqDpPpW9tQW9lZ2m1NiW/oesKYLidPEVL794R7wzMDudlh/NyfuTl/Mg3i/2Rnx3Ok+0IyLqf1i2l6Ix0elGzvLzZahSti+Jy/V+/V/12Ta21ng6pfGqZ9E8fJqzffbFJM0J6PnQ8d7LmyXGAQQxuYkIZ6cZoXfFsRj4HJO8imQ+Sebc1TvHBgRSWUkDkDaIpD2MpLKJgUMnygAwP3HU+3QtSpkO6B5XJ1Uk+hrIoUF8H1SW6IJgRelGi5+G+L9zzNWWNp/N3IGjEs76MQAFjAB2OqHRRUmNYXRISURlWl6vfBqvVG7cdS3EOuOiw/KLjCvzcTk7+l8xrLK86rsDvdFzeXk5drbzgt+riip3Xo5OF4ryq2sYWkkjZb5eQ7GiwHCiqUs/fc66zjAvzN/JFCcKo5JsEVGzzSXKuufnMwkTx1pOXhiqcMswiKhTNqGobUyRFi9ae+HvA3Tc3q94MrXsztO6N0Lo32kDl9S1147dWP8hvtjnFq6xGm6s25VRobL5q/fHRavXicyfl4QIzq7R7lv8YmHL5ak++9MjKmtNLdIpyjfXOzcsMgw7cbXx+ffVv19S01+qapwLLfvfxpUVrj98XF6nrmjpuTtYQB4aHAwhnhmBgoAqNqnCd9F+MxI+ReoLUClTEPiyieLeCCps9j2d8mUElywMyPSBjMmS6M5mTcXvHdBfIcGIy3A1p72rTfesk3rTwbbjvSGW+Buku6MH4FpkvaOQGPOPLAEacS4870+N5XyMkE4yAyvC4+QdglK093hCiaNoiBiGzLGsomu64xvwqY7WtZdm8YHnG23ZZ038AzozskjjQzw7czJIv3HPm/bM2surNX80XJoh+OnPNRI2UOcG996+biMr5nAXH0344lmwwPTJBqffH6dMWwyOi0tyiv/yLdO3ey+78xNdXSd7aXD02tO6tsLq3WFDBrLKllVUmbqvde6exMw6pqNXlqEyi0pYmXfem19Y2JP2469zG9dc3r7obGvJLaMidLSFXNq0+88OGn2Pj9T1oz1mvMd7Nbcos1eVVtdi8So1ayv9k7W9X22IVll6eDq566p/3Jn55fN2+Kz/fV2hs9by3uWeykjhgLw4wQIPeABgaQKeAsi0o2xdkk9vaO7IJ9F2AiplSMnE4BWV5GUWuBsl4JssF0nwgzQ2yxkHmOI1wIqQ4wM8LqHQ3Y9ZESJsDVffAQGtwNKUZ9LjwGM79ooEG2/1Y7cWrHo+DgEqPrSJvJA4QB55QB0wU1diiPXDx1tyoywtPZS3u0G19UaJ4R+IVAiodIyqLz2UvOJa6MOK0rKjMYKKGatKX+ca1d1CprmvaGnNt1qpTEwTX3vo6/+3QmrfD6saG1Y0NxXortO6tLXVvYtW+wUqQWFuj6XS6YVW9LltpFJfrS6p13c4ByVcbZmzNm7I2dc66mwvXXV247sr8dT/7rb3jvjrt8wOFDdpuEJxhUGZhk7jCkFasLavtdBJXZZ3x3X0qzCqd6+mVyqeWy//8abJXwPFtMdfVdTYmkj2hv4fIadu/AwgYtpMK/rcBGsBYB+pEXe4Ko3QGDqpIvEE8BcTejMjXJJ5uEM9ghD6QNQUyPSETh1BwICXNA9K9jCIHg2SiUTyRkkyihJOoDEeU4YzSXakMN3jgCvcd4cEEUyq3JWc50j/oJhHN/k3rboQEVLpziLxOHCAOEAeAYZCJokuU1Wfupq88lDR33wX8/TtBuOi0eFGSdOGpzK2nLj/JoNLQ3DL3wNVFp8ULE4WLEoQLTmTMO3zrg4hTG49duJ4pq25osod5cfYLKrL88i82JkwKuDh2rejtjRXjt9aOC8N6m9XY0NqxobVvmbWl9k1WUyOUpbVdfUVRNejlVUZZpSGrWEPjekCdPrRGesP5upe/rxvzXd2Y72rHfFsz+husF76te+Hbuld+qI26U99Z3Ma805omg7BMK6k0PCjU1DZ3NaqcKj1OrF+t7karVE/zi377Vfro/z712Q8JdY22ozSdnhJ5gTgwJA7gfxIwMqCjgcKfOYoGWg36NKj5js6db5T4MlJ3EHNAyAGRO2R60CJvo2iKUTzZKHI1ilxN+NnNlOUOD2aymgYPvOCBO6S6YaW46dM8tFmOGhFHJ/snVP4MGgOOniD9kJzroB2UgMqgWU0ORBwgDowABxiG0RuNtY3NOaWVCbdTt526vPHYhc0nLt6X5XabbDwCTr+zU9AbTbvPXtuZeCXizLWTN1PSsguUdQ2NGq098IllzPYIKrlFVe8Gx41dmTEhVDVxa82EbbXjt7aqC1Zx2qoqr+3m20ltk0FUrpNXGcVlumJ1V1/07+c2vr6hcMy31WO+UY/5Rj2a1Qtfq816/mv1mLWlueWdpo4gBAUqbVaZTlJpuF/Q3KjtZqbZmaymF7/uAau0wozq6eDy33xyb05QbFE5qcRiuZnJgl06gJuYmACaAZpooEyA+9RjcNcDNLdA7T1Uvl2f9z862VSjxIuW+ELWVMj0xUEVPOnLHbJcIdMNMlxblekCmS4oy8WU4apPdzNmehqyv4DyfVCfCVQTAj0CPU4e6+pfBuzSpV4OioBKLw0jbycOEAeIA8SBYemAvYAKw6ByZd2pq5kzQ06+vUY0cVv1pG01E1lN2FYzYWvNeFbjttaMC8N6m9XY0JqxoTVvhdZwdlQnZjV1O5tLozelFGnkSqO8ypCS30h10v+xroXyC5WNXlkw5utKrA2Vo9v0wobKF9ZXPs9q9hZxTbNtAtEaqKwSjbTSIKk0pBRoGrWdzkYz3zUmill3tvb3q5W/Xa3qqVapng6q+M9/3J3iH5dwXaSq7ZSahuWNSQY9YhzAqfS44SIgChBNMTjgoWWlN/c1wTXBtKDNhcYrdE00VGyEktVQIEA5y2jFZ5T8H5T8H7Ts05aCjzQln+rKBYbKLYaqw7TqZ6iXQosSjC04YINrEIMO448egQ7QCEma7+wuIKDSmTNkPXGAOEAcIA6MJAfsAlTqGjQ7Y29MD0kYv0Y4KUw1aVstKxZUtmJKaQUVFlFaQYVFFDOljN1S83VyXaOum6QRXHeYZu7kNCqURoXSKCrTVdhKHWnR06tPq0avzB2zMu/F9aVj1rVq9NrS0WtLX2jT82tLXhJIdv5cazAxHW+Iijp9ZolWVmmQVhrSizTNum5ABQAaWkxLDqp+u1L521WqXunp4Iqn/nnXZfmJ8LhbZD5Yx2tB1gytA2xXeGArf+GWJmzpLRqB1gjNBmgygMaEZ4WZ8ERMTCxt72HYTRgEDNMqcyyGZtcj/AKN8/MZmq0qBtAAoAEECGfMA413NJIfBFRG8tUl50YcIA4QB4gDbQ4MMahQNB2b/MAnKGHCmnSHsCrH7TUOrCZtq3kYUcGgUj1ha/X4rdXjwlr1dlj126HVY1nN3qssq+vRVA+E0K3sBjOoKJRGaXlLu6AKQuhkev3r3xa/GJLzYkj2i2sLXlxTMKZV+aNXY71g1qr8/1ounLSpOL2ofelhhNCDvAZZpUFWhZVZrNFYtaVvc97Gf/NVerftVU+vUvZaK5VPBZb87rO7jl8dO3tTbGPXZBVxYIgcYEDDQCOe7cX2XmxDERwDaVs2swcAYgDhuWGGViEDUEY8WwyrFXUecg8bpMFRlBojaPEPmIJoAAMDCNf4GtEPAioj+vKSkyMOEAeIA8SBVgeGElQaNbqPNpyYtDbdMazSaXu1IyuHbdVmTdpWPWlr9URWGFTCsMabQSVUPS5U/TYrh61KeUVPp3kghH7JbVCocEQFg0qFrl2ae2mt4d2I4pfX5I/hi8YESl5clTPGrJU5o1dmj16Z/cLK7BdCsJ4PUfxxaerzK3Nnhee3o52KWl1WmdZMKbIqg6i0paVnoMIgFJvS+Pz6yqdXVT2enhIUPf3prQ/XxesNPSI38jkgDgy8A3oALQKqFTGgLbpiZFNV8KwwXAsMU4qZZPAMTj07jasFwCx2ppg5xoKnkLG7wFTDAGLnk5nPwfwGHFDRMyOlX0pnV4eASmfOkPXEAeIAcYA4MJIcGBpQMZmouxl5XP+znLBKzo5qzvZqJ1aYVdpAxYEFlYes0gYqmFVYUGGfVdt/ru26+pb11UII0gqaslVGLKVRUq4rq3mkgf2e68qXVspe4qW7htz7S1DWiyGSF4MlY9o0OkgyOkjyAqvngyR//eLGn1ek/SlIuvdalaXINEIoq7hJVqmXVxnMwqBi6H5amnmcGh01L1L19MqqPqjyqcDSVz6Ou52RxzA2pqVZG0KWiQMD7gA7EwshHPAwgt4IWgqMCNNKMwUNRqDM8RMTnq9lQNBgTmlpneHFtpLH5IILHNMGMJnARIGJxrPB2AdiJ4zh2V80hV9ia/mZdzHgJzaUByCgMpTuk2MTB4gDxAHiwGA5MASg0qIzbDxwxSHkLme7mrujmrNDjbVd7cTKcbvacZvagdWkbepJW7EmspoQpp4Qph7Pyswqs/epcpS9mOWBEMosalIoDRZWEZdq2Jqp2O+yGt2kDeLXBKlf7JYmZ9W5fyd6MTDLrDGBWWMEmWMEmaNZvcDPfH5FaszNyg93iF5YnsL9Tlqgao3qNGiMwpIWC6VIKw2y8hadsaegAgC3spufWVX+9MrKvuipwNLn/vvsnpO/GE0jfLL+YH1SyHGIA3bkAAEVO7oYZCjEAeIAcYA4MGAODDaoUDTD33HGcU2q8w4Vd4faLM52DCqYVbapnbapHFk5bFU5bFVNatPEMNXEMNWEMNWEUNX4Nm1Itp3L3oVdktKmHHNEhX0WlWnVjbiosYlm/GNyX+PdX3kkR1ymyyjWfrxb/hI/9UVWY/ipY3ipo1m9wEt5ISCFuyZVWqm/ld30rwjJmK/ubr9Qau7dWVytk+AKyDicIqs0SCr0iooWE5720tMHRTOzI8qfXlnRV4WUPf3P24Kd57Q6Mg2sp+aT9xEHhoUDBFSGxWUigyQOEAeIA8SBPjow2KASvPOM0zdilx1K5x0qllVU3O1YnDY5bVO1sgoGFaXDVuUks8KUE1lNCFNOCFWOD8Xrzwh7XZNXWtqUX23KURnNylYaMosacfp7bv0bK25/e6Igs1ibo8QTww7cqPwr/96LvHsvBtwbw2p0wL3R/lgvrbi792pFNvu2lMIWQXT2lPUPKuv0BhMtr2iRVxoUVQZ5JQYVUZkut6ql27rJ7a7i8ZTap0Iqnu4P/fYfN7ccukbmgLVzmPxIHBjWDhBQGdaXjwyeOEAcIA4QB3rowKCCSnzyA876VNedKpedKhcWVLpjFQwqnbGK4zblvfz2Fbe6Pe1CpSZHbXwolTG9WFPbZFh1WLb7UqmiymDNMD+cyn/+yxsv+t950f/OmBVYo1fcfmHp7UU7JenFLa3zx1RGYak2IEoWfbW4RU+lFTUrlGw4hS35Ja7QFap7mutvGbyopPmpwLKnQ8r7QUFlv//oPOmyYvGWLBAHRoADBFRGwEUkp0AcIA4QB4gD3ToweKBSXd88LSTRdXul606l606ly04lG1dROu9QcncouduxOKyctinNctymdGRBpZVVwqomtmlCaNWELRVhZ0u0Pc5TN3vR2GLMKml5CCpqY67aeF1ck/hAqajSWyjFvHDsfvVLG6pG80Sjl91/YekvLyx78EKAaPSa0ncia1KLtRZQyVYZxeW674/lSkqa5FV6BYso5qpf4nJdSbWu28tg/YaGFtOyKAWu39UvoBJS/pSgxOGfh0iyirXJZJk4MKwdIKAyrC8fGTxxgDhAHCAO9NCBwQOVYxdTOd+I3XYqXXdgubTJebvSmaUUzCrblBxWGFS2YjmycghTOoQpJ4VVTQqrmhjaqnHfFLisyQhPLi1Wa3te+ItBKK2wOZflE8tzVkmLrEKfqzJaK0dp/O6c6tVNja9sbHxlE9bLmxpf/qHxpR8a3HdW3yvUWVNNtsooq9Dfz2vCk76sVam32VbS5uVhEJKWNPMO5vzHktu/WSp/Orj06eCyftFvvhSduJRu86BkJXGAODDsHCCgMuwuGRkwcYA4QBwgDjyGA4MHKnNWHnfbUem2U2lhFRZXqlx2VDlvx+Kata2Kw8ppW5XTVixHVg5hVQ4sqLSxSuW4Dblv8dMmBKV//JP8yK3K6iZDT3CFLR/cnPcoqGBieZRSclXGPJXxo4NVr25qeHVjwyttenljw8s/NLz+vepuwSOg0pqgr2SzU6xARVapUzd2X5cMIVSsatmaVOS+Nv2pj+/8xwd3fvOVjAWV0v55Dipx/vIIw+AOFORBHCAODHcHCKgM9ytIxk8cIA4QB4gDPXFgkECluq6Zuz7DfWeV+44qN1auO6pcd1S5bG8VZpVtVdxtlWZxtlZytlY6sXIMqzTLIazSIbRyEquJWyonbCobG5z5Fj/tLX6a46qMd7aI910pq27sBlcQQtIyTZ7aaEMsnORZPTuHVvxlU4MVq9S/srH+5Y31Y75WXxA3tWMbzCosqCiqMK6YlVLQZOyy5BdCqLJOtyEub0Jg6jOf3P2PD25jfXzvKUHB08El/ajnPjknzC7tyT1B3kMcIA7YuQMEVOz8ApHhEQeIA8QB4kC/ODBIoBJ68JLb9jL3nZVYOypxaGVHpeuOStftlS5tct5W6dwGKlwMKhWcrRVOWyucwioc2+QQWuEQWjGJ1cQtFeN/KBkbIjSzypv8tDd5aQ4had+fLFA26I2UpQdje6MUFZqCGmN+tTHPWh3Q5X5e04Sw2r9sqn/VrI2YUsx66Ye6iOtqy8wx80KOyqBQtteD/AabcR6EQG+kxUVNn++W/d/FN1r5hKWUX3+SihNUgkr6WV88CI+/1d4L8jNxgDgwDB0goDIMLxoZMnGAOEAcIA702oFBApXZwccn76ycbAYVa1bZ/pBVnLdjULFiFQwqmFXCHrKKQxgGFWtWmbC5bNyGXIwrgvQ3+Wlv8FLf4KW+yUsRHM69Ka3T6Gy0Oyyp1uWqDPnV3bBKQlr9+G31f9mI9apZP9S/0qaQU1XWoGKTUhRVemFxY7vaxAhA3WBISlHNDxX97mM2fmKOonx099efPPjNUtnTgUVPBxX3u55aofjkh9Nk9levPyJkA+KA/TlAQMX+rgkZEXGAOEAcIA70vwODASpNzVrXoEtmUJm8o9J9R4VZbtsr3LZXuLJy2Vbhsq3C2aytFdw2ccIqOBhUyp3Cyh1DsRzM2lI+idXELeUTN5eP31jy9obcsaskbwZmmFnl9YBUzqr0yCtlHQMaNc1GWYW2gAUVM648fFYb89u0+0bdm1tq/7qp7i8bsV5l9coPdVjf131woArnsbBxmFx20le20tBOmF7Km9tdNL2R/vZ4wTP/c8cSRfn1x7/833+m/+dSKZ7uFVg8QHpKUMBdGq83mNqNh/xIHCAODDsHCKgMu0tGBkwcIA4QB4gDj+HAYIBKpqzIZe1dj50Vk3dWTN6BZcUq5W7by11ZuWwrd/n/27v32LauxM7j5w/9wcV2UqIosFw0nQ4TJbBQowkdxbFsJxkLyAIW1n9YQBcbtlrUYN121g22DiftpBz3EcuxzTAeICP4j4A1UHflmQq47sYTBjNuaUzHU7qtOmoX7tBJ5OjZDC0rM2zGSWSPkrm759x77ouXMh1L4pX0NS7Mh8h7Dz+Xj/s79zwKs9us5aXZx/SyNT+7VQWVR1VQ6T4+84i1HJvZopbUsZnU0ZmHj848dGTqV/706uZc1Yorm/7X35/5zg8CJzRM06x/8JPvq6CyRFa5Onfr0GvzDx6Z7zzyXueR9+4/8t79g+/dp5fk4fd6js+8c/0nVlAJ5BPn5vemPpiry2nvvf/+f5u0P/ra1Z/59b+NPf3t//A/Kv/xt//lM89c+czB8Xuy76z08ksDX6u/f8eTungLz3UEEIiCAEElCnuBMiCAAAIIrLTAagSV18pjPX88+sRXZp/4yuzjX5l9/MTsTr3seFkGFU9WmekpzGyzlpdmHtPL1vzM1vzMo/mZR4/PdKtFZ5XpLcfkkjo2nTo6/bBaHnpx6qEjk5sPXcmeHr/1k48bBd//cPGtH3z0zvVbV0OXuVtX525deXfhd85c7xy8/oDMKnK5f1Au96kleXj+l3Izb1+7OS6HC7v5Zi18uXilHtrUavr6Rz1fHvuZ/3n5nlXJJ07++fmB1+brdzxFZiMg9yCAQHsFCCrt9WfrCCCAAAKrI7AaQeV/n/u77X/6vSdPzD6hlsdPqKzy8uxOtcigUpDLdrnM9Lwkl21qeSw/Yy0yqByXy6NqkVnl2MwjcpnectReUi9Op16cfthajkztP/3uv/0wfFzgD29+fHXuo3fmb70zf+tqYNHR5Z8mP/jvp+YeODLvBJVAVvnsn1z7dvVHb8/dfPNa02X0nX9vbHhm7dfx2odbDl+NZ8fvefbqqi3xgdeZon51PldsBYEVFSCorCgvK0cAAQQQiIjAagSVP/8/F3e88L0nvzLz5ImZJ9Ty+ImZx1+e2amXHS/P7CjMbNeLzirT216afixvL1vz01uPTz+ql+7j093Hph9Ri8oqU1uOTqVelEv30cnf/dq7U/PBNleO+Mef/HS8JvuoLJFVvvPWB//lq7UHj1x/4Mj1BwblqZXOwev3q+W+w9flMnj9zy/OLZFS3rx28/L0+40Nz5xivPWDD/d8dernvjh+z7OrtPwsQcXRj+SVH/MPgdYEKpVKJN/CFAoBBBBAAIHlFFiNoDLyzX/Y8Sf/9OQJGVTsrPLy9ONq2fnytFwK0zus5aXp7WrpeWm6Jz+9TS0qq0w9dnxqq7Ucm3pULd3HprqPTT1yVC5brOXFqe35qSOla/M/vrU00uTch+9cvzmhTqpYccX3//Vb3/r+jS3H3n3wyNwDR+Y6j8x1DsrlfrXcd3juvsNzyRfmDr9We7N2861r4cv/nfnw3R82DUumaf70p+aVdz/ad2rmM7/31j0H317x5dnxn/v11+Z++P7SMvwVAQQQQAABBBBAAIEoCKxGULlw6fvbD/3d509MP6mXJ16efsLJKoWpnWrZUZjaUZja/pK99OSnevJT29Ty2HEZVFRWmdx6fPLRY/bSfWyy++jkI2rZ8uLkliMTf/ad+ffDhiQOWM++99HkvAwqzbLKX47WH3hBBpUHB+cekMu1zsFr9x+2l/sOX/tPX679RnH27SYp5a1rN8embvy4hZLMvf+TwXPv/nx2NbLKf/61r//w3z8IUHATAQQQQAABBBBAAIEICqxGUPm3az/a/qXy509ML0dWkUHFl1WO2lml98TE6DvvN+sTEqD/0Y1bb9U+mlRBxYorgf+Pv3HtwSNqGbz2gFo6B691Hq7dr5Zf+KMf/OwfvPvk8cmr12++fS18+dfZDz68GTKLS6AkpmkufvzJX3z3+me/9NY9B1dy+b03u/b9xY0Pw/vtNJaKexBAAAEEEEAAAQQQaKPAagSVTz755L99+eu9f1iSy/OlXZ7l88+XrOXJ50tPfkkuT3zpdbn8gVwe18vO33995++/vsO/bH/udWvpee4b//WPX//L0sXRlv/94+jo8Llvv37hUshSvvSNv6lkCt96+IvnH/ri+Yey9vIr2fNyefb8Lx88nzzwzc9+4Ztbny0Z3/rua39dCV3+6lsXK5f+oeUSjX71TPn+3zr72d/8qxVafjFz9kDhtcWPQ4ZBa+P7j00jgAACCCCAAAIIIBAqsBpBJXTD3IkAAggggAACCCCAAAIINBMgqDST4X4EEEAAAQQQQAABBBBomwBBpW30bBgBBBBAAAEEEEAAAQSaCRBUmslwPwIIIIAAAggggAACCLRNgKDSNno2jAACCCCAAAIIIIAAAs0ECCrNZLgfAQQQQAABBBBAAAEE2iZAUGkbPRtGAAEEEEAAAQQQQACBZgIElWYy3I8AAggggAACCCCAAAJtEyCotI2eDSOAAAIIIIAAAggggEAzAYJKMxnuRwABBBBAAAEEEEAAgbYJEFTaRs+GEUAAAQQQQAABBBBAoJkAQaWZDPcjgAACCCCAAAIIIIBA2wQIKm2jZ8MIIIAAAggggAACCCDQTICg0kyG+xFAAAEEEEAAAQQQQKBtAgSVttGzYQQQQAABBBBAAAEEEGgmQFBpJsP9CCCAAAIIIIAAAggg0DYBgkrb6NkwAggggAACCCCAAAIINBMgqDST4X4EEEAAAQQQQAABBBBomwBBpW30bBgBBNa2wOJCvVarL6ztF0HpEUAAAQQQiKzAhg4qE/kuIUT6XMjeKQ3Iv5RC/sJdCKxLgYnCZhH4F9/UX7hYb/XVyoN2/1H7eKFLiK78RKtrWGuPWzjTJ0TP0OxaKzflRQABBBBYKwKLleymRNczpQ1bJ0ZQIaislQ8r5VxRASuo9GRHDEMtw/lMT0Iml9SJ1pLGuXQw9q/zoFIr7hJi21BtRXcLK0cAAQQQsAQu55LyR6l/+EbERNTP30rVyt0oZeJC7B6+u9+aau5zyu7M2ss7BBWCSsQ+8BSnPQJWUPGfRVwcU19trf0qbLSgMjvUI0Tvq3f329Gefc1WEUAAgbUnUD2kckoEv3hXJKgs1P1tFO5qh9kZT4hdxTX3o0VQaS2oLNaMg73JmGoa0xHv2luozPveMwvjRqY7Yf09lkhlRiY8obUkq5oHSvVLhf57hdhcaK2C2rd+biCwwgJhQcU0qy92CZHIjZq1V3qsK95iRJJScAAAGrZJREFU1F7tFSKZu9zQbGxAtZq0z6hU6xcL/Z32hyO136gtetdhev4qGhub2Y0wFyaM/al4h/oA3ttfuNS8QZr3oypEvDtdvOx+FlVrz67CeL2S77c/zvFU5qz3e9v+tJqzRqY7rrYXS+4tVBo2qFbVWoTzvVxuIIAAAgjcucBi+UBMxL5QLGyL3qns5Q4q9QvZLvl75686vHMz5xnlL8RE7EDxRM9abK5MUGkpqFSeiQuRzJwam6jVqm/keuNCxA9UnOOtK4WUEPGncsboRG1yzDgk/57KV/VbRB36bE6lOmKpPdnC2ap73KQfwSUC7Ra4TVAxa8VeIWLPVDzlVG2fPpermgvV84bxXI8Qouc51XJsVB36q6CS6E7FO7rS+WFjZDi3WzYm63nFDQYTMv+IxO7c8Bvl8hvOA9wsr4JKV6pbJHZmh0YM42RGfn3HDpSdT5+nQKapiiSSmZPlaq02MVrMdAoh+oZ1zFDpIpHqjotNGbm2kaHMJiFEPPOG86F0Pq2JvkPDxogxfKhPFro7UL+gTqPvHXae5isFNxBAAAEEllfgwoGYrBczF870C9FVGPetXf1SqJol9z/9mLBGyIF+yPbNeqWwN+GufFFWaXVZFVZhNdRuCW4fVBYmRjIpa1UilujOGOP+X4+FanFAV8bFk4lYMi0POK2xWnT1mbu9euWVtF6brI8bWro3qcp4yUNV88awtAt0HNU+sjLdqlLsiAeqFG2fxZpTYxjrDNYY1i8Npe3aPdFQX+8W/VNcI6i0ElTUMdzThut7Ni2PlS5adywM7xXic7kxz5FT5bmEpxmlepOJVOGKuwKuIRAxgbCg4mv6pd7n3oSgoov7ldek6ZeIp0s6J5jq69I96FdfmmKPkyNM06wP7/E1QbZ+fjyx3zq343z6/IqqSInnx9x7R3MJIfp0q1xr/Iz4gFsiu0juec6QT6s6m+T/olCn0UPH4XA3zTUEEEAAgeURsA+0ZAWw+uGQh92ef7VRu3el7GN5JtfbISugSlZXFn0g7nm4GRZUZI1Y7OG+bN6oyifWSwOqhlpVe1UvDMlqL+/PmXd1twkqC6X9sr6ra/+QcaFctivIEp4KsolCtxDx/uLlWq1Wq57qj/uatwWCykJpn0w8cm2e6jZ9ROotln1dRTuZ8UzTw+g80FOlmDkpGYf2y4Gm4vvc7vuKS9UY7s4NjxjG6ZyqwEu5cXFWVmXGn8qVLtdqk2PFfbKR3nI1jSao+I8/9J7zv4lrxaeEdUalZmVg37CkpYwQyefK8v3l/Dvd70kygTeZ3gaXCERIwAoqYZ3pnXOD/iii2n3pKivTNP1/la8s5OdBbcVJBW9k5PkOnSJsDFkLINJn7Vv+T6K6s3FD9mNN80a1PGKMeYfh8pfBavo16K8yKO1TZ13s3pnq0+qtlTBNc1KeMvXmn8oz8jR6k7M6Tmm4ggACCCCwHAI3huUYi/psvGzIlMh5aqS8m7CO45O5UX2n/1fAujfwy6JuehvCmKaqjeo741SzmWa92CdEICDZ21g6qKhVJb01aFYloGyPoP6pCjVPzdeCrLBzT+P7jyHV2uLe1g2L6gH7mo1Tq9bmjPsiT0zJ5tzuP+UTyGBS2HPaKsRH9dIUVjNv+wCgy/PbWh3ctGz9YQgqrQQV05wvZWUTEfkv1tmbyZfcPijWPrb/6LvQbzv/m8x9d3ANgegIWEHF9waOb+rNevtvWOdD7PZODWNeNeaHkJ8HX1CxGmL5vjEb4k3g50R6NW7Iq7hQGzuVy+xJJe5NJOxeY+6ZbiuouJVA6on+O0M/rf477abSZe9muY4AAgggsEIC6rR2nzvY10XZXeXAhZCt1c+l40J0veg53xLySxR6RsXXIWTiREqIvuKsU/1cq9UquWYH30sGFbUqfzaw+3/qI3v5dE+tn2lWX0h6Oqj4foBC1xYC4dylEoWnQrCiuvp4fr8sH6+YaZr+akTrh9jwtBsyTXUWyImLl7KyS8RTudIVu0mbnLBg3t+8zSnSHV7Z2EFFvhFDg4oKoA3dmBZmx4x8tu9h1S3YOQOoalvdBjAhO8D3Jgv5O3ch0H4BK6j4vqkbCzX2vG7TqBpZOfVb8pGN+SHk56ExqOhvamdj/mfdWVCZHZanzFWXmLI6h167lPPO5eLPJPYm/XeGflr9dzbWSDmF5woCCCCAwDILqB+OTZmiHj3fGBns6xCxL3iOtq0t1o10TJ6LqHoPqf2/KdYDA78sgZumaSUZX82dfcNpEeB9jUsGFbVyT8qynuj9xbyTMypWUf2ZwVuU4HXrBy5zym0aN7jb388zzCfQIKLRRxM5xwwL1VdUczAhREc8tSdX/GfPyahgoe7s9oYOKlZk9Lbo0HgycbonFn0NveRDFi5mE+78ErLplwi0FZkdM9wmKP6jHL0NLhGIkkBLQUWfDV9Q7b56fcMcer92rRcW8vXnCyqBOhtbw1rPp2r6pXKUfwZGfxn8mcTeoP9XJOzTqlbifFHIxzun7KO0CykLAgggsA4FVGOnsNAQGHfR6uLY0B/Y/ytg+QSOvAM35VG4bBLsHIXfDvX2QSUdjBa+X0xvH5WJcl4OyORpdeb7VbKKGlxb0wLa06c06vU7ja7DfO48qKgSLNSrF4ZyT/cm1BCd3s6lTQvYwh82dlCxmrLE0oZ/rOFqXp5pcVsiWp2GvefFVHNJ5yyKasznjixkmlZ/X+dEnu9N1sJO4SEIrL5Aa0HFrA1tE2JXLrerofnplcGuQIeTkK8/f1BptTO9/9fC9/3ug7J+Wrzf4NZn2fmoqqDibxVQl02fPfM2qk9rLG14KoPGnk/KCiirmUFYP05fIbiBAAIIILB8ArJPYOMkj3YfErdxkWoTFdaBO+SXqMWmX4ET/mp8y/NhA7cuGVRCG2tZtWa6U0e9ku9NxBL2EPzNBs1XpGFra94hRLaRE24msXeKSi979KiVYT5WEwmnwVhjkJNNvza7FfrBhl6L9eJuIUSmWb+ZO3p3bOygYpr1cxk1+7YaOPi0Mey07OrMVtypT62Ybo95Wrtcyj0l20C6Ld1ni3KIiURfbmRsolYtn8wkhfCMLERQuaP3JA9ui0CLQcUK4bJ2xvkKs4trpY7uA3JIEM/wxE5IUA/zBxXTbG144laDihrbRMT3Do1N1qoX5GDHiU45XYpTBvXbEIvH1YDIcuiSQr8cvzjuGS9FfVrj8XhHlz3+ycEeOcCKniRr4Uyf77Pfln3FRhFAAIENIuDrG+l9zWNySEenj7iaJcI/hqR+sKpr9rUTsx7sOWESciCuunb4e8DLiVzc7uN69fJyyaBitUTwr0pNpuycmZcdQnqHZt3Q5V23afqPIRs706uk4date56sqtED553kn32tD9TTxeZBT3s566DXbZ6gfGLps54KvNGcrMDTre9UmPSdNVKb8P92ewp2R1c3elCR7bjGjdyelO52K4d/Tnv7ylucahY5ezhtNYvcUGDKuflSbpc9g5yIJXsPeme187/J7mj/8GAEVkmg1aBiDQ0pJydxk7xdxPqFbMqa19E34aM7KYpdB+Nv49vShI9ehOZnVEzTN5Nj+pVKXQ2H4g8qXYXLcsR6ewbK4GDw1qfVqL+R671XnS33jSjfMISAt2BcR6CpgBoV1Huivukj2/YHK+eHNmu0TkXq4WGaldBuZNJQfdvs8ct5/8L8svXcXc5isa67FrDelqFvKs/Rtmo6JZKZV92eGMaIUbY7dlvza8V7Dg4ZI0O5p3sSHanUZl/LrpCgYpqVg/aYwuXLtYlRQ9VQN7Qrs16g+lWKPdyf2Z/xLa9aI5PdbnjietkZrslqoxVLdHkOIwPHkPbwxMlfLVgjBauZ/TzTADjmVu1h6HxfqldMjzWKmgoqqgKvL3faMEaGC78qBxf2DiymfOLxuB4T+WRWVeD1Fp0xNlVusacTrE2MnZL19bEBd4Bjp1Cf4gpB5VOg8RQENrDAEt99kVexzra750JDChz4SQh5BHchcMcC1qdGjhp5wDtn6h2vZwWfYEcpz8D67sZaCipORwJ9+tF9fpNrC3V7Qrsmf2/97uCp2tafySOjLWC9LUPqxWSxVbsmdSZBfW839MNwqqjkwK16LsLErqwxe/umX4ploXrKP69ioIbasVNBpWH73tMvS074WC9lEiK5z5oXRUWFAe9MJo2/St4JH2PJvYWKv/+CVS4r4wXbPthlVj2xrVM6dtOvqnyxdgVesj9f8Zw9sbkMWSOvGiHJ+vqM4aQUtU414aOu8w/W1ztSn+YKQeXTqPEcBDasQP2U7NNxu7rViPIQVCK6Y9Z7sdTgqj2FU03HVG0/gGro0nOiGBy6VJWslaAiG5nEDhRP9Ajhthhp+rp0FfIyfZMQVJpK84fIC6gw5rRh08U1nl6teg07qHjbPuhC6MvQM076jyt+SVBZcWI2gMD6EJBT/57O9nTIMa/GvIM/rp2XR1BZO/tqPZVUDUEhG2CoxlHOFGn2SwyrDNbNI8Pesf7qVV0bWjubkbWheuUL40am267djCVSmRF36q9QWRWlZFv26iE1gYP/A377oKI6Esi6bXXuyK3JdjfmqZzuiCcTseRAcWxSn1FZlI027cbVHfEufw2xjXDF07Azlso4UzwFK7M93UfdrXMNgcgKqHZrwaCiOqPr74GVLTpBZWV9WTsCCKyWgKpTEeLe/qJ/ZvfV2v4ybCfssC+wWv9RYOCP3ETgUwioNlFWI3sVAwJ9W2tj7uwQxvChXtk6fJ/dtjvsHet/i6qDjER3Kt6R6H06N2SNY6H6CtvtxSfHjEOyEfuSQ4WqBGW1ZfeU1nmttw0qqpFJMndZ9voc3hsyfrcaqijef6oq58+7XJTzHbktxOqlgbgQ9nA11QtDmU7hnSdbbT2R6o6LTenCacM4nVPzNejzNnIygKF0QohEekhKlqsN3eecF8IVBCIooIb7F8l9MrqrD0h5aJ8ckil9ztv8asUKTlBZMVpWjAACCCCAQNQFZJff2IGydY4iOEu0v/A3Spm474xli0HFe1jvRAXvac/Kc3qqVv8G7VuyZ60egNsagtwZulQ94nZBRU2R7FQJh8yIqgZo0md7ZJqRo+elCpNq7SoaeWaNMM16sc8z8IC1dc9AmqYpN+EdiJamX6H7lTvXisDCxEi2d5McYFL9iyW600MXVyWlmGZgypRQMpp+hbJwJwIIIIAAAmtcQLWJcmYLNc0lBo6zTiz4pm5oMaj4m1rJOYiTz5VV3az+73R/aC95C1d2L0nkrPGJ5Dxgr/YG+pncJqgE05fsp+uMW6o2Ic8C+Qp5eVC2MDsn/6hOtvQVZ3VR5WUlt8k95RKCEKwDJqis8Y8JxUeguQB9VJrb8BcEEEAAAQTuRkD1oOh7wR01tbi/KxADrNXXz6ZjDQ20Qo7RA5MqBA/Z7fpRXTXruwzvua6G8Ba7Bw2nBdqpjCyiNXSpKtzSQcUqZOaU+xoHd8tYZJ9EkmtY6oyK3abUV1J1QzfQD0EIvmqCyt28R3kuApEWIKhEevdQOAQQQACBNSvgjPkbPAwPzs5WH5aj6XUXPHOuyRcdcox+26AyWUgFTl8syWdPnxIsoK+fyZJBxZ4+pXEF3rkvvH1UJi4UZKeZPcNW05bSPt+MFo2FDUEgqDQycQ8C61SAoLJOdywvCwEEEECgvQJqSuxgJrG6m3uaWsmJULuFEJ7Z03SxQ47RbxtUTNn0Szxt6HWoS9nj3Bjzz3ug/qCaojkzZOvnqPSSyI3at5cKKmouC28mUc9R6cXT0aV+qdCbiCWsRvi+SVStpl++Bm+muVA9bxjnq9ZM3SEIBBW9p7hEYN0LEFTW/S7mBSKAAAIItEFAjflrjYXl27rqSu50Xjer+ZQQwtebXD9cdRdxH2ma9oOdYYhDO8LKPieizz5hoValShI2bq/qXtIQpUzzhjzD4/QzWSKoqG0FxjGTm/TMGm6aKjv1vlKzgod+cfrSKsPzTh8Z01Qde5zX2EJQMeWkE77sp1fOJQIIrHEBgsoa34EUH4ENKVA71Z+4t3dofEO+eF702hBQZxUaTlbIsntjwLhsqSU6M0Wni4h3jN3ZohquuCd70jBO5tI7E6I7JeesdkbQCp5bUDSzxd4OIRJ9uZGxiVq1fDIjxzodKDWOIqSGSw6JUnLosD1uP5OmQUXNmiKscY0DO0WOJOZ0dKmXD8pSu/9iiS41Qbj1pMpBOd111/6h8uXaxKiRe0oOp1zQw6C3ElTUC4n35xmeOLAbuInAmhcgqKz5XcgLQGB1BVS/VfeIw3ctvLfuCpRPNXlPZC8t26pDDoaWbd2saEMKqFF3PeN9eRFUgyuhTkQE5yu0PlDu2Y/6G9mU3WIq0XvQqFl935cOKqZpzpdyu5Ixa2WxpHqitwDWdRWlmpyIsOZ2sNp0NQsqVv+WvjOhZ0rk2F/Czmn10r6E6MyoeU5kn/vhfLqrQ4h4pmTPeeKZDlKIeHd66JKbqkI+m43xbLFa3CvTjhAuXeML5h4EEFhzAgSVNbfLKDAC7RVQzcft2t9sjxBiZ9YZLyisEXx7S9vq1kMOhlp9Ko9DAIGlBFSe0fMzOg88m15ixGTnUVxBAIENLkBQ2eBvAF4+Ancj4J8k+27W1O7nElTavQfY/roVUOc/g0GlfqqPsx/rdpfzwhBYPgGCyvJZsiYENpxAWFCZrxT2dsU7VCuMeFd/vlK35uRWOPYEt/VKQbbTsBtp2HcuTBj7U9YTY539xSumuViv5Pvt9ivxVPZC09Ygdsy44nl8LJU5W/PtkMWacbBXt4aRzUuKl90mKwQVnxU3EFhGAaunTWemODqhpnVcqtvMMm6WVSGAwDoQIKisg53IS0CgXQINQaVeSsdlz+ChC9VaWC9elUm6Ut0i9nBfNm9UVQt1587Ezqxsxa76/orP9fd3i/g2dc/pnJx4wWrTr15rIFeom4lUd1xsShdOG8bpXJ9sr+6txLV6BSQzJ8vVWm1itJjplCMtOSMjBVbYLlC2i8C6FFgYN7K7dP2FELFEKv2KrwpjXb5qXhQCCNy9AEHl7g1ZAwIbViAYVNTYO+7Rv2maqoGHO6yQyiQila96yRrvVGObitTzFeccihrRVTid9QO5Qt30j2t0QXbl7X1Vn1RRM1r4ejarUYmcfsCBFXqLx3UEEEAAAQQQaIsAQaUt7GwUgfUhEAgqat66PUXVukP/dynX5QkMKpOkS/5XH3JnY0fbK4NdQqROTFhPDeSKwE35mMC4QDeq5cCEd/4HhKzBX0huIYAAAggggMAqCxBUVhmczSGwngQCQUXdtEZE9f/flbcDRkgmMc2QO9WYrc75E0m2ZK4IiRn+x8s1LNTGTuUye1KJexOJhD1wq1OwkDWspx3Fa0EAAQQQQGANChBU1uBOo8gIREUgGFQy3qnowgoZkklWJ6jMDvfHhejoSueHy5fV2R51qoegEraXuA8BBBBAAIFICBBUIrEbKAQCa1MgEFRU069Ng74OKKrNVfmKPb5Wu4KK6vTi7Vt/m1M0a3N3UGoEEEAAAQTWlQBBZV3tTl4MAqsrEAgqZu2VHiGSuVFPKVSndqcRV7uCSmmfECJteAZKruZTchZr3SaNpl+efcZVBBBAAAEEIiFAUInEbqAQCKxNgWBQMRcr2YRsYaVGAZ4YG1HDCncXqjohtCuoqLmxRXzv0NhkrXphOLc7keiUU6o4QcVUvWKSA0PG+ao7u8ra3CuUGgEEEEAAgfUhQFBZH/uRV4FAWwQagorss14tDtjzNoqOeGpgyB1jOLQ7Suidy9+Z3jMXZNyaw0EW3g0qZr18MCW72G8u2B3/2yLKRhFAAAEEEEBACxBUtASXCCCAAAIIIIAAAgggEBkBgkpkdgUFQQABBBBAAAEEEEAAAS1AUNESXCKAAAIIIIAAAggggEBkBAgqkdkVFAQBBBBAAAEEEEAAAQS0AEFFS3CJAAIIIIAAAggggAACkREgqERmV1AQBBBAAAEEEEAAAQQQ0AIEFS3BJQIIIIAAAggggAACCERGgKASmV1BQRBAAAEEEEAAAQQQQEALEFS0BJcIIIAAAggggAACCCAQGQGCSmR2BQVBAAEEEEAAAQQQQAABLUBQ0RJcIoAAAggggAACCCCAQGQECCqR2RUUBAEEEEAAAQQQQAABBLQAQUVLcIkAAggggAACCCCAAAKRESCoRGZXUBAEEEAAAQQQQAABBBDQAgQVLcElAggggAACCCCAAAIIREaAoBKZXUFBEEAAAQQQQAABBBBAQAsQVLQElwgggAACCCCAAAIIIBAZAYJKZHYFBUEAAQQQQAABBBBAAAEtQFDRElwigAACCCCAAAIIIIBAZAQIKpHZFRQEAQQQQAABBBBAAAEEtABBRUtwiQACCCCAAAIIIIAAApERIKhEZldQEAQQQAABBBBAAAEEENACBBUtwSUCCCCAAAIIIIAAAghERoCgEpldQUEQQAABBBBAAAEEEEBACxBUtASXCCCAAAIIIIAAAgggEBkBgkpkdgUFQQABBBBAAAEEEEAAAS1AUNESXCKAAAIIIIAAAggggEBkBAgqkdkVFAQBBBBAAAEEEEAAAQS0AEFFS3CJAAIIIIAAAggggAACkREgqERmV1AQBBBAAAEEEEAAAQQQ0AIEFS3BJQIIIIAAAggggAACCERGgKASmV1BQRBAAAEEEEAAAQQQQEALEFS0BJcIIIAAAggggAACCCAQGQGCSmR2BQVBAAEEEEAAAQQQQAABLUBQ0RJcIoAAAggggAACCCCAQGQECCqR2RUUBAEEEEAAAQQQQAABBLQAQUVLcIkAAggggAACCCCAAAKRESCoRGZXUBAEEEAAAQQQQAABBBDQAgQVLcElAggggAACCCCAAAIIREaAoBKZXUFBEEAAAQQQQAABBBBAQAsQVLQElwgggAACCCCAAAIIIBAZAYJKZHYFBUEAAQQQQAABBBBAAAEtQFDRElwigAACCCCAAAIIIIBAZAQIKpHZFRQEAQQQQAABBBBAAAEEtABBRUtwiQACCCCAAAIIIIAAApERIKhEZldQEAQQQAABBBBAAAEEENACBBUtwSUCCCCAAAIIIIAAAghERoCgEpldQUEQQAABBBBAAAEEEEBAC/w/0PaFtpurBiYAAAAASUVORK5CYII=)
 """
 
-!pip install azure-identity==1.23.0 azure-ai-projects==1.0.0b12 requests urllib3  load_dotenv
+# !pip install azure-identity==1.23.0 azure-ai-projects==1.0.0b12 requests urllib3  load_dotenv
 
 # ==============================================================================
 # AZURE AI EMAIL ASSISTANT - TUTORIAL (NO CLASSES)
@@ -23,12 +23,14 @@ Original file is located at
 from azure.identity import ClientSecretCredential  # For Azure authentication
 from azure.ai.projects import AIProjectClient      # For Azure AI Project interactions
 from azure.ai.agents.models import ListSortOrder   # For sorting AI agent messages
-import time                                         # For polling delays
-import requests                                     # For HTTP requests to Logic Apps
 import json                                         # For JSON parsing
 import re                                          # For regular expressions
-from urllib.parse import urlparse, parse_qs       # For URL parsing
 import os
+from run_waiter import run_to_completion          # For streamed / backoff run completion
+from tool_dispatcher import dispatch_tool_calls, function_executor  # For parallel tool calls
+import tool_http                                    # Pooled, retrying HTTP for Logic Apps
+from tracing import span                            # For latency spans (set AGENT_TRACE_FILE)
+from agent_registry import AgentRegistry            # For reusing the agent across runs
 
 # ==============================================================================
 # CONFIGURATION SECTION
@@ -43,27 +45,24 @@ CLIENT_SECRET = os.getenv("CLIENT_SECRET")
 TENANT_ID = os.getenv("TENANT_ID")
 AZURE_ENDPOINT = os.getenv("PROJECT_ENDPOINT")
 LOGIC_APPS_FULL_URL = os.getenv("LOGIC_APPS_FULL_URL")
+LOGIC_APPS_ENDPOINT = tool_http.parse_endpoint(LOGIC_APPS_FULL_URL or "")  # Parsed once, reused per call
 
 def send_email_function(email_to, email_subject, email_body):
     """Send email via Logic Apps - registered as AI tool"""
     try:
-        parsed = urlparse(LOGIC_APPS_FULL_URL)
-        response = requests.post(
-            f"{parsed.scheme}://{parsed.netloc}{parsed.path}",
-            params={k: v[0] for k, v in parse_qs(parsed.query).items()},
+        response = tool_http.post(
+            LOGIC_APPS_ENDPOINT,
             json={"email_to": email_to, "email_subject": email_subject, "email_body": email_body},
-            timeout=30
         )
         return "✅ Email sent!" if response.status_code in [200, 202] else f"❌ Failed: {response.status_code}"
     except Exception as e:
         return f"❌ Error: {str(e)}"
 
-def create_agent(client):
-    """Create email assistant with Logic Apps tool"""
-    return client.agents.create_agent(
-        model="gpt-4o",
-        name="Email-Assistant",
-        instructions="""Email Assistant. Flow: Get recipient → subject → body → show preview → confirm → send.
+# Agent definition, shared with the async session server (email_server.py)
+EMAIL_AGENT = dict(
+    model="gpt-4o",
+    name="Email-Assistant",
+    instructions="""Email Assistant. Flow: Get recipient → subject → body → show preview → confirm → send.
 
 Preview format:
 📧 EMAIL PREVIEW:
@@ -74,58 +73,70 @@ Preview format:
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 Would you like me to send this email?""",
-        tools=[{
-            "type": "function",
-            "function": {
-                "name": "send_email",
-                "description": "Send email after user confirms",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "email_to": {"type": "string", "description": "Recipient email"},
-                        "email_subject": {"type": "string", "description": "Email subject"},
-                        "email_body": {"type": "string", "description": "Email content"}
-                    },
-                    "required": ["email_to", "email_subject", "email_body"]
-                }
+    tools=[{
+        "type": "function",
+        "function": {
+            "name": "send_email",
+            "description": "Send email after user confirms",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "email_to": {"type": "string", "description": "Recipient email"},
+                    "email_subject": {"type": "string", "description": "Email subject"},
+                    "email_body": {"type": "string", "description": "Email content"}
+                },
+                "required": ["email_to", "email_subject", "email_body"]
             }
-        }],
-        temperature=0.7
-    )
+        }
+    }],
+    temperature=0.7
+)
 
-def chat(client, thread, agent, message):
-    """Process conversation with tool calling"""
-    client.agents.messages.create(thread_id=thread.id, role="user", content=message)
-    run = client.agents.runs.create(thread_id=thread.id, agent_id=agent.id)
+def create_agent(client):
+    """Create email assistant with Logic Apps tool"""
+    return client.agents.create_agent(**EMAIL_AGENT)
+
+def get_agent(registry):
+    """Email assistant of an earlier run if its definition is unchanged, else a new one"""
+    return registry.get_or_create(**EMAIL_AGENT)
 
-    while run.status in ["queued", "in_progress", "requires_action"]:
-        if run.status == "requires_action":
-            outputs = []
-            for call in run.required_action.submit_tool_outputs.tool_calls:
-                if call.function.name == "send_email":
-                    args = json.loads(call.function.arguments)
-                    result = send_email_function(args["email_to"], args["email_subject"], args["email_body"])
-                    outputs.append({"tool_call_id": call.id, "output": result})
+# Tool name -> Python function, executed by the parallel tool dispatcher
+execute_tool_call = function_executor({"send_email": send_email_function})
 
-            run = client.agents.runs.submit_tool_outputs(thread_id=thread.id, run_id=run.id, tool_outputs=outputs)
+def handle_tool_calls(tool_calls):
+    """Execute the tool calls of a requires_action step concurrently"""
+    return dispatch_tool_calls(tool_calls, execute_tool_call)
 
-        time.sleep(1)
-        run = client.agents.runs.get(thread_id=thread.id, run_id=run.id)
+def chat(client, thread, agent, message):
+    """Process conversation with tool calling"""
+    with span("chat.turn", thread_id=thread.id, agent_id=agent.id):
+        with span("message.post", thread_id=thread.id):
+            client.agents.messages.create(thread_id=thread.id, role="user", content=message)
+        run_to_completion(client, thread.id, agent.id, handle_tool_calls)
 
-    messages = client.agents.messages.list(thread_id=thread.id, order=ListSortOrder.DESCENDING, limit=1)
-    for msg in messages:
-        if msg.role == "assistant":
-            return next((item.text.value for item in msg.content if hasattr(item, 'text')), "Error")
+        with span("message.fetch", thread_id=thread.id):
+            messages = client.agents.messages.list(thread_id=thread.id, order=ListSortOrder.DESCENDING, limit=1)
+            for msg in messages:
+                if msg.role == "assistant":
+                    return next((item.text.value for item in msg.content if hasattr(item, 'text')), "Error")
 
 def main():
     """Main application entry point"""
     print("📧 Email Assistant\nHi! Who would you like to send an email to?\n")
 
     # Initialize Azure client with service principal
-    credential = ClientSecretCredential(TENANT_ID, CLIENT_ID, CLIENT_SECRET)
+    with span("credential.acquire"):
+        credential = ClientSecretCredential(TENANT_ID, CLIENT_ID, CLIENT_SECRET)
+        credential.get_token("https://ai.azure.com/.default")  # Fetch the token now so it is timed here
     client = AIProjectClient(credential=credential, endpoint=AZURE_ENDPOINT)
-    agent = create_agent(client)
-    thread = client.agents.threads.create()
+    # The agent outlives the process: the next run finds it instead of creating one,
+    # agents left unused for AGENT_ORPHAN_DAYS are deleted by the background sweep
+    registry = AgentRegistry(client)
+    agent = get_agent(registry)
+    registry.start_background_sweep()
+    with span("thread.create") as attributes:
+        thread = client.agents.threads.create()
+        attributes["thread_id"] = thread.id
 
     try:
         while True:
@@ -135,11 +146,11 @@ def main():
     except KeyboardInterrupt:
         print("\n👋 Goodbye!")
     finally:
+        registry.stop()
         try:
             client.agents.threads.delete(thread.id)
-            client.agents.delete_agent(agent.id)
-        except:
-            pass
+        except Exception as e:
+            print(f"Failed to delete thread {thread.id}: {e}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
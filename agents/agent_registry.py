@@ -0,0 +1,291 @@
+# ==============================================================================
+# AGENT REGISTRY - ONE REMOTE AGENT PER DEFINITION, REUSED ACROSS RUNS
+# ==============================================================================
+# The samples created their agent at start and deleted it at exit: one extra
+# round trip each way per session, and an agent leaked whenever the cleanup
+# failed. The registry makes agent creation idempotent instead:
+#   - a definition (model, instructions, tools, temperature, ...) is hashed
+#     into a fingerprint, stored in the agent's metadata
+#   - get_or_create() finds the agent in the local index (AGENT_REGISTRY,
+#     default agents/.agent_registry.json, shared by every sample) and
+#     confirms it with one GET; on a miss it adopts a remote agent with the
+#     same fingerprint, and only then creates
+#   - the index file is re-read, merged and replaced under a file lock, so
+#     processes sharing it do not drop each other's entries; service calls
+#     run outside the registry's thread lock
+#   - the last use is kept in the agent's metadata too, so every process and
+#     machine sees it: get_or_create() and the background sweep refresh it
+#     (at most every AGENT_HEARTBEAT seconds) for the agents this process holds
+#   - sweep() deletes registry agents that lost out to a duplicate or whose
+#     last use (remote or local, whichever is newer) is older than
+#     AGENT_ORPHAN_DAYS; agents held by this process are never deleted by it;
+#     start_background_sweep() runs it periodically on a daemon thread
+# Agents created without the registry (no fingerprint in metadata) are never
+# touched.
+#
+#   registry = AgentRegistry(project_client)
+#   agent = registry.get_or_create(model="gpt-4o", name="my-agent", instructions="You are helpful agent")
+#   registry.start_background_sweep()
+
+import hashlib
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, Optional
+
+try:
+    import fcntl  # POSIX file locks
+except ImportError:
+    fcntl = None
+try:
+    import msvcrt  # Windows file locks
+except ImportError:
+    msvcrt = None
+
+from azure.core.exceptions import ResourceNotFoundError
+from tracing import span
+
+# Next to this module, so every sample finds the same index whatever its working directory
+REGISTRY_PATH = os.getenv("AGENT_REGISTRY") or os.path.join(os.path.dirname(os.path.abspath(__file__)), ".agent_registry.json")
+ORPHAN_AFTER_DAYS = float(os.getenv("AGENT_ORPHAN_DAYS", "7"))
+SWEEP_INTERVAL = float(os.getenv("AGENT_SWEEP_INTERVAL", "3600"))  # Seconds between background sweeps
+HEARTBEAT = float(os.getenv("AGENT_HEARTBEAT", "3600"))  # Seconds between last-use updates on the remote agent
+# Seconds a duplicate is left alone, another process may be using it right now: the remote last use of a
+# held agent lags by up to HEARTBEAT plus one sweep interval, the margin covers clock skew and slow sweeps
+DUPLICATE_GRACE = HEARTBEAT + SWEEP_INTERVAL + float(os.getenv("AGENT_DUPLICATE_MARGIN", "600"))
+FINGERPRINT_KEY = "definition_sha256"  # Metadata key holding the fingerprint on the remote agent
+LAST_USED_KEY = "last_used"  # Metadata key holding the last use (epoch seconds) on the remote agent
+
+# Arguments that name or label an agent but do not change how it behaves
+_NOT_FINGERPRINTED = {"name", "description", "metadata", "headers"}
+
+
+def _plain(value: Any) -> Any:
+    """JSON-serialisable form of SDK models (tool definitions, resources)"""
+    if hasattr(value, "as_dict"):
+        return value.as_dict()
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    return value
+
+
+def fingerprint(model: str, instructions: Optional[str] = None, tools=None, toolset=None, **definition: Any) -> str:
+    """SHA-256 over everything that shapes the agent's behaviour"""
+    if toolset is not None:
+        tools, definition["tool_resources"] = toolset.definitions, toolset.resources
+    payload = {"model": model, "instructions": instructions or "", "tools": _plain(tools or []),
+               **{key: _plain(value) for key, value in definition.items()
+                  if key not in _NOT_FINGERPRINTED and value is not None}}
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _created_at(agent) -> float:
+    created = getattr(agent, "created_at", None)
+    return created.timestamp() if isinstance(created, datetime) else float(created or 0)
+
+
+@contextmanager
+def _file_lock(path: str) -> Iterator[None]:
+    """Exclusive lock on `path` + ".lock", held across processes"""
+    with open(path + ".lock", "a+") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        elif msvcrt is not None:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _last_used(agent) -> float:
+    """Last use recorded on the remote agent by any process, its creation if none"""
+    try:
+        return float((getattr(agent, "metadata", None) or {})[LAST_USED_KEY])
+    except (KeyError, TypeError, ValueError):
+        return _created_at(agent)
+
+
+class AgentRegistry:
+    """Fingerprint -> agent ID, kept on local disk and verified against the service"""
+
+    def __init__(self, client, path: str = REGISTRY_PATH):
+        self.client = client
+        self.path = path
+        self.lock = threading.Lock()  # Guards index, held and resolving; never held across service calls
+        self.index: Dict[str, dict] = self._read()  # fingerprint -> agent_id, name, created_at, last_used
+        self.held: Dict[str, Any] = {}  # agent_id -> agent handed out by this process
+        self.resolving: Dict[str, threading.Lock] = {}  # fingerprint -> lock, one lookup or create per definition
+        self.sweeper: Optional[threading.Thread] = None
+        self.stopped = threading.Event()
+
+    def _read(self) -> Dict[str, dict]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _update(self, change: Callable[[Dict[str, dict]], None]) -> None:
+        """Apply `change` to the index on disk, re-read under the file lock so other processes' entries survive"""
+        with _file_lock(self.path):
+            index = self._read()
+            change(index)
+            with open(self.path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(index, f, indent=2)
+            os.replace(self.path + ".tmp", self.path)
+        self.index = index
+
+    def _remember(self, key: str, agent) -> None:
+        entry = {"agent_id": agent.id, "name": getattr(agent, "name", None),
+                 "created_at": _created_at(agent) or time.time(), "last_used": time.time()}
+        self._update(lambda index: index.__setitem__(key, entry))
+
+    def _used(self, agent_ids) -> None:
+        """Set the local last use of the indexed entries of these agents to now"""
+        def change(index: Dict[str, dict]) -> None:
+            for entry in index.values():
+                if entry["agent_id"] in agent_ids:
+                    entry["last_used"] = time.time()
+        self._update(change)
+
+    def _forget(self, key: str, agent_id: str) -> None:
+        """Drop the index entry, unless another process replaced it with a different agent meanwhile"""
+        def change(index: Dict[str, dict]) -> None:
+            if index.get(key, {}).get("agent_id") == agent_id:
+                del index[key]
+        self._update(change)
+
+    def _touch(self, agent):
+        """Record a use on the remote agent, unless one was recorded less than HEARTBEAT seconds ago"""
+        now = time.time()
+        if now - _last_used(agent) < HEARTBEAT:
+            return agent
+        metadata = {**(getattr(agent, "metadata", None) or {}), LAST_USED_KEY: str(int(now))}
+        return self.client.agents.update_agent(agent.id, metadata=metadata)
+
+    def _hold(self, agent, source: str, attributes: dict):
+        """Hand out an agent: refresh its last use and keep it safe from this process's sweeps"""
+        agent = self._touch(agent)
+        with self.lock:
+            self.held[agent.id] = agent
+        attributes.update(agent_id=agent.id, source=source)
+        return agent
+
+    def heartbeat(self) -> None:
+        """Refresh the last use of every agent this process holds, locally and remotely"""
+        with self.lock:
+            held = list(self.held.values())
+            if held:
+                self._used(set(self.held))
+        for agent in held:
+            try:
+                touched = self._touch(agent)
+            except ResourceNotFoundError:
+                continue
+            with self.lock:
+                self.held[agent.id] = touched
+
+    def _find_remote(self, key: str):
+        """Newest remote agent carrying this fingerprint, e.g. created by another machine"""
+        matches = [agent for agent in self.client.agents.list_agents()
+                   if (getattr(agent, "metadata", None) or {}).get(FINGERPRINT_KEY) == key]
+        return max(matches, key=_created_at) if matches else None
+
+    def get_or_create(self, **definition: Any):
+        """The agent for this definition: indexed, adopted or newly created"""
+        key = fingerprint(**definition)
+        with self.lock:
+            resolving = self.resolving.setdefault(key, threading.Lock())
+        # Only callers of the same definition wait for each other, and only the registry's own lock guards the index
+        with resolving, span("agent.get_or_create", agent_name=definition.get("name")) as attributes:
+            with self.lock:
+                entry = self.index.get(key)
+            if entry:
+                try:
+                    agent = self.client.agents.get_agent(entry["agent_id"])
+                except ResourceNotFoundError:
+                    agent = None  # Deleted remotely, fall through
+                with self.lock:
+                    if agent is None:
+                        self._forget(key, entry["agent_id"])
+                    else:
+                        self._used({agent.id})
+                if agent is not None:
+                    return self._hold(agent, "index", attributes)
+
+            agent = self._find_remote(key)
+            source = "adopted"
+            if agent is None:
+                metadata = {**(definition.get("metadata") or {}), FINGERPRINT_KEY: key, LAST_USED_KEY: str(int(time.time()))}
+                agent = self.client.agents.create_agent(**{**definition, "metadata": metadata})
+                source = "created"
+            with self.lock:
+                self._remember(key, agent)
+            return self._hold(agent, source, attributes)
+
+    def sweep(self, orphan_after_days: float = ORPHAN_AFTER_DAYS) -> int:
+        """Delete duplicate and idle registry agents; returns how many were deleted"""
+        cutoff = time.time() - orphan_after_days * 86400
+        with self.lock:
+            indexed = {entry["agent_id"]: key for key, entry in self.index.items()}
+            local_use = {entry["agent_id"]: entry["last_used"] for entry in self.index.values()}
+            held = set(self.held)
+        deleted = 0
+        with span("agent.sweep") as attributes:
+            for agent in list(self.client.agents.list_agents()):
+                key = (getattr(agent, "metadata", None) or {}).get(FINGERPRINT_KEY)
+                if key is None or agent.id in held:
+                    continue  # Not ours, or in use by this process
+                # Another process (other index, other machine) may use it: its remote last use counts too
+                last_used = max(_last_used(agent), local_use.get(agent.id, 0))
+                if agent.id in indexed:
+                    stale = last_used < cutoff
+                else:
+                    # A duplicate of an indexed definition nobody used lately, or idle
+                    recent = time.time() - DUPLICATE_GRACE
+                    stale = (key in indexed.values() and last_used < recent) or last_used < cutoff
+                if not stale:
+                    continue
+                try:
+                    self.client.agents.delete_agent(agent.id)
+                    deleted += 1
+                except ResourceNotFoundError:
+                    pass
+                except Exception as e:
+                    print(f"Failed to delete agent {agent.id}: {e}")
+                    continue
+                if agent.id in indexed:
+                    with self.lock:
+                        self._forget(indexed[agent.id], agent.id)
+            attributes["deleted"] = deleted
+        return deleted
+
+    def start_background_sweep(self, interval: float = SWEEP_INTERVAL) -> threading.Thread:
+        """Heartbeat and sweep now and then every `interval` seconds on a daemon thread"""
+        def loop() -> None:
+            while not self.stopped.is_set():
+                try:
+                    self.heartbeat()  # Long-running processes keep their agents' last use fresh
+                    self.sweep()
+                except Exception as e:
+                    print(f"Agent sweep failed: {e}")
+                self.stopped.wait(interval)
+
+        if self.sweeper is None or not self.sweeper.is_alive():
+            self.sweeper = threading.Thread(target=loop, name="agent-sweeper", daemon=True)
+            self.sweeper.start()
+        return self.sweeper
+
+    def stop(self) -> None:
+        self.stopped.set()
@@ -0,0 +1,197 @@
+# ==============================================================================
+# BOOTSTRAP - WARM START FOR CREDENTIALS, CLIENTS AND CONNECTION IDS
+# ==============================================================================
+# Every sample built a fresh credential, fetched a token and then discovered
+# its connections one call after another (connections.list() scanned linearly,
+# connections.get(name)). Connection IDs practically never change, so:
+#   - resolved connection IDs are cached on local disk for BOOTSTRAP_TTL
+#     seconds (default one day) - a warm start makes no discovery call at all
+#   - one credential per process; its access token is handed out again until
+#     it is within TOKEN_REFRESH_MARGIN seconds of expiry
+#     (AZURE_TOKEN_CACHE_PERSIST=1 also keeps it across processes in
+#     azure-identity's encrypted token cache)
+#   - what still has to be fetched (token, uncached connections) is fetched
+#     concurrently
+#
+#   project_client, ids = warm_start(search={"type": ConnectionType.AZURE_AI_SEARCH},
+#                                    bing={"name": os.getenv("BING_CONNECTION_NAME")})
+#   ai_search = AzureAISearchTool(index_connection_id=ids["search"], index_name=...)
+#
+# Only connection IDs are written to disk (AGENT_BOOTSTRAP_CACHE, default
+# agents/.agent_bootstrap.json), never tokens or secrets. If a cached ID stops
+# working, `forget_connections()` (or deleting the file) forces a new lookup.
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+from azure.ai.projects import AIProjectClient
+from azure.core.credentials import AccessToken, AccessTokenInfo
+from azure.identity import ClientSecretCredential, DefaultAzureCredential, TokenCachePersistenceOptions
+from tracing import span
+
+# Next to this module, so every sample finds the same cache whatever its working directory
+CACHE_PATH = os.getenv("AGENT_BOOTSTRAP_CACHE") or os.path.join(os.path.dirname(os.path.abspath(__file__)), ".agent_bootstrap.json")
+BOOTSTRAP_TTL = float(os.getenv("BOOTSTRAP_TTL", "86400"))
+TOKEN_REFRESH_MARGIN = 300  # Seconds before expiry at which a new token is requested
+PERSIST_TOKENS = os.getenv("AZURE_TOKEN_CACHE_PERSIST", "").lower() in ("1", "true", "yes")
+SCOPE = "https://ai.azure.com/.default"
+
+
+def _as_info(token) -> AccessTokenInfo:
+    if isinstance(token, AccessTokenInfo):
+        return token
+    return AccessTokenInfo(token.token, token.expires_on)
+
+
+class CachedCredential:
+    """Hands out the same access token per scope until it is close to expiry
+
+    get_token() (used by `warm_start`) and get_token_info() (preferred by the
+    azure-core bearer token policy) share one cache entry per scopes and tenant,
+    so a token fetched ahead of time is the one the client's requests use.
+    """
+
+    def __init__(self, credential, refresh_margin: float = TOKEN_REFRESH_MARGIN):
+        self.credential = credential
+        self.refresh_margin = refresh_margin
+        self.lock = threading.Lock()
+        self.tokens: Dict[tuple, AccessTokenInfo] = {}  # (scopes, tenant_id) -> token
+
+    def _cached(self, scopes: tuple, tenant_id: Optional[str], fetch, claims: Optional[str]) -> AccessTokenInfo:
+        if claims:  # Claims challenge (e.g. revoked session): always ask for a new token
+            return _as_info(fetch())
+        with self.lock:
+            token = self.tokens.get((scopes, tenant_id))
+            if token is None or token.expires_on - self.refresh_margin <= time.time() \
+                    or (token.refresh_on and token.refresh_on <= time.time()):
+                # Under the lock, concurrent callers wait for one request
+                token = self.tokens[(scopes, tenant_id)] = _as_info(fetch())
+            return token
+
+    def get_token(self, *scopes: str, claims: Optional[str] = None, tenant_id: Optional[str] = None, **kwargs) -> AccessToken:
+        token = self._cached(scopes, tenant_id,
+                             lambda: self.credential.get_token(*scopes, claims=claims, tenant_id=tenant_id, **kwargs), claims)
+        return AccessToken(token.token, token.expires_on)
+
+    def get_token_info(self, *scopes: str, options: Optional[dict] = None) -> AccessTokenInfo:
+        options = options or {}
+        return self._cached(scopes, options.get("tenant_id"),
+                            lambda: self.credential.get_token_info(*scopes, options=options), options.get("claims"))
+
+    def close(self) -> None:
+        self.credential.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+_credential: Optional[CachedCredential] = None
+_clients: Dict[str, AIProjectClient] = {}
+_lock = threading.Lock()
+
+
+def get_credential() -> CachedCredential:
+    """Process-wide credential: service principal from TENANT_ID / CLIENT_ID / CLIENT_SECRET, else DefaultAzureCredential"""
+    global _credential
+    with _lock:
+        if _credential is None:
+            options = {"cache_persistence_options": TokenCachePersistenceOptions(name="azure-ai-agents")} if PERSIST_TOKENS else {}
+            if os.getenv("CLIENT_ID") and os.getenv("CLIENT_SECRET") and os.getenv("TENANT_ID"):
+                inner = ClientSecretCredential(os.getenv("TENANT_ID"), os.getenv("CLIENT_ID"), os.getenv("CLIENT_SECRET"), **options)
+            else:
+                inner = DefaultAzureCredential(**options)
+            _credential = CachedCredential(inner)
+        return _credential
+
+
+def get_project_client(endpoint: Optional[str] = None) -> AIProjectClient:
+    """One AIProjectClient per endpoint, sharing the process-wide credential"""
+    endpoint = endpoint or os.environ["PROJECT_ENDPOINT"]
+    with _lock:
+        if endpoint not in _clients:
+            _clients[endpoint] = AIProjectClient(endpoint=endpoint, credential=get_credential())
+        return _clients[endpoint]
+
+
+# --- connection IDs ------------------------------------------------------------
+
+_cache_lock = threading.Lock()
+
+
+def _read_cache() -> Dict[str, dict]:
+    try:
+        with open(CACHE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_cache(entries: Dict[str, dict]) -> None:
+    with open(CACHE_PATH + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(entries, f, indent=2)
+    os.replace(CACHE_PATH + ".tmp", CACHE_PATH)
+
+
+def _cache_key(endpoint: str, name: Optional[str], connection_type: Optional[str]) -> str:
+    return f"{endpoint}|name={name}" if name else f"{endpoint}|type={getattr(connection_type, 'value', connection_type)}"
+
+
+def find_connection_id(client: AIProjectClient, name: Optional[str] = None, connection_type=None) -> str:
+    """Connection ID by name (one GET) or the first connection of a type (server-side filtered list)"""
+    if name:
+        return client.connections.get(name=name).id
+    for connection in client.connections.list(connection_type=connection_type):
+        return connection.id
+    raise LookupError(f"No connection of type {connection_type} in the project")
+
+
+def resolve_connections(client: AIProjectClient, ttl: float = BOOTSTRAP_TTL, **wanted: dict) -> Dict[str, str]:
+    """{alias: connection ID} for `alias={"name": ...}` / `alias={"type": ...}`, cached IDs first, the rest in parallel"""
+    endpoint = getattr(getattr(client, "_config", None), "endpoint", "")  # Cached IDs are per project
+    keys = {alias: _cache_key(endpoint, spec.get("name"), spec.get("type")) for alias, spec in wanted.items()}
+    with _cache_lock:
+        entries = _read_cache()
+    now = time.time()
+    ids = {alias: entries[key]["id"] for alias, key in keys.items()
+           if key in entries and now - entries[key]["resolved_at"] < ttl}
+    missing = [alias for alias in wanted if alias not in ids]
+
+    def lookup(alias: str) -> Tuple[str, str]:
+        with span("connection.resolve", alias=alias):
+            return alias, find_connection_id(client, wanted[alias].get("name"), wanted[alias].get("type"))
+
+    if missing:
+        with ThreadPoolExecutor(max_workers=len(missing)) as pool:
+            resolved = dict(pool.map(lookup, missing))
+        with _cache_lock:
+            entries = _read_cache()  # Another process may have written meanwhile
+            for alias, connection_id in resolved.items():
+                entries[keys[alias]] = {"id": connection_id, "resolved_at": now}
+            _write_cache(entries)
+        ids.update(resolved)
+    return ids
+
+
+def forget_connections() -> None:
+    """Drop all cached connection IDs, the next start looks them up again"""
+    with _cache_lock:
+        _write_cache({})
+
+
+def warm_start(endpoint: Optional[str] = None, scope: str = SCOPE, **connections: dict) -> Tuple[AIProjectClient, Dict[str, str]]:
+    """Project client with a token ready and the requested connection IDs, fetched concurrently"""
+    client = get_project_client(endpoint)
+    with span("bootstrap", connections=len(connections)) as attributes, ThreadPoolExecutor(max_workers=2) as pool:
+        token = pool.submit(get_credential().get_token_info, scope)  # The method the client's auth policy calls
+        ids = pool.submit(resolve_connections, client, **connections) if connections else None
+        token.result()
+        ids = ids.result() if ids else {}
+        attributes["connection_ids"] = ids
+    return client, ids
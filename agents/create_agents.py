@@ -3,60 +3,77 @@ import os
 from azure.ai.projects import AIProjectClient
 from azure.identity import DefaultAzureCredential
 from dotenv import load_dotenv
+from agent_registry import AgentRegistry
+from message_cursor import MessageCursor
+from request_scheduler import RequestScheduler
+from tracing import span, usage_attributes
 load_dotenv('agents.env')
 
 # Create an AIProjectClient from an endpoint, copied from your Azure AI Foundry project.
 # You need to login to Azure subscription via Azure CLI and set the environment variables
 project_endpoint = os.environ["PROJECT_ENDPOINT"]  # Ensure the PROJECT_ENDPOINT environment variable is set
 
+# Time every step, set AGENT_TRACE_FILE=traces.jsonl to get the spans
+with span("credential.acquire"):
+    credential = DefaultAzureCredential()  # Use Azure Default Credential for authentication
+    credential.get_token("https://ai.azure.com/.default")  # Fetch the token now so it is timed here
+
 # Create an AIProjectClient instance
 project_client = AIProjectClient(
     endpoint=project_endpoint,
-    credential=DefaultAzureCredential(),  # Use Azure Default Credential for authentication
+    credential=credential,
 )
 
 with project_client:
-    agent = project_client.agents.create_agent(
+    # Reuse the agent of an earlier run with the same definition, create it only the first time
+    registry = AgentRegistry(project_client)
+    agent = registry.get_or_create(
         model=os.environ["MODEL_DEPLOYMENT_NAME"],  # Model deployment name
         name="my-agent",  # Name of the agent
         instructions="You are helpful agent",
     )
-    print(f"Created agent, agent ID: {agent.id}")
+    print(f"Using agent, agent ID: {agent.id}")
 
     # Create a thread
-    thread = project_client.agents.threads.create()
+    with span("thread.create") as attributes:
+        thread = project_client.agents.threads.create()
+        attributes["thread_id"] = thread.id
     print(f"Created thread, thread ID: {thread.id}")
 
     # Create a message
-    message = project_client.agents.messages.create(
-        thread_id=thread.id,
-        role="user",
-        content="Who is CEO of Amazon?",
-    )
+    with span("message.post", thread_id=thread.id):
+        message = project_client.agents.messages.create(
+            thread_id=thread.id,
+            role="user",
+            content="Who is CEO of Amazon?",
+        )
     print(f"Created message, message ID: {message.id}")
 
-    # Run the agent
-    run = project_client.agents.runs.create_and_process(thread_id=thread.id, agent_id=agent.id)
+    # Run the agent through the quota-aware scheduler: it paces runs to the RPM / TPM
+    # budget of each deployment in MODEL_DEPLOYMENT_NAMES and retries rate-limited runs
+    scheduler = RequestScheduler.from_env()
+    with span("agent.run", thread_id=thread.id, agent_id=agent.id) as attributes:
+        run = scheduler.submit(
+            lambda deployment: project_client.agents.runs.create_and_process(
+                thread_id=thread.id, agent_id=agent.id, model=deployment
+            ),
+            estimated_tokens=1000,
+        ).result()
+        attributes.update(run_id=run.id, status=run.status, **usage_attributes(run))
+    scheduler.shutdown()
     print(f"Run finished with status: {run.status}")
 
     if run.status == "failed":
-        # Check if you got "Rate limit is exceeded.", then you want to get more quota
+        # Still "Rate limit is exceeded." after the scheduler's retries? Then you want to get more quota
         print(f"Run failed: {run.last_error}")
 
-    #Get messages from the thread
-    messages = project_client.agents.messages.list(thread_id=thread.id)
-    #agent_response = messages[0].content[0].text.value # messages.data[0].content[0].text.value
-    #print(f"Agent: {agent_response}")
-    for message in messages:
-    # If content is a list of parts (common in Azure SDKs)
-        if message.role == "assistant":
-            for part in message.content:
-                if hasattr(part, "text"):
-                    print(f"Agent response: {part.text.value}")
-                else:
-                    print(f"Agent response: {part}")
-
-
-    # Delete the agent once done
-    project_client.agents.delete_agent(agent.id)
-    print("Deleted agent")
+    # Get the messages the run added: the cursor lists newest first and stops at the user message
+    cursor = MessageCursor()
+    cursor.record(message)
+    for entry in cursor.fetch_new(project_client, thread.id):
+        if entry["role"] == "assistant":
+            print(f"Agent response: {entry['text']}")
+
+
+    # The agent is kept for the next run; agents unused for AGENT_ORPHAN_DAYS are deleted here
+    print(f"Swept {registry.sweep()} stale agent(s)")
@@ -0,0 +1,329 @@
+# ==============================================================================
+# EMAIL ASSISTANT SESSION SERVER - MANY CONVERSATIONS IN ONE EVENT LOOP
+# ==============================================================================
+# agent_email.py serves one person per process and blocks a thread while a run
+# is polled. This server multiplexes many conversations in one asyncio event
+# loop using the async Azure clients (`azure.ai.projects.aio`):
+#   - one agent (agent_email.EMAIL_AGENT) shared by every session
+#   - one thread per session, turns of a session are serialized
+#   - runs are polled with the usual adaptive backoff, without blocking
+#   - send_email is posted to Logic Apps with aiohttp (pooled, retried only
+#     if the connection could not be opened, behind the same per-host circuit
+#     breaker as tool_http)
+#   - idle sessions are swept and their threads deleted
+#
+# Local API:
+#   POST   /sessions                       -> {"session_id": ...}
+#   POST   /sessions/{session_id}/messages    {"message": ...} -> {"reply": ...}
+#   DELETE /sessions/{session_id}
+#   GET    /ws[?session_id=...]            WebSocket: send text, receive
+#                                          {"type": "tool_calls" | "reply" | "error", ...};
+#                                          without session_id the socket gets its own session
+#   GET    /health
+#
+#   python email_server.py --port 8080
+#   curl -X POST localhost:8080/sessions
+#
+# Needs aiohttp in addition to the packages of agent_email.py.
+
+import argparse
+import asyncio
+import json
+import os
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import aiohttp
+from aiohttp import web
+from azure.ai.agents.models import ListSortOrder
+from azure.ai.projects.aio import AIProjectClient
+from azure.identity.aio import ClientSecretCredential
+
+import agent_email                                  # Configuration, agent definition, Logic Apps endpoint
+import tool_http
+from run_waiter import run_to_completion_async
+from tool_dispatcher import TOOL_CALL_TIMEOUT
+from tracing import span
+
+# Runs in flight across all sessions; further turns wait for a slot
+MAX_ACTIVE_RUNS = int(os.getenv("EMAIL_SERVER_MAX_RUNS", "64"))
+# Seconds without a turn after which a session and its thread are deleted
+SESSION_IDLE_TIMEOUT = float(os.getenv("EMAIL_SESSION_IDLE_TIMEOUT", "900"))
+# Failures before the request was sent; anything later may have reached Logic Apps and is not retried
+CONNECT_ERRORS = (aiohttp.ClientConnectorError, aiohttp.ConnectionTimeoutError)
+
+
+class AsyncToolHttp:
+    """aiohttp counterpart of tool_http: pooled session, timeouts, connect retries and tool_http's circuit breakers"""
+
+    def __init__(self):
+        self.session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(sock_connect=tool_http.CONNECT_TIMEOUT, sock_read=tool_http.READ_TIMEOUT),
+            connector=aiohttp.TCPConnector(limit_per_host=tool_http.POOL_SIZE),
+        )
+
+    async def post(self, endpoint: tool_http.Endpoint, **kwargs) -> Tuple[int, str]:
+        """POST, retried only when the connection could not be opened (like tool_http); returns status and body"""
+        breaker = tool_http.breaker_for(endpoint.host)
+        if not breaker.allow():
+            raise tool_http.CircuitOpenError(f"Circuit open for {endpoint.host}, not calling it for now")
+
+        for attempt in range(tool_http.MAX_RETRIES + 1):
+            try:
+                async with self.session.post(endpoint.url, params=endpoint.params, **kwargs) as response:
+                    status, text = response.status, await response.text()
+                break
+            except CONNECT_ERRORS:
+                if attempt == tool_http.MAX_RETRIES:
+                    breaker.record_failure()
+                    raise
+                await asyncio.sleep(tool_http.BACKOFF_FACTOR * 2 ** attempt)
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                breaker.record_failure()  # Possibly delivered, a retry could send the email twice
+                raise
+
+        if status in tool_http.RETRY_STATUSES:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return status, text
+
+    async def close(self) -> None:
+        await self.session.close()
+
+
+class Session:
+    """One conversation: its thread and the lock that keeps one run per thread"""
+
+    def __init__(self, session_id: str, thread_id: str):
+        self.id = session_id
+        self.thread_id = thread_id
+        self.lock = asyncio.Lock()
+        self.last_used = time.monotonic()
+        self.turns = 0
+
+
+class EmailServer:
+    """Shared client, agent and tool HTTP session plus the table of live sessions"""
+
+    def __init__(self, max_active_runs: int = MAX_ACTIVE_RUNS, idle_timeout: float = SESSION_IDLE_TIMEOUT):
+        self.idle_timeout = idle_timeout
+        self.run_slots = asyncio.Semaphore(max_active_runs)
+        self.sessions: Dict[str, Session] = {}
+        self.active_runs = 0
+        self.credential = None
+        self.client = None
+        self.agent = None
+        self.http: Optional[AsyncToolHttp] = None
+        self.sweeper: Optional[asyncio.Task] = None
+        self.tools: Dict[str, Callable[..., Any]] = {"send_email": self.send_email}
+
+    # --- lifecycle -----------------------------------------------------------
+
+    async def start(self) -> None:
+        with span("credential.acquire"):
+            self.credential = ClientSecretCredential(agent_email.TENANT_ID, agent_email.CLIENT_ID, agent_email.CLIENT_SECRET)
+            await self.credential.get_token("https://ai.azure.com/.default")  # Fetch the token now so it is timed here
+        self.client = AIProjectClient(credential=self.credential, endpoint=agent_email.AZURE_ENDPOINT)
+        with span("agent.create") as attributes:
+            self.agent = await self.client.agents.create_agent(**agent_email.EMAIL_AGENT)
+            attributes["agent_id"] = self.agent.id
+        self.http = AsyncToolHttp()
+        self.sweeper = asyncio.create_task(self._sweep_idle())
+
+    async def stop(self) -> None:
+        if self.sweeper:
+            self.sweeper.cancel()
+        await asyncio.gather(*(self.close_session(session_id) for session_id in list(self.sessions)))
+        if self.agent:
+            try:
+                await self.client.agents.delete_agent(self.agent.id)
+            except Exception as e:
+                print(f"Failed to delete agent {self.agent.id}: {e}")
+        if self.http:
+            await self.http.close()
+        if self.client:
+            await self.client.close()
+        if self.credential:
+            await self.credential.close()
+
+    async def _sweep_idle(self) -> None:
+        while True:
+            await asyncio.sleep(min(60.0, self.idle_timeout / 2))
+            cutoff = time.monotonic() - self.idle_timeout
+            idle = [s.id for s in self.sessions.values() if s.last_used < cutoff and not s.lock.locked()]
+            await asyncio.gather(*(self.close_session(session_id) for session_id in idle))
+
+    # --- sessions ------------------------------------------------------------
+
+    async def open_session(self) -> Session:
+        with span("thread.create") as attributes:
+            thread = await self.client.agents.threads.create()
+            attributes["thread_id"] = thread.id
+        session = Session(uuid.uuid4().hex, thread.id)
+        self.sessions[session.id] = session
+        return session
+
+    async def close_session(self, session_id: str) -> None:
+        session = self.sessions.pop(session_id, None)
+        if session is None:
+            return
+        try:
+            await self.client.agents.threads.delete(session.thread_id)
+        except Exception as e:
+            print(f"Failed to delete thread {session.thread_id}: {e}")
+
+    # --- turns ---------------------------------------------------------------
+
+    async def chat(self, session: Session, message: str,
+                   on_tool_calls: Optional[Callable[[List[Any]], None]] = None) -> str:
+        """Async counterpart of agent_email.chat for one session"""
+        async with session.lock, self.run_slots:
+            session.last_used = time.monotonic()
+            session.turns += 1
+            self.active_runs += 1
+            try:
+                with span("chat.turn", thread_id=session.thread_id, agent_id=self.agent.id, session_id=session.id):
+                    with span("message.post", thread_id=session.thread_id):
+                        await self.client.agents.messages.create(thread_id=session.thread_id, role="user", content=message)
+                    run = await run_to_completion_async(self.client, session.thread_id, self.agent.id,
+                                                        self.handle_tool_calls, on_tool_calls=on_tool_calls)
+                    if run.status == "failed":
+                        return f"❌ Run failed: {run.last_error}"
+
+                    with span("message.fetch", thread_id=session.thread_id):
+                        async for msg in self.client.agents.messages.list(thread_id=session.thread_id, order=ListSortOrder.DESCENDING, limit=1):
+                            if msg.role == "assistant":
+                                return next((item.text.value for item in msg.content if hasattr(item, "text")), "Error")
+                            break
+                    return "Error"
+            finally:
+                self.active_runs -= 1
+                session.last_used = time.monotonic()
+
+    async def handle_tool_calls(self, tool_calls: List[Any]) -> List[dict]:
+        """Run the tool calls of a requires_action step concurrently, outputs in call order"""
+        outputs = await asyncio.gather(*(self._call_tool(call) for call in tool_calls))
+        return [{"tool_call_id": call.id, "output": output} for call, output in zip(tool_calls, outputs)]
+
+    async def _call_tool(self, call) -> str:
+        with span("tool.call", tool=call.function.name, tool_call_id=call.id):
+            function = self.tools.get(call.function.name)
+            if function is None:
+                return f"❌ Error: Unknown function: {call.function.name}"
+            try:
+                result = await asyncio.wait_for(function(**json.loads(call.function.arguments or "{}")), TOOL_CALL_TIMEOUT)
+            except asyncio.TimeoutError:
+                return f"❌ Error: {call.function.name} timed out after {TOOL_CALL_TIMEOUT:g}s"
+            except Exception as e:
+                return f"❌ Error: {str(e)}"
+            return result if isinstance(result, str) else json.dumps(result)
+
+    async def send_email(self, email_to, email_subject, email_body) -> str:
+        """Send email via Logic Apps - async twin of agent_email.send_email_function"""
+        status, _ = await self.http.post(
+            agent_email.LOGIC_APPS_ENDPOINT,
+            json={"email_to": email_to, "email_subject": email_subject, "email_body": email_body},
+        )
+        return "✅ Email sent!" if status in [200, 202] else f"❌ Failed: {status}"
+
+
+# ==============================================================================
+# HTTP / WEBSOCKET API
+# ==============================================================================
+
+def _session_or_404(server: EmailServer, session_id: str) -> Session:
+    session = server.sessions.get(session_id)
+    if session is None:
+        raise web.HTTPNotFound(text=json.dumps({"error": f"Unknown session {session_id}"}), content_type="application/json")
+    return session
+
+
+async def create_session(request: web.Request) -> web.Response:
+    session = await request.app["server"].open_session()
+    return web.json_response({"session_id": session.id}, status=201)
+
+
+async def post_message(request: web.Request) -> web.Response:
+    server: EmailServer = request.app["server"]
+    session = _session_or_404(server, request.match_info["session_id"])
+    body = await request.json()
+    message = str(body.get("message", "")).strip()
+    if not message:
+        raise web.HTTPBadRequest(text=json.dumps({"error": "message is required"}), content_type="application/json")
+    return web.json_response({"reply": await server.chat(session, message)})
+
+
+async def delete_session(request: web.Request) -> web.Response:
+    server: EmailServer = request.app["server"]
+    _session_or_404(server, request.match_info["session_id"])
+    await server.close_session(request.match_info["session_id"])
+    return web.Response(status=204)
+
+
+async def websocket(request: web.Request) -> web.WebSocketResponse:
+    server: EmailServer = request.app["server"]
+    session_id = request.query.get("session_id")
+    session = _session_or_404(server, session_id) if session_id else await server.open_session()
+
+    ws = web.WebSocketResponse(heartbeat=30)
+    await ws.prepare(request)
+    await ws.send_json({"type": "session", "session_id": session.id})
+
+    def announce(tool_calls) -> None:
+        names = [call.function.name for call in tool_calls]
+        asyncio.ensure_future(ws.send_json({"type": "tool_calls", "tools": names}))
+
+    try:
+        async for frame in ws:
+            if frame.type != aiohttp.WSMsgType.TEXT or not frame.data.strip():
+                continue
+            try:
+                reply = await server.chat(session, frame.data.strip(), on_tool_calls=announce)
+                await ws.send_json({"type": "reply", "text": reply})
+            except Exception as e:
+                await ws.send_json({"type": "error", "error": str(e)})
+    finally:
+        if not session_id:
+            await server.close_session(session.id)  # The socket owned this session
+    return ws
+
+
+async def health(request: web.Request) -> web.Response:
+    server: EmailServer = request.app["server"]
+    return web.json_response({
+        "agent_id": server.agent.id if server.agent else None,
+        "sessions": len(server.sessions),
+        "active_runs": server.active_runs,
+    })
+
+
+def make_app(server: Optional[EmailServer] = None) -> web.Application:
+    app = web.Application()
+    app["server"] = server or EmailServer()
+
+    async def on_startup(app: web.Application) -> None:
+        await app["server"].start()
+
+    async def on_cleanup(app: web.Application) -> None:
+        await app["server"].stop()
+
+    app.on_startup.append(on_startup)
+    app.on_cleanup.append(on_cleanup)
+    app.add_routes([
+        web.post("/sessions", create_session),
+        web.post("/sessions/{session_id}/messages", post_message),
+        web.delete("/sessions/{session_id}", delete_session),
+        web.get("/ws", websocket),
+        web.get("/health", health),
+    ])
+    return app
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Async multi-session server for the email assistant")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args()
+    web.run_app(make_app(), host=args.host, port=args.port)
@@ -0,0 +1,185 @@
+# ==============================================================================
+# FILE MANIFEST - UPLOAD ONCE, REUSE FILE AND VECTOR STORE IDS
+# ==============================================================================
+# Uploading a document and indexing it into a vector store takes tens of
+# seconds, and the samples did both on every run. The manifest is a small
+# local JSON file (AGENT_FILE_MANIFEST, default agents/.agent_files.json)
+# keyed by the SHA-256 of the file content:
+#   - `upload(path)` returns the existing file ID when the content is unchanged
+#   - `vector_store(paths, name)` reuses the store built from the same contents
+#   - new or changed files of a multi-file set are uploaded in parallel
+#   - `collect_garbage()` deletes stores replaced by newer content or unused
+#     for a while, and files no store needs any more - only IDs this manifest
+#     recorded, never stores or files created some other way
+#
+#   manifest = FileManifest(project_client)
+#   vector_store_id = manifest.vector_store(["../data/gpt-4-system-card.pdf"], name="my_vectorstore")
+#   file_id = manifest.upload("../data/sales_data.csv")
+#
+# Remote IDs are checked with one cheap GET before reuse, so a store or file
+# deleted in the portal is simply recreated.
+
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+from azure.ai.agents.models import FilePurpose
+from azure.core.exceptions import ResourceNotFoundError
+from tracing import span
+
+# Next to this module, so every sample finds the same manifest whatever its working directory
+MANIFEST_PATH = os.getenv("AGENT_FILE_MANIFEST") or os.path.join(os.path.dirname(os.path.abspath(__file__)), ".agent_files.json")
+UPLOAD_WORKERS = int(os.getenv("FILE_UPLOAD_WORKERS", "4"))
+# Stores not used for this many days are deleted by collect_garbage()
+STALE_AFTER_DAYS = float(os.getenv("VECTOR_STORE_STALE_DAYS", "7"))
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class FileManifest:
+    """Content hash -> file ID and file set -> vector store ID, persisted as JSON"""
+
+    def __init__(self, client, path: str = MANIFEST_PATH, verify: bool = True):
+        self.client = client
+        self.path = path
+        self.verify = verify  # Check that a remembered ID still exists before reusing it
+        self.lock = threading.Lock()
+        self.data = {"files": {}, "vector_stores": {}}
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self.data.update(json.load(f))
+
+    def _save(self) -> None:
+        """Write to a temp file and swap it in, a crash never leaves half a manifest"""
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, indent=2)
+        os.replace(temporary, self.path)
+
+    # --- files ---------------------------------------------------------------
+
+    def _file_exists(self, file_id: str) -> bool:
+        try:
+            self.client.agents.files.get(file_id)
+            return True
+        except ResourceNotFoundError:
+            return False
+
+    def upload(self, path: str, purpose: FilePurpose = FilePurpose.AGENTS, content_hash: Optional[str] = None) -> str:
+        """File ID for the content of `path`, uploading only if this content is not known yet"""
+        content_hash = content_hash or file_sha256(path)
+        with self.lock:
+            entry = self.data["files"].get(content_hash)
+        if entry and (not self.verify or self._file_exists(entry["file_id"])):
+            with self.lock:
+                entry["last_used"] = time.time()
+                self._save()
+            return entry["file_id"]
+
+        with span("file.upload", path=os.path.basename(path), bytes=os.path.getsize(path)) as attributes:
+            uploaded = self.client.agents.files.upload_and_poll(file_path=path, purpose=purpose)
+            attributes["file_id"] = uploaded.id
+        with self.lock:
+            self.data["files"][content_hash] = {
+                "file_id": uploaded.id, "name": os.path.basename(path), "size": os.path.getsize(path),
+                "uploaded_at": time.time(), "last_used": time.time(),
+            }
+            self._save()
+        return uploaded.id
+
+    def upload_many(self, paths: Iterable[str], purpose: FilePurpose = FilePurpose.AGENTS) -> List[str]:
+        """File IDs in the order of `paths`; unknown contents are uploaded in parallel"""
+        paths = list(paths)
+        if len(paths) <= 1:
+            return [self.upload(path, purpose) for path in paths]
+        with ThreadPoolExecutor(max_workers=min(UPLOAD_WORKERS, len(paths))) as pool:
+            return list(pool.map(lambda path: self.upload(path, purpose), paths))
+
+    # --- vector stores -------------------------------------------------------
+
+    def _store_usable(self, vector_store_id: str) -> bool:
+        try:
+            store = self.client.agents.vector_stores.get(vector_store_id)
+        except ResourceNotFoundError:
+            return False
+        return str(getattr(store.status, "value", store.status)) != "expired"
+
+    def vector_store(self, paths: Iterable[str], name: str) -> str:
+        """Vector store ID over exactly these file contents, created only when the contents changed"""
+        paths = list(paths)
+        hashes = [file_sha256(path) for path in paths]
+        key = hashlib.sha256("\n".join(sorted(hashes)).encode("utf-8")).hexdigest()
+        with self.lock:
+            entry = self.data["vector_stores"].get(key)
+        if entry and (not self.verify or self._store_usable(entry["vector_store_id"])):
+            with self.lock:
+                entry["last_used"] = time.time()
+                self._save()
+            return entry["vector_store_id"]
+
+        with ThreadPoolExecutor(max_workers=max(1, min(UPLOAD_WORKERS, len(paths)))) as pool:
+            file_ids = list(pool.map(lambda item: self.upload(item[0], content_hash=item[1]), zip(paths, hashes)))
+        with span("vector_store.create", store_name=name, files=len(file_ids)) as attributes:
+            store = self.client.agents.vector_stores.create_and_poll(file_ids=file_ids, name=name)
+            attributes["vector_store_id"] = store.id
+        with self.lock:
+            self.data["vector_stores"][key] = {
+                "vector_store_id": store.id, "name": name, "file_hashes": hashes,
+                "created_at": time.time(), "last_used": time.time(),
+            }
+            self._save()
+        return store.id
+
+    # --- clean-up ------------------------------------------------------------
+
+    def collect_garbage(self, stale_after_days: float = STALE_AFTER_DAYS, delete_files: bool = True) -> Dict[str, int]:
+        """Delete recorded stores superseded by a newer recorded one or unused for `stale_after_days`"""
+        cutoff = time.time() - stale_after_days * 86400
+        with self.lock:
+            stores = dict(self.data["vector_stores"])  # Only stores this manifest created; remote ones are never listed
+        newest_by_name: Dict[str, float] = {}
+        for entry in stores.values():
+            newest_by_name[entry["name"]] = max(newest_by_name.get(entry["name"], 0.0), entry["created_at"])
+
+        removed = {"vector_stores": 0, "files": 0}
+        for key, entry in stores.items():
+            # Superseded: a newer recorded store took over the name and this one was not used since,
+            # so a second file set that shares the name but is still in use is kept
+            newest = newest_by_name[entry["name"]]
+            superseded = entry["created_at"] < newest and entry["last_used"] < newest
+            if not (superseded or entry["last_used"] < cutoff):
+                continue
+            try:
+                self.client.agents.vector_stores.delete(entry["vector_store_id"])
+            except ResourceNotFoundError:
+                pass  # Already gone remotely
+            with self.lock:
+                self.data["vector_stores"].pop(key, None)
+            removed["vector_stores"] += 1
+
+        if delete_files:
+            with self.lock:
+                referenced = {h for entry in self.data["vector_stores"].values() for h in entry["file_hashes"]}
+                orphans = {h: e for h, e in self.data["files"].items() if h not in referenced and e["last_used"] < cutoff}
+            for content_hash, entry in orphans.items():
+                try:
+                    self.client.agents.files.delete(entry["file_id"])
+                except ResourceNotFoundError:
+                    pass
+                with self.lock:
+                    self.data["files"].pop(content_hash, None)
+                removed["files"] += 1
+
+        with self.lock:
+            self._save()
+        return removed
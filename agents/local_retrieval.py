@@ -0,0 +1,299 @@
+# ==============================================================================
+# LOCAL RETRIEVAL - OFFLINE SEARCH OVER THE BUNDLED DOCUMENTS
+# ==============================================================================
+# A file-search tool that runs in-process: no network, no GPU, no model.
+#   - PDFs in data/ are split into overlapping word chunks (pypdf, optional;
+#     .txt / .md files are read as they are)
+#   - every chunk becomes a hashed TF-IDF vector (unigrams + bigrams) in one
+#     float32 matrix on disk, opened with np.memmap
+#   - a BM25 inverted index over exact words catches names and rare terms the
+#     hashed vectors blur together
+#   - a query is one matrix-vector product plus a few postings lookups,
+#     top-k with np.argpartition
+# Re-indexing is incremental: only files whose size, mtime and content hash
+# changed are extracted again, the matrix is then rebuilt from cached chunks.
+#
+#   index = LocalIndex()                     # Builds or refreshes data/.local_index
+#   index.search("What risks does GPT-4 pose for cybersecurity?", top_k=5)
+#
+# As an agent tool (first pass before the remote vector store, or offline):
+#   functions = FunctionTool(functions={search_documents})
+#
+#   python local_retrieval.py "hallucinations"        # Query from the shell
+
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+import zlib
+from typing import Dict, List, Optional
+
+import numpy as np
+
+try:
+    from pypdf import PdfReader
+except ImportError:  # PDFs are skipped, text files still work
+    PdfReader = None
+
+DOCS_DIR = os.getenv("LOCAL_DOCS_DIR") or os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
+INDEX_DIR = os.getenv("LOCAL_INDEX_DIR") or os.path.join(DOCS_DIR, ".local_index")
+DOC_EXTENSIONS = (".pdf", ".txt", ".md")
+
+CHUNK_WORDS = 200     # Words per chunk
+CHUNK_OVERLAP = 40    # Words shared by neighbouring chunks, an answer split across a boundary is still found
+DIMENSIONS = 4096     # Hash buckets per vector; 1000 chunks take 16 MB
+BM25_K1, BM25_B = 1.5, 0.75
+VECTOR_WEIGHT = 0.5   # Share of the cosine score in the hybrid score, the rest is normalised BM25
+
+_TOKEN = re.compile(r"[a-z0-9]+(?:[-'][a-z0-9]+)*")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the this to was were will with "
+    "what which who how when where why does do did can could should would may might".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    return [token for token in _TOKEN.findall(text.lower()) if token not in _STOPWORDS]
+
+
+def _bucket(feature: str) -> int:
+    return zlib.crc32(feature.encode("utf-8")) % DIMENSIONS  # Stable across processes, unlike hash()
+
+
+def _features(tokens: List[str]) -> List[int]:
+    return [_bucket(t) for t in tokens] + [_bucket(f"{a} {b}") for a, b in zip(tokens, tokens[1:])]
+
+
+def _content_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def extract_pages(path: str) -> List[str]:
+    """Text per page (a text file is one page)"""
+    if path.lower().endswith(".pdf"):
+        if PdfReader is None:
+            print(f"pypdf is not installed, skipping {os.path.basename(path)} (pip install pypdf)")
+            return []
+        return [page.extract_text() or "" for page in PdfReader(path).pages]
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        return [f.read()]
+
+
+def chunk_pages(pages: List[str], size: int = CHUNK_WORDS, overlap: int = CHUNK_OVERLAP) -> List[dict]:
+    """Overlapping word windows; a chunk carries the page it starts on"""
+    words, starts = [], []  # starts[i] = page number of words[i]
+    for number, text in enumerate(pages, start=1):
+        page_words = text.split()
+        words.extend(page_words)
+        starts.extend([number] * len(page_words))
+    step = max(1, size - overlap)
+    return [{"page": starts[i], "text": " ".join(words[i:i + size])}
+            for i in range(0, max(1, len(words) - overlap), step) if words[i:i + size]]
+
+
+class LocalIndex:
+    """Hashed TF-IDF matrix (memory-mapped) plus BM25 postings over the documents of one directory"""
+
+    def __init__(self, docs_dir: str = DOCS_DIR, index_dir: str = INDEX_DIR, refresh: bool = True):
+        self.docs_dir = docs_dir
+        self.index_dir = index_dir
+        self.lock = threading.Lock()
+        self.files: Dict[str, dict] = {}  # file name -> size, mtime, sha256, chunks
+        self.chunks: List[dict] = []       # source, page, text of every matrix row
+        self.vectors = None
+        os.makedirs(index_dir, exist_ok=True)
+        self._load()
+        if refresh:
+            self.refresh()
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.index_dir, name)
+
+    def _load(self) -> None:
+        try:
+            with open(self._path("files.json"), "r", encoding="utf-8") as f:
+                self.files = json.load(f)
+            self._open_arrays()
+        except (OSError, ValueError, KeyError):
+            self.files = {}  # Missing or from an older layout, refresh() rebuilds it
+
+    def _open_arrays(self) -> None:
+        with open(self._path("meta.json"), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta["dimensions"] != DIMENSIONS:
+            raise KeyError("dimensions changed")
+        self.chunks = [{"source": name, **chunk} for name in meta["order"] for chunk in self.files[name]["chunks"]]
+        self.idf = np.asarray(meta["idf"], dtype=np.float32)
+        self.vocabulary = meta["vocabulary"]
+        postings = np.load(self._path("postings.npz"))
+        self.indptr, self.doc_ids, self.term_freqs = postings["indptr"], postings["doc_ids"], postings["term_freqs"]
+        self.doc_lengths = postings["doc_lengths"]
+        self.average_length = float(self.doc_lengths.mean()) if len(self.doc_lengths) else 0.0
+        self.bm25_idf = postings["bm25_idf"]
+        self.vectors = (np.memmap(self._path("vectors.f32"), dtype=np.float32, mode="r", shape=(len(self.chunks), DIMENSIONS))
+                        if self.chunks else np.zeros((0, DIMENSIONS), dtype=np.float32))
+
+    # --- indexing ------------------------------------------------------------
+
+    def refresh(self) -> bool:
+        """Re-extract new or changed documents, rebuild the arrays if anything changed"""
+        changed = touched = False
+        present = {}
+        for name in sorted(os.listdir(self.docs_dir)):
+            path = os.path.join(self.docs_dir, name)
+            if not (os.path.isfile(path) and name.lower().endswith(DOC_EXTENSIONS)):
+                continue
+            stat = os.stat(path)
+            known = self.files.get(name)
+            present[name] = known
+            if known and known["size"] == stat.st_size and known["mtime"] == stat.st_mtime:
+                continue  # Untouched, not even hashed
+            content_hash = _content_hash(path)
+            if known and known["sha256"] == content_hash:
+                known["mtime"] = stat.st_mtime  # Touched but identical, only the bookkeeping changes
+                touched = True
+                continue
+            started = time.perf_counter()
+            present[name] = {"size": stat.st_size, "mtime": stat.st_mtime, "sha256": content_hash,
+                             "chunks": chunk_pages(extract_pages(path))}
+            print(f"Indexed {name}: {len(present[name]['chunks'])} chunks in {time.perf_counter() - started:.1f}s")
+            changed = True
+        if set(present) != set(self.files):
+            changed = True  # Files were removed
+        with self.lock:
+            self.files = present
+            if changed or self.vectors is None:
+                self._build()
+            elif touched:
+                self._write_json("files.json", self.files)
+        return changed
+
+    def _build(self) -> None:
+        order = sorted(self.files)
+        chunks = [chunk for name in order for chunk in self.files[name]["chunks"]]
+        token_lists = [tokenize(chunk["text"]) for chunk in chunks]
+        rows = len(chunks)
+
+        # Hashed term counts, then sublinear TF x IDF, then unit length so a dot product is the cosine
+        counts = np.zeros((rows, DIMENSIONS), dtype=np.float32)
+        for row, tokens in enumerate(token_lists):
+            np.add.at(counts[row], np.asarray(_features(tokens), dtype=np.int64), 1.0)
+        document_frequency = np.count_nonzero(counts, axis=0)
+        idf = (np.log((1 + rows) / (1 + document_frequency)) + 1).astype(np.float32)
+        weights = np.log1p(counts, out=counts)
+        weights *= idf
+        norms = np.linalg.norm(weights, axis=1, keepdims=True)
+        weights /= np.where(norms == 0, 1, norms)
+
+        # BM25 postings in CSR layout: term id -> (chunk ids, term frequencies)
+        postings: Dict[str, Dict[int, int]] = {}
+        for row, tokens in enumerate(token_lists):
+            for token in tokens:
+                per_doc = postings.setdefault(token, {})
+                per_doc[row] = per_doc.get(row, 0) + 1
+        vocabulary = {term: i for i, term in enumerate(sorted(postings))}
+        indptr = np.zeros(len(vocabulary) + 1, dtype=np.int64)
+        doc_ids, term_freqs = [], []
+        for term, i in vocabulary.items():
+            doc_ids.extend(postings[term].keys())
+            term_freqs.extend(postings[term].values())
+            indptr[i + 1] = len(doc_ids)
+        df = np.diff(indptr).astype(np.float32)
+        bm25_idf = np.log(1 + (rows - df + 0.5) / (df + 0.5)).astype(np.float32)
+
+        # Write next to the live files and swap in, a reader never sees half an index
+        self.vectors = None  # Release the old mapping before replacing its file
+        weights.tofile(self._path("vectors.f32.tmp"))
+        os.replace(self._path("vectors.f32.tmp"), self._path("vectors.f32"))
+        with open(self._path("postings.npz.tmp"), "wb") as f:
+            np.savez(f, indptr=indptr, doc_ids=np.asarray(doc_ids, dtype=np.int32),
+                     term_freqs=np.asarray(term_freqs, dtype=np.float32), bm25_idf=bm25_idf,
+                     doc_lengths=np.asarray([len(t) for t in token_lists], dtype=np.float32))
+        os.replace(self._path("postings.npz.tmp"), self._path("postings.npz"))
+        self._write_json("meta.json", {"dimensions": DIMENSIONS, "order": order, "idf": idf.tolist(), "vocabulary": vocabulary})
+        self._write_json("files.json", self.files)
+        self._open_arrays()
+
+    def _write_json(self, name: str, content) -> None:
+        with open(self._path(name + ".tmp"), "w", encoding="utf-8") as f:
+            json.dump(content, f)
+        os.replace(self._path(name + ".tmp"), self._path(name))
+
+    # --- search --------------------------------------------------------------
+
+    def _bm25(self, tokens: List[str]) -> np.ndarray:
+        scores = np.zeros(len(self.chunks), dtype=np.float32)
+        length_norm = BM25_K1 * (1 - BM25_B + BM25_B * self.doc_lengths / max(self.average_length, 1e-9))
+        for token in set(tokens):
+            term = self.vocabulary.get(token)
+            if term is None:
+                continue
+            start, end = self.indptr[term], self.indptr[term + 1]
+            docs, tf = self.doc_ids[start:end], self.term_freqs[start:end]
+            scores[docs] += self.bm25_idf[term] * tf * (BM25_K1 + 1) / (tf + length_norm[docs])
+        return scores
+
+    def search(self, query: str, top_k: int = 5) -> List[dict]:
+        """Best chunks for the query, highest hybrid score first"""
+        tokens = tokenize(query)
+        with self.lock:
+            if not tokens or not self.chunks:
+                return []
+            query_vector = np.zeros(DIMENSIONS, dtype=np.float32)
+            np.add.at(query_vector, np.asarray(_features(tokens), dtype=np.int64), 1.0)
+            query_vector = np.log1p(query_vector) * self.idf
+            query_vector /= np.linalg.norm(query_vector) or 1.0
+            cosine = self.vectors @ query_vector
+            bm25 = self._bm25(tokens)
+            scores = VECTOR_WEIGHT * cosine + (1 - VECTOR_WEIGHT) * bm25 / (bm25.max() or 1.0)
+
+            top_k = min(top_k, len(scores))
+            best = np.argpartition(-scores, top_k - 1)[:top_k]
+            best = best[np.argsort(-scores[best])]
+            return [{**self.chunks[i], "score": round(float(scores[i]), 4)} for i in best if scores[i] > 0]
+
+
+_index: Optional[LocalIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_index() -> LocalIndex:
+    """Shared index of DOCS_DIR, built on first use"""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = LocalIndex()
+        return _index
+
+
+def search_documents(query: str, top_k: int = 5) -> str:
+    """
+    Searches the local documents (e.g. the GPT-4 system card) for passages relevant to a question.
+
+    :param query (str): The question or keywords to search for.
+    :param top_k (int): Number of passages to return, default 5.
+    :return: Matching passages with source file, page and score as a JSON string.
+    """
+    try:
+        return json.dumps({"results": get_index().search(query, top_k=max(1, min(int(top_k), 20)))})
+    except Exception as e:
+        return json.dumps({"error": str(e)})
+
+
+if __name__ == "__main__":
+    started = time.perf_counter()
+    index = get_index()
+    print(f"Index ready: {len(index.chunks)} chunks in {time.perf_counter() - started:.2f}s")
+    question = " ".join(sys.argv[1:]) or "What safety risks were evaluated?"
+    started = time.perf_counter()
+    results = index.search(question)
+    print(f"Query took {(time.perf_counter() - started) * 1000:.1f} ms")
+    for result in results:
+        print(f"[{result['score']:.3f}] {result['source']} p.{result['page']}: {result['text'][:160]}...")
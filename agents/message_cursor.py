@@ -0,0 +1,91 @@
+# ==============================================================================
+# MESSAGE CURSOR - FETCH ONLY THE MESSAGES A TURN ADDED
+# ==============================================================================
+# Listing a thread after every run gets slower as the conversation grows.
+# The cursor remembers the newest message already seen per thread and lists
+# in descending order only until it reaches that message, so a turn costs one
+# small page no matter how long the thread is. Text of fetched messages is
+# kept locally, older turns never have to be downloaded again.
+#
+#   cursor = MessageCursor()
+#   message = client.agents.messages.create(thread_id=thread.id, role="user", content=text)
+#   cursor.record(message)                  # The user's own message needs no fetch
+#   ... run the agent ...
+#   reply = cursor.latest_reply(client, thread.id)
+
+import threading
+from typing import Dict, List, Optional
+
+from azure.ai.agents.models import ListSortOrder
+from tracing import span
+
+# Messages per list request; a turn rarely adds more than a couple
+PAGE_SIZE = 10
+# Messages kept in the local cache per thread
+MAX_CACHED = 500
+
+
+def _role(message) -> str:
+    return str(getattr(message.role, "value", message.role))  # MessageRole enum or plain string
+
+
+def message_text(message) -> str:
+    """Text parts of a message joined together"""
+    return "\n".join(part.text.value for part in message.content if getattr(part, "text", None) is not None)
+
+
+class MessageCursor:
+    """Last seen message ID and cached message text, per thread"""
+
+    def __init__(self, page_size: int = PAGE_SIZE, max_cached: int = MAX_CACHED):
+        self.page_size = page_size
+        self.max_cached = max_cached
+        self.lock = threading.Lock()
+        self.last_seen: Dict[str, str] = {}          # thread_id -> newest message ID seen
+        self.messages: Dict[str, List[dict]] = {}    # thread_id -> cached messages, oldest first
+
+    def _append(self, thread_id: str, entries: List[dict]) -> None:
+        cached = self.messages.setdefault(thread_id, [])
+        cached.extend(entries)
+        del cached[:-self.max_cached]
+        if entries:
+            self.last_seen[thread_id] = entries[-1]["id"]
+
+    def record(self, message) -> None:
+        """Remember a message this process created itself (e.g. the user message of a turn)"""
+        entry = {"id": message.id, "role": _role(message), "text": message_text(message), "run_id": None}
+        with self.lock:
+            self._append(message.thread_id, [entry])
+
+    def fetch_new(self, client, thread_id: str) -> List[dict]:
+        """Messages added since the last fetch (or record), oldest first"""
+        with self.lock:
+            last_seen = self.last_seen.get(thread_id)
+        new = []
+        with span("message.fetch", thread_id=thread_id) as attributes:
+            for message in client.agents.messages.list(thread_id=thread_id, order=ListSortOrder.DESCENDING, limit=self.page_size):
+                if message.id == last_seen:
+                    break  # Everything older is already known
+                new.append({"id": message.id, "role": _role(message), "text": message_text(message),
+                            "run_id": getattr(message, "run_id", None)})
+            attributes["fetched"] = len(new)
+        new.reverse()
+        with self.lock:
+            self._append(thread_id, new)
+        return new
+
+    def latest_reply(self, client, thread_id: str) -> Optional[str]:
+        """Text of the newest assistant message added since the last fetch, None if there is none"""
+        new = self.fetch_new(client, thread_id)
+        return next((entry["text"] for entry in reversed(new) if entry["role"] == "assistant"), None)
+
+    def history(self, thread_id: str) -> List[dict]:
+        """Cached messages of the thread, oldest first, without any request"""
+        with self.lock:
+            return list(self.messages.get(thread_id, []))
+
+    def forget(self, thread_id: str) -> None:
+        """Drop the state of a deleted thread"""
+        with self.lock:
+            self.last_seen.pop(thread_id, None)
+            self.messages.pop(thread_id, None)
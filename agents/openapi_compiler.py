@@ -0,0 +1,238 @@
+# ==============================================================================
+# OPENAPI COMPILER - SMALL, PRE-RESOLVED SPECS FOR OpenApiTool
+# ==============================================================================
+# The OpenAPI samples ran jsonref over the whole spec on every start and sent
+# the result as the tool definition, so every run carried response schemas,
+# examples and long descriptions the model never needs to make a call.
+# compile_spec() turns a spec into what the tool actually needs:
+#   - `$ref`s resolved once (local "#/..." refs; cycles are left as refs)
+#   - only the allow-listed operations (by operationId) and parameters;
+#     required parameters are always kept
+#   - responses reduced to their description, or to allow-listed fields
+#   - descriptions stripped of markup, whitespace collapsed, cut to a limit;
+#     examples, tags and x-* extensions dropped
+# load_tool_spec() caches the compiled spec on disk, keyed by the SHA-256 of the
+# source file and the options, so a start is one small json.load.
+#
+#   spec = load_tool_spec("../data/tripadvisor_api_schema.json",
+#                         operations=["searchForLocations", "getLocationDetails"])
+#   # Spec tripadvisor_api_schema.json: 14,210 -> 1,580 tokens (cached)
+#   openapi_tool = OpenApiTool(name="tripadvisor_api", spec=spec, description=..., auth=auth)
+#
+#   python openapi_compiler.py ../data/tripadvisor_api_schema.json searchForLocations getLocationDetails
+
+import copy
+import hashlib
+import json
+import os
+import re
+import sys
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    import tiktoken  # Optional: exact token counts
+    _encoding = tiktoken.get_encoding("cl100k_base")
+except ImportError:
+    _encoding = None
+
+CACHE_DIR = os.getenv("OPENAPI_CACHE_DIR")  # Default: .openapi_cache next to the source spec
+MAX_DESCRIPTION = int(os.getenv("OPENAPI_MAX_DESCRIPTION", "160"))  # Characters per description
+COMPILER_VERSION = 1  # Bump when the output format changes, old cache entries are then ignored
+
+HTTP_METHODS = ("get", "put", "post", "delete", "options", "head", "patch", "trace")
+_DROPPED_KEYS = {"example", "examples", "tags", "externalDocs", "deprecated", "xml"}
+
+
+def count_tokens(text: str) -> int:
+    """Exact count with tiktoken when installed, else the usual ~4 characters per token estimate"""
+    if _encoding is not None:
+        return len(_encoding.encode(text))
+    return (len(text) + 3) // 4
+
+
+def spec_tokens(spec: dict) -> int:
+    return count_tokens(json.dumps(spec, separators=(",", ":")))
+
+
+def resolve_refs(node: Any, root: dict, _active: tuple = ()) -> Any:
+    """Copy of `node` with every local $ref replaced by its target"""
+    if isinstance(node, list):
+        return [resolve_refs(item, root, _active) for item in node]
+    if not isinstance(node, dict):
+        return node
+    ref = node.get("$ref")
+    if isinstance(ref, str) and ref.startswith("#/"):
+        if ref in _active:
+            return {"$ref": ref}  # Recursive schema, keep the reference
+        target = root
+        for part in ref[2:].split("/"):
+            target = target[part.replace("~1", "/").replace("~0", "~")]
+        siblings = {k: v for k, v in node.items() if k != "$ref"}
+        return resolve_refs({**target, **siblings}, root, _active + (ref,))
+    return {key: resolve_refs(value, root, _active) for key, value in node.items()}
+
+
+def minify_description(text: str, limit: int = MAX_DESCRIPTION) -> str:
+    """Plain text, one line, at most `limit` characters ending on a sentence or word"""
+    text = re.sub(r"<[^>]+>|[*_`#]+", " ", text)
+    text = re.sub(r"\s+", " ", text).strip()
+    if len(text) <= limit:
+        return text
+    cut = text[:limit]
+    sentence = cut.rfind(". ")
+    if sentence > limit // 2:
+        return cut[:sentence + 1]
+    return cut.rsplit(" ", 1)[0] + "..."
+
+
+def _strip(node: Any, limit: int) -> Any:
+    """Drop examples and extensions, minify descriptions, at every level"""
+    if isinstance(node, list):
+        return [_strip(item, limit) for item in node]
+    if not isinstance(node, dict):
+        return node
+    result = {}
+    for key, value in node.items():
+        if key in _DROPPED_KEYS or key.startswith("x-"):
+            continue
+        if key in ("description", "summary") and isinstance(value, str):
+            value = minify_description(value, limit)
+            if not value:
+                continue
+        elif key == "properties" and isinstance(value, dict):
+            value = {name: _strip(schema, limit) for name, schema in value.items()}  # Property names are data, not keywords
+        else:
+            value = _strip(value, limit)
+        result[key] = value
+    return result
+
+
+def _prune_schema(schema: Any, fields: set) -> Optional[dict]:
+    """Keep only properties named in `fields` (at any depth); None if nothing is left"""
+    if not isinstance(schema, dict):
+        return schema
+    schema = dict(schema)
+    if "items" in schema:
+        items = _prune_schema(schema["items"], fields)
+        if items is None:
+            return None
+        schema["items"] = items
+    if isinstance(schema.get("properties"), dict):
+        kept = {}
+        for name, child in schema["properties"].items():
+            if name in fields:
+                kept[name] = child
+            else:
+                pruned = _prune_schema(child, fields)
+                if pruned is not None and (pruned.get("properties") or pruned.get("items")):
+                    kept[name] = pruned
+        if not kept:
+            return None
+        schema["properties"] = kept
+        if "required" in schema:
+            schema["required"] = [name for name in schema["required"] if name in kept]
+    return schema
+
+
+def compile_spec(spec: dict, operations: Optional[Iterable[str]] = None,
+                 parameters: Optional[Dict[str, List[str]]] = None,
+                 response_fields: Optional[Iterable[str]] = None,
+                 max_description: int = MAX_DESCRIPTION) -> dict:
+    """Resolved, pruned and minified copy of an OpenAPI spec"""
+    resolved = resolve_refs(spec, spec)
+    allowed = set(operations) if operations is not None else None
+    fields = set(response_fields) if response_fields is not None else None
+
+    paths = {}
+    for path, item in resolved.get("paths", {}).items():
+        shared_parameters = item.get("parameters", [])
+        kept = {}
+        for method, operation in item.items():
+            if method not in HTTP_METHODS:
+                continue
+            operation_id = operation.get("operationId")
+            if allowed is not None and operation_id not in allowed:
+                continue
+            operation = copy.deepcopy(operation)
+            operation_parameters = shared_parameters + operation.get("parameters", [])
+            wanted = (parameters or {}).get(operation_id)
+            if wanted is not None:
+                operation_parameters = [p for p in operation_parameters if p.get("required") or p.get("name") in wanted]
+            if operation_parameters:
+                operation["parameters"] = operation_parameters
+            responses = {}
+            for status, response in operation.get("responses", {}).items():
+                slim = {"description": response.get("description", "")}
+                if fields:
+                    for media_type, content in response.get("content", {}).items():
+                        schema = _prune_schema(content.get("schema"), fields)
+                        if schema is not None:
+                            slim.setdefault("content", {})[media_type] = {"schema": schema}
+                responses[status] = slim
+            operation["responses"] = responses or {"200": {"description": "OK"}}
+            kept[method] = operation
+        if kept:
+            paths[path] = kept
+    if allowed is not None:
+        missing = allowed - {op.get("operationId") for item in paths.values() for op in item.values()}
+        if missing:
+            raise ValueError(f"Operations not found in the spec: {sorted(missing)}")
+
+    compiled = {key: resolved[key] for key in ("openapi", "info", "servers", "security") if key in resolved}
+    compiled["info"] = {k: v for k, v in compiled.get("info", {}).items() if k in ("title", "version", "description")}
+    compiled["paths"] = paths
+    components = resolved.get("components", {})
+    if "securitySchemes" in components:
+        compiled["components"] = {"securitySchemes": components["securitySchemes"]}
+    if "$ref" in json.dumps(paths):  # Recursive schemas still point into components
+        compiled.setdefault("components", {})["schemas"] = components.get("schemas", {})
+    return _strip(compiled, max_description)
+
+
+def load_tool_spec(path: str, operations: Optional[Iterable[str]] = None,
+                   parameters: Optional[Dict[str, List[str]]] = None,
+                   response_fields: Optional[Iterable[str]] = None,
+                   max_description: int = MAX_DESCRIPTION,
+                   cache_dir: Optional[str] = CACHE_DIR, verbose: bool = True) -> dict:
+    """Compiled spec for `path`, from the cache when neither the file nor the options changed"""
+    with open(path, "rb") as f:
+        source = f.read()
+    options = {
+        "operations": sorted(operations) if operations is not None else None,
+        "parameters": {k: sorted(v) for k, v in (parameters or {}).items()},
+        "response_fields": sorted(response_fields) if response_fields is not None else None,
+        "max_description": max_description,
+        "version": COMPILER_VERSION,
+    }
+    key = hashlib.sha256(source + json.dumps(options, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+    cache_dir = cache_dir or os.path.join(os.path.dirname(os.path.abspath(path)), ".openapi_cache")
+    stem = os.path.splitext(os.path.basename(path))[0]
+    cache_path = os.path.join(cache_dir, f"{stem}-{key}.json")
+
+    cached = False
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+        cached = True
+    except (OSError, ValueError):
+        spec = json.loads(source)
+        compiled = compile_spec(spec, operations, parameters, response_fields, max_description)
+        entry = {"spec": compiled, "tokens_before": spec_tokens(resolve_refs(spec, spec)), "tokens_after": spec_tokens(compiled)}
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(cache_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(entry, f, separators=(",", ":"))
+        os.replace(cache_path + ".tmp", cache_path)
+    if verbose:
+        print(f"Spec {os.path.basename(path)}: {entry['tokens_before']:,} -> {entry['tokens_after']:,} tokens"
+              f"{' (cached)' if cached else ''}")
+    return entry["spec"]
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        sys.exit("usage: python openapi_compiler.py SPEC.json [operationId ...]")
+    compiled = load_tool_spec(sys.argv[1], operations=sys.argv[2:] or None)
+    for path, item in compiled["paths"].items():
+        for method, operation in item.items():
+            names = [p["name"] for p in operation.get("parameters", [])]
+            print(f"  {method.upper()} {path} {operation.get('operationId')} {names}")
@@ -0,0 +1,191 @@
+# ==============================================================================
+# REQUEST SCHEDULER - QUOTA-AWARE PACING FOR AZURE AI AGENTS CALLS
+# ==============================================================================
+# Model deployments have requests-per-minute (RPM) and tokens-per-minute (TPM)
+# quotas. Firing runs as fast as users type turns bursts into "Rate limit is
+# exceeded" failures. The scheduler sits in front of `AIProjectClient.agents`
+# calls and:
+#   - keeps an RPM and a TPM token bucket per deployment
+#   - queues work by priority (lower number = more urgent)
+#   - sends each call to the configured deployment that has budget first
+#   - backs a deployment off when it still answers with a rate limit error,
+#     honoring Retry-After, and re-queues the call
+#
+# Usage:
+#   scheduler = RequestScheduler.from_env()
+#   run = scheduler.submit(
+#       lambda deployment: client.agents.runs.create_and_process(
+#           thread_id=thread.id, agent_id=agent.id, model=deployment),
+#       estimated_tokens=2000,
+#   ).result()
+
+import heapq                                        # For the priority queue
+import itertools
+import os
+import re
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from azure.core.exceptions import HttpResponseError
+
+# Back-off used when a rate limit error carries no Retry-After hint
+DEFAULT_PENALTY = 10.0
+MAX_ATTEMPTS = 5
+
+
+class TokenBucket:
+    """Classic token bucket refilled continuously at `per_minute / 60` tokens per second"""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = float(per_minute)
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until `amount` tokens are available"""
+        self._refill(now)
+        amount = min(amount, self.capacity)  # Oversized requests wait for a full bucket
+        return 0.0 if self.tokens >= amount else (amount - self.tokens) / self.rate
+
+    def consume(self, amount: float, now: float) -> None:
+        self._refill(now)
+        self.tokens -= amount  # May go negative when actual usage exceeded the estimate
+
+
+class Deployment:
+    """RPM / TPM budget of one model deployment"""
+
+    def __init__(self, name: str, rpm: float, tpm: float):
+        self.name = name
+        self.requests = TokenBucket(rpm)
+        self.tokens = TokenBucket(tpm)
+        self.blocked_until = 0.0
+
+    def wait_time(self, estimated_tokens: float, now: float) -> float:
+        return max(self.blocked_until - now,
+                   self.requests.wait_time(1, now),
+                   self.tokens.wait_time(estimated_tokens, now))
+
+
+def _retry_after(error: Any) -> Optional[float]:
+    """Extract a rate limit back-off from an HTTP error or a failed run, None if not a rate limit"""
+    if isinstance(error, HttpResponseError):
+        if error.status_code != 429:
+            return None
+        header = error.response.headers.get("Retry-After") if error.response is not None else None
+        return float(header) if header and header.isdigit() else DEFAULT_PENALTY
+
+    last_error = getattr(error, "last_error", None)
+    if getattr(error, "status", None) == "failed" and last_error and last_error.get("code") == "rate_limit_exceeded":
+        match = re.search(r"(\d+) seconds", last_error.get("message", ""))
+        return float(match.group(1)) if match else DEFAULT_PENALTY
+    return None
+
+
+class RequestScheduler:
+    """Priority queue + per-deployment token buckets in front of agents calls"""
+
+    def __init__(self, deployments: List[Deployment], workers: int = 4):
+        self.deployments = deployments
+        self.condition = threading.Condition()
+        self.queue: List[Tuple[int, int, dict]] = []
+        self.sequence = itertools.count()
+        self.running = True
+        self.workers = [threading.Thread(target=self._work, daemon=True, name=f"scheduler-{i}")
+                        for i in range(workers)]
+        for worker in self.workers:
+            worker.start()
+
+    @classmethod
+    def from_env(cls) -> "RequestScheduler":
+        """Deployments from MODEL_DEPLOYMENT_NAMES ("name[:rpm:tpm],...") or MODEL_DEPLOYMENT_NAME"""
+        default_rpm = float(os.getenv("MODEL_RPM_LIMIT", "60"))
+        default_tpm = float(os.getenv("MODEL_TPM_LIMIT", "60000"))
+        names = os.getenv("MODEL_DEPLOYMENT_NAMES") or os.environ["MODEL_DEPLOYMENT_NAME"]
+
+        deployments = []
+        for entry in names.split(","):
+            name, *limits = entry.strip().split(":")
+            rpm = float(limits[0]) if len(limits) > 0 else default_rpm
+            tpm = float(limits[1]) if len(limits) > 1 else default_tpm
+            deployments.append(Deployment(name, rpm, tpm))
+        return cls(deployments, workers=int(os.getenv("SCHEDULER_WORKERS", "4")))
+
+    def submit(self, call: Callable[[str], Any], estimated_tokens: int = 1000, priority: int = 10) -> Future:
+        """Queue `call(deployment_name)` and return a Future with its result"""
+        item = {"call": call, "tokens": estimated_tokens, "future": Future(), "attempts": 0}
+        self._enqueue(priority, item)
+        return item["future"]
+
+    def shutdown(self) -> None:
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+        for worker in self.workers:
+            worker.join()
+
+    def _enqueue(self, priority: int, item: dict) -> None:
+        with self.condition:
+            heapq.heappush(self.queue, (priority, next(self.sequence), item))
+            self.condition.notify()
+
+    def _reserve(self, estimated_tokens: int) -> Tuple[Optional[Deployment], float]:
+        """Pick the deployment that can serve soonest, consuming its budget if it can serve now"""
+        now = time.monotonic()
+        deployment, wait = min(((d, d.wait_time(estimated_tokens, now)) for d in self.deployments),
+                               key=lambda pair: pair[1])
+        if wait > 0:
+            return None, wait
+        deployment.requests.consume(1, now)
+        deployment.tokens.consume(estimated_tokens, now)
+        return deployment, 0.0
+
+    def _work(self) -> None:
+        while True:
+            with self.condition:
+                while self.running and not self.queue:
+                    self.condition.wait()
+                if not self.running:
+                    return
+                priority, _, item = self.queue[0]
+                deployment, wait = self._reserve(item["tokens"])
+                if deployment is None:
+                    # Sleep until budget frees up, or a new (possibly more urgent) item arrives
+                    self.condition.wait(timeout=wait)
+                    continue
+                heapq.heappop(self.queue)
+            self._execute(priority, item, deployment)
+
+    def _execute(self, priority: int, item: dict, deployment: Deployment) -> None:
+        item["attempts"] += 1
+        try:
+            result = item["call"](deployment.name)
+            outcome = result
+        except Exception as e:
+            result, outcome = None, e
+
+        penalty = _retry_after(outcome)
+        if penalty is not None and item["attempts"] < MAX_ATTEMPTS:
+            # Still throttled: park this deployment and try again, maybe elsewhere
+            with self.condition:
+                deployment.blocked_until = time.monotonic() + penalty
+            self._enqueue(priority, item)
+            return
+
+        usage = getattr(result, "usage", None)
+        if usage is not None and getattr(usage, "total_tokens", None):
+            # Correct the estimate with what the run actually used
+            with self.condition:
+                deployment.tokens.consume(usage.total_tokens - item["tokens"], time.monotonic())
+
+        if isinstance(outcome, Exception):
+            item["future"].set_exception(outcome)
+        else:
+            item["future"].set_result(result)
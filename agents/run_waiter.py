@@ -0,0 +1,268 @@
+# ==============================================================================
+# RUN WAITER - EVENT-DRIVEN RUN COMPLETION FOR AZURE AI AGENTS
+# ==============================================================================
+# Drives an agent run until it reaches a terminal state. The run event stream
+# is used when the SDK supports it, so tool calls are answered the moment the
+# run reports `requires_action`. Otherwise the run is polled with an adaptive
+# backoff: fast polls right after a state change, slower polls later, with
+# jitter so many conversations do not poll in lockstep.
+#
+# Tools have side effects (emails, tickets), so a tool call must never run
+# twice: polling takes over from the stream only if the stream could not even
+# start a run, and a run whose stream dropped later is polled with the outputs
+# already produced, running only the tool calls that were not handled yet.
+
+import asyncio                                      # For the `.aio` client variants
+import random                                       # For poll jitter
+import time                                         # For polling delays
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
+
+from azure.ai.agents.models import AgentEventHandler, SubmitToolOutputsAction
+from azure.core.exceptions import HttpResponseError
+from tracing import StatusTimer, span, usage_attributes
+
+# Run states in which the service is still working on the run
+ACTIVE_STATUSES = ("queued", "in_progress", "requires_action", "cancelling")
+
+# Receives the tool calls of a `requires_action` step and returns the outputs
+# as a list of {"tool_call_id": ..., "output": ...} dicts
+ToolCallHandler = Callable[[List[Any]], List[dict]]
+AsyncToolCallHandler = Callable[[List[Any]], Awaitable[List[dict]]]
+# Optional progress callbacks for streaming UIs
+TextDeltaCallback = Callable[[str], None]
+ToolCallsCallback = Callable[[List[Any]], None]
+
+
+class StreamUnavailable(Exception):
+    """The run stream failed before a run existed; creating the run by polling is safe"""
+
+
+class StreamTranscript:
+    """Text deltas of a streamed run, kept per message"""
+
+    def __init__(self):
+        self.messages: Dict[Optional[str], List[str]] = {}  # Message ID -> deltas, in arrival order
+        self.completed = False  # The stream itself delivered `completed`, no polling fallback was needed
+
+    def add(self, message_id: Optional[str], text: str) -> None:
+        self.messages.setdefault(message_id, []).append(text)
+
+    def reply(self) -> Optional[str]:
+        """The streamed reply, or None when it may be incomplete or spans several messages"""
+        if not self.completed or len(self.messages) != 1:
+            return None
+        return "".join(next(iter(self.messages.values())))
+
+
+def backoff_delays(initial: float = 0.2, maximum: float = 2.0,
+                   factor: float = 1.5, jitter: float = 0.2) -> Iterator[float]:
+    """Yield poll delays that start short and grow towards `maximum`"""
+    delay = initial
+    while True:
+        yield delay * random.uniform(1 - jitter, 1 + jitter)
+        delay = min(delay * factor, maximum)
+
+
+def wait_for_run(client, thread_id: str, run, handle_tool_calls: ToolCallHandler,
+                 initial_delay: float = 0.2, max_delay: float = 2.0,
+                 on_tool_calls: Optional[ToolCallsCallback] = None,
+                 timer: Optional[StatusTimer] = None,
+                 completed: Optional[Dict[str, dict]] = None):
+    """Poll a run with adaptive backoff until it leaves the active states
+
+    `completed` maps tool call IDs to outputs produced earlier for this run
+    (e.g. by a stream that dropped); those calls are not executed again.
+    """
+    delays = backoff_delays(initial_delay, max_delay)
+    last_status = run.status
+    timer = timer or StatusTimer()
+    timer.observe(run.status)
+    completed = {} if completed is None else completed
+
+    while run.status in ACTIVE_STATUSES:
+        if run.status == "requires_action" and isinstance(run.required_action, SubmitToolOutputsAction):
+            tool_calls = run.required_action.submit_tool_outputs.tool_calls
+            new_calls = [call for call in tool_calls if call.id not in completed]
+            if new_calls:
+                if on_tool_calls:
+                    on_tool_calls(new_calls)
+                completed.update((output["tool_call_id"], output) for output in handle_tool_calls(new_calls))
+            outputs = [completed[call.id] for call in tool_calls if call.id in completed]
+            try:
+                with span("run.submit_tool_outputs", run_id=run.id, tool_calls=len(outputs)):
+                    run = client.agents.runs.submit_tool_outputs(thread_id=thread_id, run_id=run.id, tool_outputs=outputs)
+            except HttpResponseError:
+                if new_calls:
+                    raise
+                # Only outputs the dropped stream may already have submitted: the run moved on, read it again
+                run = client.agents.runs.get(thread_id=thread_id, run_id=run.id)
+            timer.observe(run.status)
+
+        # Every state change restarts the backoff, the next one usually follows quickly
+        if run.status != last_status:
+            delays = backoff_delays(initial_delay, max_delay)
+            last_status = run.status
+
+        if run.status not in ACTIVE_STATUSES:
+            break
+        time.sleep(next(delays))
+        with span("run.poll", run_id=run.id) as attributes:
+            run = client.agents.runs.get(thread_id=thread_id, run_id=run.id)
+            attributes["status"] = run.status
+        timer.observe(run.status)
+
+    return run
+
+
+class _RunEventHandler(AgentEventHandler):
+    """Stream handler that answers tool calls as soon as they are requested"""
+
+    def __init__(self, client, handle_tool_calls: ToolCallHandler,
+                 on_text_delta: Optional[TextDeltaCallback] = None,
+                 on_tool_calls: Optional[ToolCallsCallback] = None,
+                 timer: Optional[StatusTimer] = None,
+                 transcript: Optional[StreamTranscript] = None):
+        super().__init__()
+        self.client = client
+        self.handle_tool_calls = handle_tool_calls
+        self.on_text_delta = on_text_delta
+        self.on_tool_calls = on_tool_calls
+        self.timer = timer or StatusTimer()
+        self.transcript = transcript
+        self.run = None
+        self.completed: Dict[str, dict] = {}  # Tool call ID -> output, handed to polling if the stream drops
+        self.tool_error: Optional[Exception] = None
+
+    def on_message_delta(self, delta) -> None:
+        if not delta.text:
+            return
+        if self.transcript is not None:
+            self.transcript.add(getattr(delta, "id", None), delta.text)
+        if self.on_text_delta:
+            self.on_text_delta(delta.text)
+
+    def on_thread_run(self, run) -> None:
+        self.run = run
+        self.timer.observe(run.status)
+        if run.status == "completed" and self.transcript is not None:
+            self.transcript.completed = True  # Message deltas precede the run's completion event
+        if run.status == "requires_action" and isinstance(run.required_action, SubmitToolOutputsAction):
+            tool_calls = [call for call in run.required_action.submit_tool_outputs.tool_calls
+                          if call.id not in self.completed]
+            if not tool_calls:
+                return  # Repeated event for a step that was answered already
+            if self.on_tool_calls:
+                self.on_tool_calls(tool_calls)
+            try:
+                outputs = self.handle_tool_calls(tool_calls)
+            except Exception as e:
+                self.tool_error = e  # Not a stream problem, must not be retried by polling
+                raise
+            self.completed.update((output["tool_call_id"], output) for output in outputs)
+            self.client.agents.runs.submit_tool_outputs_stream(
+                thread_id=run.thread_id, run_id=run.id, tool_outputs=outputs, event_handler=self
+            )
+
+
+def stream_run(client, thread_id: str, agent_id: str, handle_tool_calls: ToolCallHandler,
+               on_text_delta: Optional[TextDeltaCallback] = None,
+               on_tool_calls: Optional[ToolCallsCallback] = None,
+               timer: Optional[StatusTimer] = None,
+               transcript: Optional[StreamTranscript] = None):
+    """Create a run and follow its event stream until it finishes"""
+    handler = _RunEventHandler(client, handle_tool_calls, on_text_delta, on_tool_calls, timer, transcript)
+    try:
+        with client.agents.runs.stream(thread_id=thread_id, agent_id=agent_id, event_handler=handler) as stream:
+            stream.until_done()
+    except Exception as e:
+        if handler.run is None and handler.tool_error is None:
+            # The stream broke before the run was created, the caller may create one by polling
+            raise StreamUnavailable(str(e)) from e
+        if handler.tool_error is not None:
+            raise
+    if handler.tool_error is not None:
+        raise handler.tool_error
+    if handler.run is None:
+        raise RuntimeError("Run stream ended without any run events")
+    # A stream that dropped mid-run is finished by polling the same run, without repeating tool calls
+    return wait_for_run(client, thread_id, handler.run, handle_tool_calls, on_tool_calls=on_tool_calls,
+                        timer=handler.timer, completed=handler.completed)
+
+
+def run_to_completion(client, thread_id: str, agent_id: str, handle_tool_calls: ToolCallHandler,
+                      use_stream: bool = True,
+                      on_text_delta: Optional[TextDeltaCallback] = None,
+                      on_tool_calls: Optional[ToolCallsCallback] = None,
+                      transcript: Optional[StreamTranscript] = None):
+    """Run the agent on the thread, streaming when possible and polling otherwise
+
+    `on_text_delta` only fires on the streaming path, `on_tool_calls` on both.
+    `transcript` collects the streamed deltas per message, see `StreamTranscript.reply`.
+    Emits an `agent.run` span with one child span per run status, poll and tool call.
+    """
+    with span("agent.run", thread_id=thread_id, agent_id=agent_id) as attributes:
+        timer = StatusTimer()
+        run = None
+        if use_stream:
+            try:
+                run = stream_run(client, thread_id, agent_id, handle_tool_calls, on_text_delta, on_tool_calls, timer,
+                                 transcript)
+                attributes["streamed"] = True
+            except StreamUnavailable:
+                pass  # No run was created, use the polling path below
+
+        if run is None:
+            run = client.agents.runs.create(thread_id=thread_id, agent_id=agent_id)
+            run = wait_for_run(client, thread_id, run, handle_tool_calls, on_tool_calls=on_tool_calls, timer=timer)
+            attributes["streamed"] = False
+
+        timer.export(run_id=run.id, thread_id=thread_id)
+        attributes.update(run_id=run.id, status=run.status, **usage_attributes(run))
+        return run
+
+
+async def wait_for_run_async(client, thread_id: str, run, handle_tool_calls: AsyncToolCallHandler,
+                             initial_delay: float = 0.2, max_delay: float = 2.0,
+                             on_tool_calls: Optional[ToolCallsCallback] = None,
+                             timer: Optional[StatusTimer] = None):
+    """`wait_for_run` for the async clients (`azure.ai.projects.aio`): polls without blocking the event loop"""
+    delays = backoff_delays(initial_delay, max_delay)
+    last_status = run.status
+    timer = timer or StatusTimer()
+    timer.observe(run.status)
+
+    while run.status in ACTIVE_STATUSES:
+        if run.status == "requires_action" and isinstance(run.required_action, SubmitToolOutputsAction):
+            tool_calls = run.required_action.submit_tool_outputs.tool_calls
+            if on_tool_calls:
+                on_tool_calls(tool_calls)
+            outputs = await handle_tool_calls(tool_calls)
+            with span("run.submit_tool_outputs", run_id=run.id, tool_calls=len(outputs)):
+                run = await client.agents.runs.submit_tool_outputs(thread_id=thread_id, run_id=run.id, tool_outputs=outputs)
+            timer.observe(run.status)
+
+        if run.status != last_status:
+            delays = backoff_delays(initial_delay, max_delay)
+            last_status = run.status
+
+        if run.status not in ACTIVE_STATUSES:
+            break
+        await asyncio.sleep(next(delays))
+        with span("run.poll", run_id=run.id) as attributes:
+            run = await client.agents.runs.get(thread_id=thread_id, run_id=run.id)
+            attributes["status"] = run.status
+        timer.observe(run.status)
+
+    return run
+
+
+async def run_to_completion_async(client, thread_id: str, agent_id: str, handle_tool_calls: AsyncToolCallHandler,
+                                  on_tool_calls: Optional[ToolCallsCallback] = None):
+    """Create a run with an async client and poll it to completion, with the same spans as `run_to_completion`"""
+    with span("agent.run", thread_id=thread_id, agent_id=agent_id, streamed=False) as attributes:
+        timer = StatusTimer()
+        run = await client.agents.runs.create(thread_id=thread_id, agent_id=agent_id)
+        run = await wait_for_run_async(client, thread_id, run, handle_tool_calls, on_tool_calls=on_tool_calls, timer=timer)
+        timer.export(run_id=run.id, thread_id=thread_id)
+        attributes.update(run_id=run.id, status=run.status, **usage_attributes(run))
+        return run
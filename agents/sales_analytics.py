@@ -0,0 +1,220 @@
+# ==============================================================================
+# SALES ANALYTICS - LOCAL GROUP-BY / FILTER / AGGREGATE OVER sales_data.csv
+# ==============================================================================
+# "Revenue by product" or "monthly profit" used to make Code Interpreter write
+# and run pandas code remotely, several seconds per answer. This tool answers
+# them in-process:
+#   - the CSV is loaded once into typed NumPy columns: Date as datetime64[D],
+#     text columns (Product) dictionary-encoded as int32 codes, the rest numeric
+#   - a query filters with boolean masks, builds group codes (product and / or
+#     day / week / month / quarter / year bucket) and aggregates with bincount
+#   - results are cached per query; the table (and its cache) is reloaded only
+#     when the file's size or mtime changes
+# Charts and anything else beyond this stay with Code Interpreter.
+#
+#   functions = FunctionTool(functions={describe_sales, query_sales})
+#   query_sales(metric="Profit", group_by="month")
+#   query_sales(metric="Revenue", group_by="Product", start_date="2024-01-15", top_n=3)
+
+import csv
+import json
+import os
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+
+SALES_CSV = os.getenv("SALES_CSV") or os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "sales_data.csv")
+AGGREGATES = ("sum", "mean", "min", "max", "count")
+TIME_BUCKETS = ("day", "week", "month", "quarter", "year")
+MAX_CACHED_QUERIES = 256
+
+
+class SalesTable:
+    """Columnar copy of the CSV: dates, dictionary-encoded text columns and numeric columns"""
+
+    def __init__(self, path: str):
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))
+        header, rows = rows[0], [row for row in rows[1:] if row]
+        raw = {name: [row[i] for row in rows] for i, name in enumerate(header)}
+
+        self.rows = len(rows)
+        self.dates = np.array(raw.pop("Date"), dtype="datetime64[D]")
+        self.numeric: Dict[str, np.ndarray] = {}
+        self.categories: Dict[str, np.ndarray] = {}  # column -> distinct values, codes index into it
+        self.codes: Dict[str, np.ndarray] = {}
+        for name, values in raw.items():
+            try:
+                column = np.array(values, dtype=np.float64)
+                self.numeric[name] = column.astype(np.int64) if np.all(column == np.round(column)) else column
+            except ValueError:
+                self.categories[name], codes = np.unique(np.array(values), return_inverse=True)
+                self.codes[name] = codes.astype(np.int32)
+        self.cache: Dict[tuple, dict] = {}
+        self.lock = threading.Lock()
+
+    def describe(self) -> dict:
+        return {
+            "rows": self.rows,
+            "date_range": [str(self.dates.min()), str(self.dates.max())] if self.rows else [],
+            "metrics": list(self.numeric),
+            "categories": {name: values.tolist() for name, values in self.categories.items()},
+        }
+
+    def _bucket(self, unit: str):
+        """Group code per row and the label of every code for a time bucket"""
+        if unit == "week":  # Weeks start on Monday; 1970-01-01 was a Thursday
+            days = self.dates.astype(np.int64)
+            starts = (days - (days + 3) % 7).astype("datetime64[D]")
+        elif unit == "quarter":
+            months = self.dates.astype("datetime64[M]").astype(np.int64)
+            starts = (months - months % 3).astype("datetime64[M]")
+        else:
+            starts = self.dates.astype({"day": "datetime64[D]", "month": "datetime64[M]", "year": "datetime64[Y]"}[unit])
+        values, codes = np.unique(starts, return_inverse=True)
+        if unit == "quarter":
+            labels = [f"{str(v)[:4]}-Q{(int(str(v)[5:7]) - 1) // 3 + 1}" for v in values]
+        else:
+            labels = [str(v) for v in values]
+        return codes, labels
+
+    def query(self, metrics: List[str], aggregate: str, group_by: List[str], filters: Dict[str, List[str]],
+              start_date: Optional[str], end_date: Optional[str], top_n: Optional[int]) -> dict:
+        # Filter
+        mask = np.ones(self.rows, dtype=bool)
+        if start_date:
+            mask &= self.dates >= np.datetime64(start_date, "D")
+        if end_date:
+            mask &= self.dates <= np.datetime64(end_date, "D")
+        for column, wanted in filters.items():
+            lookup = {value.lower(): code for code, value in enumerate(self.categories[column].tolist())}
+            unknown = [value for value in wanted if value.lower() not in lookup]
+            if unknown:
+                raise ValueError(f"Unknown {column} {unknown}, known: {self.categories[column].tolist()}")
+            mask &= np.isin(self.codes[column], [lookup[value.lower()] for value in wanted])
+
+        # Group codes: one key column per dimension, combined into a single group index
+        key_columns, key_labels = [], []
+        for dimension in group_by:
+            if dimension in TIME_BUCKETS:
+                codes, labels = self._bucket(dimension)
+            else:
+                codes, labels = self.codes[dimension], self.categories[dimension].tolist()
+            key_columns.append(codes[mask])
+            key_labels.append(labels)
+        if key_columns:
+            groups, inverse = np.unique(np.stack(key_columns, axis=1), axis=0, return_inverse=True)
+            inverse = inverse.reshape(-1)
+        else:
+            groups, inverse = np.zeros((1, 0), dtype=np.int64), np.zeros(int(mask.sum()), dtype=np.int64)
+        group_count = len(groups)
+
+        # Aggregate every metric at once per group
+        counts = np.bincount(inverse, minlength=group_count)
+        results = {}
+        for metric in metrics:
+            values = self.numeric[metric][mask]
+            if aggregate == "count":
+                results[metric] = counts
+            elif aggregate in ("sum", "mean"):
+                sums = np.bincount(inverse, weights=values, minlength=group_count)
+                results[metric] = sums if aggregate == "sum" else sums / np.maximum(counts, 1)
+            else:
+                out = np.full(group_count, -np.inf if aggregate == "max" else np.inf)
+                (np.maximum if aggregate == "max" else np.minimum).at(out, inverse, values)
+                results[metric] = out
+
+        table = []
+        for g in range(group_count):
+            if counts[g] == 0:
+                continue
+            row = {dimension: key_labels[d][groups[g][d]] for d, dimension in enumerate(group_by)}
+            for metric, column in results.items():
+                value = float(column[g])
+                row[metric] = int(value) if value == int(value) else round(value, 2)
+            table.append(row)
+
+        # Categories rank by the first metric, pure time series stay chronological
+        if group_by and not all(dimension in TIME_BUCKETS for dimension in group_by):
+            table.sort(key=lambda row: row[metrics[0]], reverse=True)
+        if top_n:
+            table = table[:top_n]
+        return {"aggregate": aggregate, "group_by": group_by, "rows_matched": int(mask.sum()), "results": table}
+
+
+_table: Optional[SalesTable] = None
+_version = None
+_load_lock = threading.Lock()
+
+
+def get_table(path: str = SALES_CSV) -> SalesTable:
+    """The loaded table, read again only if the file changed since the last call"""
+    global _table, _version
+    stat = os.stat(path)
+    version = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    with _load_lock:
+        if _table is None or version != _version:
+            _table, _version = SalesTable(path), version
+        return _table
+
+
+def _split(value: Optional[str]) -> List[str]:
+    return [part.strip() for part in (value or "").split(",") if part.strip()]
+
+
+def describe_sales() -> str:
+    """
+    Describes the sales dataset: row count, date range, numeric metrics and the values of each category column.
+
+    :return: Dataset summary as a JSON string.
+    """
+    try:
+        return json.dumps(get_table().describe())
+    except Exception as e:
+        return json.dumps({"error": str(e)})
+
+
+def query_sales(metric: str = "Revenue", aggregate: str = "sum", group_by: str = "", product: str = "",
+                start_date: str = "", end_date: str = "", top_n: int = 0) -> str:
+    """
+    Aggregates the sales data (Date, Product, Revenue, Profit) with optional grouping and filters.
+
+    :param metric (str): Numeric column(s) to aggregate, comma separated, e.g. "Revenue" or "Revenue,Profit".
+    :param aggregate (str): One of sum, mean, min, max, count.
+    :param group_by (str): Comma separated grouping, any of Product, day, week, month, quarter, year; empty for a total.
+    :param product (str): Comma separated product names to keep; empty for all products.
+    :param start_date (str): First date included, YYYY-MM-DD; empty for no lower bound.
+    :param end_date (str): Last date included, YYYY-MM-DD; empty for no upper bound.
+    :param top_n (int): Keep only the first N groups (highest first when grouping by Product); 0 for all.
+    :return: Aggregated rows as a JSON string.
+    """
+    try:
+        table = get_table()
+        metrics = _split(metric) or ["Revenue"]
+        aggregate = (aggregate or "sum").lower()
+        columns = {name.lower(): name for name in list(table.categories) + list(table.numeric)}
+        group_by = [d.lower() if d.lower() in TIME_BUCKETS else columns.get(d.lower(), d) for d in _split(group_by)]
+        metrics = [columns.get(m.lower(), m) for m in metrics]
+
+        if aggregate not in AGGREGATES:
+            return json.dumps({"error": f"aggregate must be one of {list(AGGREGATES)}"})
+        unknown = [m for m in metrics if m not in table.numeric] + \
+                  [d for d in group_by if d not in TIME_BUCKETS and d not in table.categories]
+        if unknown:
+            return json.dumps({"error": f"Unknown column(s) {unknown}", **table.describe()})
+
+        filters = {"Product": _split(product)} if _split(product) else {}
+        key = (tuple(metrics), aggregate, tuple(group_by), tuple(sorted((k, tuple(v)) for k, v in filters.items())),
+               start_date or None, end_date or None, int(top_n or 0))
+        with table.lock:
+            cached = table.cache.get(key)
+        if cached is None:
+            cached = table.query(metrics, aggregate, group_by, filters, start_date or None, end_date or None, int(top_n or 0))
+            with table.lock:
+                if len(table.cache) >= MAX_CACHED_QUERIES:
+                    table.cache.pop(next(iter(table.cache)))  # Oldest first
+                table.cache[key] = cached
+        return json.dumps(cached)
+    except Exception as e:
+        return json.dumps({"error": str(e)})
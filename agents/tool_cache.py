@@ -0,0 +1,107 @@
+# ==============================================================================
+# TOOL CACHE - TTL MEMOIZATION FOR READ-ONLY FUNCTION TOOLS
+# ==============================================================================
+# Models often ask the same read-only question several times in a few minutes
+# (e.g. the weather in the same city). Decorating the tool function with
+# `ttl_cache` answers repeats from memory instead of a network round trip.
+#
+#   @ttl_cache(ttl=600, key=round_coordinates(2))
+#   def get_weather(latitude: float, longitude: float) -> str: ...
+#
+# The decorated function keeps its name, signature and docstring, so it can be
+# registered with `FunctionTool` exactly like the original.
+
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+
+def round_coordinates(digits: int = 2) -> Callable[..., Dict[str, Any]]:
+    """Key normalizer that snaps latitude / longitude to a grid (2 digits ~ 1 km)"""
+    def key(**arguments):
+        for name in ("latitude", "longitude"):
+            if isinstance(arguments.get(name), (int, float)):
+                arguments[name] = round(float(arguments[name]), digits)
+        return arguments
+    return key
+
+
+def ttl_cache(ttl: float = 300, maxsize: int = 256,
+              key: Optional[Callable[..., Any]] = None,
+              cache_if: Optional[Callable[[Any], bool]] = None,
+              persist_path: Optional[str] = None):
+    """Memoize a tool function for `ttl` seconds with LRU eviction beyond `maxsize` entries
+
+    :param key: receives the bound arguments as keywords and returns the value to key on
+    :param cache_if: only results for which this returns True are stored (e.g. skip errors)
+    :param persist_path: optional JSON file so the cache survives process restarts
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (expires_at, result)
+        stats = {"hits": 0, "misses": 0}
+        lock = threading.Lock()
+
+        if persist_path and os.path.exists(persist_path):
+            try:
+                with open(persist_path, "r", encoding="utf-8") as f:
+                    now = time.time()
+                    entries.update((k, tuple(v)) for k, v in json.load(f).items() if v[0] > now)
+            except (OSError, ValueError):
+                pass  # A corrupt cache file just means a cold cache
+
+        def save() -> None:
+            tmp_path = f"{persist_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, persist_path)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            cache_key = json.dumps(key(**arguments) if key else arguments, sort_keys=True, default=str)
+
+            now = time.time()
+            with lock:
+                entry = entries.get(cache_key)
+                if entry is not None and entry[0] > now:
+                    entries.move_to_end(cache_key)
+                    stats["hits"] += 1
+                    return entry[1]
+                stats["misses"] += 1
+
+            result = func(*args, **kwargs)
+            if cache_if is not None and not cache_if(result):
+                return result
+
+            with lock:
+                entries[cache_key] = (now + ttl, result)
+                entries.move_to_end(cache_key)
+                while len(entries) > maxsize:
+                    entries.popitem(last=False)
+                if persist_path:
+                    save()
+            return result
+
+        def cache_info() -> Dict[str, int]:
+            with lock:
+                return {**stats, "size": len(entries), "maxsize": maxsize}
+
+        def cache_clear() -> None:
+            with lock:
+                entries.clear()
+                stats.update(hits=0, misses=0)
+                if persist_path:
+                    save()
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
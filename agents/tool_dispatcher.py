@@ -0,0 +1,86 @@
+# ==============================================================================
+# TOOL DISPATCHER - PARALLEL EXECUTION OF TOOL CALLS
+# ==============================================================================
+# A single `requires_action` step can ask for several independent tool calls.
+# They are executed concurrently on a bounded thread pool, each call gets its
+# own deadline, and the outputs come back in the order of the calls so they
+# can be submitted with one `submit_tool_outputs` request. A call's deadline
+# starts when it starts running: time spent waiting for a free worker (behind
+# the other calls of a large batch or of other conversations) does not count.
+# A call still queued one timeout later is cancelled and reported as an error.
+#
+# Works with plain Python functions (see `function_executor`) as well as with
+# the `FunctionTool` used by the ToolSet based samples (pass `functions.execute`).
+
+import contextvars                                  # For carrying the trace context into pool threads
+import json                                         # For argument / output serialization
+import os
+import threading                                    # For signalling when a queued call starts
+import time                                         # For per-call deadlines
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, List
+
+from tracing import span
+
+# Upper bound on tool calls running at the same time across all conversations
+TOOL_CALL_WORKERS = int(os.getenv("TOOL_CALL_WORKERS", "8"))
+# Seconds a single tool call may take before it is reported as timed out
+TOOL_CALL_TIMEOUT = float(os.getenv("TOOL_CALL_TIMEOUT", "30"))
+
+_executor = ThreadPoolExecutor(max_workers=TOOL_CALL_WORKERS, thread_name_prefix="tool-call")
+
+
+def function_executor(functions: Dict[str, Callable[..., Any]]) -> Callable[[Any], Any]:
+    """Build an executor that calls the function registered under the tool name"""
+    def execute(call):
+        function = functions.get(call.function.name)
+        if function is None:
+            raise ValueError(f"Unknown function: {call.function.name}")
+        return function(**json.loads(call.function.arguments or "{}"))
+    return execute
+
+
+class _Started:
+    """Set by the pool thread when the call starts running"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.at = 0.0
+
+
+def _traced(execute: Callable[[Any], Any], call, started: _Started) -> Any:
+    started.at = time.monotonic()
+    started.event.set()
+    with span("tool.call", tool=call.function.name, tool_call_id=call.id):
+        return execute(call)
+
+
+def _as_output(result: Any) -> str:
+    """Tool outputs must be strings"""
+    return result if isinstance(result, str) else json.dumps(result)
+
+
+def dispatch_tool_calls(tool_calls: List[Any], execute: Callable[[Any], Any],
+                        timeout: float = TOOL_CALL_TIMEOUT) -> List[dict]:
+    """Run all tool calls concurrently and return their outputs in call order; `timeout` applies per call"""
+    starts = [_Started() for _ in tool_calls]
+    futures = [_executor.submit(contextvars.copy_context().run, _traced, execute, call, started)
+               for call, started in zip(tool_calls, starts)]
+
+    outputs = []
+    for call, future, started in zip(tool_calls, futures, starts):
+        try:
+            # Queued calls wait for a worker without using up their timeout, but not for longer than one timeout
+            if not started.event.wait(timeout) and future.cancel():
+                outputs.append({"tool_call_id": call.id,
+                                "output": f"❌ Error: {call.function.name} found no free worker within {timeout:g}s"})
+                continue
+            started.event.wait(timeout)  # Only if the call started while being cancelled: set right away
+            remaining = max(0.0, started.at + timeout - time.monotonic())
+            output = _as_output(future.result(timeout=remaining))
+        except FutureTimeoutError:
+            output = f"❌ Error: {call.function.name} timed out after {timeout:g}s"
+        except Exception as e:
+            output = f"❌ Error: {str(e)}"
+        outputs.append({"tool_call_id": call.id, "output": output})
+    return outputs
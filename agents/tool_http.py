@@ -0,0 +1,177 @@
+# ==============================================================================
+# TOOL HTTP - POOLED, RETRYING HTTP CLIENT FOR TOOL BACK-ENDS
+# ==============================================================================
+# Tool functions (Logic Apps email, Freshdesk tickets, weather lookups) call
+# the same few hosts over and over. Instead of opening a fresh connection per
+# call they share one keep-alive `requests.Session` per host, so the TLS
+# handshake is paid once. On top of that:
+#   - endpoint URLs are parsed once (`parse_endpoint`)
+#   - connect / read timeouts are always set
+#   - 429 and 5xx responses of idempotent requests (GET, PUT, DELETE, ...) are
+#     retried with backoff, honoring Retry-After; a POST is retried when the
+#     connection could not be opened, or on 429 / 503, where the back-end
+#     turned the request away before processing it. Other 5xx, read errors and
+#     timeouts of a POST are not retried: the back-end may already have
+#     accepted the email or ticket, and a retry would send it twice
+#   - `retries=False` turns transport retries off for callers that retry
+#     themselves (e.g. the ticket outbox)
+#   - a per-host circuit breaker fails fast while a back-end is down
+
+import os
+import threading                                    # For thread-safe session / breaker maps
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Tuple, Union
+from urllib.parse import parse_qs, urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Configuration, overridable through the environment
+CONNECT_TIMEOUT = float(os.getenv("TOOL_HTTP_CONNECT_TIMEOUT", "5"))
+READ_TIMEOUT = float(os.getenv("TOOL_HTTP_READ_TIMEOUT", "30"))
+MAX_RETRIES = int(os.getenv("TOOL_HTTP_RETRIES", "3"))
+BACKOFF_FACTOR = float(os.getenv("TOOL_HTTP_BACKOFF", "0.5"))
+POOL_SIZE = int(os.getenv("TOOL_HTTP_POOL_SIZE", "10"))
+BREAKER_THRESHOLD = int(os.getenv("TOOL_HTTP_BREAKER_THRESHOLD", "5"))
+BREAKER_RESET = float(os.getenv("TOOL_HTTP_BREAKER_RESET", "30"))
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+POST_RETRY_STATUSES = (429, 503)  # Rejected before processing: safe to send a POST again
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised instead of calling a host whose circuit breaker is open"""
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    """A pre-parsed URL: base URL without query string plus its query parameters"""
+    url: str
+    host: str
+    params: Dict[str, str] = field(default_factory=dict, hash=False)
+
+
+@lru_cache(maxsize=128)
+def parse_endpoint(full_url: str) -> Endpoint:
+    """Split a URL (e.g. a Logic Apps trigger URL with its SAS query) once"""
+    parsed = urlparse(full_url)
+    return Endpoint(
+        url=f"{parsed.scheme}://{parsed.netloc}{parsed.path}",
+        host=f"{parsed.scheme}://{parsed.netloc}",
+        params={k: v[0] for k, v in parse_qs(parsed.query).items()},
+    )
+
+
+class CircuitBreaker:
+    """Opens after `threshold` consecutive failures and lets a probe through after `reset_after` seconds"""
+
+    def __init__(self, threshold: int = BREAKER_THRESHOLD, reset_after: float = BREAKER_RESET):
+        self.threshold = threshold
+        self.reset_after = reset_after
+        self.failures = 0
+        self.opened_at = None
+        self.lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at >= self.reset_after:
+                self.opened_at = time.monotonic()  # Half-open: one probe per reset period
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self) -> None:
+        with self.lock:
+            self.failures += 1
+            if self.failures >= self.threshold:
+                self.opened_at = time.monotonic()
+
+
+class _Retry(Retry):
+    """urllib3 Retry that also retries a POST answered with one of POST_RETRY_STATUSES"""
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        # Only status retries go through here; read errors of a POST stay excluded by allowed_methods
+        if method.upper() == "POST" and status_code in POST_RETRY_STATUSES:
+            return bool(self.total)
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+_lock = threading.Lock()
+_sessions: Dict[Tuple[str, bool], requests.Session] = {}
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def _new_session(retries: bool = True) -> requests.Session:
+    retry: Union[Retry, int] = 0  # No transport retries
+    if retries:
+        retry = _Retry(
+            total=MAX_RETRIES,
+            backoff_factor=BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUSES,
+            # Default allowed_methods: read errors and retry statuses are retried for idempotent
+            # methods only, connect errors (request never sent) for every method; _Retry adds
+            # 429 / 503 for POST, waiting as long as Retry-After asks
+            respect_retry_after_header=True,
+            raise_on_status=False,              # Hand the last response back instead of raising
+        )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def breaker_for(host: str) -> CircuitBreaker:
+    """The circuit breaker of a host, shared by every client of it (sync and async)"""
+    with _lock:
+        if host not in _breakers:
+            _breakers[host] = CircuitBreaker()
+        return _breakers[host]
+
+
+def _for_host(host: str, retries: bool = True) -> Tuple[requests.Session, CircuitBreaker]:
+    with _lock:
+        if (host, retries) not in _sessions:
+            _sessions[(host, retries)] = _new_session(retries)
+    return _sessions[(host, retries)], breaker_for(host)  # One breaker per host, whatever the retry setting
+
+
+def request(method: str, endpoint: Union[str, Endpoint], retries: bool = True, **kwargs) -> requests.Response:
+    """Send a request through the pooled session of the endpoint's host"""
+    if isinstance(endpoint, str):
+        endpoint = parse_endpoint(endpoint)
+    session, breaker = _for_host(endpoint.host, retries)
+    if not breaker.allow():
+        raise CircuitOpenError(f"Circuit open for {endpoint.host}, not calling it for now")
+
+    kwargs["params"] = {**endpoint.params, **(kwargs.get("params") or {})}
+    kwargs.setdefault("timeout", (CONNECT_TIMEOUT, READ_TIMEOUT))
+    try:
+        response = session.request(method, endpoint.url, **kwargs)
+    except requests.RequestException:
+        breaker.record_failure()
+        raise
+
+    if response.status_code in RETRY_STATUSES:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+    return response
+
+
+def get(endpoint: Union[str, Endpoint], retries: bool = True, **kwargs) -> requests.Response:
+    return request("GET", endpoint, retries=retries, **kwargs)
+
+
+def post(endpoint: Union[str, Endpoint], retries: bool = True, **kwargs) -> requests.Response:
+    return request("POST", endpoint, retries=retries, **kwargs)
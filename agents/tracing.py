@@ -0,0 +1,136 @@
+# ==============================================================================
+# TRACING - PER-RUN LATENCY BREAKDOWN FOR AGENT ENTRY POINTS
+# ==============================================================================
+# Lightweight spans around everything a turn spends time on: credential
+# acquisition, agent / thread creation, message post, time a run spends queued
+# vs in_progress, every poll, every tool call and the final message fetch.
+#
+#   with span("agent.create", model=model) as attributes:
+#       agent = client.agents.create_agent(...)
+#       attributes["agent_id"] = agent.id
+#
+# Exporters (both optional, both can be on):
+#   AGENT_TRACE_FILE=traces.jsonl   one JSON object per finished span
+#   AGENT_TRACE_OTEL=1              forward spans to OpenTelemetry (needs
+#                                   opentelemetry-api and a configured SDK)
+# With neither set a span only costs a couple of clock reads.
+
+import contextvars                                   # For parent / child span tracking across threads
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, Iterator, Optional
+
+TRACE_FILE = os.getenv("AGENT_TRACE_FILE")
+USE_OTEL = os.getenv("AGENT_TRACE_OTEL", "").lower() in ("1", "true", "yes")
+
+_otel_tracer = None
+if USE_OTEL:
+    try:
+        from opentelemetry import trace as _otel_trace
+        _otel_tracer = _otel_trace.get_tracer("azure_ai_agents")
+    except ImportError:
+        print("AGENT_TRACE_OTEL is set but opentelemetry is not installed, spans go to AGENT_TRACE_FILE only")
+
+_current = contextvars.ContextVar("current_span", default=None)  # (trace_id, span_id) of the open span
+_file_lock = threading.Lock()
+
+
+def _export(record: Dict[str, Any]) -> None:
+    if TRACE_FILE:
+        line = json.dumps(record, default=str)
+        with _file_lock, open(TRACE_FILE, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+def _otel_attributes(attributes: Dict[str, Any]) -> Dict[str, Any]:
+    """OpenTelemetry only accepts primitive attribute values"""
+    return {k: v if isinstance(v, (str, bool, int, float)) else str(v) for k, v in attributes.items() if v is not None}
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Dict[str, Any]]:
+    """Time the enclosed block; the yielded dict can be filled with more attributes"""
+    parent = _current.get()
+    trace_id = parent[0] if parent else uuid.uuid4().hex
+    span_id = uuid.uuid4().hex[:16]
+    token = _current.set((trace_id, span_id))
+    start_wall, start = time.time(), time.perf_counter()
+    with (_otel_tracer.start_as_current_span(name) if _otel_tracer else nullcontext()) as otel_span:
+        try:
+            yield attributes
+        except Exception as e:
+            attributes["error"] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            duration_ms = round((time.perf_counter() - start) * 1000, 3)
+            _current.reset(token)
+            if otel_span is not None:
+                otel_span.set_attributes(_otel_attributes(attributes))
+            # Exported on the way out either way: failed spans are the ones a trace is read for
+            _export({
+                "trace_id": trace_id,
+                "span_id": span_id,
+                "parent_id": parent[1] if parent else None,
+                "name": name,
+                "start": start_wall,
+                "duration_ms": duration_ms,
+                "attributes": attributes,
+            })
+
+
+def record_span(name: str, duration_s: float, **attributes: Any) -> None:
+    """Export a span measured elsewhere (e.g. time a run spent queued) under the current span"""
+    parent = _current.get()
+    if _otel_tracer:
+        end_ns = time.time_ns()
+        otel_span = _otel_tracer.start_span(name, start_time=end_ns - int(duration_s * 1e9))
+        otel_span.set_attributes(_otel_attributes(attributes))
+        otel_span.end(end_time=end_ns)
+    _export({
+        "trace_id": parent[0] if parent else uuid.uuid4().hex,
+        "span_id": uuid.uuid4().hex[:16],
+        "parent_id": parent[1] if parent else None,
+        "name": name,
+        "start": time.time() - duration_s,
+        "duration_ms": round(duration_s * 1000, 3),
+        "attributes": attributes,
+    })
+
+
+class StatusTimer:
+    """Accumulates how long a run spends in each status (queued, in_progress, ...)"""
+
+    def __init__(self):
+        self.status: Optional[str] = None
+        self.since = time.perf_counter()
+        self.durations: Dict[str, float] = {}
+
+    def observe(self, status: Any) -> None:
+        status = str(getattr(status, "value", status))  # RunStatus enum or plain string
+        now = time.perf_counter()
+        if self.status is not None:
+            self.durations[self.status] = self.durations.get(self.status, 0.0) + now - self.since
+        self.status = status
+        self.since = now
+
+    def export(self, **attributes: Any) -> None:
+        """Emit one `run.<status>` span per status the run went through and has left"""
+        for status, seconds in self.durations.items():
+            if status != self.status:  # The current (terminal) status has no end yet
+                record_span(f"run.{status}", seconds, **attributes)
+
+
+def usage_attributes(run: Any) -> Dict[str, Any]:
+    """Token usage of a finished run as span attributes"""
+    usage = getattr(run, "usage", None)
+    if usage is None:
+        return {}
+    return {
+        "prompt_tokens": getattr(usage, "prompt_tokens", None),
+        "completion_tokens": getattr(usage, "completion_tokens", None),
+        "total_tokens": getattr(usage, "total_tokens", None),
+    }
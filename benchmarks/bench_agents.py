@@ -0,0 +1,362 @@
+# ==============================================================================
+# OFFLINE BENCHMARK - TURN LATENCY, REQUESTS PER TURN AND TOOL THROUGHPUT
+# ==============================================================================
+# Drives the real entry points against local stand-ins, no Azure needed:
+#   email      chat() from agents/agent_email.py   (Logic Apps -> stub server)
+#   freshdesk  the Streamlit message handler        (Freshdesk -> stub server)
+#   pipeline   the Semantic Kernel sequential pipeline with a fake chat service
+#
+# The Agents service is replaced by fake_agents_service.FakeProjectClient, so
+# what is measured is the project's own overhead on top of the simulated
+# service time: polling cadence, streaming, tool dispatch and extra requests.
+#
+#   python benchmarks/bench_agents.py --conversations 20 --concurrency 5
+#   python benchmarks/bench_agents.py --scenario email --output bench.json
+#   python benchmarks/bench_agents.py --scenario freshdesk --outbox           # tickets via the write-behind outbox
+#   python benchmarks/bench_agents.py --baseline bench.json --tolerance 0.2   # exit 1 on regression
+#
+# Scenarios whose libraries are not installed are skipped.
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+for folder in ("agents", "streamlit-app", "semantic-kernel"):
+    sys.path.append(os.path.join(ROOT, folder))
+
+from fake_agents_service import FakeProjectClient
+from stub_backends import start_stub_server
+
+# Metrics compared against a baseline; all of them are "lower is better"
+REGRESSION_METRICS = ("p95", "requests_per_turn")
+
+EMAIL_SCRIPT = [
+    "I'd like to send an email to alex@example.com",
+    "Subject: Quarterly numbers",
+    "Body: Hi Alex, the quarterly numbers are attached. Regards",
+    "Yes, send it",
+]
+
+FRESHDESK_SCRIPT = [
+    "Hi, my printer is offline again",
+    "Please open tickets for sam@example.com and kim@example.com about 'Printer offline'",
+    "Thanks!",
+]
+
+POST = "Hi Folks, I am launching a new Beginners to Pro Course on Udemy on Model Context Protocol MCP (#{index})"
+
+
+def percentile(values: List[float], share: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * share))] if ordered else 0.0
+
+
+def filler(words: int) -> str:
+    return " ".join(["Here is the preview of your message"] * max(1, words // 7))
+
+
+def summarize(scenario: str, latencies: List[float], errors: int, requests: Counter, elapsed: float,
+              tool_calls: int, **extra) -> Dict:
+    turns = len(latencies) + errors
+    return {
+        "scenario": scenario,
+        "turns": turns,
+        "errors": errors,
+        "p50": round(percentile(latencies, 0.50), 4),
+        "p95": round(percentile(latencies, 0.95), 4),
+        "p99": round(percentile(latencies, 0.99), 4),
+        "mean": round(sum(latencies) / len(latencies), 4) if latencies else 0.0,
+        "requests_per_turn": round(sum(requests.values()) / turns, 2) if turns else 0.0,
+        "requests": dict(sorted(requests.items())),
+        "tool_calls": tool_calls,
+        "tool_calls_per_s": round(tool_calls / elapsed, 2) if elapsed else 0.0,
+        "turns_per_s": round(turns / elapsed, 2) if elapsed else 0.0,
+        "elapsed": round(elapsed, 3),
+        **extra,
+    }
+
+
+def run_conversations(script: List[str], conversations: int, concurrency: int, client, turn) -> tuple:
+    """Run `conversations` copies of `script`, each on its own thread; returns latencies, errors, elapsed"""
+    def conversation(_):
+        thread = client.agents.threads.create()
+        latencies, errors = [], 0
+        for message in script:
+            started = time.perf_counter()
+            try:
+                if turn(thread, message) is None:
+                    errors += 1
+                else:
+                    latencies.append(time.perf_counter() - started)
+            except Exception:
+                errors += 1
+        client.agents.threads.delete(thread.id)
+        return latencies, errors
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(conversation, range(conversations)))
+    elapsed = time.perf_counter() - started
+    return [latency for latencies, _ in results for latency in latencies], sum(errors for _, errors in results), elapsed
+
+
+# --- email: chat() from agents/agent_email.py ------------------------------------
+
+def email_responder(reply_words: int):
+    """Fake model of the email assistant: previews until the user confirms, then calls send_email"""
+    def responder(agent, user_text: str, tool_outputs: List[str]):
+        if tool_outputs:
+            return f"{tool_outputs[0]} Anything else?"
+        if user_text.lower().startswith("yes"):
+            return [("send_email", {"email_to": "alex@example.com", "email_subject": "Quarterly numbers",
+                                    "email_body": "Hi Alex, the quarterly numbers are attached. Regards"})]
+        return filler(reply_words)
+    return responder
+
+
+def bench_email(args, server) -> Dict:
+    import agent_email  # Imported late: reads LOGIC_APPS_FULL_URL at import time
+
+    client = FakeProjectClient(email_responder(args.reply_words), **fake_options(args))
+    agent = agent_email.create_agent(client)
+    client.agents.reset_counters()  # Count the turns only
+    server.requests.clear()
+
+    latencies, errors, elapsed = run_conversations(
+        EMAIL_SCRIPT, args.conversations, args.concurrency, client,
+        lambda thread, message: agent_email.chat(client, thread, agent, message),
+    )
+    requests = conversation_requests(client)
+    return summarize("email", latencies, errors, requests, elapsed, client.agents.stats["tool_calls"],
+                     failed_runs=client.agents.stats["failed_runs"], emails_sent=server.requests["logic_apps"])
+
+
+# --- freshdesk: the Streamlit message handler ------------------------------------
+
+def bench_freshdesk(args, server) -> Dict:
+    from azure.ai.agents.models import FunctionTool, ToolSet
+    from freshdesk_chat import create_freshdesk_ticket, handle_message
+
+    tool = create_freshdesk_ticket
+    if args.outbox:  # Write-behind: the turn only queues, delivery is timed separately below
+        import ticket_outbox
+        outbox = ticket_outbox.TicketOutbox(os.path.join(tempfile.mkdtemp(prefix="bench-outbox-"), "outbox.db"))
+        ticket_outbox._outbox = outbox.start()
+        tool = ticket_outbox.queue_freshdesk_ticket
+
+    def responder(agent, user_text: str, tool_outputs: List[str]):
+        if tool_outputs:
+            return f"I created {len(tool_outputs)} tickets for you."
+        addresses = re.findall(r"[\w.+-]+@[\w-]+\.[\w.]+", user_text)
+        if addresses and "ticket" in user_text.lower():
+            return [(tool.__name__, {"email": address, "subject": "Printer offline"}) for address in addresses]
+        return filler(args.reply_words)
+
+    functions = FunctionTool({tool})
+    toolset = ToolSet()
+    toolset.add(functions)
+    client = FakeProjectClient(responder, **fake_options(args))
+    agent = client.agents.create_agent(model="gpt-4o", name="freshdesk-agent",
+                                       instructions="You are a helpful agent who can create freshdesk tickets.", toolset=toolset)
+    client.agents.reset_counters()
+    server.requests.clear()
+
+    def turn(thread, message):
+        reply = handle_message(client, thread.id, agent.id, message, functions, use_stream=not args.no_stream)
+        return None if reply.startswith("Run failed") else reply
+
+    latencies, errors, elapsed = run_conversations(FRESHDESK_SCRIPT, args.conversations, args.concurrency, client, turn)
+    requests = conversation_requests(client)
+    extra = {}
+    if args.outbox:
+        start = time.perf_counter()
+        while outbox.pending() and time.perf_counter() - start < args.timeout:
+            time.sleep(0.01)
+        extra = {"outbox_drain_s": round(time.perf_counter() - start, 3), "outbox_pending": outbox.pending()}
+        outbox.stop()
+        ticket_outbox._outbox = None
+    return summarize("freshdesk", latencies, errors, requests, elapsed, client.agents.stats["tool_calls"],
+                     failed_runs=client.agents.stats["failed_runs"], tickets_created=server.requests["tickets"], **extra)
+
+
+# --- pipeline: Semantic Kernel sequential orchestration --------------------------
+
+def load_orchestration_module():
+    """Import semantic-kernel/sequential-orchestration.py (the file name is not a module name)"""
+    for name, value in {"AZURE_OPENAI_API_KEY": "offline", "AZURE_OPENAI_ENDPOINT": "https://offline.invalid/",
+                        "AZURE_OPENAI_DEPLOYMENT_NAME": "offline", "AZURE_OPENAI_API_VERSION": "2024-10-21"}.items():
+        os.environ.setdefault(name, value)  # Only needed to construct the agents, which are then rebound
+    path = os.path.join(ROOT, "semantic-kernel", "sequential-orchestration.py")
+    spec = importlib.util.spec_from_file_location("sequential_orchestration", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+async def _bench_pipeline(args) -> Dict:
+    from semantic_kernel.agents import ChatCompletionAgent
+    from semantic_kernel.agents.runtime import InProcessRuntime
+    from fake_chat_completion import FakeChatCompletion
+
+    orchestration = load_orchestration_module()
+    service = FakeChatCompletion(ai_model_id="offline", latency=args.model_latency, reply_words=args.reply_words)
+    agents = [ChatCompletionAgent(name=agent.name, instructions=agent.instructions, service=service)
+              for agent in orchestration.get_social_media_agents()]
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        stage_options = None
+        if args.staged:
+            stage_options = orchestration.build_stage_options(cache_dir, False, False, 0.95, args.compact_tokens)
+        runtime = InProcessRuntime()
+        runtime.start()
+        semaphore = asyncio.Semaphore(args.concurrency)
+
+        async def limited(index: int) -> dict:
+            async with semaphore:
+                return await orchestration.optimize_post(agents, runtime, str(index), POST.format(index=index),
+                                                         args.timeout, stage_options)
+
+        started = time.perf_counter()
+        try:
+            results = await asyncio.gather(*(limited(index) for index in range(args.conversations)))
+        finally:
+            await runtime.stop_when_idle()
+        elapsed = time.perf_counter() - started
+
+    latencies = [result["latency"] for result in results if "error" not in result]
+    errors = sum(1 for result in results if "error" in result)
+    stages = {agent.name: round(percentile([r["stages"][agent.name] for r in results if agent.name in r["stages"]], 0.95), 4)
+              for agent in agents}
+    return summarize("pipeline", latencies, errors, Counter({"chat.completions": service.calls}), elapsed, 0,
+                     stage_p95=stages)
+
+
+def bench_pipeline(args, server) -> Dict:
+    return asyncio.run(_bench_pipeline(args))
+
+
+# --- reporting -----------------------------------------------------------------
+
+def add_fake_arguments(parser: argparse.ArgumentParser) -> None:
+    """Timing and failure knobs of the fake service and the stub backends"""
+    parser.add_argument("--queue-latency", type=float, default=0.05, help="Seconds a fake run stays queued")
+    parser.add_argument("--model-latency", type=float, default=0.2, help="Seconds per fake model step")
+    parser.add_argument("--api-latency", type=float, default=0.005, help="Round trip added to every fake API call")
+    parser.add_argument("--tool-latency", type=float, default=0.05, help="Seconds the stub backends take per request")
+    parser.add_argument("--tool-errors", type=float, default=0.0, help="Share of stub backend requests answered with 503")
+    parser.add_argument("--http-429", type=float, default=0.0, help="Share of run creations rejected with HTTP 429")
+    parser.add_argument("--run-429", type=float, default=0.0, help="Share of runs failing with rate_limit_exceeded")
+    parser.add_argument("--reply-words", type=int, default=60, help="Length of the fake model replies")
+    parser.add_argument("--seed", type=int, default=7, help="Seed of the injected failures")
+
+
+def fake_options(args) -> Dict:
+    return {
+        "queue_latency": args.queue_latency,
+        "model_latency": args.model_latency,
+        "api_latency": args.api_latency,
+        "http_429_ratio": args.http_429,
+        "run_429_ratio": args.run_429,
+        "seed": args.seed,
+    }
+
+
+def conversation_requests(client) -> Counter:
+    """Requests made by the turns; thread create / delete of the harness itself are left out"""
+    requests = Counter(client.agents.requests)
+    for operation in ("threads.create", "threads.delete"):
+        requests.pop(operation, None)
+    return requests
+
+
+def print_summary(summary: Dict) -> None:
+    print(f"\n{summary['scenario']}: {summary['turns']} turns, {summary['errors']} errors, {summary['elapsed']:.2f}s")
+    print(f"  latency   p50 {summary['p50'] * 1000:.0f} ms  p95 {summary['p95'] * 1000:.0f} ms  "
+          f"p99 {summary['p99'] * 1000:.0f} ms  mean {summary['mean'] * 1000:.0f} ms")
+    print(f"  requests  {summary['requests_per_turn']} per turn  "
+          + "  ".join(f"{operation} {count}" for operation, count in summary["requests"].items()))
+    print(f"  tools     {summary['tool_calls']} calls  {summary['tool_calls_per_s']} calls/s  "
+          f"{summary['turns_per_s']} turns/s")
+    for key in ("failed_runs", "emails_sent", "tickets_created", "outbox_drain_s", "outbox_pending", "stage_p95"):
+        if key in summary:
+            print(f"  {key:<9} {summary[key]}")
+
+
+def regressions(summaries: List[Dict], baseline_path: str, tolerance: float) -> List[str]:
+    """Metrics that got worse than the baseline by more than `tolerance`"""
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = {summary["scenario"]: summary for summary in json.load(f)}
+    found = []
+    for summary in summaries:
+        reference = baseline.get(summary["scenario"])
+        if reference is None:
+            continue
+        for metric in REGRESSION_METRICS:
+            if reference[metric] and summary[metric] > reference[metric] * (1 + tolerance):
+                found.append(f"{summary['scenario']} {metric}: {reference[metric]} -> {summary[metric]}")
+    return found
+
+
+SCENARIOS = {"email": bench_email, "freshdesk": bench_freshdesk, "pipeline": bench_pipeline}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline benchmark of the agent samples against a local stand-in service")
+    parser.add_argument("--scenario", choices=[*SCENARIOS, "all"], default="all")
+    parser.add_argument("--conversations", type=int, default=20, help="Conversations (pipelines for 'pipeline') to run")
+    parser.add_argument("--concurrency", type=int, default=5, help="Conversations running at the same time")
+    add_fake_arguments(parser)
+    parser.add_argument("--no-stream", action="store_true", help="Use the polling path in the freshdesk scenario")
+    parser.add_argument("--outbox", action="store_true", help="Queue tickets in the freshdesk scenario (ticket_outbox.py)")
+    parser.add_argument("--staged", action="store_true", help="Run the pipeline stage by stage (stage cache on)")
+    parser.add_argument("--compact-tokens", type=int, help="Handoff token budget in --staged mode")
+    parser.add_argument("--timeout", type=float, default=60, help="Seconds per pipeline")
+    parser.add_argument("--output", help="Write the summaries to this JSON file")
+    parser.add_argument("--baseline", help="JSON file of an earlier run to compare p95 and requests per turn against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative regression against --baseline")
+    args = parser.parse_args(argv)
+
+    server = start_stub_server(latency=args.tool_latency, error_ratio=args.tool_errors, seed=args.seed)
+    os.environ["LOGIC_APPS_FULL_URL"] = f"{server.url}/workflows/send-email/triggers/manual/paths/invoke?sig=stub"
+    os.environ["FRESHDESK_BASE_URL"] = server.url
+    os.environ.setdefault("FRESHDESK_API_KEY", "stub")
+
+    summaries = []
+    try:
+        for name, bench in SCENARIOS.items():
+            if args.scenario not in (name, "all"):
+                continue
+            try:
+                summary = bench(args, server)
+            except ImportError as e:
+                print(f"\n{name}: skipped ({e})")
+                continue
+            print_summary(summary)
+            summaries.append(summary)
+    finally:
+        server.shutdown()
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(summaries, f, indent=2)
+    if args.baseline:
+        found = regressions(summaries, args.baseline, args.tolerance)
+        for line in found:
+            print(f"❌ Regression: {line}")
+        return 1 if found else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,252 @@
+# ==============================================================================
+# EMAIL ASSISTANT LOAD GENERATOR - MANY CONCURRENT CONVERSATIONS
+# ==============================================================================
+# Simulates users of agents/agent_email.py: conversations arrive as a Poisson
+# process at `--rate` per second, each one plays a scripted flow through
+# chat() (recipient -> subject -> body -> confirm, or a variant from the mix)
+# with a think time between turns, and all of them share one agent and client
+# like a deployed assistant would.
+#
+#   python benchmarks/email_load.py --conversations 300 --rate 10 --think-time 2
+#   python benchmarks/email_load.py --mix send=0.6,revise=0.3,abandon=0.1
+#   python benchmarks/email_load.py --target azure --conversations 50 --rate 1
+#
+# --target fake (default) uses the local stand-in service, --target azure the
+# project configured for agent_email.py. Emails always go to the local stub
+# backend unless --logic-apps real is given, so a load test never mails
+# real recipients by accident.
+#
+# Reports p50/p95/p99 turn latency (overall and per step), error rates by
+# kind and emails-sent throughput.
+
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from bench_agents import add_fake_arguments, email_responder, fake_options, percentile
+from fake_agents_service import FakeProjectClient
+from stub_backends import start_stub_server  # bench_agents also puts ../agents on sys.path
+
+# Scripted flows; every user message is one turn
+FLOWS = {
+    "send": [
+        "I'd like to send an email to {recipient}",
+        "Subject: {subject}",
+        "Body: {body}",
+        "Yes, send it",
+    ],
+    "revise": [
+        "Please write an email to {recipient}",
+        "Subject: {subject}",
+        "Body: {body}",
+        "Actually, change the subject to 'Updated: {subject}'",
+        "Yes, send it",
+    ],
+    "abandon": [
+        "Email {recipient} please",
+        "Subject: {subject}",
+        "Never mind, I'll call them instead",
+    ],
+}
+
+DEFAULT_MIX = "send=0.7,revise=0.2,abandon=0.1"
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """"send=0.7,revise=0.2" -> {"send": 0.7, "revise": 0.2}"""
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in FLOWS:
+            raise argparse.ArgumentTypeError(f"Unknown flow '{name}', choose from {', '.join(FLOWS)}")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+class LoadStats:
+    """Turn latencies and outcomes collected from all conversation threads"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies: List[float] = []
+        self.latencies_by_step: Dict[int, List[float]] = defaultdict(list)
+        self.errors: Counter = Counter()      # Error kind -> count
+        self.flows: Counter = Counter()       # Flow name -> conversations finished
+        self.emails_sent = 0
+        self.emails_failed = 0
+        self.active = 0
+        self.peak_active = 0
+
+    def turn(self, step: int, latency: float) -> None:
+        with self.lock:
+            self.latencies.append(latency)
+            self.latencies_by_step[step].append(latency)
+
+    def error(self, kind: str) -> None:
+        with self.lock:
+            self.errors[kind] += 1
+
+    def tool_result(self, output) -> None:
+        with self.lock:
+            if str(output).startswith("✅"):
+                self.emails_sent += 1
+            else:
+                self.emails_failed += 1
+
+    def started(self) -> None:
+        with self.lock:
+            self.active += 1
+            self.peak_active = max(self.peak_active, self.active)
+
+    def finished(self, flow: str) -> None:
+        with self.lock:
+            self.active -= 1
+            self.flows[flow] += 1
+
+
+def count_emails(agent_email, stats: LoadStats) -> None:
+    """Wrap the email tool executor so every send attempt is counted"""
+    execute = agent_email.execute_tool_call
+
+    def counted(call):
+        output = execute(call)
+        stats.tool_result(output)
+        return output
+
+    agent_email.execute_tool_call = counted  # handle_tool_calls looks it up at call time
+
+
+def conversation(agent_email, client, agent, flow: str, think_time: float, stats: LoadStats, rng: random.Random) -> None:
+    stats.started()
+    values = {"recipient": f"user{rng.randrange(10000)}@example.com", "subject": "Quarterly numbers",
+              "body": "Hi, the quarterly numbers are attached. Regards"}
+    thread = None
+    try:
+        thread = client.agents.threads.create()
+        for step, template in enumerate(FLOWS[flow]):
+            if step and think_time:
+                time.sleep(rng.expovariate(1 / think_time))  # The user reads the reply and types
+            started = time.perf_counter()
+            try:
+                reply = agent_email.chat(client, thread, agent, template.format(**values))
+            except Exception as e:
+                stats.error(type(e).__name__)
+                break
+            if reply is None:
+                stats.error("no_reply")  # Run failed or ended without an assistant message
+                break
+            stats.turn(step, time.perf_counter() - started)
+    except Exception as e:
+        stats.error(f"thread.{type(e).__name__}")
+    finally:
+        if thread is not None:
+            try:
+                client.agents.threads.delete(thread.id)
+            except Exception:
+                stats.error("thread.delete")
+        stats.finished(flow)
+
+
+def make_client(args):
+    """Fake client or the project configured for agent_email.py"""
+    if args.target == "fake":
+        return FakeProjectClient(email_responder(args.reply_words), **fake_options(args))
+    import agent_email
+    from azure.ai.projects import AIProjectClient
+    from azure.identity import ClientSecretCredential
+    credential = ClientSecretCredential(agent_email.TENANT_ID, agent_email.CLIENT_ID, agent_email.CLIENT_SECRET)
+    return AIProjectClient(credential=credential, endpoint=agent_email.AZURE_ENDPOINT)
+
+
+def report(stats: LoadStats, elapsed: float, conversations: int) -> Dict:
+    turns = len(stats.latencies)
+    failed = sum(stats.errors.values())
+    summary = {
+        "conversations": conversations,
+        "turns": turns,
+        "errors": dict(stats.errors),
+        "error_rate": round(failed / (turns + failed), 4) if turns + failed else 0.0,
+        "p50": round(percentile(stats.latencies, 0.50), 4),
+        "p95": round(percentile(stats.latencies, 0.95), 4),
+        "p99": round(percentile(stats.latencies, 0.99), 4),
+        "p95_by_step": {step: round(percentile(values, 0.95), 4) for step, values in sorted(stats.latencies_by_step.items())},
+        "emails_sent": stats.emails_sent,
+        "emails_failed": stats.emails_failed,
+        "emails_per_s": round(stats.emails_sent / elapsed, 3) if elapsed else 0.0,
+        "turns_per_s": round(turns / elapsed, 2) if elapsed else 0.0,
+        "peak_conversations": stats.peak_active,
+        "flows": dict(stats.flows),
+        "elapsed": round(elapsed, 2),
+    }
+    print(f"\n{'='*60}")
+    print(f"Conversations: {conversations}  Turns: {turns}  Elapsed: {elapsed:.1f}s  Peak concurrent: {stats.peak_active}")
+    print(f"Turn latency  p50 {summary['p50']:.2f}s  p95 {summary['p95']:.2f}s  p99 {summary['p99']:.2f}s")
+    print("p95 by step   " + "  ".join(f"#{step} {value:.2f}s" for step, value in summary["p95_by_step"].items()))
+    print(f"Errors        {failed} ({summary['error_rate']:.1%})  " + "  ".join(f"{kind} {count}" for kind, count in stats.errors.items()))
+    print(f"Emails        {stats.emails_sent} sent, {stats.emails_failed} failed, {summary['emails_per_s']} emails/s")
+    print(f"Flows         " + "  ".join(f"{flow} {count}" for flow, count in stats.flows.items()))
+    print(f"{'='*60}")
+    return summary
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Concurrent multi-user load for the email assistant")
+    parser.add_argument("--target", choices=["fake", "azure"], default="fake", help="Local stand-in or the configured project")
+    parser.add_argument("--logic-apps", choices=["stub", "real"], default="stub", help="Where send_email posts to")
+    parser.add_argument("--conversations", type=int, default=200, help="Conversations to start")
+    parser.add_argument("--rate", type=float, default=10.0, help="Conversations arriving per second (Poisson)")
+    parser.add_argument("--think-time", type=float, default=2.0, help="Mean seconds a user waits before the next turn")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX), help=f"Flow weights, default {DEFAULT_MIX}")
+    parser.add_argument("--max-concurrent", type=int, default=500, help="Upper bound on conversations in flight")
+    parser.add_argument("--output", help="Write the summary to this JSON file")
+    add_fake_arguments(parser)
+    args = parser.parse_args(argv)
+
+    server = None
+    if args.logic_apps == "stub":
+        server = start_stub_server(latency=args.tool_latency, error_ratio=args.tool_errors, seed=args.seed)
+        os.environ["LOGIC_APPS_FULL_URL"] = f"{server.url}/workflows/send-email/triggers/manual/paths/invoke?sig=stub"
+    import agent_email  # Imported after LOGIC_APPS_FULL_URL is set
+
+    stats = LoadStats()
+    count_emails(agent_email, stats)
+    client = make_client(args)
+    agent = agent_email.create_agent(client)
+    rng = random.Random(args.seed)
+    flows, weights = zip(*args.mix.items())
+
+    print(f"🚦 {args.conversations} conversations at {args.rate}/s against {args.target}, mix {dict(args.mix)}")
+    started = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=args.max_concurrent, thread_name_prefix="user") as pool:
+            for index in range(args.conversations):
+                flow = rng.choices(flows, weights)[0]
+                pool.submit(conversation, agent_email, client, agent, flow, args.think_time, stats,
+                            random.Random(rng.random()))
+                if index + 1 < args.conversations:
+                    time.sleep(rng.expovariate(args.rate))  # Next arrival
+    finally:
+        elapsed = time.perf_counter() - started
+        try:
+            client.agents.delete_agent(agent.id)
+        except Exception as e:
+            print(f"Failed to delete agent {agent.id}: {e}")
+        if server is not None:
+            server.shutdown()
+
+    summary = report(stats, elapsed, args.conversations)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,422 @@
+# ==============================================================================
+# FAKE AGENTS SERVICE - IN-PROCESS STAND-IN FOR `AIProjectClient.agents`
+# ==============================================================================
+# Implements the part of the Azure AI Agents surface the samples use (agents,
+# threads, messages, runs incl. streaming and tool outputs) with simulated
+# timing, so polling, streaming and tool dispatch can be measured without Azure:
+#
+#   client = FakeProjectClient(responder, queue_latency=0.05, model_latency=0.2)
+#   chat(client, thread, agent, "Send an email to ...")   # unchanged sample code
+#   client.agents.requests   # Counter of API calls by operation, e.g. "runs.get"
+#
+# A run is `queued` for `queue_latency`, `in_progress` for `model_latency`
+# and then asks the `responder` what the model "says": a reply text completes
+# the run, a list of (tool name, arguments) puts it in `requires_action` until
+# the outputs are submitted, after which the next model step starts.
+# Run status follows the wall clock, so a client that polls too often pays
+# for it in requests and one that polls too rarely pays in latency.
+#
+# Rate limits can be injected: `http_429_ratio` of run creations fail with an
+# HTTP 429, `run_429_ratio` of runs fail with `rate_limit_exceeded` like the
+# service reports model quota exhaustion.
+
+import itertools
+import json
+import random
+import threading
+import time
+from collections import Counter
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from azure.ai.agents.models import (
+    RequiredFunctionToolCall,
+    RequiredFunctionToolCallDetails,
+    SubmitToolOutputsAction,
+    SubmitToolOutputsDetails,
+)
+from azure.core.exceptions import HttpResponseError, ResourceNotFoundError
+
+# (agent, latest user message, tool outputs of this run) -> reply text or tool calls
+Responder = Callable[[Any, str, List[str]], Union[str, List[Tuple[str, dict]]]]
+
+TERMINAL_STATUSES = ("completed", "failed", "cancelled", "expired")
+
+
+def _http_error(status_code: int, message: str) -> HttpResponseError:
+    error = HttpResponseError(message=message)
+    error.status_code = status_code
+    return error
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+class _Run:
+    """Server-side state of one run"""
+
+    def __init__(self, run_id: str, thread_id: str, agent_id: str, ready_at: float, done_at: float, rate_limited: bool):
+        self.id = run_id
+        self.thread_id = thread_id
+        self.agent_id = agent_id
+        self.status = "queued"
+        self.ready_at = ready_at          # queued -> in_progress
+        self.done_at = done_at            # end of the current model step
+        self.rate_limited = rate_limited  # Fail with rate_limit_exceeded at the end of the first step
+        self.pending_calls: List[RequiredFunctionToolCall] = []
+        self.tool_outputs: List[str] = []
+        self.reply = ""
+        self.last_error: Optional[dict] = None
+        self.usage = None
+
+    def next_event_at(self) -> Optional[float]:
+        if self.status == "queued":
+            return self.ready_at
+        if self.status == "in_progress":
+            return self.done_at
+        return None
+
+    def snapshot(self):
+        """What the SDK would hand back for this run"""
+        required_action = None
+        if self.status == "requires_action":
+            required_action = SubmitToolOutputsAction(
+                submit_tool_outputs=SubmitToolOutputsDetails(tool_calls=list(self.pending_calls)))
+        return SimpleNamespace(
+            id=self.id, thread_id=self.thread_id, agent_id=self.agent_id, status=self.status,
+            required_action=required_action, last_error=self.last_error, usage=self.usage,
+        )
+
+
+class _FakeStream:
+    """Context manager returned by `runs.stream`, pushes run events to the handler"""
+
+    def __init__(self, service: "FakeAgentsClient", run: _Run, event_handler):
+        self.service = service
+        self.run = run
+        self.event_handler = event_handler
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def until_done(self) -> None:
+        service, run, handler = self.service, self.run, self.event_handler
+        with service.lock:
+            handler_run = run.snapshot()
+        handler.on_thread_run(handler_run)
+        while True:
+            with service.lock:
+                event_at = run.next_event_at()
+                if event_at is None:  # Waiting for tool outputs or finished
+                    break
+            time.sleep(max(0.0, event_at - time.monotonic()))
+            with service.lock:
+                before = run.status
+                service._advance(run)
+                changed = run.status != before
+                snapshot = run.snapshot()
+            if not changed:
+                continue
+            if run.status == "completed":
+                for delta in service._chunks(run.reply):
+                    handler.on_message_delta(SimpleNamespace(text=delta))
+            handler.on_thread_run(snapshot)  # May submit tool outputs, which restarts the model step
+
+
+class _Threads:
+    def __init__(self, service: "FakeAgentsClient"):
+        self.service = service
+
+    def create(self, **kwargs):
+        self.service._request("threads.create")
+        with self.service.lock:
+            thread_id = self.service._new_id("thread")
+            self.service.thread_messages[thread_id] = []
+        return SimpleNamespace(id=thread_id, metadata=kwargs.get("metadata") or {})
+
+    def delete(self, thread_id: str) -> None:
+        self.service._request("threads.delete")
+        with self.service.lock:
+            if self.service.thread_messages.pop(thread_id, None) is None:
+                raise ResourceNotFoundError(f"No thread found with id '{thread_id}'")
+
+
+class _Messages:
+    def __init__(self, service: "FakeAgentsClient"):
+        self.service = service
+
+    def create(self, thread_id: str, role: str, content: str, **kwargs):
+        self.service._request("messages.create")
+        with self.service.lock:
+            return self.service._add_message(thread_id, str(getattr(role, "value", role)), content)
+
+    def list(self, thread_id: str, order: Any = "desc", limit: Optional[int] = None,
+             run_id: Optional[str] = None, after: Optional[str] = None, before: Optional[str] = None, **kwargs):
+        self.service._request("messages.list")
+        with self.service.lock:
+            messages = list(self.service._thread(thread_id))
+        if str(getattr(order, "value", order)) == "desc":
+            messages.reverse()
+        if run_id is not None:
+            messages = [message for message in messages if message.run_id == run_id]
+        ids = [message.id for message in messages]
+        if after in ids:
+            messages = messages[ids.index(after) + 1:]
+        if before in ids:
+            messages = messages[:ids.index(before)]
+        return self._paged(messages, limit or 20)
+
+    def _paged(self, messages: List[Any], page_size: int):
+        """Like the SDK's ItemPaged: `limit` is the page size, the next page is requested on demand"""
+        for index, message in enumerate(messages):
+            if index and index % page_size == 0:
+                self.service._request("messages.list")
+            yield message
+
+
+class _Runs:
+    def __init__(self, service: "FakeAgentsClient"):
+        self.service = service
+
+    def create(self, thread_id: str, agent_id: str, **kwargs):
+        self.service._request("runs.create")
+        return self.service._start_run(thread_id, agent_id).snapshot()
+
+    def get(self, thread_id: str, run_id: str, **kwargs):
+        self.service._request("runs.get")
+        with self.service.lock:
+            run = self.service._run(run_id)
+            self.service._advance(run)
+            return run.snapshot()
+
+    def submit_tool_outputs(self, thread_id: str, run_id: str, tool_outputs: List[dict], **kwargs):
+        self.service._request("runs.submit_tool_outputs")
+        return self.service._submit(run_id, tool_outputs).snapshot()
+
+    def submit_tool_outputs_stream(self, thread_id: str, run_id: str, tool_outputs: List[dict], event_handler=None, **kwargs):
+        # The events of the continued run arrive through the stream that is already open
+        self.service._request("runs.submit_tool_outputs_stream")
+        self.service._submit(run_id, tool_outputs)
+
+    def stream(self, thread_id: str, agent_id: str, event_handler=None, **kwargs):
+        self.service._request("runs.stream")
+        return _FakeStream(self.service, self.service._start_run(thread_id, agent_id), event_handler)
+
+    def create_and_process(self, thread_id: str, agent_id: str, toolset=None, **kwargs):
+        """Server-side wait; tool calls are answered with `toolset` like the SDK's auto function calls"""
+        self.service._request("runs.create_and_process")
+        service = self.service
+        run = service._start_run(thread_id, agent_id)
+        while True:
+            with service.lock:
+                service._advance(run)
+                event_at = run.next_event_at()
+                status = run.status
+                calls = list(run.pending_calls)
+            if status == "requires_action":
+                if toolset is None:
+                    with service.lock:
+                        run.status, run.last_error = "cancelled", {"code": "tool_calls_unanswered", "message": "No toolset to answer tool calls"}
+                    break
+                service._submit(run.id, toolset.execute_tool_calls(calls))
+            elif event_at is None:
+                break
+            else:
+                time.sleep(max(0.0, event_at - time.monotonic()))
+        with service.lock:
+            return run.snapshot()
+
+
+class FakeAgentsClient:
+    """The `client.agents` surface with simulated run timing and request accounting"""
+
+    def __init__(self, responder: Responder, queue_latency: float = 0.05, model_latency: float = 0.2,
+                 api_latency: float = 0.005, http_429_ratio: float = 0.0, run_429_ratio: float = 0.0,
+                 stream_chunks: int = 8, seed: Optional[int] = None):
+        self.responder = responder
+        self.queue_latency = queue_latency  # Seconds a run stays queued
+        self.model_latency = model_latency  # Seconds per model step (before and after tool calls)
+        self.api_latency = api_latency      # Round trip added to every API call
+        self.http_429_ratio = http_429_ratio
+        self.run_429_ratio = run_429_ratio
+        self.stream_chunks = stream_chunks  # Message deltas per streamed reply
+        self.random = random.Random(seed)
+        self.lock = threading.RLock()
+        self.requests: Counter = Counter()  # API calls by operation
+        self.stats: Counter = Counter()     # runs, tool_calls, failed_runs, rate_limited
+        self.agents_by_id: Dict[str, Any] = {}
+        self.thread_messages: Dict[str, List[Any]] = {}
+        self.runs_by_id: Dict[str, _Run] = {}
+        self._ids = itertools.count(1)
+        self.threads = _Threads(self)
+        self.messages = _Messages(self)
+        self.runs = _Runs(self)
+
+    # --- agents ---------------------------------------------------------------
+
+    def create_agent(self, model: str, name: Optional[str] = None, instructions: Optional[str] = None,
+                     tools: Optional[list] = None, toolset=None, metadata: Optional[dict] = None, **kwargs):
+        self._request("agents.create")
+        definitions = toolset.definitions if toolset is not None else (tools or [])
+        with self.lock:
+            agent = SimpleNamespace(id=self._new_id("asst"), model=model, name=name, instructions=instructions,
+                                    tools=definitions, metadata=metadata or {}, created_at=time.time())
+            self.agents_by_id[agent.id] = agent
+        return agent
+
+    def get_agent(self, agent_id: str):
+        self._request("agents.get")
+        with self.lock:
+            if agent_id not in self.agents_by_id:
+                raise ResourceNotFoundError(f"No assistant found with id '{agent_id}'")
+            return self.agents_by_id[agent_id]
+
+    def update_agent(self, agent_id: str, metadata: Optional[dict] = None, **kwargs):
+        self._request("agents.update")
+        with self.lock:
+            if agent_id not in self.agents_by_id:
+                raise ResourceNotFoundError(f"No assistant found with id '{agent_id}'")
+            agent = self.agents_by_id[agent_id]
+            if metadata is not None:
+                agent.metadata = dict(metadata)
+            for field, value in kwargs.items():
+                setattr(agent, field, value)
+            return agent
+
+    def list_agents(self, **kwargs):
+        self._request("agents.list")
+        with self.lock:
+            return iter(list(self.agents_by_id.values()))
+
+    def delete_agent(self, agent_id: str) -> None:
+        self._request("agents.delete")
+        with self.lock:
+            if self.agents_by_id.pop(agent_id, None) is None:
+                raise ResourceNotFoundError(f"No assistant found with id '{agent_id}'")
+
+    # --- bookkeeping ----------------------------------------------------------
+
+    def reset_counters(self) -> None:
+        with self.lock:
+            self.requests.clear()
+            self.stats.clear()
+
+    def _request(self, operation: str) -> None:
+        with self.lock:
+            self.requests[operation] += 1
+        if self.api_latency:
+            time.sleep(self.api_latency)
+
+    def _new_id(self, prefix: str) -> str:
+        return f"{prefix}_{next(self._ids):08d}"  # Zero padded so IDs sort by creation
+
+    def _thread(self, thread_id: str) -> List[Any]:
+        if thread_id not in self.thread_messages:
+            raise ResourceNotFoundError(f"No thread found with id '{thread_id}'")
+        return self.thread_messages[thread_id]
+
+    def _run(self, run_id: str) -> _Run:
+        if run_id not in self.runs_by_id:
+            raise ResourceNotFoundError(f"No run found with id '{run_id}'")
+        return self.runs_by_id[run_id]
+
+    def _add_message(self, thread_id: str, role: str, text: str, run_id: Optional[str] = None):
+        content = [SimpleNamespace(type="text", text=SimpleNamespace(value=text, annotations=[]))]
+        message = SimpleNamespace(id=self._new_id("msg"), thread_id=thread_id, role=role, content=content,
+                                  text_messages=content, run_id=run_id, created_at=time.time())
+        self._thread(thread_id).append(message)
+        return message
+
+    def _chunks(self, text: str) -> List[str]:
+        size = max(1, -(-len(text) // self.stream_chunks))
+        return [text[i:i + size] for i in range(0, len(text), size)]
+
+    # --- run simulation -------------------------------------------------------
+
+    def _start_run(self, thread_id: str, agent_id: str) -> _Run:
+        if self.http_429_ratio and self.random.random() < self.http_429_ratio:
+            with self.lock:
+                self.stats["rate_limited"] += 1
+            raise _http_error(429, "Rate limit is exceeded. Try again in 1 seconds.")
+        with self.lock:
+            self._thread(thread_id)
+            if agent_id not in self.agents_by_id:
+                raise ResourceNotFoundError(f"No assistant found with id '{agent_id}'")
+            now = time.monotonic()
+            rate_limited = bool(self.run_429_ratio) and self.random.random() < self.run_429_ratio
+            run = _Run(self._new_id("run"), thread_id, agent_id, now + self.queue_latency,
+                       now + self.queue_latency + self.model_latency, rate_limited)
+            self.runs_by_id[run.id] = run
+            self.stats["runs"] += 1
+            return run
+
+    def _advance(self, run: _Run) -> None:
+        """Move the run along the wall clock (caller holds the lock)"""
+        now = time.monotonic()
+        if run.status == "queued" and now >= run.ready_at:
+            run.status = "in_progress"
+        if run.status == "in_progress" and now >= run.done_at:
+            self._finish_step(run)
+
+    def _finish_step(self, run: _Run) -> None:
+        if run.rate_limited:
+            run.status = "failed"
+            run.last_error = {"code": "rate_limit_exceeded", "message": "Rate limit is exceeded. Try again in 2 seconds."}
+            self.stats["failed_runs"] += 1
+            self.stats["rate_limited"] += 1
+            return
+        messages = self.thread_messages[run.thread_id]
+        user_text = next((m.content[0].text.value for m in reversed(messages) if m.role == "user"), "")
+        result = self.responder(self.agents_by_id[run.agent_id], user_text, list(run.tool_outputs))
+        if isinstance(result, str):
+            run.reply = result
+            self._add_message(run.thread_id, "assistant", result, run_id=run.id)
+            prompt_tokens = sum(_estimate_tokens(m.content[0].text.value) for m in messages) + sum(map(_estimate_tokens, run.tool_outputs))
+            completion_tokens = _estimate_tokens(result)
+            run.usage = SimpleNamespace(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens,
+                                        total_tokens=prompt_tokens + completion_tokens)
+            run.status = "completed"
+            return
+        run.pending_calls = [
+            RequiredFunctionToolCall(id=self._new_id("call"),
+                                     function=RequiredFunctionToolCallDetails(name=name, arguments=json.dumps(arguments)))
+            for name, arguments in result
+        ]
+        self.stats["tool_calls"] += len(run.pending_calls)
+        run.status = "requires_action"
+
+    def _submit(self, run_id: str, tool_outputs: List[dict]) -> _Run:
+        with self.lock:
+            run = self._run(run_id)
+            self._advance(run)
+            if run.status != "requires_action":
+                raise _http_error(400, f"Run {run_id} is {run.status}, it does not accept tool outputs")
+            expected = {call.id for call in run.pending_calls}
+            submitted = {output["tool_call_id"] for output in tool_outputs}
+            if submitted != expected:
+                raise _http_error(400, f"Tool outputs must answer exactly the calls {sorted(expected)}")
+            run.tool_outputs.extend(output["output"] for output in tool_outputs)
+            run.pending_calls = []
+            run.status = "in_progress"
+            run.done_at = time.monotonic() + self.model_latency  # Next model step
+            return run
+
+
+class FakeProjectClient:
+    """Drop-in for `AIProjectClient` as far as the samples use it"""
+
+    def __init__(self, responder: Responder, **options: Any):
+        self.agents = FakeAgentsClient(responder, **options)
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
@@ -0,0 +1,59 @@
+# ==============================================================================
+# FAKE CHAT COMPLETION - OFFLINE SEMANTIC KERNEL CHAT SERVICE
+# ==============================================================================
+# Stands in for AzureChatCompletion behind ChatCompletionAgent so the
+# sequential pipeline can be benchmarked offline. Every call sleeps for a
+# latency with a lognormal tail (so hedging has stragglers to work on),
+# answers with a sectioned reply of `reply_words` words and reports token
+# usage in the metadata like the real connector.
+
+import asyncio
+import random
+from typing import Any, AsyncGenerator, ClassVar, List
+
+from semantic_kernel.connectors.ai.chat_completion_client_base import ChatCompletionClientBase
+from semantic_kernel.connectors.ai.completion_usage import CompletionUsage
+from semantic_kernel.contents import ChatMessageContent, StreamingChatMessageContent
+from semantic_kernel.contents.utils.author_role import AuthorRole
+
+_WORDS = "engagement audience hashtag launch course clarity emoji tone call action reach".split()
+
+
+class FakeChatCompletion(ChatCompletionClientBase):
+    """Chat service with simulated latency, canned replies and usage metadata"""
+
+    SUPPORTS_FUNCTION_CALLING: ClassVar[bool] = False
+
+    latency: float = 0.2      # Median seconds per call
+    tail: float = 0.3         # Sigma of the lognormal latency multiplier
+    reply_words: int = 120    # Length of every reply
+    calls: int = 0            # Calls served so far
+
+    def _reply(self, chat_history) -> str:
+        rng = random.Random(len(chat_history.messages) + self.calls)
+        body = " ".join(rng.choice(_WORDS) for _ in range(self.reply_words))
+        half = len(body) // 2
+        return f"Sure, here is my take.\n\n## Analysis\n{body[:half]}\n\n## Recommendations\n- {body[half:]}"
+
+    def _usage(self, chat_history, reply: str) -> CompletionUsage:
+        prompt = sum(len(str(message.content or "")) for message in chat_history.messages)
+        return CompletionUsage(prompt_tokens=prompt // 4, completion_tokens=len(reply) // 4)
+
+    async def _sleep(self) -> None:
+        self.calls += 1
+        await asyncio.sleep(self.latency * random.lognormvariate(0, self.tail))
+
+    async def _inner_get_chat_message_contents(self, chat_history, settings) -> List[ChatMessageContent]:
+        await self._sleep()
+        reply = self._reply(chat_history)
+        return [ChatMessageContent(role=AuthorRole.ASSISTANT, content=reply, ai_model_id=self.ai_model_id,
+                                   metadata={"usage": self._usage(chat_history, reply)})]
+
+    async def _inner_get_streaming_chat_message_contents(self, chat_history, settings, function_invoke_attempt: int = 0
+                                                         ) -> AsyncGenerator[List[StreamingChatMessageContent], Any]:
+        await self._sleep()
+        reply = self._reply(chat_history)
+        words = reply.split(" ")
+        for index, word in enumerate(words):
+            yield [StreamingChatMessageContent(role=AuthorRole.ASSISTANT, choice_index=0, ai_model_id=self.ai_model_id,
+                                               content=word if index == 0 else " " + word)]
@@ -0,0 +1,101 @@
+# ==============================================================================
+# STUB BACKENDS - LOCAL LOGIC APPS AND FRESHDESK ENDPOINTS
+# ==============================================================================
+# A threaded HTTP server on localhost that answers like the two tool backends:
+#   POST /api/v2/tickets   -> 201 with a Freshdesk style ticket JSON
+#   GET  /api/v2/search/tickets?query="tag:'X'" -> the tickets tagged X
+#   POST anything else     -> 202 like a Logic Apps HTTP trigger
+# with configurable latency and a share of 503 answers to exercise retries.
+#
+#   server = start_stub_server(latency=0.05)
+#   os.environ["LOGIC_APPS_FULL_URL"] = server.url + "/workflows/send/invoke?sig=stub"
+#   os.environ["FRESHDESK_BASE_URL"] = server.url
+#   ...
+#   server.shutdown()
+
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, latency: float, error_ratio: float, seed=None):
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.latency = latency          # Seconds before every answer
+        self.error_ratio = error_ratio  # Share of requests answered with 503
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests: Counter = Counter()  # "tickets" / "logic_apps" / "searches" / "errors"
+        self.ticket_ids = itertools.count(1)
+        self.tickets: list = []  # Created tickets, for the search endpoint
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, like the real backends
+
+    def do_POST(self):
+        server: StubServer = self.server
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if server.latency:
+            time.sleep(server.latency)
+        with server.lock:
+            failed = server.random.random() < server.error_ratio
+            if failed:
+                server.requests["errors"] += 1
+
+        if failed:
+            self._send(503, {"error": "Service Unavailable"})
+        elif self.path.startswith("/api/v2/tickets"):
+            ticket = json.loads(body or b"{}")
+            with server.lock:
+                server.requests["tickets"] += 1
+                ticket = {"id": next(server.ticket_ids), **ticket}
+                server.tickets.append(ticket)
+            self._send(201, ticket)
+        else:
+            with server.lock:
+                server.requests["logic_apps"] += 1
+            self._send(202, None)
+
+    def do_GET(self):
+        server: StubServer = self.server
+        url = urlparse(self.path)
+        if not url.path.startswith("/api/v2/search/tickets"):
+            self._send(404, {"error": "Not Found"})
+            return
+        match = re.search(r"tag:'([^']*)'", parse_qs(url.query).get("query", [""])[0])
+        with server.lock:
+            server.requests["searches"] += 1
+            results = [ticket for ticket in server.tickets if match and match.group(1) in ticket.get("tags", [])]
+        self._send(200, {"results": results, "total": len(results)})
+
+    def _send(self, status: int, payload) -> None:
+        data = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass  # Keep benchmark output readable
+
+
+def start_stub_server(latency: float = 0.05, error_ratio: float = 0.0, seed=None) -> StubServer:
+    """Start the stub backends on a free localhost port in a background thread"""
+    server = StubServer(latency, error_ratio, seed)
+    threading.Thread(target=server.serve_forever, daemon=True, name="stub-backends").start()
+    return server
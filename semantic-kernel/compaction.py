@@ -0,0 +1,144 @@
+# Context compaction between sequential agents
+#
+# Each stage's full output becomes the next stage's prompt. Compactors shrink
+# that handoff before it is sent on: drop boilerplate, keep only the sections
+# the next agent needs, or cap it at a token budget. A compactor is any
+# function `str -> str` (or an async one, e.g. an LLM summarizer); `chain`
+# combines several. TokenLedger records prompt / completion tokens per stage
+# and handoff sizes before / after compaction so the savings are visible.
+import inspect  # Import inspect to support async compactors
+import re  # Import re for section and boilerplate matching
+from typing import Awaitable, Callable, Dict, Union  # Import types for type hinting
+
+Compactor = Callable[[str], Union[str, Awaitable[str]]]
+
+try:
+    import tiktoken  # Optional: exact token counts
+    _encoding = tiktoken.get_encoding("cl100k_base")
+except ImportError:
+    _encoding = None
+
+
+# Function to count tokens
+def count_tokens(text: str) -> int:
+    """Exact count with tiktoken when installed, else the usual ~4 characters per token estimate"""
+    if _encoding is not None:
+        return len(_encoding.encode(text))
+    return (len(text) + 3) // 4
+
+
+# Pleasantries an agent wraps its answer in: an intro line announcing the answer
+# ("Sure! Here is the improved post:"), a bare interjection, or a sign-off offering
+# more help. They are only recognised as the first / last line, never in the body
+_INTRO = re.compile(
+    r"^\s*((certainly|sure|of course|absolutely|great|here('s| is| are)|below is)\b.*"
+    r"\b(post|version|draft|analysis|review|rewrite|revision|optimi[sz]ed|improved|updated|revised|following|below)\b.*:"
+    r"|(certainly|sure|of course|absolutely)[!.,]?)\s*$",
+    re.IGNORECASE,
+)
+_SIGN_OFF = re.compile(
+    r"^\s*(let me know if (you|there|i)\b|feel free to (ask|reach out|let me know)\b"
+    r"|i hope (this|that|these) (helps?|is helpful|works|meets)\b|happy to help\b).*$",
+    re.IGNORECASE,
+)
+_SEPARATOR = re.compile(r"^\s*([-*_=]\s*){3,}$")
+
+
+# Function to drop a leading / trailing pleasantry (and separators next to it) and repeated blank lines
+def strip_boilerplate(text: str) -> str:
+    """Trim the wrapper around an answer; the body itself is never touched"""
+    lines = text.strip().splitlines()
+    while lines and (not lines[0].strip() or _INTRO.match(lines[0]) or _SEPARATOR.match(lines[0])):
+        lines.pop(0)
+    while lines and (not lines[-1].strip() or _SIGN_OFF.match(lines[-1]) or _SEPARATOR.match(lines[-1])):
+        lines.pop()
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip() or text.strip()
+
+
+# Function to build a compactor that keeps only the sections whose heading matches a keyword
+def extract_sections(*keywords: str) -> Callable[[str], str]:
+    """Keep headed sections (markdown headings or bold / numbered titles) matching `keywords`"""
+    heading = re.compile(r"^\s*(#{1,6}\s+|\*\*|\d+[.)]\s+|[A-Z][A-Za-z /&-]{2,40}:\s*$)")
+    wanted = [keyword.lower() for keyword in keywords]
+
+    def compact(text: str) -> str:
+        kept, keep = [], False
+        for line in text.splitlines():
+            if heading.match(line):
+                keep = any(keyword in line.lower() for keyword in wanted)
+            if keep:
+                kept.append(line)
+        return "\n".join(kept).strip() or text  # Nothing matched: hand over the full text
+
+    return compact
+
+
+# Function to build a compactor that caps the handoff at a token budget
+def token_budget(max_tokens: int) -> Callable[[str], str]:
+    def compact(text: str) -> str:
+        if count_tokens(text) <= max_tokens:
+            return text
+        if _encoding is not None:
+            return _encoding.decode(_encoding.encode(text)[:max_tokens]) + " …"
+        return text[: max_tokens * 4] + " …"
+    return compact
+
+
+# Function to build a compactor that asks an agent to summarize the handoff
+def summarize_with(agent, max_tokens: int) -> Compactor:
+    """LLM summary for handoffs over `max_tokens`; costs one extra (small) call"""
+    async def compact(text: str) -> str:
+        if count_tokens(text) <= max_tokens:
+            return text
+        response = await agent.get_response(messages=f"Summarize in at most {max_tokens} tokens, keep every recommendation:\n\n{text}")
+        return str(response.message.content)
+    return compact
+
+
+# Function to apply several compactors in order
+def chain(*compactors: Compactor) -> Compactor:
+    async def compact(text: str) -> str:
+        for compactor in compactors:
+            text = await apply(compactor, text)
+        return text
+    return compact
+
+
+# Function to run a sync or async compactor
+async def apply(compactor: Compactor, text: str) -> str:
+    result = compactor(text)
+    return await result if inspect.isawaitable(result) else result
+
+
+class TokenLedger:
+    """Token totals per stage: model usage plus handoff size before / after compaction"""
+
+    def __init__(self):
+        self.stages: Dict[str, Dict[str, int]] = {}
+
+    def _stage(self, name: str) -> Dict[str, int]:
+        return self.stages.setdefault(name, {"calls": 0, "prompt_tokens": 0, "completion_tokens": 0, "handoff_before": 0, "handoff_after": 0})
+
+    def record_usage(self, name: str, response) -> None:
+        """Add the usage reported in the response metadata (if the connector provides it)"""
+        usage = response.message.metadata.get("usage") if response.message.metadata else None
+        stage = self._stage(name)
+        stage["calls"] += 1
+        if usage is not None:
+            stage["prompt_tokens"] += getattr(usage, "prompt_tokens", 0) or 0
+            stage["completion_tokens"] += getattr(usage, "completion_tokens", 0) or 0
+
+    def record_handoff(self, name: str, before: str, after: str) -> None:
+        stage = self._stage(name)
+        stage["handoff_before"] += count_tokens(before)
+        stage["handoff_after"] += count_tokens(after)
+
+    def report(self) -> str:
+        lines = []
+        for name, stage in self.stages.items():
+            line = f"  {name:<16} calls {stage['calls']}  prompt {stage['prompt_tokens']}  completion {stage['completion_tokens']}"
+            if stage["handoff_before"]:
+                saved = 1 - stage["handoff_after"] / stage["handoff_before"]
+                line += f"  handoff {stage['handoff_before']} -> {stage['handoff_after']} tokens ({saved:.0%} saved)"
+            lines.append(line)
+        return "\n".join(lines)
@@ -0,0 +1,96 @@
+# Hedged requests across two deployments
+#
+# A single slow response from one deployment holds up the whole sequential
+# chain. With hedging, a stage that has not answered within a delay taken from
+# the stage's own latency history (e.g. its p95) sends a duplicate request to a
+# second deployment. Whichever answers first wins and the other is cancelled,
+# so only the slowest few percent of calls cost a second request.
+import asyncio  # Import asyncio for racing the two requests
+import time  # Import time to measure stage latency
+from collections import deque  # Import deque for the rolling latency window
+from typing import Dict, List, Optional  # Import types for type hinting
+from semantic_kernel.agents import Agent  # Import the agent base class
+
+
+class HedgePolicy:
+    """Rolling latency window of one stage and the hedge counters for it"""
+
+    def __init__(self, percentile: float = 0.95, initial_delay: float = 10.0, min_samples: int = 20, window: int = 200):
+        self.percentile = percentile  # Hedge once a call is slower than this share of past calls
+        self.initial_delay = initial_delay  # Delay used until enough samples are collected
+        self.min_samples = min_samples  # Samples needed before trusting the percentile
+        self.latencies = deque(maxlen=window)  # Most recent successful latencies in seconds
+        self.calls = 0  # Stage calls made
+        self.hedges = 0  # Calls where the backup request was fired
+        self.backup_wins = 0  # Hedged calls the backup deployment answered first
+
+    def delay(self) -> float:
+        """Seconds to wait for the primary before hedging"""
+        if len(self.latencies) < self.min_samples:
+            return self.initial_delay
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * self.percentile))]
+
+
+class Hedger:
+    """Runs each stage against its primary agent and, when it straggles, a backup agent"""
+
+    def __init__(self, backups: List[Agent], percentile: float = 0.95, initial_delay: float = 10.0):
+        self.backups: Dict[str, Agent] = {agent.name: agent for agent in backups}  # Backup agent by stage name
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.policies: Dict[str, HedgePolicy] = {}  # Latency history by stage name
+
+    def policy(self, name: str) -> HedgePolicy:
+        if name not in self.policies:
+            self.policies[name] = HedgePolicy(self.percentile, self.initial_delay)
+        return self.policies[name]
+
+    async def get_response(self, agent: Agent, stage_input: str):
+        """Return the first successful response of the primary or, after the hedge delay, the backup"""
+        policy = self.policy(agent.name)
+        policy.calls += 1
+        started = time.perf_counter()
+        primary = asyncio.create_task(agent.get_response(messages=stage_input))
+        tasks = [primary]
+        try:
+            backup_agent: Optional[Agent] = self.backups.get(agent.name)
+            if backup_agent is None:
+                response = await primary
+                policy.latencies.append(time.perf_counter() - started)
+                return response
+
+            done, _ = await asyncio.wait({primary}, timeout=policy.delay())
+            if done and primary.exception() is None:
+                policy.latencies.append(time.perf_counter() - started)
+                return primary.result()
+
+            # Primary is straggling (or already failed): race it against the backup deployment
+            policy.hedges += 1
+            backup = asyncio.create_task(backup_agent.get_response(messages=stage_input))
+            tasks.append(backup)
+            pending = {primary, backup} - done
+            error = primary.exception() if done else None
+            while pending:
+                finished, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in finished:
+                    if task.exception() is None:
+                        policy.latencies.append(time.perf_counter() - started)
+                        if task is backup:
+                            policy.backup_wins += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            # Drop the loser, and both calls if the caller was cancelled while waiting
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def report(self) -> str:
+        """One line per stage with hedge rate and backup wins"""
+        lines = []
+        for name, policy in self.policies.items():
+            rate = policy.hedges / policy.calls if policy.calls else 0.0
+            lines.append(f"  {name:<16} calls {policy.calls}  hedged {policy.hedges} ({rate:.0%})  backup wins {policy.backup_wins}  delay {policy.delay():.2f}s")
+        return "\n".join(lines)
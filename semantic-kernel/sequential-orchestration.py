@@ -2,11 +2,21 @@
 from typing import List, Optional  # Import List and Optional types for type hinting
 from semantic_kernel.agents import Agent, ChatCompletionAgent, SequentialOrchestration  # Import agent classes and orchestration
 from semantic_kernel.connectors.ai.open_ai import AzureChatCompletion  # Import Azure OpenAI connector
-from semantic_kernel.contents import ChatMessageContent  # Import message content class for agent responses
+from semantic_kernel.contents import ChatMessageContent, StreamingChatMessageContent  # Import message content classes for agent responses
 from semantic_kernel.agents.runtime import InProcessRuntime  # Import runtime for agent execution
 import os  # Import os for environment variable access
+import sys  # Import sys to reach the shared helpers in ../agents
 import asyncio  # Import asyncio for asynchronous programming
+import argparse  # Import argparse for the batch mode command line
+import csv  # Import csv to read batch input files
+import json  # Import json to read / write batch JSONL files
+import time  # Import time to measure throughput and stage latency
 from dotenv import load_dotenv  # Import dotenv to load environment variables from .env file
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "agents"))  # Shared tracing helper
+from tracing import record_span, span  # Import latency spans (set AGENT_TRACE_FILE)
+from stage_pipeline import StageCache, run_staged_pipeline  # Import the cached, resumable stage runner
+from hedging import Hedger  # Import the hedged request runner
+from compaction import TokenLedger, chain, extract_sections, strip_boilerplate, token_budget  # Import handoff compaction
 
 
 # Load environment variables from .env file into the environment
@@ -17,6 +27,10 @@ AZURE_OPENAI_API_KEY = os.getenv("AZURE_OPENAI_API_KEY")  # Get API key from env
 AZURE_OPENAI_ENDPOINT = os.getenv("AZURE_OPENAI_ENDPOINT")  # Get endpoint URL from environment
 AZURE_OPENAI_DEPLOYMENT_NAME = os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME")  # Get deployment name from environment
 AZURE_OPENAI_API_VERSION = os.getenv("AZURE_OPENAI_API_VERSION")  # Get API version from environment
+# Optional second deployment used for hedged requests (endpoint / key default to the primary ones)
+AZURE_OPENAI_HEDGE_DEPLOYMENT_NAME = os.getenv("AZURE_OPENAI_HEDGE_DEPLOYMENT_NAME")  # Get backup deployment name
+AZURE_OPENAI_HEDGE_ENDPOINT = os.getenv("AZURE_OPENAI_HEDGE_ENDPOINT") or AZURE_OPENAI_ENDPOINT  # Get backup endpoint
+AZURE_OPENAI_HEDGE_API_KEY = os.getenv("AZURE_OPENAI_HEDGE_API_KEY") or AZURE_OPENAI_API_KEY  # Get backup API key
 print(f"Current Directory: {os.getcwd()}")  # Print current working directory
 print(f"Using Azure OpenAI Endpoint: {AZURE_OPENAI_ENDPOINT}")  # Print the endpoint being used
 
@@ -54,7 +68,11 @@ async def test_azure_connection():
         return False  # Return False if connection fails
     
 # Function to get the agents
-def get_social_media_agents() -> List[Agent]:
+def get_social_media_agents(
+    deployment_name: Optional[str] = None,
+    endpoint: Optional[str] = None,
+    api_key: Optional[str] = None,
+) -> List[Agent]:
     """
     Define three agents for social media post optimization:
     1. AnalyzerAgent: Analyzes the original post for tone, engagement factors, and issues
@@ -64,9 +82,9 @@ def get_social_media_agents() -> List[Agent]:
 
     # Initialize the Azure OpenAI service
     ai_service = AzureChatCompletion(
-        api_key=AZURE_OPENAI_API_KEY,  # Use API key from environment
-        endpoint=AZURE_OPENAI_ENDPOINT,  # Use endpoint from environment
-        deployment_name=AZURE_OPENAI_DEPLOYMENT_NAME,  # Use deployment name from environment
+        api_key=api_key or AZURE_OPENAI_API_KEY,  # Use API key from environment
+        endpoint=endpoint or AZURE_OPENAI_ENDPOINT,  # Use endpoint from environment
+        deployment_name=deployment_name or AZURE_OPENAI_DEPLOYMENT_NAME,  # Use deployment name from environment
         api_version=AZURE_OPENAI_API_VERSION  # Use API version from environment
     )
 
@@ -127,15 +145,38 @@ def agent_response_callback(message: ChatMessageContent) -> None:
     print(message.content)  # Print agent's message content
     print()  # Print empty line
 
+# Function to build a streaming callback that prints each agent's tokens as they are generated
+def make_streaming_callback():
+    """Create a callback that prints token deltas and announces each agent as soon as it starts"""
+    current_agent = [None]  # Name of the agent currently streaming
+
+    def streaming_agent_response_callback(message: StreamingChatMessageContent, is_final: bool) -> None:
+        if message.name != current_agent[0]:
+            current_agent[0] = message.name  # A new stage has started
+            print(f"\n{'='*50}")  # Print separator
+            print(f"🤖 {message.name}")  # Print agent name
+            print(f"{'='*50}")  # Print separator
+        print(message.content or "", end="", flush=True)  # Print the delta right away
+        if is_final:
+            print("\n")  # End of this agent's response
+
+    return streaming_agent_response_callback
+
 # Alternative example Function with a business post to run the multi agent squential orchestration for social media post optimization
-async def run_business_post_example():
+async def run_business_post_example(stream: bool = False, timeout: float = 60, stage_options: Optional[dict] = None):
     """Example with a business-focused social media post"""
 
     agents = get_social_media_agents()  # Get the list of agents
-    sequential_orchestration = SequentialOrchestration(
-        members=agents,  # Pass agents as members of the orchestration
-        agent_response_callback=agent_response_callback,  # Set callback for agent responses
-    )
+    if stream:
+        sequential_orchestration = SequentialOrchestration(
+            members=agents,  # Pass agents as members of the orchestration
+            streaming_agent_response_callback=make_streaming_callback(),  # Print tokens as they are generated
+        )
+    else:
+        sequential_orchestration = SequentialOrchestration(
+            members=agents,  # Pass agents as members of the orchestration
+            agent_response_callback=agent_response_callback,  # Set callback for agent responses
+        )
 
     runtime = InProcessRuntime()  # Create a runtime for agent execution
     runtime.start()  # Start the runtime
@@ -152,12 +193,22 @@ async def run_business_post_example():
     print(f"{'-'*35}\n")  # Print separator
 
     try:
-        orchestration_result = await sequential_orchestration.invoke(
-            task=business_post,  # Pass the business post as the task
-            runtime=runtime,  # Use the created runtime
-        )
-
-        final_result = await orchestration_result.get(timeout=60)  # Wait for the result with a timeout
+        if stage_options is not None:
+            # Stage-by-stage mode: stage cache, checkpoints and hedging (see build_stage_options)
+            def print_stage(agent_name: str, output: str, cached: bool) -> None:
+                agent_response_callback(ChatMessageContent(role="assistant", name=agent_name + (" (cached)" if cached else ""), content=output))
+
+            final_result = await asyncio.wait_for(
+                run_staged_pipeline(agents, business_post, on_stage=print_stage, **stage_options),
+                timeout=timeout,
+            )
+        else:
+            orchestration_result = await sequential_orchestration.invoke(
+                task=business_post,  # Pass the business post as the task
+                runtime=runtime,  # Use the created runtime
+            )
+
+            final_result = await orchestration_result.get(timeout=timeout)  # Wait for the result with a timeout
 
         print("🎉 FINAL OPTIMIZED BUSINESS POST")  # Print header for final result
         print("="*55)  # Print separator
@@ -169,10 +220,145 @@ async def run_business_post_example():
 
     finally:
         await runtime.stop_when_idle()  # Stop the runtime when idle
+        if stage_options is not None:
+            print_stage_report(stage_options)  # Print cache / hedge statistics
+
+
+# Function to build the options of the stage-by-stage mode from the command line flags
+def build_stage_options(cache_dir: Optional[str], resume: bool, hedge: bool, hedge_percentile: float,
+                        compact_tokens: Optional[int] = None, compact_analysis: bool = False) -> Optional[dict]:
+    """Keyword arguments for run_staged_pipeline, or None to use SequentialOrchestration"""
+    if not (cache_dir or hedge or compact_tokens or compact_analysis):
+        return None  # No stage-level feature requested
+    options = {"resume": resume, "ledger": TokenLedger()}  # Token counts are always recorded in this mode
+    if cache_dir:
+        options["cache"] = StageCache(os.path.join(cache_dir, "stages"))  # Stage result cache
+        options["checkpoint_dir"] = os.path.join(cache_dir, "checkpoints")  # Per-pipeline checkpoints
+    if hedge:
+        if not AZURE_OPENAI_HEDGE_DEPLOYMENT_NAME:
+            raise SystemExit("--hedge needs AZURE_OPENAI_HEDGE_DEPLOYMENT_NAME")
+        backups = get_social_media_agents(  # Same agents bound to the second deployment
+            deployment_name=AZURE_OPENAI_HEDGE_DEPLOYMENT_NAME,
+            endpoint=AZURE_OPENAI_HEDGE_ENDPOINT,
+            api_key=AZURE_OPENAI_HEDGE_API_KEY,
+        )
+        options["hedger"] = Hedger(backups, percentile=hedge_percentile)  # Hedge stages slower than this percentile
+    if compact_tokens or compact_analysis:
+        budget = [token_budget(compact_tokens)] if compact_tokens else []
+        analysis_steps = [extract_sections("recommend", "improve", "missing")] if compact_analysis else []
+        options["compactors"] = {
+            # Only the recommendations matter to the optimizer
+            "AnalyzerAgent": chain(*analysis_steps, strip_boilerplate, *budget),
+            # The optimized post is the reviewer's subject: passed on verbatim, at most capped
+            "OptimizerAgent": chain(*budget),
+        }
+    return options
+
+# Function to print the statistics of the stage-by-stage mode
+def print_stage_report(stage_options: dict) -> None:
+    """Print stage cache hits and hedge counters"""
+    if stage_options.get("cache"):
+        print(f"  Stage cache: {stage_options['cache'].hits} hits, {stage_options['cache'].misses} misses")
+    if stage_options.get("hedger"):
+        print("  Hedging:")
+        print(stage_options["hedger"].report())
+    print("  Tokens:")
+    print(stage_options["ledger"].report())
+
+# Function to read the posts of a batch from a JSONL or CSV file
+def read_posts(path: str) -> List[dict]:
+    """Read posts from JSONL (one {"id", "post"} object per line) or CSV (columns id, post)"""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if path.lower().endswith(".csv"):
+            rows = list(csv.DictReader(f))  # Each CSV row becomes a dict
+        else:
+            rows = [json.loads(line) for line in f if line.strip()]  # Skip blank lines
+    return [{"id": row.get("id") or str(index), "post": row["post"]} for index, row in enumerate(rows)]
+
+# Function to optimize one post of a batch on the shared runtime
+async def optimize_post(agents: List[Agent], runtime: InProcessRuntime, post_id: str, post: str, timeout: float,
+                        stage_options: Optional[dict] = None) -> dict:
+    """Run the sequential pipeline for one post and record how long each stage took"""
+    started = time.perf_counter()  # Start of this pipeline
+    stage_finished = [started]  # Completion time of every stage, starting with the start time
+    stages = {}  # Stage latency in seconds by agent name
+
+    def record_stage(message: ChatMessageContent) -> None:
+        now = time.perf_counter()
+        stages[message.name] = round(now - stage_finished[-1], 3)  # Time since the previous stage finished
+        stage_finished.append(now)
+        if stage_options is None:
+            record_span(f"stage.{message.name}", now - stage_finished[-2], post_id=post_id)  # Orchestration mode has no stage spans of its own
+
+    try:
+        with span("pipeline", post_id=post_id):
+            if stage_options is not None:
+                # Stage-by-stage mode: stage cache, checkpoints and hedging
+                result = await asyncio.wait_for(
+                    run_staged_pipeline(
+                        agents, post,
+                        on_stage=lambda agent_name, output, cached: record_stage(ChatMessageContent(role="assistant", name=agent_name, content=output)),
+                        **stage_options,
+                    ),
+                    timeout=timeout,
+                )
+            else:
+                orchestration = SequentialOrchestration(
+                    members=agents,  # Same agents for every post
+                    agent_response_callback=record_stage,  # Record stage timings instead of printing
+                )
+                orchestration_result = await orchestration.invoke(task=post, runtime=runtime)
+                result = await orchestration_result.get(timeout=timeout)
+            return {"id": post_id, "result": str(result), "latency": round(time.perf_counter() - started, 3), "stages": stages}
+    except Exception as e:
+        return {"id": post_id, "error": str(e), "latency": round(time.perf_counter() - started, 3), "stages": stages}
+
+# Function to process a whole file of posts concurrently
+async def run_batch(input_path: str, output_path: str, concurrency: int, timeout: float,
+                    stage_options: Optional[dict] = None) -> None:
+    """Optimize every post of `input_path`, streaming results to `output_path` as they finish"""
+    posts = read_posts(input_path)  # Load the batch
+    agents = get_social_media_agents()  # One set of agents for the whole batch
+    runtime = InProcessRuntime()  # One runtime shared by all pipelines
+    runtime.start()
+
+    semaphore = asyncio.Semaphore(concurrency)  # Limit pipelines in flight
+
+    async def limited(item: dict) -> dict:
+        async with semaphore:
+            return await optimize_post(agents, runtime, item["id"], item["post"], timeout, stage_options)
+
+    print(f"📦 Optimizing {len(posts)} posts with concurrency {concurrency}")
+    started = time.perf_counter()
+    results = []
+    try:
+        with open(output_path, "w", encoding="utf-8") as out:
+            for finished in asyncio.as_completed([limited(item) for item in posts]):
+                result = await finished
+                results.append(result)
+                out.write(json.dumps(result, ensure_ascii=False) + "\n")  # Stream each result as it finishes
+                out.flush()
+                print(f"{'✅' if 'error' not in result else '❌'} {result['id']} ({result['latency']}s) [{len(results)}/{len(posts)}]")
+    finally:
+        await runtime.stop_when_idle()
+
+    # Throughput and per-stage latency report
+    elapsed = time.perf_counter() - started
+    failed = sum(1 for result in results if "error" in result)
+    print(f"\n{'='*60}")
+    print(f"Posts: {len(results)}  Failed: {failed}  Elapsed: {elapsed:.1f}s  Throughput: {len(results) / elapsed:.2f} posts/s")
+    for agent in agents:
+        timings = sorted(result["stages"][agent.name] for result in results if agent.name in result["stages"])
+        if timings:
+            p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+            print(f"  {agent.name:<16} avg {sum(timings) / len(timings):.2f}s  p95 {p95:.2f}s")
+    if stage_options is not None:
+        print_stage_report(stage_options)
+    print(f"{'='*60}")
 
 
 # Main function
-async def main():
+async def main(stream: bool = False, timeout: float = 60, stage_options: Optional[dict] = None):
     """Main function to run the examples"""
     print("🎯 Social Media Post Optimization with Sequential Agents")  # Print title
     print("="*60)  # Print separator
@@ -194,11 +380,35 @@ async def main():
 
     # Run the business post example
     print("💼 Example 2: Business Post Optimization")  # Print which example is running
-    await run_business_post_example()  # Run the business post optimization
+    await run_business_post_example(stream=stream, timeout=timeout, stage_options=stage_options)  # Run the business post optimization
 
     print("\n" + "="*80 + "\n")  # Print final separator
 
 
 # Execute everything
 if __name__ == "__main__":
-    asyncio.run(main())  # Run the main function asynchronously if script is executed directly
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Social media post optimization with sequential agents")
+    parser.add_argument("--batch", help="JSONL or CSV file of posts to optimize (fields: id, post)")
+    parser.add_argument("--output", default="optimized_posts.jsonl", help="JSONL file the batch results are written to")
+    parser.add_argument("--concurrency", type=int, default=8, help="Pipelines running at the same time in batch mode")
+    parser.add_argument("--timeout", type=float, default=60, help="Seconds to wait for each pipeline result")
+    parser.add_argument("--stream", action="store_true", help="Print each agent's output token by token (single post, no stage options)")
+    parser.add_argument("--cache-dir", help="Folder for the stage result cache and checkpoints (enables stage-by-stage mode)")
+    parser.add_argument("--resume", action="store_true", help="Resume failed pipelines from their last completed stage (needs --cache-dir)")
+    parser.add_argument("--hedge", action="store_true", help="Duplicate straggling stages to AZURE_OPENAI_HEDGE_DEPLOYMENT_NAME")
+    parser.add_argument("--hedge-percentile", type=float, default=0.95, help="Hedge a stage once it is slower than this share of its past calls")
+    parser.add_argument("--compact-tokens", type=int, help="Cap every handoff between agents at this many tokens (the analysis also loses its intro / sign-off)")
+    parser.add_argument("--compact-analysis", action="store_true", help="Hand only the recommendation sections of the analysis to the optimizer")
+    args = parser.parse_args()
+    if args.resume and not args.cache_dir:
+        parser.error("--resume requires --cache-dir")  # Checkpoints live in the cache folder
+    stage_options = build_stage_options(args.cache_dir, args.resume, args.hedge, args.hedge_percentile,
+                                        args.compact_tokens, args.compact_analysis)  # None keeps SequentialOrchestration
+    if args.stream and (args.batch or stage_options is not None):
+        # Only SequentialOrchestration streams its agents' output
+        parser.error("--stream cannot be combined with --batch, --cache-dir, --hedge or --compact-* options")
+
+    if args.batch:
+        asyncio.run(run_batch(args.batch, args.output, args.concurrency, args.timeout, stage_options))  # Batch mode
+    else:
+        asyncio.run(main(stream=args.stream, timeout=args.timeout, stage_options=stage_options))  # Run the main function asynchronously if script is executed directly
\ No newline at end of file
@@ -0,0 +1,191 @@
+# Stage-by-stage runner for the sequential agent pipeline
+#
+# SequentialOrchestration hands each agent's output to the next agent as its
+# task. This module runs the same chain one stage at a time so every stage can
+# be cached and checkpointed:
+#   - StageCache: content-addressed disk cache keyed by
+#     (agent name, instructions hash, deployment, stage input), LRU evicted by size
+#   - checkpoints: completed stage outputs of a pipeline are saved as they
+#     finish, so a failed pipeline can resume from the last completed stage
+#   - compaction: a stage's output can be shrunk before it becomes the next
+#     stage's input (see compaction.py)
+import hashlib  # Import hashlib for content-addressed keys
+import json  # Import json for cache / checkpoint files
+import os  # Import os for file handling
+from typing import Callable, Dict, List, Optional  # Import types for type hinting
+from semantic_kernel.agents import Agent  # Import the agent base class
+from hedging import Hedger  # Import the hedged request runner
+from compaction import Compactor, TokenLedger, apply  # Import handoff compaction and token accounting
+from tracing import span  # Import latency spans (shared helper from ../agents)
+
+
+# Function to hash any text into a stable key
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+# Function to get the deployment an agent talks to
+def agent_deployment(agent: Agent) -> str:
+    """Deployment (model id) of the agent's chat completion service"""
+    service = getattr(agent, "service", None)
+    return getattr(service, "ai_model_id", "") or ""
+
+
+# Function to compute the cache key of one stage
+def stage_key(agent: Agent, stage_input: str) -> str:
+    """Content-addressed key: agent name, instructions hash, deployment and input"""
+    instructions_hash = _sha256(agent.instructions or "")
+    return _sha256(json.dumps([agent.name, instructions_hash, agent_deployment(agent), stage_input]))
+
+
+class StageCache:
+    """Disk cache of stage outputs, one JSON file per key, evicted least-recently-used beyond `max_bytes`"""
+
+    def __init__(self, directory: str, max_bytes: int = 50 * 1024 * 1024):
+        self.directory = directory  # Folder holding the cache files
+        self.max_bytes = max_bytes  # Size budget of the folder
+        self.hits = 0  # Stage results served from the cache
+        self.misses = 0  # Stage results that had to be generated
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached output or None"""
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                output = json.load(f)["output"]
+        except (OSError, ValueError, KeyError):
+            self.misses += 1
+            return None
+        os.utime(path)  # Mark as recently used
+        self.hits += 1
+        return output
+
+    def put(self, key: str, output: str) -> None:
+        """Store an output and evict the least recently used entries if over budget"""
+        tmp_path = self._path(key) + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"output": output}, f, ensure_ascii=False)
+        os.replace(tmp_path, self._path(key))  # Atomic write, concurrent readers never see partial files
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                stat = os.stat(os.path.join(self.directory, name))
+                entries.append((stat.st_mtime, stat.st_size, name))
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):  # Oldest first
+            if total <= self.max_bytes:
+                break
+            os.remove(os.path.join(self.directory, name))
+            total -= size
+
+
+# Function to compute the checkpoint id of a whole pipeline
+def pipeline_key(agents: List[Agent], task: str) -> str:
+    """Identifies a pipeline run by its task and the exact stages it is made of"""
+    return _sha256(json.dumps([task] + [stage_key(agent, "") for agent in agents]))
+
+
+def _load_checkpoint(path: str) -> List[dict]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)["stages"]
+    except (OSError, ValueError, KeyError):
+        return []
+
+
+def _save_checkpoint(path: str, stages: List[dict]) -> None:
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"stages": stages}, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+# Function to run the agents one after another with caching and checkpoints
+async def run_staged_pipeline(
+    agents: List[Agent],
+    task: str,
+    cache: Optional[StageCache] = None,
+    checkpoint_dir: Optional[str] = None,
+    resume: bool = False,
+    on_stage: Optional[Callable[[str, str, bool], None]] = None,
+    hedger: Optional[Hedger] = None,
+    compactors: Optional[Dict[str, Compactor]] = None,
+    ledger: Optional[TokenLedger] = None,
+) -> str:
+    """Run the sequential pipeline stage by stage and return the last stage's output
+
+    :param cache: serve stages whose exact input was processed before from disk
+    :param checkpoint_dir: save each completed stage so a failed run can resume
+    :param resume: restart from the last completed stage of a previous failed run
+    :param on_stage: called with (agent name, output, served from cache or checkpoint)
+    :param hedger: race straggling stages against a backup deployment
+    :param compactors: compactor by agent name, applied to that agent's output before the next stage
+    :param ledger: collects prompt / completion tokens and handoff sizes per stage
+    """
+    checkpoint_path = None
+    completed: List[dict] = []
+    if checkpoint_dir:
+        os.makedirs(checkpoint_dir, exist_ok=True)
+        checkpoint_path = os.path.join(checkpoint_dir, f"{pipeline_key(agents, task)}.json")
+        if resume:
+            completed = _load_checkpoint(checkpoint_path)
+
+    async def handoff(agent: Agent, output: str) -> str:
+        """Input of the next stage: the output, compacted if a compactor is set for this agent"""
+        compactor = (compactors or {}).get(agent.name)
+        if compactor is None:
+            return output
+        compacted = await apply(compactor, output)
+        if ledger:
+            ledger.record_handoff(agent.name, output, compacted)
+        return compacted
+
+    stage_input = task
+    for index, agent in enumerate(agents):
+        last = index == len(agents) - 1
+        if index < len(completed) and completed[index]["agent"] == agent.name:
+            output = completed[index]["output"]  # Finished in a previous attempt
+            if cache:
+                cache.put(stage_key(agent, stage_input), output)
+            if on_stage:
+                on_stage(agent.name, output, True)
+            stage_input = output if last else await handoff(agent, output)
+            continue
+        completed = completed[:index]  # Anything after a mismatch is stale
+
+        with span(f"stage.{agent.name}", deployment=agent_deployment(agent)) as attributes:
+            key = stage_key(agent, stage_input)
+            output = cache.get(key) if cache else None
+            from_cache = output is not None
+            attributes["cached"] = from_cache
+            if output is None:
+                if hedger:
+                    response = await hedger.get_response(agent, stage_input)  # Generate, hedging stragglers
+                else:
+                    response = await agent.get_response(messages=stage_input)  # Generate this stage
+                output = str(response.message.content)
+                usage = response.message.metadata.get("usage") if response.message.metadata else None
+                attributes["prompt_tokens"] = getattr(usage, "prompt_tokens", None)
+                attributes["completion_tokens"] = getattr(usage, "completion_tokens", None)
+                if ledger:
+                    ledger.record_usage(agent.name, response)
+                if cache:
+                    cache.put(key, output)
+
+        completed.append({"agent": agent.name, "output": output})
+        if checkpoint_path:
+            _save_checkpoint(checkpoint_path, completed)
+        if on_stage:
+            on_stage(agent.name, output, from_cache)
+        stage_input = output if last else await handoff(agent, output)
+
+    if checkpoint_path and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)  # Pipeline finished, nothing to resume
+    return stage_input
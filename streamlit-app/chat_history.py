@@ -0,0 +1,151 @@
+import json
+import os
+import tempfile
+import threading
+import uuid
+import weakref
+import zlib
+from collections import deque
+from typing import List, Tuple
+
+import streamlit as st
+
+# Chat history of one browser session, bounded in memory and cheap to rerender:
+#   - only the newest CHAT_HISTORY_WINDOW turns are drawn, "Load older" pages back
+#   - a turn's HTML is built once and reused on every rerun
+#   - at most CHAT_HISTORY_MAX_TURNS turns stay in memory; older ones are
+#     spilled to a per-session file of zlib-compressed records and read back
+#     only when the user pages that far
+#   - turns in memory can still be patched (replace_text), e.g. to swap a
+#     provisional ticket reference for the real number
+# The whole window goes out as a single markdown element.
+
+WINDOW = int(os.getenv("CHAT_HISTORY_WINDOW", "10"))                 # Turns shown / loaded per page
+MAX_TURNS_IN_MEMORY = int(os.getenv("CHAT_HISTORY_MAX_TURNS", "50"))  # Turns kept in session state
+SPILL_DIR = os.getenv("CHAT_HISTORY_SPILL_DIR") or os.path.join(tempfile.gettempdir(), "freshdesk-chat")
+
+
+# Chat bubbles
+def user_bubble(message: str) -> str:
+    return f"""
+        <div class="chat-container user">
+            <div class="message-content">
+                <div class="avatar user-avatar">U</div>
+                <div class="chat-bubble user-bubble">{message}</div>
+            </div>
+        </div>
+    """
+
+
+def agent_bubble(message: str) -> str:
+    return f"""
+        <div class="chat-container agent">
+            <div class="message-content">
+                <div class="chat-bubble agent-bubble">{message}</div>
+                <div class="avatar agent-avatar">A</div>
+            </div>
+        </div>
+    """
+
+
+def turn_html(user: str, agent: str) -> str:
+    """Both bubbles of a turn; notices posted by the app have no user part"""
+    return (user_bubble(user) if user else "") + agent_bubble(agent)
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class _SpillStore:
+    """Append-only file of compressed turns with an in-memory offset index"""
+
+    def __init__(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, f"{uuid.uuid4().hex}.bin")
+        self.index: List[Tuple[int, int]] = []  # (offset, length) per spilled turn
+        self.size = 0
+        self.lock = threading.Lock()
+        weakref.finalize(self, _remove, self.path)  # Gone with the session (or the process)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def append(self, user: str, agent: str) -> None:
+        record = zlib.compress(json.dumps([user, agent], ensure_ascii=False).encode("utf-8"))
+        with self.lock, open(self.path, "ab") as f:
+            f.write(record)
+            self.index.append((self.size, len(record)))
+            self.size += len(record)
+
+    def read(self, start: int, end: int) -> List[Tuple[str, str]]:
+        turns = []
+        with self.lock, open(self.path, "rb") as f:
+            for offset, length in self.index[start:end]:
+                f.seek(offset)
+                user, agent = json.loads(zlib.decompress(f.read(length)))
+                turns.append((user, agent))
+        return turns
+
+
+class ChatHistory:
+    """Turns of one session: the newest in memory with their rendered HTML, older ones spilled"""
+
+    def __init__(self, max_in_memory: int = MAX_TURNS_IN_MEMORY, spill_dir: str = SPILL_DIR):
+        self.max_in_memory = max_in_memory
+        self.recent = deque()  # (user, agent, html), oldest first
+        self.spilled = _SpillStore(spill_dir)
+
+    def __len__(self) -> int:
+        return len(self.spilled) + len(self.recent)
+
+    def append(self, user: str, agent: str) -> None:
+        self.recent.append((user, agent, turn_html(user, agent)))
+        while len(self.recent) > self.max_in_memory:
+            old_user, old_agent, _ = self.recent.popleft()
+            self.spilled.append(old_user, old_agent)
+
+    def append_notice(self, agent: str) -> None:
+        """An agent message without a user message, e.g. a ticket number that arrived later"""
+        self.append("", agent)
+
+    def replace_text(self, old: str, new: str) -> int:
+        """Replace `old` in the agent replies kept in memory (spilled turns stay as they were); returns turns changed"""
+        changed = 0
+        for i, (user, agent, _) in enumerate(self.recent):
+            if old in agent:
+                agent = agent.replace(old, new)
+                self.recent[i] = (user, agent, turn_html(user, agent))
+                changed += 1
+        return changed
+
+    def window_html(self, turns: int) -> str:
+        """HTML of the newest `turns` turns, oldest first"""
+        start = max(0, len(self) - turns)
+        parts = []
+        if start < len(self.spilled):
+            parts = [turn_html(user, agent) for user, agent in self.spilled.read(start, len(self.spilled))]
+        skip = max(0, start - len(self.spilled))
+        parts.extend(html for _, _, html in list(self.recent)[skip:])
+        return "".join(parts)
+
+
+def get_history() -> ChatHistory:
+    """The history of the current browser session"""
+    if not isinstance(st.session_state.get("chat_history"), ChatHistory):
+        st.session_state.chat_history = ChatHistory()
+        st.session_state.history_window = WINDOW
+    return st.session_state.chat_history
+
+
+def render_history(history: ChatHistory, container) -> None:
+    """Draw the visible window with a "Load older" control above it"""
+    with container:
+        hidden = len(history) - st.session_state.history_window
+        if hidden > 0 and st.button(f"⬆️ Load older messages ({hidden} more)", key="load_older"):
+            st.session_state.history_window += WINDOW
+        if len(history):
+            st.markdown(history.window_html(st.session_state.history_window), unsafe_allow_html=True)
@@ -0,0 +1,112 @@
+import atexit
+import os
+import threading
+from typing import Dict
+
+import streamlit as st
+from azure.ai.projects import AIProjectClient
+from azure.identity import ClientSecretCredential
+from streamlit.runtime import get_instance
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from tracing import span  # Shared helper from ../agents, on sys.path via the app script
+from agent_registry import AgentRegistry, fingerprint
+from freshdesk_chat import forget_thread
+
+# Streamlit re-executes the whole script on every interaction. Everything that
+# costs a network round trip (credential, client, agent, thread) is created
+# once here and reused across reruns:
+#   - credential / client and the agent are shared by the whole process
+#   - the agent also survives restarts: the registry (agents/agent_registry.py)
+#     finds it by its definition and sweeps agents that are no longer used;
+#     while the app runs, the sweeper's heartbeat keeps its agent marked as used
+#   - every browser session gets its own thread, kept in session state
+# Threads of closed sessions are deleted on the next rerun of any session and
+# the remaining threads when the process exits.
+
+
+@st.cache_resource
+def get_project_client() -> AIProjectClient:
+    """Process-wide Azure AI Project client"""
+    with span("credential.acquire"):
+        credential = ClientSecretCredential(
+            tenant_id=os.getenv("TENANT_ID"),
+            client_id=os.getenv("CLIENT_ID"),
+            client_secret=os.getenv("CLIENT_SECRET")
+        )
+        credential.get_token("https://ai.azure.com/.default")  # Fetch the token now so it is timed here
+    return AIProjectClient(credential=credential, endpoint=os.getenv("PROJECT_ENDPOINT"))
+
+
+@st.cache_resource
+def get_agent_registry() -> AgentRegistry:
+    """Agents by definition fingerprint, kept across app restarts; stale ones are swept in the background"""
+    registry = AgentRegistry(get_project_client())
+    registry.start_background_sweep()
+    return registry
+
+
+@st.cache_resource
+def _get_agent(definition_key: str, model: str, name: str, instructions: str, _toolset):
+    """One agent per distinct definition, `_toolset` is covered by `definition_key`"""
+    return get_agent_registry().get_or_create(model=model, name=name, instructions=instructions, toolset=_toolset)
+
+
+def get_agent(model: str, name: str, instructions: str, toolset):
+    """Return the shared agent for this model + instructions + tools, reused across app restarts"""
+    definition_key = fingerprint(model=model, instructions=instructions, toolset=toolset)
+    return _get_agent(definition_key, model, name, instructions, toolset)
+
+
+class _SessionThreads:
+    """Thread IDs by Streamlit session ID, shared by all sessions of the process"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.threads: Dict[str, str] = {}
+        atexit.register(self.delete_all)
+
+    def sweep(self) -> None:
+        """Delete the threads of sessions that are no longer connected"""
+        runtime = get_instance()
+        with self.lock:
+            closed = {session_id: thread_id for session_id, thread_id in self.threads.items()
+                      if not runtime.is_active_session(session_id)}
+            for session_id in closed:
+                del self.threads[session_id]
+        for thread_id in closed.values():
+            self._delete(thread_id)
+
+    def delete_all(self) -> None:
+        with self.lock:
+            thread_ids = list(self.threads.values())
+            self.threads.clear()
+        for thread_id in thread_ids:
+            self._delete(thread_id)
+
+    @staticmethod
+    def _delete(thread_id: str) -> None:
+        forget_thread(thread_id)
+        try:
+            get_project_client().agents.threads.delete(thread_id)
+        except Exception as e:
+            print(f"Failed to delete thread {thread_id}: {e}")
+
+
+@st.cache_resource
+def _session_threads() -> _SessionThreads:
+    return _SessionThreads()
+
+
+def get_thread_id() -> str:
+    """Return the thread of the current browser session, creating it on first use"""
+    registry = _session_threads()
+    registry.sweep()
+
+    if "thread_id" not in st.session_state:
+        with span("thread.create") as attributes:
+            thread = get_project_client().agents.threads.create()
+            attributes["thread_id"] = thread.id
+        st.session_state.thread_id = thread.id
+        with registry.lock:
+            registry.threads[get_script_run_ctx().session_id] = thread.id
+    return st.session_state.thread_id
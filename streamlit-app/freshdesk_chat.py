@@ -0,0 +1,108 @@
+import contextvars
+import json
+import os
+from typing import Callable, Iterable, List, Optional
+
+from message_cursor import MessageCursor  # Shared helpers from ../agents, on sys.path via the app script
+from run_waiter import StreamTranscript, run_to_completion
+from tool_dispatcher import dispatch_tool_calls
+import tool_http
+from tracing import span
+
+# The ticket tool and the handling of one chat message, kept free of Streamlit
+# so the same code runs in the app and in the offline benchmark
+# (benchmarks/bench_agents.py).
+
+# Last seen message per thread: a turn only fetches the messages it added
+_cursor = MessageCursor()
+# Thread of the turn being handled, visible to tool functions (the dispatcher copies the context)
+current_thread_id = contextvars.ContextVar("current_thread_id", default=None)
+
+
+def forget_thread(thread_id: str) -> None:
+    """Drop the cached messages of a deleted thread"""
+    _cursor.forget(thread_id)
+
+
+def _freshdesk(path: str):
+    """URL and basic auth for a Freshdesk API path"""
+    FRESHDESK_DOMAIN = os.getenv("FRESHDESK_DOMAIN")
+    FRESHDESK_API_KEY = os.getenv("FRESHDESK_API_KEY")
+    # FRESHDESK_BASE_URL points the tool somewhere else, e.g. a local stub
+    base_url = os.getenv("FRESHDESK_BASE_URL") or f"https://{FRESHDESK_DOMAIN}"
+    return f"{base_url}{path}", (FRESHDESK_API_KEY, "X")
+
+
+def post_freshdesk_ticket(email: str, subject: str, tags: Iterable[str] = (), retries: bool = True):
+    """POST one ticket to Freshdesk and return the response"""
+    url, auth = _freshdesk("/api/v2/tickets")
+
+    ticket_data = {
+        "email": email,
+        "subject": subject,
+        "description": "This is a test ticket created via Azure AI Agent.",
+        "priority": 2,
+        "status": 2,
+        "tags": ["API", "Python", *tags]
+    }
+
+    headers = {"Content-Type": "application/json", "Accept": "application/json"}
+
+    # Pooled keep-alive session with timeouts and circuit breaking (a POST is retried only if it never left)
+    return tool_http.post(url, retries=retries, auth=auth, headers=headers, data=json.dumps(ticket_data))
+
+
+def search_freshdesk_tickets(tag: str):
+    """Search Freshdesk for tickets carrying `tag` and return the response"""
+    url, auth = _freshdesk("/api/v2/search/tickets")
+    return tool_http.get(url, auth=auth, headers={"Accept": "application/json"}, params={"query": f'"tag:\'{tag}\'"'})
+
+
+# Freshdesk Ticket Creator
+def create_freshdesk_ticket(email: str, subject: str) -> str:
+    response = post_freshdesk_ticket(email, subject)
+
+    if response.status_code == 201:
+        return json.dumps(response.json(), indent=4)
+    else:
+        return json.dumps({"error": response.text, "status_code": response.status_code}, indent=4)
+
+
+def handle_message(project_client, thread_id: str, agent_id: str, text: str, functions,
+                   use_stream: bool = True,
+                   on_text_delta: Optional[Callable[[str], None]] = None,
+                   on_tool_calls: Optional[Callable[[List], None]] = None) -> str:
+    """Post the user message, run the agent and return its reply"""
+    transcript = StreamTranscript()
+    token = current_thread_id.set(thread_id)  # Read by tools that need the conversation, e.g. the ticket outbox
+    try:
+        with span("chat.turn", thread_id=thread_id, agent_id=agent_id):
+            with span("message.post", thread_id=thread_id):
+                message = project_client.agents.messages.create(thread_id=thread_id, role="user", content=text)
+            _cursor.record(message)
+            # Tool calls of one step (e.g. several tickets) run concurrently
+            run = run_to_completion(
+                project_client, thread_id, agent_id,
+                handle_tool_calls=lambda tool_calls: dispatch_tool_calls(tool_calls, functions.execute),
+                use_stream=use_stream,
+                on_text_delta=on_text_delta,
+                on_tool_calls=on_tool_calls,
+                transcript=transcript,
+            )
+
+            if run.status == "failed":
+                return f"Run failed: {run.last_error}"
+            reply = transcript.reply()
+            if reply is not None:
+                return reply
+            # Blocking path, a stream that dropped or a reply in several messages: read the messages the run added
+            return _cursor.latest_reply(project_client, thread_id) or "Error"
+    finally:
+        current_thread_id.reset(token)
+
+
+def post_notice(project_client, thread_id: str, text: str) -> None:
+    """Add an assistant message to the thread outside a run, e.g. a ticket number that arrived later"""
+    with span("message.post", thread_id=thread_id):
+        message = project_client.agents.messages.create(thread_id=thread_id, role="assistant", content=text)
+    _cursor.record(message)  # Known already, the next turn does not fetch it again
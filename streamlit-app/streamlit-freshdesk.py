@@ -1,20 +1,24 @@
 import os
-import json
-import requests
+import sys
 import streamlit as st
-from azure.ai.projects import AIProjectClient
-from azure.identity import ClientSecretCredential
 from azure.ai.agents.models import FunctionTool, ToolSet
 from dotenv import load_dotenv
 from typing import Any, Callable, Set
-from datetime import datetime
+
+# Shared agent helpers live next to the other agent samples
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "agents"))
+from freshdesk_agent import get_agent, get_project_client, get_thread_id
+from freshdesk_chat import create_freshdesk_ticket, handle_message, post_notice
+from ticket_outbox import get_outbox, queue_freshdesk_ticket, ticket_notice
+from chat_history import agent_bubble, get_history, render_history, user_bubble
 
 # Load environment variables
 load_dotenv('api_settings.env')
 
-TENANT_ID = os.getenv("TENANT_ID")
-CLIENT_ID = os.getenv("CLIENT_ID")
-CLIENT_SECRET = os.getenv("CLIENT_SECRET")
+# Render agent replies token by token; set AGENT_STREAMING=false for the blocking path
+STREAMING = os.getenv("AGENT_STREAMING", "true").lower() != "false"
+# Queue tickets and create them in the background (see ticket_outbox.py); set FRESHDESK_OUTBOX=false to create them inline
+OUTBOX = os.getenv("FRESHDESK_OUTBOX", "true").lower() != "false"
 
 # Streamlit layout config
 st.set_page_config(layout="wide", initial_sidebar_state="collapsed")
@@ -120,96 +124,61 @@ st.markdown("""
 chat_container = st.container()
 input_container = st.container()
 
-# Session state for chat history
-if "chat_history" not in st.session_state:
-    st.session_state.chat_history = []
-
-# Freshdesk Ticket Creator
-def create_freshdesk_ticket(email: str, subject: str) -> str:
-    FRESHDESK_DOMAIN = os.getenv("FRESHDESK_DOMAIN")
-    FRESHDESK_API_KEY = os.getenv("FRESHDESK_API_KEY")
-    url = f"https://{FRESHDESK_DOMAIN}/api/v2/tickets"
-    
-    ticket_data = {
-        "email": email,
-        "subject": subject,
-        "description": "This is a test ticket created via Azure AI Agent.",
-        "priority": 2,
-        "status": 2,
-        "tags": ["API", "Python"]
-    }
-    
-    headers = {"Content-Type": "application/json", "Accept": "application/json"}
-    
-    response = requests.post(url, auth=(FRESHDESK_API_KEY, "X"), headers=headers, data=json.dumps(ticket_data))
-    
-    if response.status_code == 201:
-        return json.dumps(response.json(), indent=4)
-    else:
-        return json.dumps({"error": response.text, "status_code": response.status_code}, indent=4)
+# Session state for chat history (windowed, bounded, see chat_history.py)
+history = get_history()
 
 # Toolset and Azure agent
-user_functions: Set[Callable[..., Any]] = {create_freshdesk_ticket}
-
-credential = ClientSecretCredential(
-    tenant_id=TENANT_ID,
-    client_id=CLIENT_ID,
-    client_secret=CLIENT_SECRET
-)
+user_functions: Set[Callable[..., Any]] = {queue_freshdesk_ticket if OUTBOX else create_freshdesk_ticket}
 
-project_client = AIProjectClient(
-    credential=credential,
-    endpoint=os.getenv("PROJECT_ENDPOINT"),
-    #subscription_id=os.getenv("SUBSCRIPTION_ID"),
-    #resource_group_name=os.getenv("RESOURCE_GRPUP"),
-    #project_name=os.getenv("PROJECT_NAME"),
-)
-
-#project_client = AIProjectClient(
-#    subscription_id=os.getenv("SUBSCRIPTION_ID"),
-#    resource_group_name=os.getenv("RESOURCE_GRPUP"),
-#    project_name=os.getenv("PROJECT_NAME"),
-#    credential=credential
-#)
+# Client, agent and thread survive Streamlit reruns (see freshdesk_agent.py)
+project_client = get_project_client()
 
 functions = FunctionTool(user_functions)
 toolset = ToolSet()
 toolset.add(functions)
-project_client.agents.enable_auto_function_calls(tools=toolset)
 
-agent = project_client.agents.create_agent(
+agent = get_agent(
     model=os.getenv("MODEL_DEPLOYMENT_NAME"),
     name="freshdesk-agent",
-    instructions="You are a helpful agent who can create freshdesk tickets.",
+    instructions="You are a helpful agent who can create freshdesk tickets." + (
+        " New tickets are queued: give the user the provisional reference, the ticket number follows in the chat."
+        if OUTBOX else ""),
     toolset=toolset
 )
 
-thread = project_client.agents.threads.create()
+thread_id = get_thread_id()
+
+
+def show_ticket_updates() -> bool:
+    """Put tickets the outbox finished since the last rerun into the chat and the thread"""
+    updates = get_outbox().take_updates(thread_id)
+    for ticket in updates:
+        notice = ticket_notice(ticket)
+        if ticket["status"] == "created":
+            history.replace_text(ticket["reference"], f"#{ticket['ticket_id']}")
+        history.append_notice(notice)
+        try:
+            post_notice(project_client, thread_id, notice)  # So the agent knows the real number too
+        except Exception as e:
+            print(f"Failed to post ticket notice: {e}")
+        st.toast(notice)
+    return bool(updates)
+
+
+if OUTBOX:
+    show_ticket_updates()
+
+    # While tickets are queued, check every few seconds and rerun once one is done
+    @st.fragment(run_every=2)
+    def poll_ticket_updates() -> None:
+        if show_ticket_updates():
+            st.rerun()  # Whole app, so the history shows the ticket number
+
+    if get_outbox().pending(thread_id):
+        poll_ticket_updates()
 
 # Chat Display
-with chat_container:
-    for i in range(0, len(st.session_state.chat_history), 2):
-        if i < len(st.session_state.chat_history):
-            user_role, user_message = st.session_state.chat_history[i]
-            st.markdown(f"""
-                <div class="chat-container user">
-                    <div class="message-content">
-                        <div class="avatar user-avatar">U</div>
-                        <div class="chat-bubble user-bubble">{user_message}</div>
-                    </div>
-                </div>
-            """, unsafe_allow_html=True)
-
-        if i + 1 < len(st.session_state.chat_history):
-            agent_role, agent_message = st.session_state.chat_history[i + 1]
-            st.markdown(f"""
-                <div class="chat-container agent">
-                    <div class="message-content">
-                        <div class="chat-bubble agent-bubble">{agent_message}</div>
-                        <div class="avatar agent-avatar">A</div>
-                    </div>
-                </div>
-            """, unsafe_allow_html=True)
+render_history(history, chat_container)
 
 # Input field
 with input_container:
@@ -221,16 +190,29 @@ with input_container:
 
 # Process message
 if send_button and user_input:
-    project_client.agents.messages.create(thread_id=thread.id, role="user", content=user_input)
-    run = project_client.agents.runs.create_and_process(thread_id=thread.id, agent_id=agent.id)
-
-    if run.status == "failed":
-        response_text = f"Run failed: {run.last_error}"
-    else:
-        messages = project_client.agents.messages.list(thread_id=thread.id)
-        latest_message = next(msg for msg in project_client.agents.messages.list(thread_id=thread.id) if msg.role == "assistant")
-        response_text = next(content.text.value for content in latest_message.content if content.type == "text")
-
-    st.session_state.chat_history.append(("User", user_input))
-    st.session_state.chat_history.append(("Agent", response_text))
+    # Render the turn right away and fill the agent bubble as tokens arrive
+    with chat_container:
+        st.markdown(user_bubble(user_input), unsafe_allow_html=True)
+        status_placeholder = st.empty()
+        reply_placeholder = st.empty()
+    streamed_parts = []
+
+    def show_delta(text: str) -> None:
+        status_placeholder.empty()
+        streamed_parts.append(text)
+        reply_placeholder.markdown(agent_bubble("".join(streamed_parts)), unsafe_allow_html=True)
+
+    def show_tool_calls(tool_calls) -> None:
+        names = ", ".join(call.function.name.replace("_", " ") for call in tool_calls)
+        status_placeholder.info(f"🛠️ Running {names}…")
+
+    response_text = handle_message(
+        project_client, thread_id, agent.id, user_input, functions,
+        use_stream=STREAMING,
+        on_text_delta=show_delta,
+        on_tool_calls=show_tool_calls,
+    )
+    status_placeholder.empty()
+
+    history.append(user_input, response_text)
     st.rerun()
@@ -0,0 +1,250 @@
+import hashlib
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from freshdesk_chat import current_thread_id, post_freshdesk_ticket, search_freshdesk_tickets
+from tracing import span
+
+# Write-behind ticket creation. The agent's tool only records the ticket in a
+# local SQLite outbox and answers at once with a provisional reference
+# ("PENDING-1A2B3C4D"), so a turn no longer waits for Freshdesk, and a
+# Freshdesk outage no longer fails the run. A background worker delivers the
+# queued tickets:
+#   - at most TICKET_OUTBOX_WORKERS POSTs at a time
+#   - 429 / 5xx / network errors are retried with exponential backoff and
+#     jitter, other 4xx answers fail the ticket for good
+#   - the idempotency key (thread + email + subject) makes a repeated tool call
+#     return the existing entry instead of queueing a second ticket; asking
+#     again for a ticket that failed queues it once more
+#   - every POST goes out once (no transport retries), carrying the reference
+#     as a Freshdesk tag; before a retry - after a timeout, an error or a crash
+#     mid-POST - the ticket is looked up by that tag and adopted if an earlier
+#     attempt did create it, so retries do not create duplicates
+# The app picks up finished tickets with `take_updates(thread_id)` and puts the
+# real ticket numbers into the chat.
+
+OUTBOX_PATH = os.getenv("TICKET_OUTBOX_DB") or os.path.join(os.path.dirname(os.path.abspath(__file__)), "ticket_outbox.db")
+WORKERS = int(os.getenv("TICKET_OUTBOX_WORKERS", "4"))           # Concurrent deliveries
+MAX_ATTEMPTS = int(os.getenv("TICKET_OUTBOX_MAX_ATTEMPTS", "8"))  # Then the ticket is marked failed
+RETRY_BASE = float(os.getenv("TICKET_OUTBOX_RETRY_BASE", "2"))   # Seconds before the first retry, doubled per attempt
+RETRY_MAX = 300.0
+IDLE_POLL = 1.0  # Seconds the worker sleeps when nothing is due
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tickets (
+    idempotency_key TEXT PRIMARY KEY,
+    reference       TEXT NOT NULL UNIQUE,
+    thread_id       TEXT,
+    email           TEXT NOT NULL,
+    subject         TEXT NOT NULL,
+    status          TEXT NOT NULL DEFAULT 'pending',  -- pending, sending, created, failed
+    attempts        INTEGER NOT NULL DEFAULT 0,       -- Deliveries started, counted before the POST
+    next_attempt    REAL NOT NULL,
+    ticket_id       INTEGER,
+    error           TEXT,
+    notified        INTEGER NOT NULL DEFAULT 0,       -- 1 once the chat has been told the outcome
+    created_at      REAL NOT NULL,
+    updated_at      REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tickets_due ON tickets (status, next_attempt);
+CREATE INDEX IF NOT EXISTS tickets_thread ON tickets (thread_id, notified);
+"""
+
+
+class PermanentError(Exception):
+    """Freshdesk rejected the ticket, retrying will not help"""
+
+
+def idempotency_key(thread_id: Optional[str], email: str, subject: str) -> str:
+    normalized = f"{thread_id or ''}\n{email.strip().lower()}\n{' '.join(subject.split()).lower()}"
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def find_in_freshdesk(reference: str) -> Optional[int]:
+    """ID of the ticket an earlier attempt created under this reference, if any"""
+    response = search_freshdesk_tickets(reference)
+    if response.status_code != 200:
+        raise RuntimeError(f"Freshdesk search answered {response.status_code}")  # Retried, never POST blind
+    results = response.json().get("results") or []
+    return min(ticket["id"] for ticket in results) if results else None
+
+
+def send_to_freshdesk(ticket: Dict) -> int:
+    """Create the ticket and return its Freshdesk ID"""
+    if ticket["attempts"] > 1 or ticket["error"]:
+        # An earlier attempt may have reached Freshdesk (timeout, crash mid-POST): adopt what it created.
+        # Freshdesk's search index can trail a few seconds, the retry backoff covers that.
+        existing = find_in_freshdesk(ticket["reference"])
+        if existing is not None:
+            return existing
+    response = post_freshdesk_ticket(ticket["email"], ticket["subject"], tags=[ticket["reference"]], retries=False)
+    if response.status_code == 201:
+        return response.json()["id"]
+    if response.status_code == 429 or response.status_code >= 500:
+        raise RuntimeError(f"Freshdesk answered {response.status_code}")  # Retried
+    raise PermanentError(f"Freshdesk answered {response.status_code}: {response.text[:200]}")
+
+
+class TicketOutbox:
+    """Durable queue of tickets plus the worker that delivers them"""
+
+    def __init__(self, path: str = OUTBOX_PATH, send: Callable[[Dict], int] = send_to_freshdesk,
+                 workers: int = WORKERS, max_attempts: int = MAX_ATTEMPTS):
+        self.send = send
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.lock = threading.Lock()  # One connection shared by the app and the worker threads
+        self.db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(_SCHEMA)
+        # Deliveries interrupted by a crash or restart are due again (their attempt counts, so they are looked up first)
+        self.db.execute("UPDATE tickets SET status = 'pending' WHERE status = 'sending'")
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ticket-outbox")
+        self.in_flight = 0
+        self.wake = threading.Event()
+        self.stopped = threading.Event()
+        self.worker: Optional[threading.Thread] = None
+
+    # --- producer side -------------------------------------------------------
+
+    def enqueue(self, email: str, subject: str, thread_id: Optional[str] = None) -> Dict:
+        """Queue a ticket, or return the entry already queued for the same thread, email and subject
+
+        A failed entry is queued again; its last error is kept, so the first attempt looks it up in Freshdesk.
+        """
+        key = idempotency_key(thread_id, email, subject)
+        now = time.time()
+        with self.lock:
+            self.db.execute(
+                "INSERT OR IGNORE INTO tickets (idempotency_key, reference, thread_id, email, subject, next_attempt,"
+                " created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, f"PENDING-{key[:8].upper()}", thread_id, email, subject, now, now, now))
+            self.db.execute(
+                "UPDATE tickets SET status = 'pending', attempts = 0, notified = 0, next_attempt = ?, updated_at = ?"
+                " WHERE idempotency_key = ? AND status = 'failed'", (now, now, key))
+            row = dict(self.db.execute("SELECT * FROM tickets WHERE idempotency_key = ?", (key,)).fetchone())
+        self.wake.set()
+        return row
+
+    def take_updates(self, thread_id: str) -> List[Dict]:
+        """Tickets of the thread that were created or failed since the last call"""
+        with self.lock:
+            rows = [dict(row) for row in self.db.execute(
+                "SELECT * FROM tickets WHERE thread_id = ? AND notified = 0 AND status IN ('created', 'failed')"
+                " ORDER BY updated_at", (thread_id,))]
+            self.db.executemany("UPDATE tickets SET notified = 1 WHERE idempotency_key = ?",
+                                [(row["idempotency_key"],) for row in rows])
+        return rows
+
+    def pending(self, thread_id: Optional[str] = None) -> int:
+        """Tickets not yet delivered (of one thread, or all)"""
+        query = "SELECT COUNT(*) FROM tickets WHERE status IN ('pending', 'sending')"
+        with self.lock:
+            if thread_id is None:
+                return self.db.execute(query).fetchone()[0]
+            return self.db.execute(query + " AND thread_id = ?", (thread_id,)).fetchone()[0]
+
+    # --- worker side ---------------------------------------------------------
+
+    def start(self) -> "TicketOutbox":
+        if self.worker is None or not self.worker.is_alive():
+            self.worker = threading.Thread(target=self._run, name="ticket-outbox", daemon=True)
+            self.worker.start()
+        return self
+
+    def stop(self) -> None:
+        self.stopped.set()
+        self.wake.set()
+        self.pool.shutdown(wait=True)
+
+    def _claim(self, limit: int) -> List[Dict]:
+        """Mark up to `limit` due tickets as sending and return them"""
+        now = time.time()
+        with self.lock:
+            self.db.execute("BEGIN IMMEDIATE")
+            rows = [dict(row) for row in self.db.execute(
+                "SELECT * FROM tickets WHERE status = 'pending' AND next_attempt <= ? ORDER BY next_attempt LIMIT ?",
+                (now, limit))]
+            self.db.executemany("UPDATE tickets SET status = 'sending', attempts = attempts + 1, updated_at = ?"
+                                " WHERE idempotency_key = ?", [(now, row["idempotency_key"]) for row in rows])
+            self.db.execute("COMMIT")
+            self.in_flight += len(rows)
+        for row in rows:
+            row["attempts"] += 1
+        return rows
+
+    def _next_due_in(self) -> float:
+        with self.lock:
+            due = self.db.execute("SELECT MIN(next_attempt) FROM tickets WHERE status = 'pending'").fetchone()[0]
+        return IDLE_POLL if due is None else min(IDLE_POLL, max(0.0, due - time.time()))
+
+    def _run(self) -> None:
+        while not self.stopped.is_set():
+            with self.lock:
+                free = self.workers - self.in_flight
+            for ticket in self._claim(free) if free > 0 else []:
+                self.pool.submit(self._deliver, ticket)
+            self.wake.wait(self._next_due_in())
+            self.wake.clear()
+
+    def _deliver(self, ticket: Dict) -> None:
+        attempts = ticket["attempts"]
+        with span("ticket.deliver", reference=ticket["reference"], attempt=attempts) as attributes:
+            try:
+                ticket_id = self.send(ticket)
+                update = {"status": "created", "ticket_id": ticket_id, "error": None}
+            except Exception as e:
+                retry = not isinstance(e, PermanentError) and attempts < self.max_attempts
+                delay = min(RETRY_MAX, RETRY_BASE * 2 ** (attempts - 1)) * random.uniform(0.5, 1.0)
+                update = {"status": "pending" if retry else "failed", "error": str(e)[:500],
+                          "next_attempt": time.time() + delay}
+            attributes["status"] = update["status"]
+        update["updated_at"] = time.time()
+        with self.lock:
+            self.db.execute(f"UPDATE tickets SET {', '.join(f'{column} = ?' for column in update)} WHERE idempotency_key = ?",
+                            (*update.values(), ticket["idempotency_key"]))
+            self.in_flight -= 1
+        self.wake.set()
+
+
+_outbox: Optional[TicketOutbox] = None
+_outbox_lock = threading.Lock()
+
+
+def get_outbox() -> TicketOutbox:
+    """Process-wide outbox with its worker running"""
+    global _outbox
+    with _outbox_lock:
+        if _outbox is None:
+            _outbox = TicketOutbox().start()
+        return _outbox
+
+
+def queue_freshdesk_ticket(email: str, subject: str) -> str:
+    """
+    Creates a Freshdesk support ticket. The ticket is queued and delivered in the background;
+    the answer contains a provisional reference, the real ticket number is posted in the chat once Freshdesk confirms it.
+
+    :param email (str): Email address of the customer the ticket is for.
+    :param subject (str): Subject of the ticket.
+    :return: Queue status and provisional reference as a JSON string.
+    """
+    ticket = get_outbox().enqueue(email, subject, thread_id=current_thread_id.get())
+    if ticket["status"] == "created":  # Same ticket requested again
+        return json.dumps({"status": "created", "ticket_id": ticket["ticket_id"], "reference": ticket["reference"]})
+    return json.dumps({"status": "queued", "reference": ticket["reference"],
+                       "message": "The ticket will be created in Freshdesk shortly; its number will be posted in the chat."})
+
+
+def ticket_notice(ticket: Dict) -> str:
+    """Chat text for a finished ticket"""
+    if ticket["status"] == "created":
+        return f"✅ Ticket {ticket['reference']} was created in Freshdesk as #{ticket['ticket_id']} ({ticket['subject']})."
+    return f"❌ Ticket {ticket['reference']} ({ticket['subject']}) could not be created: {ticket['error']}"